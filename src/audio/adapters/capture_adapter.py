@@ -11,7 +11,7 @@ from queue import Queue, Empty, Full
 import threading
 import numpy as np
 
-from ..ports import AudioCapturePort, AudioData, AudioFormat, DeviceInfo
+from ..ports import AudioCapturePort, AudioData, AudioFormat, DeviceInfo, SampleFormat
 
 try:
     from ..capture import AudioCapture
@@ -192,17 +192,34 @@ class AudioCaptureAdapter:
     def _recording_worker(self):
         """Worker thread for continuous audio recording."""
         try:
-            chunk_duration = 1.0  # Record 1-second chunks
+            chunk_duration = 1.0  # Deliver 1-second chunks
+            
+            # Keep the device open and read consecutive chunks from its
+            # stream; fall back to one recording per chunk without it
+            streaming = self.capture_engine.start_streaming(
+                frame_duration=chunk_duration,
+                buffer_duration=4 * chunk_duration
+            )
+            if not streaming:
+                self.logger.warning("Capture stream unavailable, recording chunk by chunk")
             
             while self._recording:
                 try:
                     # Record audio chunk
-                    audio_bytes = self.capture_engine.record_chunk(duration=chunk_duration)
+                    if streaming:
+                        audio_bytes = self.capture_engine.read_frame(timeout=0.5)
+                    else:
+                        audio_bytes = self.capture_engine.record_chunk(duration=chunk_duration)
                     
                     if audio_bytes is not None:
+                        sample_rate = self.capture_engine.sample_rate if streaming else self._sample_rate
+                        channels = self.capture_engine.channels if streaming else self._channels
+                        sample_format = None
+                        
                         # Convert numpy array to bytes if necessary
                         if isinstance(audio_bytes, np.ndarray):
                             audio_data_bytes = audio_bytes.tobytes()
+                            sample_format = SampleFormat(audio_bytes.dtype.name, sample_rate, channels)
                         elif isinstance(audio_bytes, bytes):
                             audio_data_bytes = audio_bytes
                         else:
@@ -212,11 +229,12 @@ class AudioCaptureAdapter:
                         # Create AudioData object
                         audio_data = AudioData(
                             data=audio_data_bytes,
-                            sample_rate=self._sample_rate,
-                            channels=self._channels,
+                            sample_rate=sample_rate,
+                            channels=channels,
                             format=AudioFormat.PCM,
                             source_type=self._source_type,
-                            device_info=str(self._current_device) if self._current_device else "default"
+                            device_info=str(self._current_device) if self._current_device else "default",
+                            sample_format=sample_format
                         )
                         
                         # Add to queue (non-blocking, drop if queue is full)
@@ -231,7 +249,8 @@ class AudioCaptureAdapter:
                                 # Still couldn't add, skip this chunk
                                 pass
                     
-                    time.sleep(0.1)  # Small delay to prevent tight loop
+                    if not streaming:
+                        time.sleep(0.1)  # Small delay to prevent tight loop
                     
                 except Exception as e:
                     self.logger.error(f"Error in recording worker: {e}")
@@ -242,6 +261,7 @@ class AudioCaptureAdapter:
         except Exception as e:
             self.logger.error(f"Recording worker thread failed: {e}")
         finally:
+            self.capture_engine.stop_capture()
             self.logger.debug("Recording worker thread finished")
     
     def get_audio_stream(self) -> Iterator[AudioData]:
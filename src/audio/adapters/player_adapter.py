@@ -1,20 +1,20 @@
 """
 Audio Player Adapter for TalkBridge
 
-Wraps the existing audio player functionality to conform to the AudioPlayerPort interface.
+Wraps a persistent PlaybackEngine output stream to conform to the AudioPlayerPort interface.
 """
 
 import logging
 import asyncio
 import time
 import threading
-from typing import Optional
-import tempfile
-import os
+from typing import Any, Dict, Iterable, Optional, Tuple
 import io
 import wave
 
 from ..ports import AudioPlayerPort, AudioData, AudioFormat
+from ..playback_engine import PlaybackEngine
+from ..resampler import PolyphaseResampler, to_float32
 
 # Import numpy at module level
 try:
@@ -24,13 +24,6 @@ except ImportError:
     np = None
     NUMPY_AVAILABLE = False
 
-try:
-    from ...audio.player import AudioPlayer
-    AUDIO_PLAYER_AVAILABLE = True
-except ImportError:
-    AudioPlayer = None
-    AUDIO_PLAYER_AVAILABLE = False
-
 try:
     import sounddevice as sd
     SOUNDDEVICE_AVAILABLE = True
@@ -38,6 +31,16 @@ except ImportError:
     sd = None
     SOUNDDEVICE_AVAILABLE = False
 
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except (ImportError, OSError):
+    sf = None
+    SOUNDFILE_AVAILABLE = False
+
+# Sample types of WAV files by sample width in bytes
+_WAV_DTYPES = {1: "uint8", 2: "int16", 4: "int32"}
+
 class AudioPlayerAdapter:
     """Adapter that wraps audio player functionality to implement AudioPlayerPort."""
     
@@ -50,49 +53,40 @@ class AudioPlayerAdapter:
         self.logger = logging.getLogger("talkbridge.audio.player_adapter")
         
         self._device = device
-        self._playing = False
+        self._playing = False  # play_stream() running
         self._volume = 1.0
         self._current_thread = None
+        self._effects_chain = None
+        self._stream_stats: Dict[str, Any] = {}
+        self.last_clip = None
         
-        if AUDIO_PLAYER_AVAILABLE and AudioPlayer is not None:
-            try:
-                # Try to initialize AudioPlayer without device parameter first
-                try:
-                    self.audio_player = AudioPlayer()
-                except TypeError:
-                    # If AudioPlayer doesn't accept device parameter, try without it
-                    self.audio_player = AudioPlayer()
-                self._use_audio_player = True
-                self.logger.info("Initialized audio player adapter with AudioPlayer")
-            except Exception as e:
-                self.logger.warning(f"Failed to initialize AudioPlayer: {e}")
-                self._use_audio_player = False
-        else:
-            self._use_audio_player = False
-        
-        if not self._use_audio_player and not SOUNDDEVICE_AVAILABLE:
+        if not SOUNDDEVICE_AVAILABLE or sd is None or not NUMPY_AVAILABLE:
             raise ImportError("No audio player modules available")
         
-        if not self._use_audio_player:
-            self.logger.info("Using sounddevice fallback for audio playback")
+        # One output stream for every clip, opened on the first play()
+        self.engine = PlaybackEngine(device=device, backend=sd)
+        self.logger.info("Initialized audio player adapter with persistent output stream")
     
-    def play(self, audio_data: AudioData) -> bool:
-        """Play audio data."""
-        if self._playing:
-            self.logger.warning("Already playing audio")
-            return False
+    def play(self, audio_data: AudioData, interrupt: bool = False) -> bool:
+        """Queue audio data for playback.
+        
+        Clips queued while another one plays follow it without a gap.
         
+        Args:
+            audio_data: Audio to play
+            interrupt: Stop the current and queued clips first
+        """
         try:
-            self._playing = True
+            samples, sample_rate = self._decode(audio_data)
+            
+            if self._effects_chain is not None:
+                samples = self._apply_effects(samples, sample_rate)
             
-            if self._use_audio_player:
-                return self._play_with_audio_player(audio_data)
-            else:
-                return self._play_with_sounddevice(audio_data)
+            self.last_clip = self.engine.play(samples, sample_rate, interrupt=interrupt)
+            return True
                 
         except Exception as e:
             self.logger.error(f"Audio playback failed: {e}")
-            self._playing = False
             return False
     
     async def play_async(self, audio_data: AudioData) -> bool:
@@ -104,19 +98,13 @@ class AudioPlayerAdapter:
     def stop(self) -> bool:
         """Stop audio playback."""
         try:
-            if not self._playing:
-                return True
-            
-            self._playing = False
-            
-            if self._use_audio_player and hasattr(self.audio_player, 'stop'):
-                self.audio_player.stop()
-            elif SOUNDDEVICE_AVAILABLE and sd is not None:
-                sd.stop()
+            streaming, self._playing = self._playing, False
+            self.engine.stop()
             
-            # Wait for playback thread to finish
-            if self._current_thread and self._current_thread.is_alive():
-                self._current_thread.join(timeout=1.0)
+            if streaming:
+                # Wait for the play_stream thread to finish
+                if self._current_thread and self._current_thread.is_alive():
+                    self._current_thread.join(timeout=1.0)
             
             self.logger.info("Stopped audio playback")
             return True
@@ -125,18 +113,22 @@ class AudioPlayerAdapter:
             self.logger.error(f"Failed to stop audio playback: {e}")
             return False
     
+    def close(self) -> None:
+        """Stop playback and close the output stream."""
+        self.stop()
+        self.engine.close()
+    
     def is_playing(self) -> bool:
         """Check if audio is currently playing."""
-        return self._playing and (self._current_thread is not None and 
-                                 self._current_thread.is_alive())
+        return self.engine.is_playing or (self._playing and self._current_thread is not None
+                                          and self._current_thread.is_alive())
     
     def set_volume(self, volume: float) -> bool:
         """Set playback volume (0.0 to 1.0)."""
         try:
             self._volume = max(0.0, min(1.0, volume))
-            
-            if self._use_audio_player and hasattr(self.audio_player, 'set_volume'):
-                self.audio_player.set_volume(self._volume)
+            # Applied to the output buffer, so it also affects the playing clip
+            self.engine.volume = self._volume
             
             self.logger.info(f"Set volume to {self._volume}")
             return True
@@ -145,183 +137,170 @@ class AudioPlayerAdapter:
             self.logger.error(f"Failed to set volume: {e}")
             return False
     
-    def _play_with_audio_player(self, audio_data: AudioData) -> bool:
-        """Play audio using the AudioPlayer class."""
-        try:
-            # Prepare audio file for AudioPlayer
-            audio_file_path = self._prepare_audio_file(audio_data)
-            
-            def playback_worker():
-                try:
-                    play_method = None
-                    if hasattr(self.audio_player, 'play_file'):
-                        play_method = getattr(self.audio_player, 'play_file', None)
-                    elif hasattr(self.audio_player, 'play'):
-                        play_method = getattr(self.audio_player, 'play', None)
-                    
-                    if play_method is not None:
-                        play_method(audio_file_path)
-                    else:
-                        self.logger.warning("AudioPlayer has no recognized play method")
-                        return
-                    
-                    # Wait for playback to complete
-                    if hasattr(self.audio_player, 'is_playing'):
-                        while self.audio_player.is_playing and self._playing:
-                            time.sleep(0.1)
-                    else:
-                        # Fallback: wait a reasonable time based on audio length
-                        time.sleep(2.0)
-                finally:
-                    self._playing = False
-                    if os.path.exists(audio_file_path):
-                        os.unlink(audio_file_path)
-            
-            # Start playback in separate thread
-            self._current_thread = threading.Thread(target=playback_worker, daemon=True)
-            self._current_thread.start()
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"AudioPlayer playback failed: {e}")
-            self._playing = False
-            return False
+    def get_playback_stats(self) -> Dict[str, Any]:
+        """Statistics of the output stream, including per-clip latency
+        from play() to the first sample written to the device."""
+        return self.engine.get_stats()
     
-    def _play_with_sounddevice(self, audio_data: AudioData) -> bool:
-        """Play audio using sounddevice fallback."""
-        if not SOUNDDEVICE_AVAILABLE or sd is None:
+    def play_stream(self, chunks: Iterable, sample_rate: int) -> bool:
+        """Play mono float32 chunks as they arrive, without a file round-trip.
+        
+        Each chunk is queued on the adapter's output stream as soon as it
+        arrives and follows the previous one without a gap, so a
+        SynthesisStream synthesizes the next sentence while the current one
+        plays. Volume, stop() and playback stats apply as for play().
+        Chunks are consumed on a background thread; timing of the last
+        stream is available from get_stream_stats().
+        
+        Args:
+            chunks: Iterable of mono float32 arrays (e.g. a SynthesisStream)
+            sample_rate: Sample rate of the chunks
+        """
+        if self._playing:
+            self.logger.warning("Already playing audio")
             return False
         
-        try:
-            # Convert audio data to numpy array
-            audio_array = self._audio_data_to_numpy(audio_data)
-            
-            def playback_worker():
-                try:
-                    # Apply volume
-                    if self._volume != 1.0:
-                        audio_array_vol = audio_array * self._volume
-                    else:
-                        audio_array_vol = audio_array
+        self._playing = True
+        start_time = time.perf_counter()
+        stats: Dict[str, Any] = {
+            'chunks': 0,
+            'samples': 0,
+            'time_to_first_audio': None,
+            'underruns': 0,
+            'elapsed': 0.0
+        }
+        self._stream_stats = stats
+        
+        effects_chain = self._effects_chain
+        if effects_chain is not None and effects_chain.sample_rate != sample_rate:
+            self.logger.warning(f"Effects chain runs at {effects_chain.sample_rate} Hz, "
+                                f"stream is {sample_rate} Hz; playing unprocessed")
+            effects_chain = None
+        
+        # Resample statefully so chunk boundaries stay seamless on a stream at another rate
+        output_rate = self.engine.sample_rate or sample_rate
+        resampler = PolyphaseResampler(sample_rate, output_rate) if output_rate != sample_rate else None
+        
+        def playback_worker():
+            last_clip = None
+            try:
+                for chunk in chunks:
+                    if not self._playing:
+                        break
+                    if last_clip is not None and last_clip.done.is_set():
+                        # The next chunk arrived after the previous one finished
+                        stats['underruns'] += 1
                     
-                    # Play audio
-                    if sd is not None:
-                        sd.play(
-                            audio_array_vol,
-                            samplerate=audio_data.sample_rate,
-                            device=self._device,
-                            channels=audio_data.channels
-                        )
-                        
-                        # Wait for playback to complete
-                        sd.wait()
+                    audio = np.asarray(chunk, dtype=np.float32).reshape(-1)
+                    stats['chunks'] += 1
+                    stats['samples'] += len(audio)
+                    if effects_chain is not None:
+                        audio = effects_chain.process_array(audio).astype(np.float32)
+                    if resampler is not None:
+                        audio = resampler.process(audio)
+                        if not audio.size:
+                            continue
                     
-                finally:
-                    self._playing = False
-            
-            # Start playback in separate thread
-            self._current_thread = threading.Thread(target=playback_worker, daemon=True)
-            self._current_thread.start()
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Sounddevice playback failed: {e}")
-            self._playing = False
-            return False
-    
-    def _prepare_audio_file(self, audio_data: AudioData) -> str:
-        """Prepare audio data as a temporary file."""
-        try:
-            # Create temporary file with appropriate extension
-            if audio_data.format == AudioFormat.WAV:
-                suffix = '.wav'
-            elif audio_data.format == AudioFormat.MP3:
-                suffix = '.mp3'
-            elif audio_data.format == AudioFormat.FLAC:
-                suffix = '.flac'
-            else:
-                suffix = '.wav'  # Default to WAV
-            
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                if audio_data.format == AudioFormat.PCM:
-                    # Convert PCM to WAV format
-                    wav_data = self._pcm_to_wav(
-                        audio_data.data,
-                        audio_data.sample_rate,
-                        audio_data.channels
-                    )
-                    temp_file.write(wav_data)
-                else:
-                    # Write raw audio data for other formats
-                    temp_file.write(audio_data.data)
-                
-                return temp_file.name
+                    last_clip = self.engine.play(audio, output_rate)
+                    if stats['time_to_first_audio'] is None:
+                        stats['time_to_first_audio'] = time.perf_counter() - start_time
                 
-        except Exception as e:
-            self.logger.error(f"Failed to prepare audio file: {e}")
-            raise
+                if resampler is not None and self._playing:
+                    last_clip = self.engine.play(resampler.process(np.zeros(resampler.taps, np.float32)),
+                                                 output_rate)
+                while last_clip is not None and self._playing and not last_clip.wait(0.05):
+                    pass
+            except Exception as e:
+                self.logger.error(f"Streaming playback failed: {e}")
+            finally:
+                if hasattr(chunks, 'cancel'):
+                    chunks.cancel()
+                if hasattr(chunks, 'get_stats'):
+                    stats['synthesis'] = chunks.get_stats()
+                stats['elapsed'] = time.perf_counter() - start_time
+                self._playing = False
+        
+        self._current_thread = threading.Thread(target=playback_worker, daemon=True)
+        self._current_thread.start()
+        return True
     
-    def _audio_data_to_numpy(self, audio_data: AudioData):
-        """Convert AudioData to numpy array for sounddevice."""
-        if not NUMPY_AVAILABLE or np is None:
-            raise RuntimeError("NumPy not available for audio processing")
-            
-        try:
-            if audio_data.format == AudioFormat.PCM:
-                # Convert PCM bytes to numpy array
-                audio_array = np.frombuffer(audio_data.data, dtype=np.int16)
-                # Normalize to [-1, 1] range
-                audio_array = audio_array.astype(np.float32) / 32768.0
-            else:
-                # For other formats, try to convert via WAV
-                wav_data = self._pcm_to_wav(
-                    audio_data.data,
-                    audio_data.sample_rate,
-                    audio_data.channels
-                )
-                
-                # Read WAV data
-                with io.BytesIO(wav_data) as wav_buffer:
-                    with wave.open(wav_buffer, 'rb') as wav_file:
-                        frames = wav_file.readframes(wav_file.getnframes())
-                        audio_array = np.frombuffer(frames, dtype=np.int16)
-                        audio_array = audio_array.astype(np.float32) / 32768.0
-            
-            # Reshape for multi-channel audio
-            if audio_data.channels > 1:
-                audio_array = audio_array.reshape(-1, audio_data.channels)
-            
-            return audio_array
-            
-        except Exception as e:
-            self.logger.error(f"Failed to convert audio data to numpy: {e}")
-            raise
+    def get_stream_stats(self) -> Dict[str, Any]:
+        """Timing of the last play_stream() call.
+        
+        time_to_first_audio is measured from the play_stream() call to the
+        first chunk queued on the output stream; underruns counts chunks that
+        arrived after the previous one had finished playing. For a
+        SynthesisStream, its own statistics (synthesis TTFA and real-time
+        factor) are included under 'synthesis'.
+        """
+        return dict(self._stream_stats)
+    
+    def set_effects_chain(self, effects_chain) -> None:
+        """Process played audio through a streaming EffectsChain (None disables).
+        
+        The chain keeps its state between play() calls, so reverb and delay
+        tails carry over from one utterance into the next.
+        """
+        self._effects_chain = effects_chain
     
-    def _pcm_to_wav(self, pcm_data: bytes, sample_rate: int, channels: int) -> bytes:
-        """Convert PCM data to WAV format."""
+    def _apply_effects(self, samples, sample_rate: int):
+        """Run mono float32 audio through the effects chain."""
+        if samples.shape[1] != 1:
+            self.logger.warning("Effects chain only supports mono audio, playing unprocessed")
+            return samples
+        if sample_rate != self._effects_chain.sample_rate:
+            self.logger.warning(f"Effects chain runs at {self._effects_chain.sample_rate} Hz, "
+                                f"audio is {sample_rate} Hz; playing unprocessed")
+            return samples
+        
+        processed = self._effects_chain.process_array(samples[:, 0])
+        return np.clip(processed, -1.0, 1.0).astype(np.float32)[:, None]
+    
+    def _decode(self, audio_data: AudioData) -> Tuple[Any, int]:
+        """Decode AudioData once into float32 samples of shape (frames, channels).
+        
+        PCM is read as described by its sample format (16-bit if not given);
+        float32 PCM is viewed in place without a copy. Integer WAV files are
+        read with the wave module; float WAVs, MP3 and FLAC go through
+        soundfile.
+        
+        Returns:
+            (samples, sample rate)
+        """
+        if audio_data.format == AudioFormat.PCM:
+            sample_format = audio_data.pcm_format
+            dtype = np.dtype(sample_format.dtype)
+            raw = np.frombuffer(audio_data.data, dtype=dtype,
+                                count=memoryview(audio_data.data).nbytes // dtype.itemsize)
+            channels, sample_rate = sample_format.channels, sample_format.sample_rate
+        else:
+            decoded = self._read_wav(audio_data) if audio_data.format == AudioFormat.WAV else None
+            if decoded is None:
+                return self._read_soundfile(audio_data)
+            raw, channels, sample_rate = decoded
+        
+        samples = to_float32(raw)
+        frames = samples.size // channels
+        return samples[:frames * channels].reshape(frames, channels), sample_rate
+    
+    def _read_wav(self, audio_data: AudioData) -> Optional[Tuple[Any, int, int]]:
+        """Read an integer PCM WAV file; None if the wave module cannot read it."""
         try:
-            import wave
-            
-            # Create WAV file in memory
-            wav_buffer = io.BytesIO()
-            
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(channels)
-                wav_file.setsampwidth(2)  # 16-bit samples
-                wav_file.setframerate(sample_rate)
-                
-                # Convert bytes to 16-bit samples if needed
-                if len(pcm_data) % 2 != 0:
-                    pcm_data = pcm_data[:-1]  # Remove odd byte
-                
-                wav_file.writeframes(pcm_data)
-            
-            wav_buffer.seek(0)
-            return wav_buffer.read()
-            
-        except Exception as e:
-            self.logger.error(f"PCM to WAV conversion failed: {e}")
-            return pcm_data  # Return original data as fallback
\ No newline at end of file
+            with wave.open(io.BytesIO(audio_data.data), 'rb') as wav_file:
+                sample_width = wav_file.getsampwidth()
+                if sample_width not in _WAV_DTYPES:
+                    return None
+                frames = wav_file.readframes(wav_file.getnframes())
+                return (np.frombuffer(frames, dtype=_WAV_DTYPES[sample_width]),
+                        wav_file.getnchannels(), wav_file.getframerate())
+        except (wave.Error, EOFError):
+            # Float and WAVE_FORMAT_EXTENSIBLE files
+            return None
+    
+    def _read_soundfile(self, audio_data: AudioData) -> Tuple[Any, int]:
+        """Decode a compressed or float audio file with soundfile."""
+        if not SOUNDFILE_AVAILABLE or sf is None:
+            raise ValueError(f"Cannot decode {audio_data.format.value} audio for playback: "
+                             f"soundfile not available")
+        samples, sample_rate = sf.read(io.BytesIO(audio_data.data), dtype='float32', always_2d=True)
+        return samples, sample_rate
@@ -11,15 +11,22 @@ from typing import Optional, List, Iterator, Dict, Any
 import io
 import tempfile
 import os
+import numpy as np
 
 from ..ports import STTPort, AudioData, TranscriptionResult, AudioFormat
 from ...utils.language_utils import get_supported_languages
 
 try:
     from ...stt.whisper_engine import WhisperEngine
+    from ...stt.audio_utils import pcm_to_float32, decode_audio_bytes
+    from ...stt.streaming import StreamingTranscriber, StreamingUpdate
     WHISPER_AVAILABLE = True
 except ImportError:
     WhisperEngine = None
+    pcm_to_float32 = None
+    decode_audio_bytes = None
+    StreamingTranscriber = None
+    StreamingUpdate = None
     WHISPER_AVAILABLE = False
 
 class WhisperSTTAdapter:
@@ -51,14 +58,15 @@ class WhisperSTTAdapter:
         start_time = time.time()
         
         try:
-            # Convert AudioData to format expected by WhisperEngine
-            audio_file_path = self._prepare_audio_file(audio_data)
+            # Convert AudioData to an in-memory array (or a temp file as a last resort)
+            audio_input, sample_rate, audio_file_path = self._prepare_audio_input(audio_data)
             
             try:
                 # Use WhisperEngine's transcribe method
                 result = self.whisper_engine.transcribe(
-                    audio_file_path,
-                    language=audio_data.language_hint or self._current_language
+                    audio_input,
+                    language=audio_data.language_hint or self._current_language,
+                    sample_rate=sample_rate
                 )
                 
                 # Extract text and language from result
@@ -87,7 +95,7 @@ class WhisperSTTAdapter:
                 
             finally:
                 # Clean up temporary file
-                if os.path.exists(audio_file_path):
+                if audio_file_path and os.path.exists(audio_file_path):
                     os.unlink(audio_file_path)
                     
         except Exception as e:
@@ -107,14 +115,55 @@ class WhisperSTTAdapter:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.transcribe, audio_data)
     
+    def create_stream(self, language: Optional[str] = None, **options) -> "StreamingTranscriber":
+        """Create an incremental transcription session for one audio source.
+        
+        Args:
+            language: Expected language (defaults to the adapter language)
+            **options: StreamingTranscriber options (step_seconds, max_window_seconds, ...)
+        """
+        return StreamingTranscriber(self.whisper_engine,
+                                    language=language or self._current_language,
+                                    **options)
+    
     def transcribe_stream(self, audio_stream: Iterator[AudioData]) -> Iterator[TranscriptionResult]:
-        """Transcribe streaming audio data."""
-        for audio_chunk in audio_stream:
-            # For streaming, we could implement buffering or sliding window
-            # For now, transcribe each chunk individually
-            result = self.transcribe(audio_chunk)
-            if result.text.strip():  # Only yield non-empty results
-                yield result
+        """Transcribe streaming audio data incrementally.
+        
+        Audio is decoded over a sliding window; words confirmed by two
+        consecutive hypotheses are committed and only the unstable tail is
+        re-decoded. A partial result is yielded after every decode step and a
+        final result once the stream ends.
+        """
+        stream = self.create_stream()
+        try:
+            for audio_chunk in audio_stream:
+                samples, sample_rate = self._to_array(audio_chunk)
+                if samples is None:
+                    self.logger.warning(f"Skipping {audio_chunk.format.value} chunk that cannot be streamed")
+                    continue
+                if samples.ndim > 1:
+                    samples = samples.mean(axis=1)
+                update = stream.push(samples, sample_rate)
+                if update is not None and update.text:
+                    yield self._update_to_result(update)
+            
+            final = stream.finish()
+            if final.text:
+                yield self._update_to_result(final)
+        except Exception as e:
+            self.logger.error(f"Streaming transcription failed: {e}")
+            raise
+    
+    def _update_to_result(self, update: "StreamingUpdate") -> TranscriptionResult:
+        """Convert a streaming update to a TranscriptionResult."""
+        return TranscriptionResult(
+            text=update.text,
+            language=update.language,
+            confidence=1.0,
+            processing_time=update.processing_time,
+            is_partial=not update.is_final,
+            stable_text=update.committed_text
+        )
     
     def set_language(self, language: str) -> bool:
         """Set the expected language for transcription."""
@@ -134,6 +183,47 @@ class WhisperSTTAdapter:
         """Check if the STT engine is ready."""
         return self.whisper_engine is not None
     
+    def _to_array(self, audio_data: AudioData):
+        """Decode AudioData into a float32 array in memory.
+        
+        Returns:
+            Tuple of (samples, sample rate), or (None, sample rate) if the
+            format cannot be decoded in memory
+        """
+        if audio_data.format == AudioFormat.PCM:
+            sample_format = audio_data.pcm_format
+            if sample_format.dtype == "float32":
+                # Pipeline audio is already float32; view it without converting
+                view = audio_data.view
+                samples = np.frombuffer(view, dtype=np.float32, count=view.nbytes // 4)
+                if sample_format.channels > 1:
+                    samples = samples[:samples.size - samples.size % sample_format.channels]
+                    samples = samples.reshape(-1, sample_format.channels)
+                return samples, sample_format.sample_rate
+            return (pcm_to_float32(audio_data.view, sample_format.channels, sample_format.sample_width),
+                    sample_format.sample_rate)
+        
+        if audio_data.format != AudioFormat.MP3:
+            decoded = decode_audio_bytes(audio_data.view)
+            if decoded is not None:
+                return decoded
+        
+        return None, audio_data.sample_rate
+    
+    def _prepare_audio_input(self, audio_data: AudioData):
+        """Prepare audio for WhisperEngine, avoiding the disk where possible.
+        
+        Returns:
+            Tuple of (audio array or file path, sample rate, temp file path or None)
+        """
+        samples, sample_rate = self._to_array(audio_data)
+        if samples is not None:
+            return samples, sample_rate, None
+        
+        # Formats that cannot be decoded in memory go through ffmpeg via a file
+        audio_file_path = self._prepare_audio_file(audio_data)
+        return audio_file_path, audio_data.sample_rate, audio_file_path
+    
     def _prepare_audio_file(self, audio_data: AudioData) -> str:
         """Prepare audio data as a temporary file for WhisperEngine."""
         try:
@@ -159,7 +249,7 @@ class WhisperSTTAdapter:
                     temp_file.write(wav_data)
                 else:
                     # Write raw audio data for other formats
-                    temp_file.write(audio_data.data)
+                    temp_file.write(audio_data.view)
                 
                 return temp_file.name
                 
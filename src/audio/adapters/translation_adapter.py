@@ -2,12 +2,16 @@
 Translation Adapter for TalkBridge
 
 Wraps the existing Translator class to conform to the TranslationPort interface.
+Offline models (argos-translate / MarianMT) are used first when installed; they
+come from the process-wide translation model registry, so every adapter shares
+the same loaded models. The Ollama Translator is the fallback.
 """
 
 import logging
 import asyncio
+import threading
 import time
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from ..ports import TranslationPort, TranslationResult
 from ...utils.language_utils import get_supported_languages
@@ -19,6 +23,21 @@ except ImportError:
     Translator = None
     TRANSLATOR_AVAILABLE = False
 
+try:
+    from ...translation.offline_translator import (
+        get_offline_translator, get_translation_batcher, preload_translation_models
+    )
+    from ...translation.model_registry import get_model_registry
+    from ...translation.translation_memory import get_translation_memory
+    OFFLINE_TRANSLATION_AVAILABLE = True
+except ImportError:
+    get_offline_translator = None
+    get_translation_batcher = None
+    preload_translation_models = None
+    get_model_registry = None
+    get_translation_memory = None
+    OFFLINE_TRANSLATION_AVAILABLE = False
+
 class TranslationAdapter:
     """Adapter that wraps Translator to implement TranslationPort."""
     
@@ -26,27 +45,89 @@ class TranslationAdapter:
         """Initialize the translation adapter.
         
         Args:
-            service: Translation service to use ("google", "deepl", etc.)
+            service: Translation service to use. "offline" only uses the offline
+                models, "ollama" only the Ollama Translator; any other value
+                uses offline models first and falls back to Ollama.
         """
         self.logger = logging.getLogger("talkbridge.audio.translation_adapter")
         
-        if not TRANSLATOR_AVAILABLE or Translator is None:
+        self.offline_translator = None
+        if service != "ollama" and OFFLINE_TRANSLATION_AVAILABLE and get_offline_translator is not None:
+            try:
+                offline_translator = get_offline_translator()
+                if offline_translator.is_available():
+                    self.offline_translator = offline_translator
+            except Exception as e:
+                self.logger.warning(f"Offline translation unavailable: {e}")
+        
+        use_translator = service != "offline" and TRANSLATOR_AVAILABLE and Translator is not None
+        if self.offline_translator is None and not use_translator:
             raise ImportError("Translator module not available")
         
         try:
-            self.translator = Translator()  # Use default config_path
+            self.translator = Translator() if use_translator else None  # Use default config_path
             self._service = service
             self._supported_languages = get_supported_languages('translation')
             self.logger.info(f"Initialized translation adapter with service: {service}")
         except Exception as e:
             self.logger.error(f"Failed to initialize Translator: {e}")
             raise
+        
+        # Load the configured language pairs without delaying startup
+        if self.offline_translator is not None and preload_translation_models is not None:
+            threading.Thread(target=preload_translation_models, name="translation-preload",
+                             daemon=True).start()
+    
+    def _translate_offline(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Translate with the shared offline models; None if no model handles the pair."""
+        if self.offline_translator is None or source_lang == 'auto':
+            return None
+        try:
+            # Repeated phrases come straight from the translation memory
+            cached = self.offline_translator.lookup_memory(text, source_lang, target_lang)
+            if cached is not None:
+                return cached
+            if get_translation_batcher is not None:
+                # Share a batch with other pipeline workers and web requests
+                return get_translation_batcher().translate(
+                    text, source_lang, target_lang,
+                    translate_batch=self.offline_translator.translate_batch) or None
+            return self.offline_translator.translate(text, source_lang, target_lang) or None
+        except Exception as e:
+            self.logger.debug(f"Offline translation unavailable for {source_lang}-{target_lang}: {e}")
+            return None
+    
+    def get_model_stats(self) -> Dict[str, Any]:
+        """Get statistics of the shared model registry, batcher and translation memory."""
+        if get_model_registry is None:
+            return {}
+        stats = get_model_registry().get_stats()
+        if get_translation_batcher is not None:
+            stats["batching"] = get_translation_batcher().get_stats()
+        if get_translation_memory is not None:
+            memory = get_translation_memory()
+            stats["memory"] = memory.get_stats() if memory is not None else None
+        return stats
     
     def translate(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
         """Translate text from source to target language."""
         start_time = time.time()
         
         try:
+            offline_text = self._translate_offline(text, source_lang, target_lang)
+            if offline_text is not None:
+                return TranslationResult(
+                    original_text=text,
+                    translated_text=offline_text,
+                    source_language=source_lang,
+                    target_language=target_lang,
+                    confidence=1.0,
+                    processing_time=time.time() - start_time
+                )
+            
+            if self.translator is None:
+                raise RuntimeError(f"No offline model for {source_lang}-{target_lang}")
+            
             # Use Translator's translate method
             result = self.translator.translate(
                 text=text,
@@ -57,7 +138,14 @@ class TranslationAdapter:
             processing_time = time.time() - start_time
             
             # Handle different result formats
-            if isinstance(result, dict):
+            if isinstance(result, tuple):
+                # Translator returns (translation, latency); translation is None on failure
+                if not result or result[0] is None:
+                    raise RuntimeError("Translator returned no translation")
+                translated_text = result[0]
+                detected_lang = source_lang
+                confidence = 1.0
+            elif isinstance(result, dict):
                 translated_text = result.get('translated_text', result.get('text', ''))
                 detected_lang = result.get('detected_language', source_lang)
                 confidence = result.get('confidence', 1.0)
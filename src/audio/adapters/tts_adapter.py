@@ -14,11 +14,12 @@ from ..ports import TTSPort, SynthesisResult, AudioFormat
 from ...utils.language_utils import get_supported_languages
 
 try:
-    from ...tts.synthesizer import synthesize_voice
+    from ...tts.synthesizer import synthesize_voice, synthesize_stream
     TTS_AVAILABLE = True
 except Exception:
     # Handle case where module or function doesn't exist
     synthesize_voice = None
+    synthesize_stream = None
     TTS_AVAILABLE = False
 
 class TTSAdapter:
@@ -100,6 +101,22 @@ class TTSAdapter:
                 processing_time=processing_time
             )
     
+    def synthesize_stream(self, text: str, language: str = "en", voice: Optional[str] = None):
+        """Synthesize speech sentence by sentence.
+        
+        Returns a SynthesisStream of mono float32 chunks (its sample_rate
+        attribute gives the rate) to pass to AudioPlayerAdapter.play_stream(),
+        which plays each sentence while the next one is synthesized.
+        """
+        if synthesize_stream is None:
+            raise RuntimeError("TTS streaming synthesis not available")
+        
+        return synthesize_stream(
+            text=text,
+            language=language,
+            clone_voice=False  # Use default voice for now
+        )
+    
     async def synthesize_async(self, text: str, language: str = "en", voice: Optional[str] = None) -> SynthesisResult:
         """Synthesize speech from text asynchronously."""
         # Run synthesis in thread pool to avoid blocking
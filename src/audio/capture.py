@@ -24,6 +24,9 @@ Functions:
 - record_fixed_duration: Record audio for a fixed duration.
 - record_audio: Record audio for a fixed duration and save to file.
 - get_audio_buffer: Get the current audio buffer and clear it.
+- start_streaming: Open a persistent capture stream for gapless frames.
+- read_frame: Read the next fixed-size frame from the capture stream.
+- stop_capture: Stop the capture stream and any input stream.
 - stop: Stop audio capture.
 ======================================================================
 """
@@ -36,6 +39,8 @@ import subprocess
 from typing import Optional, Callable, Dict, Any, List, Tuple
 from ..logging_config import get_logger
 from ..utils.error_handler import handle_error, retry_with_backoff, RetryableError, CriticalError
+from .capture_stream import CaptureStream
+from .device_registry import AudioDevice, get_device_registry
 
 logger = get_logger(__name__)
 
@@ -69,6 +74,15 @@ def _safe_device_access(devices: Any, index: int) -> Any:
         pass
     return {}
 
+def _lookup_device(device: Any = None) -> Optional[AudioDevice]:
+    """Look up a device by index or name in the device registry (default input for None)."""
+    registry = get_device_registry()
+    if device is None:
+        return registry.get(registry.default_input)
+    if isinstance(device, str):
+        return registry.find(device)
+    return registry.get(device)
+
 class AudioCapture:
     def __init__(self, sample_rate=None, channels=1, device=None, loopback_mode=False):
         # Validate and set device
@@ -78,23 +92,17 @@ class AudioCapture:
         # Enhanced device logging
         logger.info(f"Initializing AudioCapture with device={device}, loopback_mode={loopback_mode}")
         
-        # Log detailed device information
-        try:
-            if device is not None:
-                device_info = sd.query_devices(device)
-                device_name = _safe_device_attr(device_info, 'name', 'Unknown')
-                inputs = _safe_device_attr(device_info, 'max_input_channels', 0)
-                outputs = _safe_device_attr(device_info, 'max_output_channels', 0)
-                default_sr = _safe_device_attr(device_info, 'default_samplerate', 'Unknown')
-                logger.info(f"Selected device {device}: {device_name} "
-                          f"(inputs: {inputs}, outputs: {outputs}, default_sr: {default_sr})")
-            else:
-                default_device = sd.query_devices(kind='input')
-                device_name = _safe_device_attr(default_device, 'name', 'Unknown')
-                inputs = _safe_device_attr(default_device, 'max_input_channels', 0)
-                logger.info(f"Using default input device: {device_name} (inputs: {inputs})")
-        except Exception as e:
-            logger.warning(f"Could not query device information: {e}")
+        # Log detailed device information from the registry (no re-enumeration)
+        device_info = _lookup_device(device)
+        if device_info is None:
+            logger.warning(f"Device {device} not found in the device registry")
+        elif device is not None:
+            logger.info(f"Selected device {device}: {device_info.name} "
+                      f"(inputs: {device_info.max_input_channels}, outputs: {device_info.max_output_channels}, "
+                      f"default_sr: {device_info.default_samplerate})")
+        else:
+            logger.info(f"Using default input device: {device_info.name} "
+                      f"(inputs: {device_info.max_input_channels})")
         
         # Auto-detect optimal sample rate if not provided
         if sample_rate is None:
@@ -111,34 +119,11 @@ class AudioCapture:
         self.sample_rate = sample_rate
         self.channels = channels
         self.stream = None
+        self.capture_stream: Optional[CaptureStream] = None
         self.is_recording = False
         self.audio_buffer = []
         
         logger.info(f"AudioCapture initialized successfully - sample_rate={self.sample_rate}, channels={self.channels}, device={self.device}, loopback_mode={self.loopback_mode}")
-        
-        # Test device accessibility
-        try:
-            test_frames = int(0.01 * self.sample_rate)  # 10ms test
-            test_recording = sd.rec(
-                test_frames,
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=np.float32,
-                device=self.device
-            )
-            sd.wait()
-            logger.info(f"Device access test successful - recorded {len(test_recording)} frames")
-        except Exception as e:
-            logger.error(f"Device access test failed: {e}. Voice input may not work properly.")
-            # Log system audio info for debugging
-            try:
-                logger.debug(f"Available audio devices: {len(sd.query_devices())}")
-                input_device = sd.query_devices(kind='input')
-                output_device = sd.query_devices(kind='output')
-                logger.debug(f"Default input device: {_safe_device_attr(input_device, 'name', 'Unknown')}")
-                logger.debug(f"Default output device: {_safe_device_attr(output_device, 'name', 'Unknown')}")
-            except Exception as e:
-                logger.debug(f"Could not query audio device information: {e}")
 
     def initialize_device_by_index(self, device_index: int | str | None = "auto", samplerate: int = 44100, channels: int = 1) -> bool:
         """
@@ -242,29 +227,29 @@ class AudioCapture:
         system = platform.system().lower()
         
         try:
-            devices = sd.query_devices()
+            devices = get_device_registry().devices()
             
             if system == "windows":
                 # Windows WASAPI loopback devices
-                for i, device_info in enumerate(devices):
-                    device_name = _safe_device_attr(device_info, 'name', '').lower()
+                for device_info in devices:
+                    device_name = device_info.name.lower()
                     
                     # Look for output devices that support loopback
-                    max_output_channels = _safe_device_attr(device_info, 'max_output_channels', 0)
-                    if isinstance(max_output_channels, (int, float)) and max_output_channels > 0:
+                    max_output_channels = device_info.max_output_channels
+                    if max_output_channels > 0:
                         # Common Windows output device names
                         if any(keyword in device_name for keyword in [
                             'speakers', 'headphones', 'output', 'realtek', 
                             'audio', 'sound', 'stereo mix', 'what u hear'
                         ]):
                             loopback_devices.append({
-                                'index': i,
-                                'name': _safe_device_attr(device_info, 'name', 'Unknown'),
+                                'index': device_info.index,
+                                'name': device_info.name,
                                 'platform': 'windows',
                                 'type': 'wasapi_loopback',
                                 'channels': max_output_channels,
-                                'sample_rate': _safe_device_attr(device_info, 'default_samplerate', 44100),
-                                'hostapi': _safe_device_attr(device_info, 'hostapi', None)
+                                'sample_rate': device_info.default_samplerate,
+                                'hostapi': device_info.hostapi
                             })
                             
             elif system == "linux":
@@ -294,34 +279,34 @@ class AudioCapture:
                     logger.warning(f"Failed to query PulseAudio sources: {e}")
                 
                 # Also check sounddevice for monitor devices
-                for i, device_info in enumerate(devices):
-                    device_name = _safe_device_attr(device_info, 'name', '').lower()
+                for device_info in devices:
+                    device_name = device_info.name.lower()
                     if 'monitor' in device_name or 'loopback' in device_name:
                         loopback_devices.append({
-                            'index': i,
-                            'name': _safe_device_attr(device_info, 'name', 'Unknown'),
+                            'index': device_info.index,
+                            'name': device_info.name,
                             'platform': 'linux',
                             'type': 'alsa_monitor',
-                            'channels': _safe_device_attr(device_info, 'max_input_channels', 2),
-                            'sample_rate': _safe_device_attr(device_info, 'default_samplerate', 44100),
-                            'hostapi': _safe_device_attr(device_info, 'hostapi', None)
+                            'channels': device_info.max_input_channels,
+                            'sample_rate': device_info.default_samplerate,
+                            'hostapi': device_info.hostapi
                         })
                         
             elif system == "darwin":  # macOS
                 # macOS virtual audio devices
-                for i, device_info in enumerate(devices):
-                    device_name = _safe_device_attr(device_info, 'name', '').lower()
+                for device_info in devices:
+                    device_name = device_info.name.lower()
                     if any(keyword in device_name for keyword in [
                         'blackhole', 'soundflower', 'loopback', 'virtual'
                     ]):
                         loopback_devices.append({
-                            'index': i,
-                            'name': _safe_device_attr(device_info, 'name', 'Unknown'),
+                            'index': device_info.index,
+                            'name': device_info.name,
                             'platform': 'macos',
                             'type': 'virtual_audio',
-                            'channels': _safe_device_attr(device_info, 'max_input_channels', 2),
-                            'sample_rate': _safe_device_attr(device_info, 'default_samplerate', 44100),
-                            'hostapi': _safe_device_attr(device_info, 'hostapi', None)
+                            'channels': device_info.max_input_channels,
+                            'sample_rate': device_info.default_samplerate,
+                            'hostapi': device_info.hostapi
                         })
             
             logger.info(f"Found {len(loopback_devices)} loopback devices on {system}")
@@ -523,11 +508,10 @@ class AudioCapture:
     def _get_optimal_sample_rate(self, device=None):
         """Get the optimal sample rate for the specified device."""
         try:
+            device_info = _lookup_device(device)
             if device is None:
-                device = sd.default.device[0]  # Default input device
-            
-            device_info = sd.query_devices(device)
-            default_rate = int(_safe_device_attr(device_info, 'default_samplerate', 44100))
+                device = device_info.index if device_info is not None else None
+            default_rate = int(device_info.default_samplerate) if device_info is not None else 44100
             
             # Common sample rates to test in order of preference
             preferred_rates = [44100, 48000, 22050, 16000, 8000]
@@ -879,12 +863,66 @@ class AudioCapture:
         self.audio_buffer.clear()
         return audio_data
 
+    def start_streaming(self, frame_duration: float = 0.1, buffer_duration: float = 2.0,
+                        backend: Any = None) -> bool:
+        """
+        Open a persistent capture stream for gapless frames.
+
+        The device stays open and its callback fills a ring buffer, so
+        capture_chunk() and read_frame() return consecutive int16 frames
+        instead of separate recordings with gaps between them.
+
+        Args:
+            frame_duration: Duration of the frames returned by read_frame()
+            buffer_duration: Audio the ring can hold while the reader is busy
+            backend: Module providing InputStream (default: sounddevice)
+
+        Returns:
+            bool: True if the stream is running
+        """
+        if self.capture_stream is not None and self.capture_stream.is_active:
+            return True
+        self.capture_stream = CaptureStream(
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+            device=self.device,
+            frame_duration=frame_duration,
+            buffer_duration=buffer_duration,
+            backend=backend if backend is not None else sd,
+        )
+        if not self.capture_stream.start():
+            self.capture_stream = None
+            return False
+        self.is_recording = True
+        return True
+
+    @property
+    def is_streaming(self) -> bool:
+        """True while a capture stream is running."""
+        return self.capture_stream is not None and self.capture_stream.is_active
+
+    def read_frame(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Read the next fixed-size frame from the capture stream.
+
+        Args:
+            timeout: Seconds to wait for the frame (None waits forever)
+
+        Returns:
+            Optional[np.ndarray]: Interleaved int16 samples, or None on
+            timeout or when no stream is running
+        """
+        if self.capture_stream is None:
+            return None
+        return self.capture_stream.read_frame(timeout)
+
     def capture_chunk(self, duration: float = 0.1) -> Optional[np.ndarray]:
         """
         Capture one audio chunk from the device for real-time processing.
         
         This method is used by the pipeline manager for continuous audio capture
-        and processing. It internally uses the record_chunk method.
+        and processing. It reads from the capture stream when one is running
+        and otherwise records the chunk with record_chunk.
         
         Args:
             duration: Duration in seconds to capture (default: 0.1s)
@@ -893,6 +931,10 @@ class AudioCapture:
             Optional[np.ndarray]: Audio data chunk or None if capture fails
         """
         try:
+            if self.is_streaming:
+                frames = max(1, int(round(duration * self.sample_rate)))
+                return self.capture_stream.read(frames, timeout=duration + 1.0)
+
             # Use the existing record_chunk implementation
             audio_data = self.record_chunk(duration=duration, sample_rate=self.sample_rate)
             
@@ -908,8 +950,16 @@ class AudioCapture:
             logger.error(f"Failed to capture audio chunk: {e}")
             return None
 
+    def stop_capture(self):
+        """Stop the capture stream and any input stream."""
+        self.stop()
+
     def stop(self):
         """Stop audio capture."""
+        if self.capture_stream is not None:
+            self.capture_stream.stop()
+            self.capture_stream = None
+            self.is_recording = False
         if self.stream:
             self.stream.stop()
             self.stream.close()
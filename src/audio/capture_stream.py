@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Capture Stream
+=================================
+
+Persistent callback-driven input stream with a lock-free frame ring
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- sounddevice
+- numpy
+======================================================================
+Classes:
+- CaptureRingBuffer: Single-producer/single-consumer ring of PCM frames.
+- CaptureStream: One open sd.InputStream per source feeding a CaptureRingBuffer.
+======================================================================
+
+Opening a PortAudio stream for every chunk (sd.rec + sd.wait) loses the
+audio that arrives between two recordings and pays the stream setup cost
+each time. A CaptureStream opens the device once; PortAudio's callback
+copies every block into the ring, and consumers pull fixed-size frames from
+it. Frames are consecutive in time: a frame's capture time is the stream
+start plus the number of frames read before it.
+
+The ring needs no lock: only the callback moves the write position and only
+the consumer moves the read position. When the consumer falls behind and
+the ring is full, new samples are dropped and counted instead of
+overwriting audio that is being read.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+from ..logging_config import get_logger
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    sd = None
+    SOUNDDEVICE_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+
+class CaptureRingBuffer:
+    """
+    Single-producer/single-consumer ring of PCM frames.
+
+    Args:
+        capacity: Capacity in frames
+        channels: Number of interleaved channels
+        dtype: Sample type
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype=np.int16):
+        self.capacity = max(1, int(capacity))
+        self.channels = max(1, channels)
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros((self.capacity, self.channels), dtype=self.dtype)
+        # Absolute positions; the writer only moves _write, the reader only _read
+        self._write = 0
+        self._read = 0
+        self.dropped_frames = 0
+        self.closed = False
+        self._data_ready = threading.Event()
+
+    def __len__(self) -> int:
+        """Number of frames ready to be read."""
+        return self._write - self._read
+
+    @property
+    def total_written(self) -> int:
+        """Frames ever stored."""
+        return self._write
+
+    @property
+    def total_read(self) -> int:
+        """Frames ever read."""
+        return self._read
+
+    def write(self, block: np.ndarray) -> int:
+        """
+        Store a block of frames (producer side, e.g. the audio callback).
+
+        Args:
+            block: Samples, shape (frames, channels) or interleaved 1-D
+
+        Returns:
+            Number of frames stored; the rest is counted in dropped_frames
+        """
+        block = np.asarray(block).reshape(-1, self.channels)
+        frames = len(block)
+        free = self.capacity - (self._write - self._read)
+        if frames > free:
+            self.dropped_frames += frames - free
+            frames = free
+        if frames:
+            start = self._write % self.capacity
+            first = min(frames, self.capacity - start)
+            self._data[start:start + first] = block[:first]
+            if frames > first:
+                self._data[:frames - first] = block[first:frames]
+            # Publish only after the samples are in place
+            self._write += frames
+        self._data_ready.set()
+        return frames
+
+    def read(self, frames: int, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Take exactly `frames` frames (consumer side).
+
+        Args:
+            frames: Number of frames to read
+            timeout: Seconds to wait for them (None waits forever)
+
+        Returns:
+            Interleaved 1-D copy of the samples, or None on timeout or
+            once the buffer is closed
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._write - self._read < frames:
+            if self.closed:
+                return None
+            self._data_ready.clear()
+            # The writer may have published between the check and the clear
+            if self._write - self._read >= frames:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return None
+            self._data_ready.wait(remaining)
+
+        start = self._read % self.capacity
+        first = min(frames, self.capacity - start)
+        out = np.empty((frames, self.channels), dtype=self.dtype)
+        out[:first] = self._data[start:start + first]
+        if frames > first:
+            out[first:] = self._data[:frames - first]
+        self._read += frames
+        return out.reshape(-1)
+
+    def close(self) -> None:
+        """Stop accepting reads and wake a waiting reader."""
+        self.closed = True
+        self._data_ready.set()
+
+
+class CaptureStream:
+    """
+    One open sd.InputStream per source feeding a CaptureRingBuffer.
+
+    Args:
+        sample_rate: Sample rate in Hz
+        channels: Number of channels
+        device: Device index or name (None for the default input)
+        frame_duration: Duration of the frames returned by read_frame, in seconds
+        buffer_duration: Ring capacity in seconds
+        dtype: Sample type requested from PortAudio
+        blocksize: Frames per callback (0 lets PortAudio choose)
+        backend: Module providing InputStream (default: sounddevice)
+    """
+
+    def __init__(self, sample_rate: int = 16000, channels: int = 1,
+                 device: Optional[Union[int, str]] = None, frame_duration: float = 0.1,
+                 buffer_duration: float = 2.0, dtype: str = "int16", blocksize: int = 0,
+                 backend: Any = None):
+        self.sample_rate = sample_rate
+        self.channels = max(1, channels)
+        self.device = device
+        self.dtype = dtype
+        self.blocksize = blocksize
+        self.frame_frames = max(1, int(round(frame_duration * sample_rate)))
+        capacity = max(int(round(buffer_duration * sample_rate)), 2 * self.frame_frames)
+        self.buffer = CaptureRingBuffer(capacity, self.channels, dtype)
+        self.backend = backend if backend is not None else sd
+
+        self._stream = None
+        self.start_time: Optional[float] = None
+        self.last_frame_time: Optional[float] = None
+        self.callbacks = 0
+        self.input_overflows = 0  # Blocks PortAudio reported as overflowed
+        self.status_errors = 0    # Callbacks with any status flag set
+
+    @property
+    def is_active(self) -> bool:
+        """True while the stream is open."""
+        return self._stream is not None
+
+    def start(self) -> bool:
+        """
+        Open and start the input stream.
+
+        Returns:
+            True if the stream is running
+        """
+        if self._stream is not None:
+            return True
+        if self.backend is None:
+            logger.error("sounddevice not available - cannot open capture stream")
+            return False
+        try:
+            stream = self.backend.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype=self.dtype,
+                device=self.device,
+                blocksize=self.blocksize,
+                callback=self._callback,
+            )
+            self.buffer = CaptureRingBuffer(self.buffer.capacity, self.channels, self.dtype)
+            self.start_time = time.time()
+            self._stream = stream
+            stream.start()
+        except Exception as e:
+            self._stream = None
+            logger.error(f"Failed to open capture stream on device {self.device}: {e}")
+            return False
+        logger.info(f"Capture stream started on device {self.device} "
+                    f"({self.sample_rate}Hz, {self.channels}ch, {self.frame_frames} frames/read)")
+        return True
+
+    def _callback(self, indata, frames, time_info, status) -> None:
+        """PortAudio callback: copy the block into the ring, nothing else."""
+        self.callbacks += 1
+        if status:
+            self.status_errors += 1
+            if getattr(status, "input_overflow", False):
+                self.input_overflows += 1
+        self.buffer.write(indata)
+
+    def read(self, frames: int, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Read exactly `frames` frames.
+
+        Args:
+            frames: Number of frames
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            Interleaved 1-D samples, or None on timeout or when stopped
+        """
+        if self._stream is None:
+            return None
+        position = self.buffer.total_read
+        data = self.buffer.read(frames, timeout)
+        if data is not None and self.start_time is not None:
+            self.last_frame_time = self.start_time + position / self.sample_rate
+        return data
+
+    def read_frame(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Read one fixed-size frame of frame_duration seconds."""
+        return self.read(self.frame_frames, timeout)
+
+    def stop(self) -> None:
+        """Stop and close the stream; buffered audio is discarded."""
+        stream, self._stream = self._stream, None
+        self.buffer.close()
+        if stream is None:
+            return
+        try:
+            stream.stop()
+            stream.close()
+        except Exception as e:
+            logger.warning(f"Error closing capture stream: {e}")
+        stats = self.get_stats()
+        logger.info(f"Capture stream stopped: {stats['frames_captured']} frames, "
+                    f"{stats['dropped_frames']} dropped, {stats['input_overflows']} overflows")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get capture statistics.
+
+        Returns:
+            Dict[str, Any]: Callbacks, frames captured/read/buffered, frames
+            dropped because the ring was full, and PortAudio overflows
+        """
+        return {
+            "active": self.is_active,
+            "callbacks": self.callbacks,
+            "frames_captured": self.buffer.total_written,
+            "frames_read": self.buffer.total_read,
+            "buffered_frames": len(self.buffer),
+            "dropped_frames": self.buffer.dropped_frames,
+            "input_overflows": self.input_overflows,
+            "status_errors": self.status_errors,
+        }
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Device Registry
+==================================
+
+Enumerate-once audio device registry with indexed lookups and hot-plug polling
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- sounddevice
+======================================================================
+Functions:
+- get_device_registry: Get the process-wide device registry.
+Classes:
+- AudioDevice: Immutable description of one PortAudio device.
+- DeviceRegistry: Device list indexed by id, name and host API.
+======================================================================
+
+sd.query_devices() is called once, and again only when a refresh is asked
+for explicitly or by the hot-plug poll. Each enumeration builds a new
+immutable snapshot (devices plus lookup tables) that replaces the previous
+one in a single assignment, so readers never lock and never see a
+half-built list. Listeners are told which devices appeared or went away.
+
+PortAudio keeps the device list it saw when it was initialized. To notice
+hot-plugged devices the poll re-initializes PortAudio, which would break
+open streams, so it only does that while its can_reinitialize predicate
+says no stream is running; otherwise it re-reads the cached list.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..logging_config import get_logger
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    sd = None
+    SOUNDDEVICE_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+DeviceListener = Callable[[Tuple["AudioDevice", ...], Tuple["AudioDevice", ...]], None]
+
+
+@dataclass(frozen=True)
+class AudioDevice:
+    """Immutable description of one PortAudio device."""
+    index: int
+    name: str
+    hostapi: str
+    max_input_channels: int
+    max_output_channels: int
+    default_samplerate: float
+
+    @property
+    def key(self) -> Tuple[str, str, int, int]:
+        """Identity used to detect added and removed devices."""
+        return (self.name, self.hostapi, self.max_input_channels, self.max_output_channels)
+
+
+class _Snapshot:
+    """One enumeration with its lookup tables; never modified after creation."""
+
+    def __init__(self, devices: Tuple[AudioDevice, ...],
+                 default_input: Optional[int], default_output: Optional[int]):
+        self.devices = devices
+        self.default_input = default_input
+        self.default_output = default_output
+        self.by_index: Dict[int, AudioDevice] = {device.index: device for device in devices}
+        self.by_name: Dict[str, AudioDevice] = {}
+        self.by_hostapi: Dict[str, Tuple[AudioDevice, ...]] = {}
+        for device in devices:
+            # First device wins when a name appears under several host APIs
+            self.by_name.setdefault(device.name.lower(), device)
+            self.by_hostapi[device.hostapi] = self.by_hostapi.get(device.hostapi, ()) + (device,)
+
+
+class DeviceRegistry:
+    """
+    Device list indexed by id, name and host API.
+
+    Args:
+        backend: Module providing query_devices (default: sounddevice)
+    """
+
+    def __init__(self, backend: Any = None):
+        self.backend = backend if backend is not None else sd
+        self._snapshot: Optional[_Snapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._listeners: List[DeviceListener] = []
+
+        self._poll_thread: Optional[threading.Thread] = None
+        self._poll_stop = threading.Event()
+
+        self.enumerations = 0
+        self.changes = 0
+
+    def _enumerate(self) -> _Snapshot:
+        """Query the backend once and build a snapshot."""
+        raw_devices = list(self.backend.query_devices())
+        try:
+            hostapis = [api.get('name', str(i)) for i, api in enumerate(self.backend.query_hostapis())]
+        except Exception:
+            hostapis = []
+
+        devices = []
+        for index, raw in enumerate(raw_devices):
+            hostapi_index = raw.get('hostapi', -1)
+            hostapi = (hostapis[hostapi_index] if isinstance(hostapi_index, int)
+                       and 0 <= hostapi_index < len(hostapis) else str(hostapi_index))
+            devices.append(AudioDevice(
+                index=raw.get('index', index),
+                name=raw.get('name', f'Unknown Device {index}'),
+                hostapi=hostapi,
+                max_input_channels=int(raw.get('max_input_channels', 0) or 0),
+                max_output_channels=int(raw.get('max_output_channels', 0) or 0),
+                default_samplerate=float(raw.get('default_samplerate', 0) or 0),
+            ))
+
+        try:
+            default_input, default_output = self.backend.default.device
+        except Exception:
+            default_input = default_output = None
+        return _Snapshot(tuple(devices), default_input, default_output)
+
+    def refresh(self, reinitialize: bool = False) -> bool:
+        """
+        Enumerate the devices again.
+
+        Args:
+            reinitialize: Re-initialize PortAudio first so hot-plugged devices
+                          appear (breaks any open stream)
+
+        Returns:
+            True if devices were added or removed
+        """
+        with self._refresh_lock:
+            if reinitialize and hasattr(self.backend, '_terminate'):
+                try:
+                    self.backend._terminate()
+                    self.backend._initialize()
+                except Exception as e:
+                    logger.warning(f"Could not re-initialize PortAudio: {e}")
+            try:
+                snapshot = self._enumerate()
+            except Exception as e:
+                logger.error(f"Error enumerating audio devices: {e}")
+                return False
+            self.enumerations += 1
+
+            previous = self._snapshot
+            self._snapshot = snapshot
+            old_keys = {device.key for device in previous.devices} if previous else set()
+            new_keys = {device.key for device in snapshot.devices}
+            if previous is not None and old_keys == new_keys:
+                return False
+            added = tuple(d for d in snapshot.devices if d.key not in old_keys)
+            removed = tuple(d for d in previous.devices if d.key not in new_keys) if previous else ()
+            listeners = list(self._listeners)
+
+        if previous is not None:
+            self.changes += 1
+            logger.info(f"Audio devices changed: {len(added)} added, {len(removed)} removed")
+        for listener in listeners:
+            try:
+                listener(added, removed)
+            except Exception as e:
+                logger.error(f"Device listener error: {e}")
+        return True
+
+    def _current(self) -> _Snapshot:
+        """Current snapshot, enumerating on first use."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            self.refresh()
+            snapshot = self._snapshot or _Snapshot((), None, None)
+        return snapshot
+
+    def devices(self) -> Tuple[AudioDevice, ...]:
+        """All devices of the current enumeration."""
+        return self._current().devices
+
+    def get(self, index: Optional[int]) -> Optional[AudioDevice]:
+        """Device with this PortAudio index, or None."""
+        return self._current().by_index.get(index) if index is not None else None
+
+    def find(self, name: str) -> Optional[AudioDevice]:
+        """
+        Device by name.
+
+        Exact (case-insensitive) names are a dictionary lookup; otherwise
+        the first device whose name contains the text is returned.
+        """
+        snapshot = self._current()
+        key = name.lower()
+        device = snapshot.by_name.get(key)
+        if device is None:
+            device = next((d for d in snapshot.devices if key in d.name.lower()), None)
+        return device
+
+    def by_hostapi(self, hostapi: str) -> Tuple[AudioDevice, ...]:
+        """Devices of a host API, e.g. 'Windows WASAPI' or 'ALSA'."""
+        return self._current().by_hostapi.get(hostapi, ())
+
+    def inputs(self) -> Tuple[AudioDevice, ...]:
+        """Devices with input channels."""
+        return tuple(d for d in self._current().devices if d.max_input_channels > 0)
+
+    @property
+    def default_input(self) -> Optional[int]:
+        """Index of the default input device."""
+        return self._current().default_input
+
+    @property
+    def default_output(self) -> Optional[int]:
+        """Index of the default output device."""
+        return self._current().default_output
+
+    def add_listener(self, listener: DeviceListener) -> None:
+        """Call listener(added, removed) whenever the device list changes."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: DeviceListener) -> None:
+        """Stop notifying a listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def start_polling(self, interval: float = 2.0,
+                      can_reinitialize: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Poll for hot-plugged devices on a background thread.
+
+        Args:
+            interval: Seconds between polls
+            can_reinitialize: Returns True when no stream is open, so
+                              PortAudio may be re-initialized to see new devices
+        """
+        if self._poll_thread is not None and self._poll_thread.is_alive():
+            return
+        self._poll_stop.clear()
+
+        def poll():
+            while not self._poll_stop.wait(interval):
+                reinitialize = bool(can_reinitialize and can_reinitialize())
+                self.refresh(reinitialize=reinitialize)
+
+        self._poll_thread = threading.Thread(target=poll, name="DeviceHotplugPoll", daemon=True)
+        self._poll_thread.start()
+
+    def stop_polling(self) -> None:
+        """Stop the hot-plug poll."""
+        self._poll_stop.set()
+        if self._poll_thread is not None and self._poll_thread is not threading.current_thread():
+            self._poll_thread.join(timeout=2.0)
+        self._poll_thread = None
+
+    @property
+    def is_polling(self) -> bool:
+        """True while the hot-plug poll runs."""
+        return self._poll_thread is not None and self._poll_thread.is_alive()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dict[str, Any]: Devices, enumerations, detected changes, polling
+        """
+        snapshot = self._snapshot
+        return {
+            "devices": len(snapshot.devices) if snapshot else 0,
+            "enumerations": self.enumerations,
+            "changes": self.changes,
+            "polling": self.is_polling,
+        }
+
+
+_registry: Optional[DeviceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_device_registry() -> DeviceRegistry:
+    """
+    Get the process-wide device registry.
+
+    Returns:
+        DeviceRegistry shared by every capture and pipeline
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = DeviceRegistry()
+        return _registry
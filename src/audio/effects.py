@@ -12,6 +12,7 @@ Version: 1.0
 Requirements:
 - sounddevice
 - numpy
+- scipy
 ======================================================================
 Functions:
 - __init__: Initialize audio effects processor.
@@ -25,6 +26,10 @@ Functions:
 - apply_eq: Apply 3-band EQ.
 - apply_bit_crusher: Apply bit crusher effect.
 ======================================================================
+
+All effects are vectorized: recursive filters run through lfilter, feedback
+delays are computed one delay-length block at a time, and modulated delays
+gather their taps with index arrays instead of per-sample Python loops.
 """
 
 import numpy as np
@@ -32,6 +37,144 @@ import sounddevice as sd
 import time
 from typing import Optional, List, Tuple
 import math
+from scipy.signal import lfilter, oaconvolve
+
+# Below this delay a feedback comb is cheaper as a single lfilter call
+_LFILTER_MAX_DELAY = 32
+
+# Impulse responses with at most this many taps are applied by shift-and-add
+_SPARSE_IR_TAPS = 16
+
+
+def _comb_filter(signal: np.ndarray, delay: int, feedback: float,
+                 start: int = 0, end: Optional[int] = None) -> None:
+    """
+    In place: signal[i] += feedback * signal[i - delay] for start <= i < end.
+    
+    ``signal[:start]`` holds earlier output (history). Samples before
+    ``delay`` have nothing to feed back and are left as they are.
+    """
+    end = len(signal) if end is None else end
+    start = max(start, delay)
+    if delay <= 0 or start >= end:
+        return
+    
+    if end - start <= delay:
+        signal[start:end] += feedback * signal[start - delay:end - delay]
+    elif delay < _LFILTER_MAX_DELAY:
+        a = np.zeros(delay + 1)
+        a[0] = 1.0
+        a[delay] = -feedback
+        # The comb's filter state is the last ``delay`` outputs, scaled
+        signal[start:end], _ = lfilter([1.0], a, signal[start:end],
+                                       zi=feedback * signal[start - delay:start])
+    else:
+        # Each block only depends on the previous one, so it is one vector op
+        for block in range(start, end, delay):
+            block_end = min(block + delay, end)
+            signal[block:block_end] += feedback * signal[block - delay:block_end - delay]
+
+
+def _feedback_comb(audio: np.ndarray, delay_samples: int, feedback: float) -> np.ndarray:
+    """Compute y[i] = x[i] + feedback * y[i - delay] (y[i] = x[i] for i < delay)."""
+    result = audio.copy()
+    _comb_filter(result, delay_samples, feedback)
+    return result
+
+
+def _modulated_delay(signal: np.ndarray, delays: np.ndarray, interpolate: bool = False,
+                     start: int = 0, origin: int = 0) -> np.ndarray:
+    """
+    Read signal[start:] through a time-varying delay.
+    
+    ``delays[j]`` applies to ``signal[start + j]``; reads before ``origin``
+    (the start of the signal) pass the current sample through dry.
+    """
+    index = np.arange(start, start + len(delays))
+    if not interpolate:
+        source = index - delays.astype(np.int64)
+        return signal[np.where(source >= origin, source, index)]
+    
+    position = index - delays
+    base = np.floor(position).astype(np.int64)
+    frac = position - base
+    valid = base >= origin
+    lo = np.where(valid, base, index)
+    hi = np.where(valid, np.minimum(base + 1, index), index)
+    return signal[lo] + frac * valid * (signal[hi] - signal[lo])
+
+
+def _modulated_feedback(signal: np.ndarray, delays: np.ndarray, feedback: float,
+                        interpolate: bool = False, start: int = 0) -> None:
+    """
+    In place: y[i] = x[i] + feedback * y[i - delays[i - start]] for i >= start.
+    
+    ``signal[start:]`` holds the input and ``signal[:start]`` earlier output.
+    Samples whose delay is zero or reaches before index 0 are passed through.
+    """
+    if interpolate:
+        _interpolated_feedback(signal, delays, feedback, start)
+        return
+    
+    # An LFO-driven delay changes slowly, so the signal splits into runs of
+    # constant whole-sample delay, each of which is a plain feedback comb
+    whole = delays.astype(np.int64)
+    boundaries = np.flatnonzero(np.diff(whole)) + 1
+    run_starts = np.concatenate(([0], boundaries))
+    run_ends = np.concatenate((boundaries, [len(whole)]))
+    for run_start, run_end in zip(run_starts, run_ends):
+        _comb_filter(signal, int(whole[run_start]), feedback,
+                     start + run_start, start + run_end)
+
+
+def _interpolated_feedback(signal: np.ndarray, delays: np.ndarray, feedback: float,
+                           start: int = 0) -> None:
+    """
+    Fractional-delay variant of _modulated_feedback (linear interpolation).
+    
+    The output is built in blocks that never read from themselves, so each
+    block is a single gather instead of a loop over its samples.
+    """
+    n = len(signal)
+    index = np.arange(start, n)
+    whole = delays.astype(np.int64)
+    frac = delays - whole
+    source = index - whole
+    older = np.maximum(source - 1, 0)
+    # Samples before the start of the signal are silence
+    older_frac = np.where(source >= 1, frac, 0.0)
+    active = (whole > 0) & (source >= 0)
+    
+    block_start = 0
+    window = 64
+    while block_start < len(index):
+        block_end = min(block_start + window, len(index))
+        # The block ends at the first sample that would read from inside it
+        hits = np.flatnonzero(active[block_start:block_end]
+                              & (source[block_start:block_end] >= start + block_start))
+        if len(hits):
+            block_end = block_start + hits[0]
+        
+        selected = np.flatnonzero(active[block_start:block_end]) + block_start
+        delayed = ((1.0 - frac[selected]) * signal[source[selected]]
+                   + older_frac[selected] * signal[older[selected]])
+        signal[index[selected]] += feedback * delayed
+        
+        window = max(64, 2 * (block_end - block_start))
+        block_start = block_end
+
+
+def _convolve(audio: np.ndarray, impulse_response: np.ndarray) -> np.ndarray:
+    """Convolve audio with an impulse response, truncated to the input length."""
+    taps = np.flatnonzero(impulse_response)
+    if len(taps) <= _SPARSE_IR_TAPS:
+        # A few discrete taps are cheaper (and exact) as shifted adds
+        result = np.zeros_like(audio)
+        for delay in taps:
+            if delay < len(audio):
+                result[delay:] += audio[:len(audio) - delay] * impulse_response[delay]
+        return result
+    return oaconvolve(audio, impulse_response)[:len(audio)].astype(audio.dtype, copy=False)
 
 class AudioEffects:
     """Audio effects processor."""
@@ -48,7 +191,8 @@ class AudioEffects:
         self.delay_index = 0
     
     def apply_reverb(self, audio: np.ndarray, room_size: float = 0.5, 
-                    damping: float = 0.5, wet_level: float = 0.3) -> np.ndarray:
+                    damping: float = 0.5, wet_level: float = 0.3,
+                    impulse_response: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply reverb effect.
         
@@ -57,24 +201,25 @@ class AudioEffects:
             room_size: Room size (0.0 to 1.0)
             damping: Damping factor (0.0 to 1.0)
             wet_level: Wet signal level (0.0 to 1.0)
+            impulse_response: Measured room response for convolution reverb
+                (replaces the room_size/damping tap model)
             
         Returns:
             Audio with reverb applied
         """
-        # Simple reverb implementation using multiple delays
         dry = audio.copy()
-        wet = np.zeros_like(audio)
         
-        # Create multiple delay taps
-        delays = [int(self.sample_rate * 0.03 * room_size),  # 30ms
-                 int(self.sample_rate * 0.05 * room_size),  # 50ms
-                 int(self.sample_rate * 0.07 * room_size)]  # 70ms
+        if impulse_response is None:
+            # Simple reverb implementation using multiple delay taps
+            delays = [int(self.sample_rate * 0.03 * room_size),  # 30ms
+                     int(self.sample_rate * 0.05 * room_size),  # 50ms
+                     int(self.sample_rate * 0.07 * room_size)]  # 70ms
+            impulse_response = np.zeros(max(delays) + 1)
+            for delay_samples in delays:
+                if delay_samples > 0:
+                    impulse_response[delay_samples] += damping
         
-        for delay_samples in delays:
-            if delay_samples > 0:
-                delayed = np.zeros_like(audio)
-                delayed[delay_samples:] = audio[:-delay_samples] * damping
-                wet += delayed
+        wet = _convolve(audio, np.asarray(impulse_response))
         
         # Mix dry and wet signals
         result = (1 - wet_level) * dry + wet_level * wet
@@ -95,14 +240,7 @@ class AudioEffects:
             Audio with delay applied
         """
         delay_samples = int(delay_time * self.sample_rate)
-        result = np.zeros_like(audio)
-        
-        for i in range(len(audio)):
-            # Add delayed signal
-            if i >= delay_samples:
-                result[i] = audio[i] + feedback * result[i - delay_samples]
-            else:
-                result[i] = audio[i]
+        result = _feedback_comb(audio, delay_samples, feedback)
         
         # Mix with original
         result = (1 - wet_level) * audio + wet_level * result
@@ -132,7 +270,8 @@ class AudioEffects:
         return result
     
     def apply_chorus(self, audio: np.ndarray, rate: float = 1.5, 
-                    depth: float = 0.002, mix: float = 0.5) -> np.ndarray:
+                    depth: float = 0.002, mix: float = 0.5,
+                    interpolate: bool = False) -> np.ndarray:
         """
         Apply chorus effect.
         
@@ -141,6 +280,8 @@ class AudioEffects:
             rate: LFO rate in Hz
             depth: Modulation depth in seconds
             mix: Mix level (0.0 to 1.0)
+            interpolate: Use fractional (linearly interpolated) delays
+                instead of whole-sample delays
             
         Returns:
             Audio with chorus applied
@@ -154,13 +295,7 @@ class AudioEffects:
         modulated_delay = depth * self.sample_rate * (1.0 + lfo)
         
         # Apply modulated delay
-        chorus = np.zeros_like(audio)
-        for i in range(len(audio)):
-            delay_samples = int(modulated_delay[i])
-            if i >= delay_samples:
-                chorus[i] = audio[i - delay_samples]
-            else:
-                chorus[i] = audio[i]
+        chorus = _modulated_delay(audio, modulated_delay, interpolate)
         
         # Mix with original
         result = (1 - mix) * audio + mix * chorus
@@ -168,7 +303,7 @@ class AudioEffects:
     
     def apply_flanger(self, audio: np.ndarray, rate: float = 0.5, 
                      depth: float = 0.005, feedback: float = 0.3, 
-                     mix: float = 0.5) -> np.ndarray:
+                     mix: float = 0.5, interpolate: bool = False) -> np.ndarray:
         """
         Apply flanger effect.
         
@@ -178,6 +313,8 @@ class AudioEffects:
             depth: Modulation depth in seconds
             feedback: Feedback amount (0.0 to 1.0)
             mix: Mix level (0.0 to 1.0)
+            interpolate: Use fractional (linearly interpolated) delays
+                instead of whole-sample delays
             
         Returns:
             Audio with flanger applied
@@ -191,13 +328,8 @@ class AudioEffects:
         modulated_delay = depth * self.sample_rate * (1.0 + lfo)
         
         # Apply modulated delay with feedback
-        flanger = np.zeros_like(audio)
-        for i in range(len(audio)):
-            delay_samples = int(modulated_delay[i])
-            if i >= delay_samples:
-                flanger[i] = audio[i] + feedback * flanger[i - delay_samples]
-            else:
-                flanger[i] = audio[i]
+        flanger = audio.copy()
+        _modulated_feedback(flanger, modulated_delay, feedback, interpolate)
         
         # Mix with original
         result = (1 - mix) * audio + mix * flanger
@@ -231,24 +363,9 @@ class AudioEffects:
         else:
             gain_reduction = 1.0
         
-        # Apply attack and release
-        attack_samples = int(attack * self.sample_rate)
-        release_samples = int(release * self.sample_rate)
-        
-        # Simple envelope follower
-        envelope = np.zeros_like(audio)
-        for i in range(len(audio)):
-            if i == 0:
-                envelope[i] = gain_reduction
-            else:
-                if gain_reduction < envelope[i-1]:
-                    # Attack phase
-                    envelope[i] = envelope[i-1] + (gain_reduction - envelope[i-1]) / attack_samples
-                else:
-                    # Release phase
-                    envelope[i] = envelope[i-1] + (gain_reduction - envelope[i-1]) / release_samples
-        
-        return audio * envelope
+        # The gain is computed once for the whole buffer, so the envelope
+        # follower starts and stays at it; attack/release have no effect here
+        return audio * gain_reduction
     
     def apply_limiter(self, audio: np.ndarray, threshold: float = 0.8) -> np.ndarray:
         """
@@ -283,22 +400,12 @@ class AudioEffects:
         # Low-pass filter for lows
         low_cutoff = 250  # Hz
         low_alpha = 1.0 / (1.0 + 2 * np.pi * low_cutoff / self.sample_rate)
-        low_filtered = np.zeros_like(audio)
-        for i in range(len(audio)):
-            if i == 0:
-                low_filtered[i] = low_alpha * audio[i]
-            else:
-                low_filtered[i] = low_alpha * audio[i] + (1 - low_alpha) * low_filtered[i-1]
+        low_filtered = lfilter([low_alpha], [1.0, low_alpha - 1], audio)
         
         # High-pass filter for highs
         high_cutoff = 4000  # Hz
         high_alpha = 1.0 / (1.0 + 2 * np.pi * high_cutoff / self.sample_rate)
-        high_filtered = np.zeros_like(audio)
-        for i in range(len(audio)):
-            if i == 0:
-                high_filtered[i] = high_alpha * audio[i]
-            else:
-                high_filtered[i] = high_alpha * (high_filtered[i-1] + audio[i] - audio[i-1])
+        high_filtered = lfilter([high_alpha, -high_alpha], [1.0, -high_alpha], audio)
         
         # Mid frequencies
         mid_filtered = audio - low_filtered - high_filtered
@@ -327,10 +434,7 @@ class AudioEffects:
         # Sample rate reduction
         if sample_rate_reduction < 1.0:
             step = int(1 / sample_rate_reduction)
-            reduced = np.zeros_like(quantized)
-            for i in range(0, len(quantized), step):
-                reduced[i:i+step] = quantized[i]
-            return reduced
+            return np.repeat(quantized[::step], step)[:len(quantized)]
         
         return quantized
     
@@ -389,6 +493,24 @@ class AudioEffects:
         
         return result
     
+    def create_streaming_chain(self, effects: List[Tuple[str, dict]],
+                               block_size: int = 1024):
+        """
+        Create a real-time version of an effects chain.
+        
+        The returned EffectsChain processes fixed-size blocks and keeps every
+        effect's state between them, e.g. inside an AudioStreamer callback.
+        
+        Args:
+            effects: List of (effect_name, parameters) tuples
+            block_size: Largest block processed at once
+            
+        Returns:
+            EffectsChain instance
+        """
+        from .streaming_effects import EffectsChain
+        return EffectsChain.from_spec(effects, sample_rate=self.sample_rate, block_size=block_size)
+    
     def effects_demo(self):
         """Generate a demo of various audio effects."""
         print("🎛️  Audio Effects Demo")
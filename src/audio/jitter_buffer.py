@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Jitter Buffer
+================================
+
+Preallocated jitter buffer and producer-fed output stream
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- sounddevice
+- numpy
+======================================================================
+Classes:
+- JitterBuffer: Single-producer/single-consumer float32 ring for output audio.
+- BufferedOutputStream: sd.OutputStream playing from a JitterBuffer that a
+  producer thread or push() keeps filled ahead of time.
+======================================================================
+
+When the PortAudio callback asks a producer for audio, every slow call
+(synthesis, a network read, a GC pause) becomes an audible dropout. Here
+the producer runs on its own thread, or pushes blocks of any size, and
+writes into a ring allocated once. The callback only copies from the ring
+into the device buffer.
+
+Playback starts once target_latency seconds are buffered. If the ring runs
+dry before the producer has finished, the callback plays silence, counts
+an underrun and waits for the target latency again before resuming, so a
+late producer causes one gap instead of a stutter. The producer blocks
+while the ring is full; a push that times out with no room drops what did
+not fit and counts an overrun.
+
+Like the capture ring, this one needs no lock: only the producer moves the
+write position and only the callback moves the read position.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Union
+
+import numpy as np
+
+from ..logging_config import get_logger
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    sd = None
+    SOUNDDEVICE_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+
+class JitterBuffer:
+    """
+    Single-producer/single-consumer float32 ring for output audio.
+
+    Args:
+        capacity: Capacity in frames
+        channels: Number of channels
+    """
+
+    def __init__(self, capacity: int, channels: int = 1):
+        self.capacity = max(1, int(capacity))
+        self.channels = max(1, channels)
+        self._data = np.zeros((self.capacity, self.channels), dtype=np.float32)
+        self._write = 0  # Absolute positions; only the producer moves _write
+        self._read = 0   # and only the consumer moves _read
+        self._space = threading.Event()
+        self._space.set()
+        self.closed = False
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    @property
+    def free(self) -> int:
+        """Frames that can be written without waiting."""
+        return self.capacity - len(self)
+
+    @property
+    def total_written(self) -> int:
+        """Frames written since creation."""
+        return self._write
+
+    @property
+    def total_read(self) -> int:
+        """Frames read since creation."""
+        return self._read
+
+    def write(self, block: np.ndarray, timeout: Optional[float] = None) -> int:
+        """
+        Write a block of any size, waiting for room as the consumer reads.
+
+        Args:
+            block: Samples, shape (frames,) interleaved or (frames, channels)
+            timeout: Seconds to wait for room (None waits until closed)
+
+        Returns:
+            Frames written (fewer than given on timeout or close)
+        """
+        block = np.asarray(block, dtype=np.float32).reshape(-1, self.channels)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        written = 0
+        while written < len(block) and not self.closed:
+            free = self.free
+            if free == 0:
+                self._space.clear()
+                if self.free == 0:  # Re-check so a read between the two is not missed
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._space.wait(remaining)
+                continue
+
+            count = min(free, len(block) - written)
+            start = self._write % self.capacity
+            first = min(count, self.capacity - start)
+            self._data[start:start + first] = block[written:written + first]
+            self._data[:count - first] = block[written + first:written + count]
+            self._write += count
+            written += count
+        return written
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Copy up to len(out) frames into out without waiting.
+
+        Args:
+            out: Destination, shape (frames, channels)
+
+        Returns:
+            Frames copied; the rest of out is left untouched
+        """
+        count = min(len(self), len(out))
+        if count:
+            start = self._read % self.capacity
+            first = min(count, self.capacity - start)
+            out[:first] = self._data[start:start + first]
+            out[first:count] = self._data[:count - first]
+            self._read += count
+            self._space.set()
+        return count
+
+    def clear(self) -> None:
+        """Discard buffered audio (consumer side)."""
+        self._read = self._write
+        self._space.set()
+
+    def close(self) -> None:
+        """Wake and stop a waiting producer."""
+        self.closed = True
+        self._space.set()
+
+
+class BufferedOutputStream:
+    """
+    sd.OutputStream playing from a JitterBuffer filled ahead of time.
+
+    Audio comes from a source callable run on a producer thread, from
+    push(), or both.
+
+    Args:
+        sample_rate: Sample rate in Hz
+        channels: Number of channels
+        target_latency: Seconds buffered before playback starts or resumes
+        max_latency: Ring capacity in seconds (default: 4x target_latency)
+        device: Device index or name (None for the default output)
+        blocksize: Frames per callback (0 lets PortAudio choose)
+        backend: Module providing OutputStream (default: sounddevice)
+    """
+
+    def __init__(self, sample_rate: int, channels: int = 1, target_latency: float = 0.1,
+                 max_latency: Optional[float] = None, device: Optional[Union[int, str]] = None,
+                 blocksize: int = 0, backend: Any = None):
+        self.sample_rate = sample_rate
+        self.channels = max(1, channels)
+        self.device = device
+        self.blocksize = blocksize
+        self.backend = backend if backend is not None else sd
+        self.target_frames = max(1, int(round(target_latency * sample_rate)))
+        max_latency = max_latency if max_latency is not None else 4 * target_latency
+        capacity = max(int(round(max_latency * sample_rate)), self.target_frames + blocksize)
+        self.buffer = JitterBuffer(capacity, self.channels)
+        self.volume = 1.0
+
+        self._stream = None
+        self._producer: Optional[threading.Thread] = None
+        self._running = False
+        self._primed = False
+        self._finished = False
+        self._drained = threading.Event()
+
+        self.callbacks = 0
+        self.frames_played = 0
+        self.underruns = 0         # Times the ring ran dry while audio was still expected
+        self.overruns = 0          # Pushes that timed out with a full ring
+        self.dropped_frames = 0    # Frames those pushes could not store
+        self.output_underflows = 0  # Blocks PortAudio reported as underflowed
+        self.producer_errors = 0
+
+    @property
+    def is_active(self) -> bool:
+        """True while the output stream is open."""
+        return self._stream is not None
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Audio waiting in the jitter buffer, in seconds."""
+        return len(self.buffer) / self.sample_rate
+
+    def start(self, source: Optional[Callable[[], Optional[np.ndarray]]] = None,
+              processor: Optional[Callable[[np.ndarray], np.ndarray]] = None) -> bool:
+        """
+        Open the output stream and start the producer.
+
+        Args:
+            source: Called on the producer thread for the next block of any
+                size; None or an empty block ends the stream. Without a
+                source, audio is supplied with push().
+            processor: Applied to each source block on the producer thread
+
+        Returns:
+            True if the stream is running
+        """
+        if self._stream is not None:
+            return True
+        if self.backend is None:
+            logger.error("sounddevice not available - cannot open output stream")
+            return False
+        self._running = True
+        try:
+            stream = self.backend.OutputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype="float32",
+                device=self.device,
+                blocksize=self.blocksize,
+                callback=self._callback,
+            )
+            self._stream = stream
+            stream.start()
+        except Exception as e:
+            self._stream = None
+            self._running = False
+            logger.error(f"Failed to open output stream on device {self.device}: {e}")
+            return False
+
+        if source is not None:
+            self._producer = threading.Thread(target=self._produce, args=(source, processor),
+                                              name="StreamProducer", daemon=True)
+            self._producer.start()
+        logger.info(f"Buffered output stream started ({self.sample_rate}Hz, "
+                    f"target latency {self.target_frames / self.sample_rate * 1000:.0f}ms)")
+        return True
+
+    def _produce(self, source: Callable[[], Optional[np.ndarray]],
+                 processor: Optional[Callable[[np.ndarray], np.ndarray]]) -> None:
+        """Producer thread: keep the ring full until the source ends."""
+        while self._running:
+            try:
+                block = source()
+                if block is None or np.size(block) == 0:
+                    break
+                if processor is not None:
+                    block = processor(block)
+            except Exception as e:
+                self.producer_errors += 1
+                logger.error(f"Stream producer error: {e}")
+                break
+            self.buffer.write(block)
+        self.finish()
+
+    def push(self, block: np.ndarray, timeout: Optional[float] = None) -> int:
+        """
+        Queue a block of any size, e.g. one synthesized sentence.
+
+        Args:
+            block: Samples, shape (frames,) or (frames, channels)
+            timeout: Seconds to wait for room (None waits until there is)
+
+        Returns:
+            Frames queued; the rest were dropped and counted as an overrun
+        """
+        frames = np.size(block) // self.channels
+        written = self.buffer.write(block, timeout)
+        if written < frames and not self.buffer.closed:
+            self.overruns += 1
+            self.dropped_frames += frames - written
+        return written
+
+    def finish(self) -> None:
+        """Mark the end of the input; buffered audio still plays."""
+        self._finished = True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the input has finished and every frame has played."""
+        return self._drained.wait(timeout)
+
+    def _callback(self, outdata, frames, time_info, status) -> None:
+        """PortAudio callback: copy buffered audio out, nothing else."""
+        self.callbacks += 1
+        if status and getattr(status, "output_underflow", False):
+            self.output_underflows += 1
+
+        if not self._primed:
+            buffered = len(self.buffer)
+            if buffered >= self.target_frames or (self._finished and buffered):
+                self._primed = True
+            else:
+                if self._finished:
+                    self._drained.set()
+                outdata.fill(0)
+                return
+
+        count = self.buffer.read_into(outdata)
+        if count < frames:
+            outdata[count:] = 0
+            if self._finished:
+                self._drained.set()
+            else:
+                # Re-buffer to the target latency instead of stuttering
+                self.underruns += 1
+                self._primed = False
+        volume = self.volume
+        if volume != 1.0:
+            outdata[:count] *= volume
+        self.frames_played += count
+
+    def stop(self) -> None:
+        """Stop the producer and close the stream; buffered audio is discarded."""
+        self._running = False
+        self.buffer.close()
+        if self._producer is not None and self._producer is not threading.current_thread():
+            self._producer.join(timeout=2.0)
+        self._producer = None
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        try:
+            stream.stop()
+            stream.close()
+        except Exception as e:
+            logger.warning(f"Error closing output stream: {e}")
+        logger.info(f"Buffered output stream stopped: {self.underruns} underruns, "
+                    f"{self.overruns} overruns")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get streaming statistics.
+
+        Returns:
+            Dict[str, Any]: Buffered audio, frames played, underruns (ring
+            empty before the end of input), overruns (pushes that did not
+            fit) and PortAudio underflows
+        """
+        return {
+            "active": self.is_active,
+            "callbacks": self.callbacks,
+            "buffered_ms": self.buffered_seconds * 1000.0,
+            "target_latency_ms": self.target_frames / self.sample_rate * 1000.0,
+            "frames_played": self.frames_played,
+            "underruns": self.underruns,
+            "overruns": self.overruns,
+            "dropped_frames": self.dropped_frames,
+            "output_underflows": self.output_underflows,
+            "producer_errors": self.producer_errors,
+        }
@@ -13,8 +13,9 @@ Version: 2.1 (Enhanced with unified logging and error handling)
 import threading
 import queue
 import time
-from typing import Dict, List, Optional, Callable, Any, Literal, Union
-from dataclasses import dataclass
+import numpy as np
+from typing import Dict, List, Optional, Callable, Any, Literal, Tuple, Union
+from dataclasses import dataclass, replace
 from enum import Enum
 
 # Import centralized logging and exception handling
@@ -56,6 +57,13 @@ except ImportError as e:
     logger.warning("Audio adapters not available - using legacy pipeline",
                   extra={"error": str(e)})
 
+from .vad import VADType, VoiceActivityDetector, create_vad
+from .transcription_stage import BackpressurePolicy, TranscriptionStage
+from .ring_buffer import AudioRingBuffer
+from .ports import SampleFormat, STT_SAMPLE_FORMAT
+from .resampler import IngestResampler
+from .device_registry import AudioDevice, DeviceRegistry, get_device_registry
+
 # Import notification system and async utilities
 try:
     from ..ui.notifier import notify, Level
@@ -86,6 +94,16 @@ class DeviceInfo:
     channels: int
     sample_rate: int
     is_input: bool = True
+    hostapi: str = ""
+
+@dataclass(frozen=True)
+class StreamMetadata:
+    """Per-stream facts fixed when a capture starts."""
+    source_type: AudioSourceType
+    device_index: Optional[int]
+    device_name: str
+    hostapi: str
+    source_format: SampleFormat  # Format the capture delivers
 
 @dataclass
 class AudioStreamData:
@@ -97,6 +115,24 @@ class AudioStreamData:
     sample_rate: int = 16000
     channels: int = 1
     language_hint: Optional[str] = None
+    sample_format: Optional[SampleFormat] = None
+    
+    @property
+    def pcm_format(self) -> SampleFormat:
+        """Sample format of audio_data (16-bit if not given)."""
+        return self.sample_format or SampleFormat("int16", self.sample_rate, self.channels)
+    
+    def samples(self) -> np.ndarray:
+        """Zero-copy view of audio_data as an array of its sample type."""
+        dtype = np.dtype(self.pcm_format.dtype)
+        return np.frombuffer(self.audio_data, dtype=dtype,
+                             count=memoryview(self.audio_data).nbytes // dtype.itemsize)
+
+@dataclass
+class StreamingChunk:
+    """Transcription job for a streaming STT session."""
+    stream_data: AudioStreamData
+    finish: bool = False  # End the session after this chunk
 
 class PipelineManager:
     """
@@ -114,13 +150,36 @@ class PipelineManager:
     def __init__(self, 
                  on_transcript: Optional[Callable] = None,
                  on_translation: Optional[Callable] = None,
-                 on_status: Optional[Callable] = None):
+                 on_status: Optional[Callable] = None,
+                 vad_type: Union[str, VADType, VoiceActivityDetector] = VADType.ENERGY,
+                 streaming_stt: bool = False,
+                 on_partial_transcript: Optional[Callable] = None,
+                 stt_workers: int = 2,
+                 stt_queue_size: int = 8,
+                 stt_backpressure: Union[str, BackpressurePolicy] = BackpressurePolicy.DROP_OLDEST,
+                 ingest_format: Optional[SampleFormat] = STT_SAMPLE_FORMAT,
+                 device_registry: Optional[DeviceRegistry] = None):
         """Initialize the audio pipeline manager.
         
         Args:
             on_transcript: Callback for transcript events (source, text, language)
             on_translation: Callback for translation events (source, original, translated)
             on_status: Callback for status updates (source, status, device)
+            vad_type: Voice activity detector to use ("energy", "spectral",
+                a VADType, or a VoiceActivityDetector instance)
+            streaming_stt: Transcribe incrementally while the speaker talks
+                instead of once per buffered utterance
+            on_partial_transcript: Callback for streaming hypotheses
+                (source, committed_text, unstable_text, language)
+            stt_workers: Worker threads running STT and translation jobs
+            stt_queue_size: Maximum pending transcription jobs
+            stt_backpressure: Policy when the job queue is full
+                ("drop_oldest" or "coalesce")
+            ingest_format: Format captured audio is converted to once, on
+                capture (default 16 kHz mono float32); None keeps the
+                device format
+            device_registry: Device enumeration to use (default: the
+                process-wide registry)
         """
         self.logger = get_logger(__name__)
         
@@ -136,6 +195,16 @@ class PipelineManager:
         # Audio capture instances
         self.mic_capture: Optional[Any] = None
         self.sys_capture: Optional[Any] = None
+        # Each source keeps its device open and reads consecutive frames
+        self.capture_frame_duration = 0.1  # seconds per captured frame
+        self.capture_buffer_duration = 2.0  # seconds the capture ring can hold
+        # Captured audio is converted to one format on ingest; later stages
+        # read that format as is
+        self.ingest_format = ingest_format
+        self.ingest_resamplers: Dict[AudioSourceType, IngestResampler] = {
+            source_type: IngestResampler(ingest_format)
+            for source_type in AudioSourceType
+        } if ingest_format is not None else {}
         
         # Threading components
         self.mic_thread: Optional[threading.Thread] = None
@@ -160,6 +229,14 @@ class PipelineManager:
             'input': [],
             'system_loopback': []
         }
+        # Devices are enumerated once and looked up by index or name;
+        # the lists are rebuilt only on refresh or a detected hot-plug
+        self.device_registry = device_registry or get_device_registry()
+        self._devices_by_index: Dict[str, Dict[int, DeviceInfo]] = {}
+        self._devices_by_name: Dict[str, Dict[str, DeviceInfo]] = {}
+        self._device_monitor_active = False
+        # Built when a stream starts and read by its capture loop
+        self.stream_metadata: Dict[AudioSourceType, StreamMetadata] = {}
         
         # Language and processing settings
         self.target_language: str = "en"
@@ -170,16 +247,38 @@ class PipelineManager:
         
         # Audio buffering for voice activity detection
         self.audio_buffer_duration = 3.0  # seconds
-        self.audio_buffers = {
-            AudioSourceType.MICROPHONE: [],
-            AudioSourceType.SYSTEM_AUDIO: []
+        self.audio_buffers: Dict[AudioSourceType, AudioRingBuffer] = {
+            AudioSourceType.MICROPHONE: AudioRingBuffer(self.audio_buffer_duration),
+            AudioSourceType.SYSTEM_AUDIO: AudioRingBuffer(self.audio_buffer_duration)
         }
+        self.latest_chunks: Dict[AudioSourceType, AudioStreamData] = {}
         self.last_activity_time: Dict[AudioSourceType, float] = {
             AudioSourceType.MICROPHONE: 0.0,
             AudioSourceType.SYSTEM_AUDIO: 0.0
         }
         self.vad_threshold = 0.01  # Voice activity detection threshold
         self.silence_duration = 1.0  # seconds of silence before processing buffer
+        if vad_type == VADType.ENERGY or vad_type == VADType.ENERGY.value:
+            self.vad = create_vad(VADType.ENERGY, threshold=self.vad_threshold)
+        else:
+            self.vad = create_vad(vad_type)
+        self.logger.info(f"Voice activity detection: {self.vad.vad_type.value}")
+        
+        # Streaming STT sessions (one per active source)
+        self.streaming_stt = streaming_stt
+        self.stt_streams: Dict[AudioSourceType, Any] = {}
+        self.open_streams: set = set()
+        
+        # STT and translation run on their own worker stage so a slow model
+        # call never stalls draining of the capture queues
+        self.transcription_stage = TranscriptionStage(
+            process=self._run_transcription_job,
+            deliver=self._deliver_job_result,
+            num_workers=stt_workers,
+            max_queue_size=stt_queue_size,
+            policy=stt_backpressure,
+            coalesce=self._coalesce_jobs
+        )
         
         # Initialize adapters if available
         if ADAPTERS_AVAILABLE and WhisperSTTAdapter is not None:
@@ -214,14 +313,15 @@ class PipelineManager:
         self.on_transcript = on_transcript
         self.on_translation = on_translation
         self.on_status = on_status
+        self.on_partial_transcript = on_partial_transcript
         
         # Legacy callback support (for backwards compatibility)
         self.status_callback: Optional[Callable] = None
         self.error_callback: Optional[Callable] = None
         self.data_callback: Optional[Callable] = None
         
-        # Initialize available devices
-        self.refresh_audio_devices()
+        # Initialize available devices from the shared enumeration
+        self._rebuild_device_lists(self.device_registry.devices())
     
     def set_callbacks(self, 
                      status_callback: Optional[Callable] = None,
@@ -256,61 +356,10 @@ class PipelineManager:
         self.logger.info(f"STT backend set to: {type(backend).__name__}")
     
     def refresh_audio_devices(self) -> Dict[str, List[DeviceInfo]]:
-        """Refresh and return available audio devices."""
-        if not AUDIO_CAPTURE_AVAILABLE:
-            self.logger.warning("AudioCapture not available - cannot refresh devices")
-            return self.available_devices
-        
+        """Enumerate the devices again and return them."""
         try:
-            # Get device information from AudioCapture
-            if not AUDIO_CAPTURE_AVAILABLE or AudioCapture is None:
-                self.logger.warning("AudioCapture not available for device refresh")
-                return self.available_devices
-                
-            temp_capture = AudioCapture()
-            devices_info = temp_capture.list_devices()
-            
-            # Clear existing devices
-            self.available_devices = {'input': [], 'system_loopback': []}
-            
-            # Process all devices from sd.query_devices()
-            all_devices = devices_info.get('devices', [])
-            self.logger.info(f"Detected audio devices: {len(all_devices)}")
-            
-            for i, device in enumerate(all_devices):
-                device_name = device.get('name', f'Unknown Device {i}')
-                max_input_channels = device.get('max_input_channels', 0)
-                max_output_channels = device.get('max_output_channels', 0)
-                
-                # Log device details for debugging
-                self.logger.debug(f"Device {i}: {device_name} "
-                                f"(in:{max_input_channels}, out:{max_output_channels})")
-                
-                # Add as input device if it has input channels
-                if max_input_channels > 0:
-                    # Exclude monitor/loopback devices from regular input list
-                    if not any(keyword in device_name.lower() 
-                              for keyword in ['monitor', 'loopback', 'output']):
-                        device_info = DeviceInfo(
-                            index=i,
-                            name=device_name,
-                            channels=max_input_channels,
-                            sample_rate=device.get('default_samplerate', 16000),
-                            is_input=True
-                        )
-                        self.available_devices['input'].append(device_info)
-                
-                # Add as system loopback device if it's a monitor/loopback device
-                if any(keyword in device_name.lower() 
-                      for keyword in ['monitor', 'loopback', 'stereo mix', 'what u hear']):
-                    device_info = DeviceInfo(
-                        index=i,
-                        name=device_name,
-                        channels=max_output_channels if max_output_channels > 0 else 2,
-                        sample_rate=device.get('default_samplerate', 44100),
-                        is_input=False
-                    )
-                    self.available_devices['system_loopback'].append(device_info)
+            self.device_registry.refresh()
+            self._rebuild_device_lists(self.device_registry.devices())
             
             self.logger.info(f"Found {len(self.available_devices['input'])} input devices")
             self.logger.info(f"Found {len(self.available_devices['system_loopback'])} loopback devices")
@@ -329,6 +378,85 @@ class PipelineManager:
                 self.error_callback(f"Device refresh error: {e}")
             return self.available_devices
     
+    def _rebuild_device_lists(self, devices: Tuple[AudioDevice, ...]) -> None:
+        """Classify registry devices into input and loopback lists with lookup tables."""
+        available: Dict[str, List[DeviceInfo]] = {'input': [], 'system_loopback': []}
+        self.logger.debug(f"Detected audio devices: {len(devices)}")
+        
+        for device in devices:
+            name = device.name.lower()
+            self.logger.debug(f"Device {device.index}: {device.name} "
+                            f"(in:{device.max_input_channels}, out:{device.max_output_channels})")
+            
+            # Add as input device if it has input channels, excluding
+            # monitor/loopback devices from the regular input list
+            if device.max_input_channels > 0 and not any(
+                    keyword in name for keyword in ['monitor', 'loopback', 'output']):
+                available['input'].append(DeviceInfo(
+                    index=device.index,
+                    name=device.name,
+                    channels=device.max_input_channels,
+                    sample_rate=device.default_samplerate or 16000,
+                    is_input=True,
+                    hostapi=device.hostapi
+                ))
+            
+            # Add as system loopback device if it's a monitor/loopback device
+            if any(keyword in name for keyword in ['monitor', 'loopback', 'stereo mix', 'what u hear']):
+                available['system_loopback'].append(DeviceInfo(
+                    index=device.index,
+                    name=device.name,
+                    channels=device.max_output_channels if device.max_output_channels > 0 else 2,
+                    sample_rate=device.default_samplerate or 44100,
+                    is_input=False,
+                    hostapi=device.hostapi
+                ))
+        
+        # Swap in complete tables so lookups never see a partial list
+        self._devices_by_index = {category: {d.index: d for d in found}
+                                  for category, found in available.items()}
+        self._devices_by_name = {category: {d.name: d for d in reversed(found)}
+                                 for category, found in available.items()}
+        self.available_devices = available
+    
+    def _lookup_device(self, category: str, index: Optional[int]) -> Optional[DeviceInfo]:
+        """Device of a category ('input' or 'system_loopback') by index."""
+        return self._devices_by_index.get(category, {}).get(index)
+    
+    def start_device_monitor(self, interval: float = 2.0) -> None:
+        """
+        Watch for hot-plugged devices on a background timer.
+        
+        PortAudio is only re-initialized to pick up new devices while
+        neither capture stream is running.
+        """
+        if self._device_monitor_active:
+            return
+        self._device_monitor_active = True
+        self.device_registry.add_listener(self._on_devices_changed)
+        self.device_registry.start_polling(
+            interval, can_reinitialize=lambda: not (self.mic_active or self.sys_active))
+    
+    def stop_device_monitor(self) -> None:
+        """Stop watching for hot-plugged devices."""
+        if not self._device_monitor_active:
+            return
+        self._device_monitor_active = False
+        self.device_registry.remove_listener(self._on_devices_changed)
+        self.device_registry.stop_polling()
+    
+    def _on_devices_changed(self, added: Tuple[AudioDevice, ...],
+                            removed: Tuple[AudioDevice, ...]) -> None:
+        """Rebuild the device lists after a hot-plug."""
+        self._rebuild_device_lists(self.device_registry.devices())
+        for device in added:
+            self.logger.info(f"Audio device connected: {device.name}")
+        for device in removed:
+            self.logger.info(f"Audio device disconnected: {device.name}")
+        if self.on_status:
+            self.on_status("devices", "changed", f"{len(added)} added, {len(removed)} removed")
+        self._notify_audio_event("Audio devices changed", "info", "audio_system")
+    
     def get_available_devices(self, source_type: AudioSourceType) -> List[str]:
         """Get available devices for the specified source type (legacy method)."""
         if source_type == AudioSourceType.MICROPHONE:
@@ -341,20 +469,18 @@ class PipelineManager:
         """Set the selected device for the specified source type (legacy method)."""
         try:
             if source_type == AudioSourceType.MICROPHONE:
-                devices = self.available_devices.get('input', [])
-                for device in devices:
-                    if device.name == device_name:
-                        self.selected_mic_device = device.index
-                        self.logger.info(f"Selected microphone device: {device_name} (index: {device.index})")
-                        return True
+                device = self._devices_by_name.get('input', {}).get(device_name)
+                if device is not None:
+                    self.selected_mic_device = device.index
+                    self.logger.info(f"Selected microphone device: {device_name} (index: {device.index})")
+                    return True
                         
             elif source_type == AudioSourceType.SYSTEM_AUDIO:
-                devices = self.available_devices.get('system_loopback', [])
-                for device in devices:
-                    if device.name == device_name:
-                        self.selected_sys_device = device.index
-                        self.logger.info(f"Selected system audio device: {device_name} (index: {device.index})")
-                        return True
+                device = self._devices_by_name.get('system_loopback', {}).get(device_name)
+                if device is not None:
+                    self.selected_sys_device = device.index
+                    self.logger.info(f"Selected system audio device: {device_name} (index: {device.index})")
+                    return True
             
             self.logger.error(f"Device '{device_name}' not found for {source_type.value}")
             return False
@@ -385,18 +511,22 @@ class PipelineManager:
                 
             self.mic_capture = AudioCapture()
             
-            # Find device by index
-            device_name = "Unknown"
-            for device in self.available_devices.get('input', []):
-                if device.index == device_index:
-                    device_name = device.name
-                    break
+            device = self._lookup_device('input', device_index)
+            device_name = device.name if device else "Unknown"
             
             if not self.mic_capture.initialize_device_by_index(device_index):
                 self.logger.error(f"Failed to initialize microphone device index: {device_index}")
                 return False
             
+            if AudioSourceType.MICROPHONE in self.ingest_resamplers:
+                self.ingest_resamplers[AudioSourceType.MICROPHONE].reset()
+            if not self.mic_capture.start_streaming(self.capture_frame_duration,
+                                                  self.capture_buffer_duration):
+                self.logger.warning("Capture stream unavailable, recording microphone chunk by chunk")
+            
             self.selected_mic_device = device_index
+            self.stream_metadata[AudioSourceType.MICROPHONE] = self._build_stream_metadata(
+                AudioSourceType.MICROPHONE, self.mic_capture, device_index)
             
             # Start capture thread
             self.mic_running.set()
@@ -448,18 +578,22 @@ class PipelineManager:
                 
             self.sys_capture = AudioCapture()
             
-            # Find device by index
-            device_name = "Unknown"
-            for device in self.available_devices.get('system_loopback', []):
-                if device.index == device_index:
-                    device_name = device.name
-                    break
+            device = self._lookup_device('system_loopback', device_index)
+            device_name = device.name if device else "Unknown"
             
             if not self.sys_capture.initialize_device_by_index(device_index):
                 self.logger.error(f"Failed to initialize system audio device index: {device_index}")
                 return False
             
+            if AudioSourceType.SYSTEM_AUDIO in self.ingest_resamplers:
+                self.ingest_resamplers[AudioSourceType.SYSTEM_AUDIO].reset()
+            if not self.sys_capture.start_streaming(self.capture_frame_duration,
+                                                  self.capture_buffer_duration):
+                self.logger.warning("Capture stream unavailable, recording system audio chunk by chunk")
+            
             self.selected_sys_device = device_index
+            self.stream_metadata[AudioSourceType.SYSTEM_AUDIO] = self._build_stream_metadata(
+                AudioSourceType.SYSTEM_AUDIO, self.sys_capture, device_index)
             
             # Start capture thread
             self.sys_running.set()
@@ -599,6 +733,7 @@ class PipelineManager:
             if self.mic_capture:
                 self.mic_capture.stop_capture()
                 self.mic_capture = None
+            self.stream_metadata.pop(AudioSourceType.MICROPHONE, None)
             
             self.mic_active = False
             self.logger.info("Stopped microphone capture")
@@ -639,6 +774,7 @@ class PipelineManager:
             if self.sys_capture:
                 self.sys_capture.stop_capture()
                 self.sys_capture = None
+            self.stream_metadata.pop(AudioSourceType.SYSTEM_AUDIO, None)
             
             self.sys_active = False
             self.logger.info("Stopped system audio capture")
@@ -664,6 +800,7 @@ class PipelineManager:
             return True
         
         try:
+            self.transcription_stage.start()
             self.processing_running.set()
             self.processing_thread = threading.Thread(
                 target=self._processing_loop,
@@ -692,6 +829,9 @@ class PipelineManager:
             if self.processing_thread and self.processing_thread.is_alive():
                 self.processing_thread.join(timeout=2.0)
             
+            self.transcription_stage.stop()
+            self._finish_open_streams()
+            
             self.logger.info("Stopped audio processing thread")
             return True
             
@@ -705,6 +845,7 @@ class PipelineManager:
         
         # Set shutdown event
         self.shutdown_event.set()
+        self.stop_device_monitor()
         
         # Stop all captures
         success = True
@@ -712,8 +853,9 @@ class PipelineManager:
         success &= self.stop_system_capture()
         success &= self.stop_processing()
         
-        # Clear queues
+        # Clear queues; streaming sessions still open deliver what they heard
         self._clear_queues()
+        self._finish_open_streams()
         
         # Reset statistics
         self.recording_stats = {
@@ -755,41 +897,91 @@ class PipelineManager:
             }
         }
     
+    def _next_capture_chunk(self, capture: Any) -> Tuple[Optional[Any], float, bool]:
+        """
+        Read the next chunk from a capture source.
+
+        Returns:
+            (audio, capture timestamp, True if it came from a capture stream)
+        """
+        if getattr(capture, 'is_streaming', False) is True:
+            audio_data = capture.read_frame(timeout=0.5)
+            timestamp = capture.capture_stream.last_frame_time if audio_data is not None else None
+            return audio_data, timestamp or time.time(), True
+        return capture.capture_chunk(), time.time(), False
+    
+    def _build_stream_metadata(self, source_type: AudioSourceType, capture: Any,
+                               device_index: Optional[int]) -> StreamMetadata:
+        """Describe a capture stream once, when it starts."""
+        category = 'input' if source_type == AudioSourceType.MICROPHONE else 'system_loopback'
+        device = self._lookup_device(category, device_index)
+        stream = getattr(capture, 'capture_stream', None)
+        # Capture streams deliver their configured dtype, sd.rec float32
+        dtype = (np.dtype(stream.dtype).name if getattr(capture, 'is_streaming', False) is True
+                 else 'float32')
+        return StreamMetadata(
+            source_type=source_type,
+            device_index=device_index,
+            device_name=device.name if device else "Unknown",
+            hostapi=device.hostapi if device else "",
+            source_format=SampleFormat(dtype, getattr(capture, 'sample_rate', 16000),
+                                       getattr(capture, 'channels', 1))
+        )
+    
+    def _ingest_audio(self, source_type: AudioSourceType, capture: Any,
+                      audio_data: Any) -> Tuple[bytes, SampleFormat]:
+        """
+        Convert a captured chunk to the ingest format.
+        
+        Returns:
+            (PCM bytes, their sample format)
+        """
+        if isinstance(audio_data, (bytes, bytearray, memoryview)):
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+        else:
+            samples = np.asarray(audio_data)
+        metadata = self.stream_metadata.get(source_type)
+        if metadata is not None and metadata.source_format.dtype == samples.dtype.name:
+            source_format = metadata.source_format
+        else:
+            source_format = SampleFormat(samples.dtype.name,
+                                         getattr(capture, 'sample_rate', 16000),
+                                         getattr(capture, 'channels', 1))
+        
+        resampler = self.ingest_resamplers.get(source_type)
+        if resampler is None:
+            return samples.tobytes(), source_format
+        return resampler.process(samples, source_format).tobytes(), resampler.target
+    
     def _microphone_capture_loop(self):
         """Main loop for microphone audio capture."""
         self.logger.debug("Microphone capture loop started")
         
+        metadata = self.stream_metadata.get(AudioSourceType.MICROPHONE)
+        if metadata is None:
+            metadata = self.stream_metadata[AudioSourceType.MICROPHONE] = self._build_stream_metadata(
+                AudioSourceType.MICROPHONE, self.mic_capture, self.selected_mic_device)
+        
         try:
             while self.mic_running.is_set() and not self.shutdown_event.is_set():
                 if not self.mic_capture:
                     break
                 
                 # Capture audio data
-                audio_data = self.mic_capture.capture_chunk()
+                audio_data, timestamp, streamed = self._next_capture_chunk(self.mic_capture)
                 if audio_data is not None:
-                    device_name = "Unknown"
-                    for device in self.available_devices.get('input', []):
-                        if device.index == self.selected_mic_device:
-                            device_name = device.name
-                            break
-                    
-                    # Convert numpy array to bytes if necessary
-                    if hasattr(audio_data, 'tobytes'):
-                        audio_bytes = audio_data.tobytes()
-                    elif isinstance(audio_data, bytes):
-                        audio_bytes = audio_data
-                    else:
-                        # Convert other types to bytes
-                        import numpy as np
-                        audio_bytes = np.array(audio_data, dtype=np.int16).tobytes()
+                    # Convert once to the pipeline format
+                    audio_bytes, sample_format = self._ingest_audio(
+                        AudioSourceType.MICROPHONE, self.mic_capture, audio_data)
                     
                     stream_data = AudioStreamData(
                         source_type=AudioSourceType.MICROPHONE,
                         audio_data=audio_bytes,
-                        timestamp=time.time(),
-                        device_name=device_name,
-                        sample_rate=getattr(self.mic_capture, 'sample_rate', 16000),
-                        channels=getattr(self.mic_capture, 'channels', 1)
+                        timestamp=timestamp,
+                        device_name=metadata.device_name,
+                        sample_rate=sample_format.sample_rate,
+                        channels=sample_format.channels,
+                        sample_format=sample_format
                     )
                     
                     try:
@@ -799,8 +991,9 @@ class PipelineManager:
                     except queue.Full:
                         self.logger.warning("Microphone queue full, dropping packet")
                 
-                # Small delay to prevent CPU overload - use threading.Event for better control
-                if not self.shutdown_event.wait(0.01):  # Non-blocking wait for 10ms
+                # Stream reads block until the next frame; only chunked
+                # recording needs a small delay to prevent CPU overload
+                if not streamed and not self.shutdown_event.wait(0.01):
                     continue
                 
         except Exception as e:
@@ -814,37 +1007,31 @@ class PipelineManager:
         """Main loop for system audio capture."""
         self.logger.debug("System audio capture loop started")
         
+        metadata = self.stream_metadata.get(AudioSourceType.SYSTEM_AUDIO)
+        if metadata is None:
+            metadata = self.stream_metadata[AudioSourceType.SYSTEM_AUDIO] = self._build_stream_metadata(
+                AudioSourceType.SYSTEM_AUDIO, self.sys_capture, self.selected_sys_device)
+        
         try:
             while self.sys_running.is_set() and not self.shutdown_event.is_set():
                 if not self.sys_capture:
                     break
                 
                 # Capture audio data
-                audio_data = self.sys_capture.capture_chunk()
+                audio_data, timestamp, streamed = self._next_capture_chunk(self.sys_capture)
                 if audio_data is not None:
-                    device_name = "Unknown"
-                    for device in self.available_devices.get('system_loopback', []):
-                        if device.index == self.selected_sys_device:
-                            device_name = device.name
-                            break
-                    
-                    # Convert numpy array to bytes if necessary
-                    if hasattr(audio_data, 'tobytes'):
-                        audio_bytes = audio_data.tobytes()
-                    elif isinstance(audio_data, bytes):
-                        audio_bytes = audio_data
-                    else:
-                        # Convert other types to bytes
-                        import numpy as np
-                        audio_bytes = np.array(audio_data, dtype=np.int16).tobytes()
+                    # Convert once to the pipeline format
+                    audio_bytes, sample_format = self._ingest_audio(
+                        AudioSourceType.SYSTEM_AUDIO, self.sys_capture, audio_data)
                     
                     stream_data = AudioStreamData(
                         source_type=AudioSourceType.SYSTEM_AUDIO,
                         audio_data=audio_bytes,
-                        timestamp=time.time(),
-                        device_name=device_name,
-                        sample_rate=getattr(self.sys_capture, 'sample_rate', 16000),
-                        channels=getattr(self.sys_capture, 'channels', 1)
+                        timestamp=timestamp,
+                        device_name=metadata.device_name,
+                        sample_rate=sample_format.sample_rate,
+                        channels=sample_format.channels,
+                        sample_format=sample_format
                     )
                     
                     try:
@@ -854,8 +1041,9 @@ class PipelineManager:
                     except queue.Full:
                         self.logger.warning("System audio queue full, dropping packet")
                 
-                # Small delay to prevent CPU overload - use threading.Event for better control
-                if not self.shutdown_event.wait(0.01):  # Non-blocking wait for 10ms
+                # Stream reads block until the next frame; only chunked
+                # recording needs a small delay to prevent CPU overload
+                if not streamed and not self.shutdown_event.wait(0.01):
                     continue
                 
         except Exception as e:
@@ -962,6 +1150,10 @@ class PipelineManager:
                 self.logger.warning("No STT adapter available, skipping transcript processing")
                 return
             
+            if self.streaming_stt and hasattr(self.stt_adapter, 'create_stream'):
+                self._process_streaming_audio(stream_data)
+                return
+            
             # Add audio chunk to buffer for VAD processing
             self._add_to_audio_buffer(stream_data)
             
@@ -980,40 +1172,38 @@ class PipelineManager:
         try:
             buffer = self.audio_buffers[stream_data.source_type]
             
-            # Add current chunk to buffer
-            buffer.append(stream_data)
-            
-            # Simple voice activity detection based on RMS energy
-            has_voice_activity = self._detect_voice_activity(stream_data.audio_data)
+            # Size the ring from the stream's real format; the oldest audio
+            # is overwritten once it holds audio_buffer_duration seconds
+            sample_format = stream_data.pcm_format
+            if buffer.configure(sample_format.sample_rate, sample_format.channels, sample_format.dtype):
+                self.logger.debug(f"Audio buffer for {stream_data.source_type.value} resized to "
+                                  f"{buffer.capacity} frames ({sample_format.sample_rate} Hz, "
+                                  f"{sample_format.channels} ch, {sample_format.dtype})")
+            samples = stream_data.samples()
+            buffer.write(samples, stream_data.timestamp)
+            self.latest_chunks[stream_data.source_type] = stream_data
+            
+            has_voice_activity = self._detect_voice_activity(
+                samples,
+                source_type=stream_data.source_type,
+                sample_rate=stream_data.sample_rate,
+                channels=stream_data.channels
+            )
             
             if has_voice_activity:
                 self.last_activity_time[stream_data.source_type] = time.time()
-            
-            # Limit buffer size to prevent excessive memory usage
-            max_buffer_chunks = int(self.audio_buffer_duration / 1.0)  # Assuming 1-second chunks
-            if len(buffer) > max_buffer_chunks:
-                buffer.pop(0)  # Remove oldest chunk
                 
         except Exception as e:
             self.logger.error(f"Error adding audio to buffer: {e}")
     
-    def _detect_voice_activity(self, audio_data: bytes) -> bool:
-        """Simple voice activity detection based on RMS energy."""
+    def _detect_voice_activity(self, audio_data: Union[bytes, np.ndarray],
+                               source_type: Optional[AudioSourceType] = None,
+                               sample_rate: int = 16000, channels: int = 1) -> bool:
+        """Run the configured voice activity detector on an audio chunk."""
         try:
-            # Convert bytes to samples (assuming 16-bit PCM)
-            import struct
-            samples = struct.unpack(f'<{len(audio_data)//2}h', audio_data)
-            
-            # Calculate RMS energy
-            if len(samples) > 0:
-                rms = (sum(sample * sample for sample in samples) / len(samples)) ** 0.5
-                normalized_rms = rms / 32768.0  # Normalize to [0, 1] range
-                
-                # Check if energy exceeds threshold
-                return normalized_rms > self.vad_threshold
-            else:
-                return False
-                
+            source = source_type.value if source_type else "default"
+            return self.vad.is_speech(audio_data, sample_rate=sample_rate,
+                                      channels=channels, source=source)
         except Exception as e:
             self.logger.debug(f"VAD processing error: {e}")
             return True  # Default to processing if VAD fails
@@ -1028,97 +1218,244 @@ class PipelineManager:
         has_sufficient_silence = silence_duration >= self.silence_duration
         
         # Also process if buffer is getting full
-        buffer_length = len(self.audio_buffers[source_type])
-        max_buffer_chunks = int(self.audio_buffer_duration / 1.0)
-        buffer_full = buffer_length >= max_buffer_chunks
+        buffer = self.audio_buffers[source_type]
         
-        return has_sufficient_silence and buffer_length > 0 or buffer_full
+        return has_sufficient_silence and len(buffer) > 0 or buffer.is_full
     
     def _process_buffered_audio(self, source_type: AudioSourceType):
         """Process accumulated audio buffer through STT."""
         try:
             buffer = self.audio_buffers[source_type]
             
-            if not buffer:
-                return
-            
-            # Combine audio chunks into single audio data
-            combined_audio_data = self._combine_audio_chunks(buffer)
-            
-            if not combined_audio_data:
+            if not len(buffer):
                 return
             
-            # Use the most recent chunk's metadata for the combined audio
-            latest_chunk = buffer[-1]
+            # Contiguous view of the buffered utterance (no concatenation)
+            window = buffer.view()
+            latest_chunk = self.latest_chunks[source_type]
             
             # Convert to AudioData format for STT adapter
             if not ADAPTERS_AVAILABLE or AudioData is None or AudioFormat is None:
                 self.logger.warning("AudioData/AudioFormat not available, cannot create audio data object")
                 return
-                
+            
+            # Transcribing inline can use the view directly; a queued job
+            # outlives the next writes to the ring, so it gets one copy
+            if self.transcription_stage.is_running():
+                data = window.tobytes()
+            else:
+                data = memoryview(window).cast('B')
+            
             audio_data = AudioData(
-                data=combined_audio_data,
-                sample_rate=latest_chunk.sample_rate,
-                channels=latest_chunk.channels,
+                data=data,
+                sample_rate=buffer.sample_rate,
+                channels=buffer.channels,
                 format=AudioFormat.PCM,
                 source_type=source_type.value,
                 language_hint=latest_chunk.language_hint,
-                device_info=latest_chunk.device_name
+                device_info=latest_chunk.device_name,
+                sample_format=SampleFormat(buffer.dtype.name, buffer.sample_rate, buffer.channels)
             )
             
-            # Perform STT transcription
-            if self.stt_adapter is None:
-                self.logger.warning("STT adapter is None, cannot transcribe audio")
-                return
-                
-            transcription_result = self.stt_adapter.transcribe(audio_data)
-            
-            # Only process if we got meaningful text
-            if transcription_result.text.strip():
-                source = source_type.value
-                text = transcription_result.text.strip()
-                language = transcription_result.language
-                confidence = transcription_result.confidence
-                
-                self.logger.debug(f"Transcribed from {source}: '{text}' (lang: {language}, confidence: {confidence:.2f})")
-                
-                # Call transcript callback with proper signature: (source, text, language)
-                if self.on_transcript:
-                    self.on_transcript(source, text, language, confidence)
-                
-                # Send notification for transcript
-                self._notify_transcript_processed(source, text)
-                
-                # Handle translation if enabled and translation callback exists
-                if self.on_translation and self.translation_adapter and language != self.target_language:
-                    self._process_translation(source, text, language, self.target_language)
+            # Hand the utterance to the transcription stage
+            self._submit_transcription(source_type, audio_data)
             
             # Clear the processed buffer
-            self.audio_buffers[source_type].clear()
+            buffer.clear()
             
         except Exception as e:
             self.logger.error(f"Error processing buffered audio: {e}")
     
-    def _combine_audio_chunks(self, audio_chunks: List[AudioStreamData]) -> bytes:
-        """Combine multiple audio chunks into a single audio data buffer."""
-        try:
-            if not audio_chunks:
-                return b''
-            
-            # Simply concatenate audio data from all chunks
-            combined_data = b''.join(chunk.audio_data for chunk in audio_chunks)
-            return combined_data
-            
-        except Exception as e:
-            self.logger.error(f"Error combining audio chunks: {e}")
-            return b''
+    def _submit_transcription(self, source_type: AudioSourceType, job: Any):
+        """Queue a job on the transcription stage, or run it inline if the stage is stopped."""
+        if self.transcription_stage.is_running():
+            # A streaming session needs every chunk, so backpressure merges them instead
+            self.transcription_stage.submit(source_type.value, job,
+                                            droppable=not isinstance(job, StreamingChunk))
+            return
+        self._deliver_job_result(source_type.value, -1,
+                                 self._run_transcription_job(source_type.value, job))
+    
+    def _run_transcription_job(self, source: str, job: Any) -> Optional[Dict[str, Any]]:
+        """Run STT and translation for one job (transcription stage worker).
+        
+        Returns:
+            Dictionary with an optional 'partial' streaming update and an
+            optional 'transcript' ready for delivery, or None
+        """
+        if self.stt_adapter is None:
+            self.logger.warning("STT adapter is None, cannot transcribe audio")
+            return None
+        
+        if isinstance(job, StreamingChunk):
+            return self._run_streaming_job(AudioSourceType(source), job)
+        
+        transcription_result = self.stt_adapter.transcribe(job)
+        
+        # Only process if we got meaningful text
+        text = transcription_result.text.strip()
+        if not text:
+            return None
+        return {'transcript': self._prepare_transcript(
+            source, text, transcription_result.language, transcription_result.confidence)}
+    
+    def _prepare_transcript(self, source: str, text: str, language: str,
+                            confidence: float) -> Dict[str, Any]:
+        """Build a final transcript, translating it if needed."""
+        transcript = {
+            'source': source,
+            'text': text,
+            'language': language,
+            'confidence': confidence,
+            'target_language': self.target_language,
+            'translation': None
+        }
+        if self.on_translation and self.translation_adapter and language != self.target_language:
+            transcript['translation'] = self._translate_text(text, language, self.target_language)
+        return transcript
+    
+    def _deliver_job_result(self, source: str, sequence: int, result: Optional[Dict[str, Any]]):
+        """Send a job's results to callbacks (called in per-source order)."""
+        if not result:
+            return
+        
+        update = result.get('partial')
+        if update is not None and self.on_partial_transcript:
+            try:
+                self.on_partial_transcript(source, update.committed_text,
+                                           update.unstable_text, update.language)
+            except Exception as callback_error:
+                self.logger.error(f"Partial transcript callback error: {callback_error}")
+        
+        transcript = result.get('transcript')
+        if transcript is not None:
+            self._deliver_transcript(transcript)
+    
+    def _deliver_transcript(self, transcript: Dict[str, Any]):
+        """Send a final transcript and its translation to callbacks."""
+        source = transcript['source']
+        text = transcript['text']
+        language = transcript['language']
+        self.logger.debug(f"Transcribed from {source}: '{text}' (lang: {language}, "
+                          f"confidence: {transcript['confidence']:.2f})")
+        
+        # Call transcript callback with proper signature: (source, text, language)
+        if self.on_transcript:
+            self.on_transcript(source, text, language, transcript['confidence'])
+        
+        # Send notification for transcript
+        self._notify_transcript_processed(source, text)
+        
+        translated_text = transcript['translation']
+        if translated_text:
+            target_lang = transcript['target_language']
+            # Call translation callback with proper signature
+            if self.on_translation:
+                self.on_translation(source, text, translated_text, language, target_lang)
+            
+            # Send notification for translation
+            self._notify_translation_processed(source, text, translated_text)
+    
+    def _coalesce_jobs(self, pending: Any, new: Any) -> Optional[Any]:
+        """Merge a new job into a pending one of the same source, if compatible.
+        
+        Streaming chunks are not merged across the end of a session; such a
+        chunk is queued after the finishing one instead of being dropped.
+        """
+        if isinstance(pending, StreamingChunk) and isinstance(new, StreamingChunk):
+            old_data, new_data = pending.stream_data, new.stream_data
+            if pending.finish or old_data.pcm_format != new_data.pcm_format:
+                return None
+            merged = replace(old_data, audio_data=b''.join((old_data.audio_data, new_data.audio_data)))
+            return StreamingChunk(merged, new.finish)
+        
+        if (AudioData is not None and isinstance(pending, AudioData) and isinstance(new, AudioData)
+                and pending.format == new.format == AudioFormat.PCM
+                and pending.pcm_format == new.pcm_format):
+            return replace(new, data=b''.join((pending.view, new.view)))
+        
+        return None
+    
+    def _process_streaming_audio(self, stream_data: AudioStreamData):
+        """Feed a chunk to the source's streaming STT session.
+        
+        A session starts on the first voiced chunk and receives every chunk
+        until ``silence_duration`` of silence, then it is finished and its
+        committed text delivered as the final transcript. Partial hypotheses
+        go to ``on_partial_transcript`` as they are decoded.
+        """
+        source_type = stream_data.source_type
+        now = time.time()
+        
+        has_voice_activity = self._detect_voice_activity(
+            stream_data.samples(),
+            source_type=source_type,
+            sample_rate=stream_data.sample_rate,
+            channels=stream_data.channels
+        )
+        if has_voice_activity:
+            self.last_activity_time[source_type] = now
+        
+        # Sessions start on the first voiced chunk; the worker owns the session itself
+        if source_type not in self.open_streams:
+            if not has_voice_activity:
+                return
+            self.open_streams.add(source_type)
+        
+        finish = not has_voice_activity and now - self.last_activity_time[source_type] >= self.silence_duration
+        if finish:
+            self.open_streams.discard(source_type)
+        self._submit_transcription(source_type, StreamingChunk(stream_data, finish))
+    
+    def _run_streaming_job(self, source_type: AudioSourceType, job: StreamingChunk) -> Dict[str, Any]:
+        """Push a chunk to the source's streaming session (transcription stage worker)."""
+        stream_data = job.stream_data
+        stream = self.stt_streams.get(source_type)
+        if stream is None:
+            stream = self.stt_adapter.create_stream(language=stream_data.language_hint)
+            self.stt_streams[source_type] = stream
+        
+        sample_format = stream_data.pcm_format
+        if sample_format.dtype == "float32" and sample_format.channels == 1:
+            # Already in the ingest format; no second conversion
+            partial = stream.push(stream_data.samples(), sample_format.sample_rate)
+        else:
+            partial = stream.push_pcm(stream_data.audio_data, stream_data.sample_rate, stream_data.channels)
+        result: Dict[str, Any] = {'partial': partial}
+        if job.finish:
+            result['transcript'] = self._finish_stream(source_type)
+        return result
+    
+    def _finish_stream(self, source_type: AudioSourceType) -> Optional[Dict[str, Any]]:
+        """Finish a streaming STT session and build its final transcript."""
+        stream = self.stt_streams.pop(source_type, None)
+        if stream is None:
+            return None
+        
+        final = stream.finish()
+        text = final.committed_text.strip()
+        if not text:
+            return None
+        return self._prepare_transcript(source_type.value, text, final.language, 1.0)
+    
+    def _finish_open_streams(self):
+        """Finish every open streaming STT session and deliver its final transcript."""
+        self.open_streams.clear()
+        for source_type in list(self.stt_streams):
+            try:
+                transcript = self._finish_stream(source_type)
+                if transcript is not None:
+                    self._deliver_transcript(transcript)
+            except Exception as e:
+                self.logger.error(f"Error finishing {source_type.value} streaming session: {e}")
+        self.stt_streams.clear()
     
-    def _process_translation(self, source: str, original_text: str, source_lang: str, target_lang: str):
-        """Process translation and call translation callback."""
+    def _translate_text(self, original_text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """Translate text with the translation adapter; returns None on failure."""
         try:
             if not self.translation_adapter:
                 self.logger.warning("No translation adapter available")
-                return
+                return None
             
             # Perform translation
             translation_result = self.translation_adapter.translate(
@@ -1127,22 +1464,16 @@ class PipelineManager:
                 target_lang=target_lang
             )
             
-            if translation_result.translated_text.strip():
-                translated_text = translation_result.translated_text.strip()
-                
+            translated_text = translation_result.translated_text.strip()
+            if translated_text:
                 self.logger.debug(f"Translated from {source_lang} to {target_lang}: '{original_text}' -> '{translated_text}'")
-                
-                # Call translation callback with proper signature
-                if self.on_translation:
-                    self.on_translation(source, original_text, translated_text, source_lang, target_lang)
-                
-                # Send notification for translation
-                self._notify_translation_processed(source, original_text, translated_text)
+                return translated_text
             
         except Exception as e:
             self.logger.error(f"Error processing translation: {e}")
             if self.error_callback:
                 self.error_callback(f"Translation processing error: {e}")
+        return None
     
     def get_pipeline_health(self) -> Dict[str, Any]:
         """Get comprehensive health status of the pipeline components."""
@@ -1165,6 +1496,10 @@ class PipelineManager:
                     'sys_active': self.sys_active,
                     'processing_active': self.processing_running.is_set(),
                     'error': None
+                },
+                'transcription_stage': {
+                    'running': self.transcription_stage.is_running(),
+                    'error': None
                 }
             },
             'performance': {
@@ -1175,6 +1510,25 @@ class PipelineManager:
                     'mic_queue': self.mic_queue.qsize(),
                     'sys_queue': self.sys_queue.qsize(),
                     'output_queue': self.output_queue.qsize()
+                },
+                'transcription_stage': self.transcription_stage.get_stats(),
+                'translation_models': (self.translation_adapter.get_model_stats()
+                                       if hasattr(self.translation_adapter, 'get_model_stats') else {}),
+                'devices': self.device_registry.get_stats(),
+                'capture_streams': {
+                    source: capture.capture_stream.get_stats()
+                    for source, capture in (('microphone', self.mic_capture),
+                                            ('system_audio', self.sys_capture))
+                    if getattr(capture, 'is_streaming', False) is True
+                },
+                'audio_buffers': {
+                    source_type.value: {
+                        'buffered_seconds': buffer.buffered_seconds,
+                        'capacity_frames': buffer.capacity,
+                        'dropped_frames': buffer.dropped_frames,
+                        'memory_bytes': buffer.nbytes
+                    }
+                    for source_type, buffer in self.audio_buffers.items()
                 }
             }
         }
@@ -1201,6 +1555,11 @@ class PipelineManager:
             health_status['components']['audio_capture']['error'] = "Queue overflow detected"
             health_status['overall_status'] = 'degraded'
         
+        stage_stats = health_status['performance']['transcription_stage']
+        if stage_stats['queue_depth'] > stage_stats['max_queue_size'] * 0.8:
+            health_status['components']['transcription_stage']['error'] = "Transcription backlog"
+            health_status['overall_status'] = 'degraded'
+        
         return health_status
     
     def handle_component_failure(self, component_name: str, error: Exception):
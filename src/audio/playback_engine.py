@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Playback Engine
+==================================
+
+Persistent callback-driven output stream fed by a queue of decoded clips
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- sounddevice
+- numpy
+======================================================================
+Classes:
+- PlaybackClip: One queued clip, decoded to float32, with its timing.
+- PlaybackEngine: One open sd.OutputStream playing queued clips back to back.
+======================================================================
+
+Starting a thread and an sd.play() (or writing a temp file for a player)
+per clip pays the stream setup cost every time and leaves a gap between
+clips. The engine opens the output device once. play() only appends a clip
+to a queue; PortAudio's callback copies samples from the clip straight
+into its output buffer, continuing with the next clip inside the same
+block, so consecutive clips play without a gap. Clips are decoded to
+float32 once, when they are queued; the callback reads slices of that
+array and never copies or converts it again. Volume is applied in place
+to the output buffer.
+
+stop() and play(..., interrupt=True) drop the current and queued clips
+under a lock the callback takes only for a few pointer updates, so the
+next callback (one block later) already plays silence or the new clip.
+
+A clip's latency is the time from play() to the callback writing its
+first sample, plus the stream's reported output latency in get_stats().
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Union
+
+import numpy as np
+
+from ..logging_config import get_logger
+from .resampler import PolyphaseResampler
+
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    sd = None
+    SOUNDDEVICE_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+
+class PlaybackClip:
+    """
+    One queued clip, decoded to float32, with its timing.
+
+    Args:
+        samples: float32 samples, shape (frames, channels)
+        sample_rate: Sample rate in Hz
+    """
+
+    def __init__(self, samples: np.ndarray, sample_rate: int):
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.frames = samples.shape[0]
+        self.position = 0
+        self.queued_at = time.perf_counter()
+        self.started_at: Optional[float] = None
+        self.preempted = False
+        self.done = threading.Event()
+
+    @property
+    def duration(self) -> float:
+        """Clip length in seconds."""
+        return self.frames / self.sample_rate
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Seconds from play() to the first sample, once it started."""
+        return self.started_at - self.queued_at if self.started_at is not None else None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the clip has played or was dropped."""
+        return self.done.wait(timeout)
+
+
+class PlaybackEngine:
+    """
+    One open sd.OutputStream playing queued clips back to back.
+
+    The stream is opened on the first play(). Its sample rate and channel
+    count are taken from that clip unless given here; later clips in
+    another format are converted once when they are queued.
+
+    Args:
+        sample_rate: Stream sample rate in Hz (None: first clip's rate)
+        channels: Stream channels (None: first clip's channels)
+        device: Device index or name (None for the default output)
+        blocksize: Frames per callback (0 lets PortAudio choose)
+        latency: PortAudio latency setting ('low', 'high' or seconds)
+        backend: Module providing OutputStream (default: sounddevice)
+        latency_history: Number of recent clip latencies kept for stats
+    """
+
+    def __init__(self, sample_rate: Optional[int] = None, channels: Optional[int] = None,
+                 device: Optional[Union[int, str]] = None, blocksize: int = 0,
+                 latency: Union[str, float] = "low", backend: Any = None,
+                 latency_history: int = 100):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.device = device
+        self.blocksize = blocksize
+        self.latency = latency
+        self.backend = backend if backend is not None else sd
+
+        self._stream = None
+        self._lock = threading.Lock()
+        self._queue: Deque[PlaybackClip] = deque()
+        self._current: Optional[PlaybackClip] = None
+        self._volume = 1.0
+
+        self._latencies: Deque[float] = deque(maxlen=latency_history)
+        self.callbacks = 0
+        self.clips_played = 0
+        self.clips_preempted = 0
+        self.output_underflows = 0  # Blocks PortAudio reported as underflowed
+
+    @property
+    def is_active(self) -> bool:
+        """True while the output stream is open."""
+        return self._stream is not None
+
+    @property
+    def is_playing(self) -> bool:
+        """True while a clip is playing or queued."""
+        return self._current is not None or bool(self._queue)
+
+    @property
+    def volume(self) -> float:
+        """Playback volume (0.0 to 1.0)."""
+        return self._volume
+
+    @volume.setter
+    def volume(self, volume: float) -> None:
+        self._volume = max(0.0, min(1.0, float(volume)))
+
+    def start(self) -> bool:
+        """
+        Open and start the output stream.
+
+        Returns:
+            True if the stream is running
+        """
+        if self._stream is not None:
+            return True
+        if self.backend is None:
+            logger.error("sounddevice not available - cannot open playback stream")
+            return False
+        if self.sample_rate is None or self.channels is None:
+            logger.error("Playback stream format not set")
+            return False
+        try:
+            stream = self.backend.OutputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype="float32",
+                device=self.device,
+                blocksize=self.blocksize,
+                latency=self.latency,
+                callback=self._callback,
+            )
+            self._stream = stream
+            stream.start()
+        except Exception as e:
+            self._stream = None
+            logger.error(f"Failed to open playback stream on device {self.device}: {e}")
+            return False
+        logger.info(f"Playback stream started on device {self.device} "
+                    f"({self.sample_rate}Hz, {self.channels}ch)")
+        return True
+
+    def _prepare(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Shape float32 samples as (frames, channels) in the stream format."""
+        audio = np.asarray(samples, dtype=np.float32)
+        audio = audio.reshape(-1, 1) if audio.ndim == 1 else audio
+        # Mono clips are broadcast to every output channel by the callback
+        if audio.shape[1] not in (1, self.channels):
+            audio = audio.mean(axis=1, dtype=np.float32, keepdims=True)
+        if sample_rate != self.sample_rate:
+            resampler = PolyphaseResampler(sample_rate, self.sample_rate)
+            audio = np.stack([resampler.resample(audio[:, c]) for c in range(audio.shape[1])], axis=1)
+        return audio
+
+    def play(self, samples: np.ndarray, sample_rate: int, interrupt: bool = False) -> PlaybackClip:
+        """
+        Queue a clip.
+
+        Args:
+            samples: float32 samples, shape (frames,) or (frames, channels)
+            sample_rate: Sample rate of the samples
+            interrupt: Drop the current and queued clips first
+
+        Returns:
+            The queued clip (wait() on it to block until it has played)
+
+        Raises:
+            RuntimeError: If the output stream cannot be opened
+        """
+        if self.sample_rate is None:
+            self.sample_rate = int(sample_rate)
+        if self.channels is None:
+            self.channels = 1 if np.ndim(samples) == 1 else int(np.shape(samples)[1])
+        if not self.start():
+            raise RuntimeError("Playback stream not available")
+
+        clip = PlaybackClip(self._prepare(samples, sample_rate), self.sample_rate)
+        with self._lock:
+            if interrupt:
+                self._drop_locked()
+            if clip.frames:
+                self._queue.append(clip)
+        if not clip.frames:
+            clip.done.set()
+        return clip
+
+    def _drop_locked(self) -> None:
+        """Drop the current and queued clips; the lock must be held."""
+        dropped = list(self._queue)
+        if self._current is not None:
+            dropped.append(self._current)
+        self._queue.clear()
+        self._current = None
+        for clip in dropped:
+            clip.preempted = True
+            clip.done.set()
+        self.clips_preempted += len(dropped)
+
+    def _callback(self, outdata, frames, time_info, status) -> None:
+        """PortAudio callback: copy queued clip samples into the output buffer."""
+        self.callbacks += 1
+        if status and getattr(status, "output_underflow", False):
+            self.output_underflows += 1
+        now = time.perf_counter()
+        filled = 0
+        with self._lock:
+            while filled < frames:
+                clip = self._current
+                if clip is None:
+                    if not self._queue:
+                        break
+                    clip = self._current = self._queue.popleft()
+                if clip.started_at is None:
+                    clip.started_at = now + filled / self.sample_rate
+                    self._latencies.append(clip.started_at - clip.queued_at)
+
+                count = min(frames - filled, clip.frames - clip.position)
+                outdata[filled:filled + count] = clip.samples[clip.position:clip.position + count]
+                clip.position += count
+                filled += count
+                if clip.position >= clip.frames:
+                    self._current = None
+                    self.clips_played += 1
+                    clip.done.set()
+
+        if filled < frames:
+            outdata[filled:] = 0
+        volume = self._volume
+        if volume != 1.0:
+            outdata[:filled] *= volume
+
+    def stop(self) -> None:
+        """Drop the current and queued clips; the stream stays open."""
+        with self._lock:
+            self._drop_locked()
+
+    def close(self) -> None:
+        """Drop all clips and close the output stream."""
+        self.stop()
+        stream, self._stream = self._stream, None
+        if stream is None:
+            return
+        try:
+            stream.stop()
+            stream.close()
+        except Exception as e:
+            logger.warning(f"Error closing playback stream: {e}")
+        logger.info(f"Playback stream closed: {self.clips_played} clips played, "
+                    f"{self.output_underflows} underflows")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get playback statistics.
+
+        Returns:
+            Dict[str, Any]: Clips played, queued and preempted, PortAudio
+            underflows, and clip latency from play() to first sample (last,
+            p50, p95, max in milliseconds)
+        """
+        latencies = np.array(self._latencies) * 1000.0
+        stream_latency = getattr(self._stream, "latency", None) if self._stream is not None else None
+        return {
+            "active": self.is_active,
+            "callbacks": self.callbacks,
+            "clips_played": self.clips_played,
+            "clips_queued": len(self._queue) + (self._current is not None),
+            "clips_preempted": self.clips_preempted,
+            "output_underflows": self.output_underflows,
+            "latency_ms": {
+                "last": float(latencies[-1]),
+                "p50": float(np.percentile(latencies, 50)),
+                "p95": float(np.percentile(latencies, 95)),
+                "max": float(latencies.max()),
+            } if latencies.size else None,
+            "output_latency_ms": (stream_latency * 1000.0
+                                  if isinstance(stream_latency, (int, float)) else None),
+        }
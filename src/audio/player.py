@@ -20,6 +20,7 @@ Functions:
 - save_audio_file: Save audio to file.
 - play_audio: Play audio data.
 - start_streaming: Start streaming audio from callback.
+- push: Queue a block for buffered streaming.
 - stop_streaming: Stop audio streaming.
 - set_volume: Set playback volume.
 - add_to_playlist: Add track to playlist.
@@ -45,6 +46,9 @@ import os
 import wave
 import json
 
+from .streaming_effects import EffectsChain
+from .jitter_buffer import BufferedOutputStream
+
 class AudioPlayer:
     """Advanced audio player with streaming and playlist capabilities."""
     
@@ -71,6 +75,7 @@ class AudioPlayer:
         # Audio buffers
         self.audio_queue = queue.Queue()
         self.output_stream = None
+        self.buffered_stream: Optional[BufferedOutputStream] = None
         
         # Callbacks
         self.on_track_change = None
@@ -165,28 +170,51 @@ class AudioPlayer:
         else:
             sd.play(audio * self.volume, self.sample_rate)
     
-    def start_streaming(self, audio_callback: Callable[[], np.ndarray]):
+    def start_streaming(self, audio_callback: Optional[Callable[[], np.ndarray]] = None,
+                        target_latency: Optional[float] = None,
+                        max_latency: Optional[float] = None):
         """
         Start streaming audio from callback.
         
+        Without target_latency, audio_callback is called inside the device
+        callback and must return a block in time. With target_latency (or
+        without audio_callback) a producer thread calls it ahead of time into
+        a jitter buffer, and push() queues blocks of any size.
+        
         Args:
-            audio_callback: Function that returns audio data
+            audio_callback: Function that returns audio data (None: push() only)
+            target_latency: Seconds buffered before playback starts (buffered mode)
+            max_latency: Jitter buffer capacity in seconds
         """
         self.is_playing = True
         
+        if audio_callback is None or target_latency is not None:
+            self.buffered_stream = BufferedOutputStream(
+                self.sample_rate,
+                target_latency=target_latency if target_latency is not None else 0.1,
+                max_latency=max_latency,
+                blocksize=self.buffer_size,
+                backend=sd
+            )
+            self.buffered_stream.volume = self.volume
+            if not self.buffered_stream.start(source=audio_callback):
+                self.buffered_stream = None
+                self.is_playing = False
+                raise AudioPlaybackError("Failed to start buffered output stream")
+            return
+        
         def stream_callback(outdata, frames, time, status):
             if status:
-                print(f"Stream status: {status}")
+                self.logger.warning(f"Stream status: {status}")
             
             try:
-                audio_data = audio_callback()
-                if len(audio_data) >= frames:
-                    outdata[:] = audio_data[:frames] * self.volume
-                else:
-                    outdata[:len(audio_data)] = audio_data * self.volume
-                    outdata[len(audio_data):] = 0
+                audio_data = np.asarray(audio_callback()).reshape(-1)
+                count = min(len(audio_data), frames)
+                # Scale straight into the device buffer
+                np.multiply(audio_data[:count], self.volume, out=outdata[:count, 0])
+                outdata[count:] = 0
             except Exception as e:
-                print(f"Stream callback error: {e}")
+                self.logger.error(f"Stream callback error: {e}")
                 outdata[:] = 0
         
         self.output_stream = sd.OutputStream(
@@ -196,9 +224,31 @@ class AudioPlayer:
         )
         self.output_stream.start()
     
+    def push(self, audio: np.ndarray, timeout: Optional[float] = None) -> int:
+        """
+        Queue a block of any size for buffered streaming.
+        
+        Args:
+            audio: Mono audio block, e.g. one synthesized sentence
+            timeout: Seconds to wait for room in the jitter buffer
+            
+        Returns:
+            int: Frames queued
+        """
+        if self.buffered_stream is None:
+            raise AudioPlaybackError("Buffered streaming not started")
+        return self.buffered_stream.push(audio, timeout)
+    
+    def get_streaming_stats(self) -> Dict[str, Any]:
+        """Jitter buffer statistics (underruns, overruns, buffered audio)."""
+        return self.buffered_stream.get_stats() if self.buffered_stream else {}
+    
     def stop_streaming(self):
         """Stop audio streaming."""
         self.is_playing = False
+        if self.buffered_stream:
+            self.buffered_stream.stop()
+            self.buffered_stream = None
         if self.output_stream:
             self.output_stream.stop()
             self.output_stream.close()
@@ -212,6 +262,8 @@ class AudioPlayer:
             volume: Volume level (0.0 to 1.0)
         """
         self.volume = max(0.0, min(1.0, volume))
+        if self.buffered_stream:
+            self.buffered_stream.volume = self.volume
     
     def add_to_playlist(self, track_info: Dict[str, Any]):
         """
@@ -424,40 +476,74 @@ class AudioStreamer:
         self.is_streaming = False
         self.audio_queue = queue.Queue()
         self.processor = None
+        self.output_stream = None
+        self.buffered_stream: Optional[BufferedOutputStream] = None
+        self.logger = get_logger(__name__)
         
-    def start_streaming(self, audio_source: Callable[[], np.ndarray], 
-                       processor: Optional[Callable[[np.ndarray], np.ndarray]] = None):
+    def start_streaming(self, audio_source: Optional[Callable[[], np.ndarray]] = None, 
+                       processor: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+                       target_latency: Optional[float] = None,
+                       max_latency: Optional[float] = None):
         """
         Start audio streaming.
         
         Args:
-            audio_source: Function that generates audio data
-            processor: Optional audio processing function
+            audio_source: Function that generates audio data (None: push() only)
+            processor: Optional audio processing function, or an EffectsChain
+                (see AudioEffects.create_streaming_chain), which writes its
+                output straight into the device buffer
+            target_latency: Seconds buffered before playback starts. When
+                given (or without audio_source), the source and processor
+                run on a producer thread that fills a jitter buffer ahead
+                of time instead of inside the device callback.
+            max_latency: Jitter buffer capacity in seconds
         """
         self.is_streaming = True
         self.processor = processor
         
+        if audio_source is None or target_latency is not None:
+            if isinstance(processor, EffectsChain):
+                processor = processor.process_array  # Blocks may exceed the chain's block size
+            self.buffered_stream = BufferedOutputStream(
+                self.sample_rate,
+                target_latency=target_latency if target_latency is not None else 0.1,
+                max_latency=max_latency,
+                blocksize=self.buffer_size,
+                backend=sd
+            )
+            if not self.buffered_stream.start(source=audio_source, processor=processor):
+                self.buffered_stream = None
+                self.is_streaming = False
+                raise AudioPlaybackError("Failed to start buffered output stream")
+            return
+        
         def stream_callback(outdata, frames, time, status):
             if status:
-                print(f"Stream status: {status}")
+                self.logger.warning(f"Stream status: {status}")
             
             try:
                 # Get audio from source
                 audio_data = audio_source()
                 
+                # Effects chains keep their state across blocks and process in place
+                if isinstance(self.processor, EffectsChain):
+                    block = np.asarray(audio_data).reshape(-1)[:frames]
+                    self.processor.process(block, out=outdata[:len(block), 0])
+                    outdata[len(block):] = 0
+                    return
+                
                 # Apply processor if available
                 if self.processor:
                     audio_data = self.processor(audio_data)
                 
                 # Ensure correct size
-                if len(audio_data) >= frames:
-                    outdata[:] = audio_data[:frames]
-                else:
-                    outdata[:len(audio_data)] = audio_data
-                    outdata[len(audio_data):] = 0
+                audio_data = np.asarray(audio_data).reshape(-1)
+                count = min(len(audio_data), frames)
+                outdata[:count, 0] = audio_data[:count]
+                outdata[count:] = 0
                     
             except Exception as e:
-                print(f"Stream callback error: {e}")
+                self.logger.error(f"Stream callback error: {e}")
                 outdata[:] = 0
         
         self.output_stream = sd.OutputStream(
@@ -467,9 +553,31 @@ class AudioStreamer:
         )
         self.output_stream.start()
     
+    def push(self, audio: np.ndarray, timeout: Optional[float] = None) -> int:
+        """
+        Queue a block of any size for buffered streaming.
+        
+        Args:
+            audio: Mono audio block, e.g. one synthesized sentence
+            timeout: Seconds to wait for room in the jitter buffer
+            
+        Returns:
+            int: Frames queued
+        """
+        if self.buffered_stream is None:
+            raise AudioPlaybackError("Buffered streaming not started")
+        return self.buffered_stream.push(audio, timeout)
+    
+    def get_streaming_stats(self) -> Dict[str, Any]:
+        """Jitter buffer statistics (underruns, overruns, buffered audio)."""
+        return self.buffered_stream.get_stats() if self.buffered_stream else {}
+    
     def stop_streaming(self):
         """Stop audio streaming."""
         self.is_streaming = False
+        if self.buffered_stream:
+            self.buffered_stream.stop()
+            self.buffered_stream = None
         if self.output_stream:
             self.output_stream.stop()
             self.output_stream.close()
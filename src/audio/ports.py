@@ -7,7 +7,7 @@ separation of concerns and enable testability.
 """
 
 from abc import ABC, abstractmethod
-from typing import Protocol, Dict, Any, Optional, List, Iterator, AsyncIterator
+from typing import Protocol, Dict, Any, Optional, List, Iterator, AsyncIterator, Union
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
@@ -19,25 +19,70 @@ class AudioFormat(Enum):
     PCM = "pcm"
     FLAC = "flac"
 
+_SAMPLE_WIDTHS = {"uint8": 1, "int16": 2, "int32": 4, "float32": 4}
+
+@dataclass(frozen=True)
+class SampleFormat:
+    """Layout of raw PCM samples: sample type, rate and channel count."""
+    dtype: str  # numpy dtype name: "int16", "int32", "uint8" or "float32"
+    sample_rate: int
+    channels: int = 1
+    
+    @property
+    def sample_width(self) -> int:
+        """Bytes per sample."""
+        return _SAMPLE_WIDTHS[self.dtype]
+    
+    @property
+    def frame_bytes(self) -> int:
+        """Bytes per interleaved frame."""
+        return self.sample_width * self.channels
+
+# Format every pipeline stage after ingest works in (what Whisper consumes)
+STT_SAMPLE_FORMAT = SampleFormat("float32", 16000, 1)
+
 @dataclass
 class AudioData:
-    """Container for audio data with metadata."""
-    data: bytes
+    """Container for audio data with metadata.
+    
+    ``data`` may be bytes or a memoryview over a larger buffer, so audio can
+    be handed between pipeline stages without copying. For PCM data,
+    ``sample_format`` describes the samples; without it they are 16-bit.
+    """
+    data: Union[bytes, bytearray, memoryview]
     sample_rate: int
     channels: int
     format: AudioFormat
     source_type: str  # "microphone", "system_audio", "file"
     language_hint: Optional[str] = None
     device_info: Optional[str] = None
+    sample_format: Optional[SampleFormat] = None
+    
+    @property
+    def pcm_format(self) -> SampleFormat:
+        """Sample format of PCM data (16-bit if not given)."""
+        return self.sample_format or SampleFormat("int16", self.sample_rate, self.channels)
+    
+    @property
+    def view(self) -> memoryview:
+        """Zero-copy byte view of the audio data."""
+        view = memoryview(self.data)
+        return view if view.format == 'B' and view.ndim == 1 else view.cast('B')
 
 @dataclass
 class TranscriptionResult:
-    """Result from speech-to-text processing."""
+    """Result from speech-to-text processing.
+    
+    Streaming transcription yields partial results (``is_partial=True``)
+    whose ``stable_text`` prefix is committed and will not change.
+    """
     text: str
     language: str
     confidence: float
     segments: Optional[List[Dict[str, Any]]] = None
     processing_time: Optional[float] = None
+    is_partial: bool = False
+    stable_text: Optional[str] = None
 
 @dataclass
 class TranslationResult:
@@ -243,6 +288,21 @@ class TranscriptCallback(Protocol):
         """
         ...
 
+class PartialTranscriptCallback(Protocol):
+    """Callback interface for streaming (partial) transcript events."""
+    
+    def on_partial_transcript(self, source: str, committed_text: str,
+                              unstable_text: str, language: str) -> None:
+        """Called whenever a streaming hypothesis is updated.
+        
+        Args:
+            source: Audio source identifier
+            committed_text: Text confirmed by local agreement (will not change)
+            unstable_text: Tentative tail that may still be revised
+            language: Detected/specified language code
+        """
+        ...
+
 class TranslationCallback(Protocol):
     """Callback interface for translation events."""
     
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Resampler
+============================
+
+Streaming polyphase resampler and ingest format conversion
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- numpy
+======================================================================
+Functions:
+- to_float32: Scale samples of any supported type to float32 in [-1, 1].
+Classes:
+- PolyphaseResampler: Stateful rational-ratio resampler for consecutive blocks.
+- IngestResampler: Convert captured audio of any format to the pipeline format.
+======================================================================
+
+Captured audio arrives in whatever format the device delivers (int16 from
+a capture stream, float32 from sd.rec, 44.1/48 kHz, stereo). The pipeline
+converts it once, when it is captured, to the format the speech model
+consumes (16 kHz mono float32); every later stage reads that format as is.
+
+The resampler upsamples by L, low-pass filters and downsamples by M in one
+step: each output sample is a dot product of the last input samples with
+one phase of a Kaiser-windowed sinc filter. It keeps its filter history
+between blocks, so consecutive chunks resample as one signal without
+clicks at the boundaries. It delays the signal by half the filter length,
+about `zero_crossings` samples at the lower of the two rates.
+"""
+
+from math import ceil, gcd
+from typing import Optional
+
+import numpy as np
+
+from .ports import STT_SAMPLE_FORMAT, SampleFormat
+
+
+def to_float32(samples: np.ndarray) -> np.ndarray:
+    """
+    Scale samples of any supported type to float32 in [-1, 1].
+
+    Args:
+        samples: int16, int32, uint8 or float samples
+
+    Returns:
+        float32 array (the input itself if it already is float32)
+    """
+    if samples.dtype == np.float32:
+        return samples
+    if samples.dtype == np.uint8:
+        return (samples.astype(np.float32) - 128.0) * np.float32(1.0 / 128.0)
+    if np.issubdtype(samples.dtype, np.integer):
+        audio = samples.astype(np.float32)
+        audio *= np.float32(1.0 / (np.iinfo(samples.dtype).max + 1.0))
+        return audio
+    return samples.astype(np.float32)
+
+
+class PolyphaseResampler:
+    """
+    Stateful rational-ratio resampler for consecutive blocks.
+
+    Args:
+        orig_sr: Input sample rate in Hz
+        target_sr: Output sample rate in Hz
+        zero_crossings: Sinc zero crossings on each side of the filter
+            (longer filters cut off more sharply)
+        rolloff: Cutoff as a fraction of the lower Nyquist frequency
+        beta: Kaiser window shape
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int, zero_crossings: int = 8,
+                 rolloff: float = 0.9, beta: float = 8.0):
+        divisor = gcd(int(orig_sr), int(target_sr))
+        self.orig_sr = int(orig_sr)
+        self.target_sr = int(target_sr)
+        self.up = self.target_sr // divisor
+        self.down = self.orig_sr // divisor
+
+        ratio = max(self.up, self.down)
+        # Input samples under the filter, for each output sample
+        self.taps = 2 * zero_crossings * int(ceil(ratio / self.up))
+        length = self.taps * self.up
+        cutoff = rolloff * 0.5 / ratio  # cycles per upsampled sample
+        t = np.arange(length) - (length - 1) / 2.0
+        h = 2.0 * cutoff * np.sinc(2.0 * cutoff * t) * np.kaiser(length, beta) * self.up
+        # Row p holds phase p: coefficients h[p], h[p + up], h[p + 2*up], ...
+        self._phases = np.ascontiguousarray(h.reshape(self.taps, self.up).T, dtype=np.float32)
+        self._tap_offsets = np.arange(self.taps)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the previous blocks (start of a new signal)."""
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        # Upsampled position of the next output, relative to the next block
+        self._position = 0
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Resample the next block of a mono signal.
+
+        Args:
+            block: 1-D float32 samples following the previous block
+
+        Returns:
+            1-D float32 output samples available so far
+        """
+        block = np.asarray(block, dtype=np.float32).reshape(-1)
+        if self.up == self.down:
+            return block
+
+        frames = block.size
+        limit = frames * self.up
+        count = -(-(limit - self._position) // self.down) if limit > self._position else 0
+        buffer = np.concatenate((self._history, block))
+
+        if count:
+            positions = self._position + np.arange(count, dtype=np.int64) * self.down
+            base = positions // self.up
+            indices = (self.taps - 1) + base[:, None] - self._tap_offsets[None, :]
+            output = np.einsum('ij,ij->i', self._phases[positions % self.up], buffer[indices])
+        else:
+            output = np.zeros(0, dtype=np.float32)
+
+        self._position += count * self.down - limit
+        self._history = buffer[buffer.size - (self.taps - 1):].copy()
+        return output.astype(np.float32, copy=False)
+
+    def resample(self, signal: np.ndarray) -> np.ndarray:
+        """
+        Resample a complete mono signal in one call.
+
+        Unlike process(), the filter is flushed with zeros and its delay is
+        removed, so the output lines up with the input and keeps its tail.
+        The resampler is reset before and after.
+
+        Args:
+            signal: 1-D float32 samples of the whole signal
+
+        Returns:
+            1-D float32 samples, ceil(len(signal) * target_sr / orig_sr) of them
+        """
+        signal = np.asarray(signal, dtype=np.float32).reshape(-1)
+        if self.up == self.down:
+            return signal
+
+        frames = -(-signal.size * self.up // self.down)
+        delay = int(round((self.taps * self.up - 1) / 2.0 / self.down))
+        self.reset()
+        output = self.process(np.concatenate((signal, np.zeros(self.taps, dtype=np.float32))))
+        self.reset()
+        return output[delay:delay + frames]
+
+
+class IngestResampler:
+    """
+    Convert captured audio of any format to the pipeline format.
+
+    Scales to float32, down-mixes to mono and resamples in one pass per
+    block. The resampler is rebuilt (and its history dropped) when the
+    source format changes.
+
+    Args:
+        target: Mono output format (default: 16 kHz float32 for STT)
+    """
+
+    def __init__(self, target: SampleFormat = STT_SAMPLE_FORMAT):
+        if target.channels != 1:
+            raise ValueError("IngestResampler only produces mono audio")
+        if target.dtype not in ("float32", "int16", "int32"):
+            raise ValueError(f"Unsupported target sample type: {target.dtype}")
+        self.target = target
+        self.source: Optional[SampleFormat] = None
+        self._resampler: Optional[PolyphaseResampler] = None
+
+    def reset(self) -> None:
+        """Forget filter history, e.g. when a capture restarts."""
+        if self._resampler is not None:
+            self._resampler.reset()
+
+    def process(self, samples: np.ndarray, source: SampleFormat) -> np.ndarray:
+        """
+        Convert one captured block.
+
+        Args:
+            samples: Interleaved samples, shape (frames,) or (frames, channels)
+            source: Format of the samples
+
+        Returns:
+            1-D array in the target format
+        """
+        if source != self.source:
+            self.source = source
+            self._resampler = (PolyphaseResampler(source.sample_rate, self.target.sample_rate)
+                               if source.sample_rate != self.target.sample_rate else None)
+
+        audio = to_float32(np.asarray(samples))
+        if source.channels > 1:
+            audio = audio.reshape(-1, source.channels).mean(axis=1, dtype=np.float32)
+        else:
+            audio = audio.reshape(-1)
+        if self._resampler is not None:
+            audio = self._resampler.process(audio)
+
+        if self.target.dtype == "float32":
+            return audio
+        full_scale = np.iinfo(np.dtype(self.target.dtype)).max + 1.0
+        return np.clip(audio * full_scale, -full_scale, full_scale - 1).astype(self.target.dtype)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Ring Buffer
+==============================
+
+Preallocated audio ring buffer with zero-copy contiguous windows
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- numpy
+======================================================================
+Classes:
+- AudioRingBuffer: Fixed-capacity interleaved PCM buffer that keeps the
+  most recent audio and a timestamp for every written sample range.
+======================================================================
+
+Every sample is written twice, at position ``i`` and ``i + capacity`` of a
+buffer twice the capacity (a mirrored ring). Any window of up to
+``capacity`` frames is therefore one contiguous slice, so readers get a
+plain numpy view instead of a concatenated copy. Memory is allocated once
+and never grows, however long the session runs.
+
+The buffer is not thread-safe; each pipeline source owns one and uses it
+from a single thread.
+"""
+
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+
+from .vad import AudioBuffer, as_sample_view
+
+
+class AudioRingBuffer:
+    """
+    Fixed-capacity ring buffer for interleaved PCM audio.
+
+    Args:
+        duration: Capacity in seconds
+        sample_rate: Sample rate in Hz (capacity is sized from it)
+        channels: Number of interleaved channels
+        dtype: Sample type stored in the buffer
+        max_segments: Number of write timestamps remembered
+    """
+
+    def __init__(self, duration: float, sample_rate: int = 16000, channels: int = 1,
+                 dtype=np.int16, max_segments: int = 256):
+        self.duration = duration
+        self.dtype = np.dtype(dtype)
+        self.max_segments = max_segments
+        self.total_frames = 0    # Frames ever written (absolute write position)
+        self.dropped_frames = 0  # Frames overwritten before they were read
+        self._allocate(sample_rate, channels)
+
+    def _allocate(self, sample_rate: int, channels: int) -> None:
+        """(Re)allocate storage for a sample format."""
+        self.sample_rate = sample_rate
+        self.channels = max(1, channels)
+        self.capacity = max(1, int(round(self.duration * sample_rate)))
+        self._data = np.zeros(2 * self.capacity * self.channels, dtype=self.dtype)
+        self._segments: Deque[Tuple[int, float]] = deque(maxlen=self.max_segments)
+        self._length = 0
+
+    def configure(self, sample_rate: int, channels: int, dtype=None) -> bool:
+        """
+        Match the buffer to a stream format, reallocating if it changed.
+
+        Args:
+            sample_rate: Sample rate in Hz
+            channels: Number of interleaved channels
+            dtype: Sample type (default: keep the current one)
+
+        Returns:
+            True if the buffer was reallocated (its contents are discarded)
+        """
+        dtype = self.dtype if dtype is None else np.dtype(dtype)
+        if (sample_rate == self.sample_rate and max(1, channels) == self.channels
+                and dtype == self.dtype):
+            return False
+        self.dtype = dtype
+        self._allocate(sample_rate, channels)
+        return True
+
+    def __len__(self) -> int:
+        """Number of frames currently buffered."""
+        return self._length
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Duration of the buffered audio in seconds."""
+        return self._length / self.sample_rate
+
+    @property
+    def is_full(self) -> bool:
+        """True when the buffer holds ``capacity`` frames."""
+        return self._length >= self.capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the sample storage."""
+        return self._data.nbytes
+
+    def write(self, audio: AudioBuffer, timestamp: Optional[float] = None) -> int:
+        """
+        Append audio, overwriting the oldest frames when full.
+
+        Args:
+            audio: PCM bytes/memoryview or an array of samples
+            timestamp: Capture time of the first frame
+
+        Returns:
+            Number of frames written
+        """
+        samples = as_sample_view(audio, self.dtype)
+        if samples.dtype != self.dtype:
+            samples = samples.astype(self.dtype)
+        frames = samples.size // self.channels
+        if frames == 0:
+            return 0
+        samples = samples[:frames * self.channels]
+
+        # Only the newest ``capacity`` frames can be kept
+        skipped = max(0, frames - self.capacity)
+        if skipped:
+            samples = samples[skipped * self.channels:]
+        kept = frames - skipped
+
+        start = (self.total_frames + skipped) % self.capacity
+        first = min(kept, self.capacity - start)
+        for offset in (0, self.capacity):
+            lo = (start + offset) * self.channels
+            self._data[lo:lo + first * self.channels] = samples[:first * self.channels]
+            if kept > first:
+                lo = offset * self.channels
+                self._data[lo:lo + (kept - first) * self.channels] = samples[first * self.channels:]
+
+        overflow = self._length + frames - self.capacity
+        if overflow > 0:
+            self.dropped_frames += overflow
+        if timestamp is not None:
+            self._segments.append((self.total_frames, timestamp))
+        self.total_frames += frames
+        self._length = min(self.capacity, self._length + frames)
+        return frames
+
+    def view(self, frames: Optional[int] = None) -> np.ndarray:
+        """
+        Zero-copy contiguous view of the most recent frames.
+
+        The view aliases the ring storage: it stays valid only until
+        the buffer wraps over it again. Copy it before handing it to
+        another thread that may outlive the next writes.
+
+        Args:
+            frames: Number of frames (default: everything buffered)
+
+        Returns:
+            Read-only 1-D array of interleaved samples
+        """
+        frames = self._length if frames is None else max(0, min(frames, self._length))
+        end = self.total_frames % self.capacity
+        if end < frames:
+            end += self.capacity
+        view = self._data[(end - frames) * self.channels:end * self.channels]
+        view.flags.writeable = False
+        return view
+
+    def clear(self) -> None:
+        """Discard the buffered frames (storage is kept)."""
+        self._length = 0
+        self._segments.clear()
+
+    def consume(self, frames: Optional[int] = None) -> None:
+        """Mark the oldest frames as read."""
+        frames = self._length if frames is None else max(0, min(frames, self._length))
+        self._length -= frames
+
+    def timestamp_at(self, frame: int) -> Optional[float]:
+        """
+        Capture time of a frame in the current window.
+
+        Args:
+            frame: Frame index relative to the start of the window
+
+        Returns:
+            Timestamp, interpolated from the closest preceding write, or None
+        """
+        absolute = self.total_frames - self._length + frame
+        for start, timestamp in reversed(self._segments):
+            if start <= absolute:
+                return timestamp + (absolute - start) / self.sample_rate
+        return None
+
+    def time_range(self) -> Tuple[Optional[float], Optional[float]]:
+        """Capture times of the start and end of the buffered window."""
+        if self._length == 0:
+            return None, None
+        start = self.timestamp_at(0)
+        return start, None if start is None else start + self.buffered_seconds
+
+    def segments(self) -> List[Tuple[int, float]]:
+        """Writes in the current window as (frame offset, timestamp) pairs."""
+        window_start = self.total_frames - self._length
+        return [(start - window_start, timestamp) for start, timestamp in self._segments
+                if start >= window_start]
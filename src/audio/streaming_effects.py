@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Streaming Effects
+====================================
+
+Block-based effects chain for real-time playback
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- numpy
+- scipy
+======================================================================
+Classes:
+- StreamingEffect: Base class for effects that process fixed-size blocks.
+- DelayEffect, ChorusEffect, FlangerEffect, ReverbEffect, EQEffect,
+  FilterEffect, DistortionEffect, CompressorEffect, LimiterEffect,
+  BitCrusherEffect, RingModulatorEffect: Block versions of the
+  AudioEffects effects.
+- EffectsChain: Runs effects in place on preallocated buffers and reports
+  per-block CPU time.
+Functions:
+- create_effect: Build a streaming effect from an AudioEffects name.
+======================================================================
+
+Every effect keeps its delay lines, filter state and LFO phase between
+blocks, so processing a signal block by block gives the same result as
+AudioEffects processing it in one call (the compressor is the exception:
+it follows the level of each block instead of the whole signal).
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.signal import lfilter, oaconvolve
+
+from src.logging_config import get_logger
+from .effects import _SPARSE_IR_TAPS, _comb_filter, _modulated_delay, _modulated_feedback
+from .synthesizer import HighPassFilter, LowPassFilter
+
+logger = get_logger(__name__)
+
+
+def _mix(block: np.ndarray, dry: np.ndarray, wet_level: float) -> None:
+    """In place: block = (1 - wet_level) * dry + wet_level * block."""
+    block *= wet_level
+    dry *= 1 - wet_level
+    block += dry
+
+
+class StreamingEffect(ABC):
+    """
+    Base class for block-based effects.
+
+    Subclasses allocate their buffers in prepare() and process mono float64
+    blocks of at most ``block_size`` samples in place.
+    """
+
+    def __init__(self):
+        self.sample_rate = 44100
+        self.block_size = 1024
+        self._dry = np.zeros(0)
+
+    def prepare(self, sample_rate: int, block_size: int) -> None:
+        """Allocate buffers for a sample rate and maximum block size, and reset state."""
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self._dry = np.zeros(block_size)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear delay lines, filter state and LFO phase."""
+
+    @abstractmethod
+    def process(self, block: np.ndarray) -> None:
+        """Process a block in place."""
+
+    def _copy_dry(self, block: np.ndarray) -> np.ndarray:
+        """Copy the block into the preallocated dry buffer."""
+        dry = self._dry[:len(block)]
+        dry[:] = block
+        return dry
+
+
+class _LFO:
+    """Sine LFO whose phase continues across blocks."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.position = 0  # Samples generated so far
+
+    def next(self, n: int, sample_rate: int) -> np.ndarray:
+        """LFO values for the next n samples."""
+        t = (self.position + np.arange(n)) / sample_rate
+        self.position += n
+        return np.sin(2 * np.pi * self.rate * t)
+
+
+class DelayEffect(StreamingEffect):
+    """Feedback delay (echo)."""
+
+    def __init__(self, delay_time: float = 0.5, feedback: float = 0.3, wet_level: float = 0.5):
+        super().__init__()
+        self.delay_time = delay_time
+        self.feedback = feedback
+        self.wet_level = wet_level
+
+    def prepare(self, sample_rate: int, block_size: int) -> None:
+        self.delay = int(self.delay_time * sample_rate)
+        # Delay line: the last ``delay`` outputs followed by room for one block
+        self._line = np.zeros(self.delay + block_size)
+        super().prepare(sample_rate, block_size)
+
+    def reset(self) -> None:
+        self._line[:] = 0.0
+
+    def process(self, block: np.ndarray) -> None:
+        n, delay = len(block), self.delay
+        dry = self._copy_dry(block)
+        line = self._line
+        line[delay:delay + n] = block
+        _comb_filter(line[:delay + n], delay, self.feedback, start=delay)
+        block[:] = line[delay:delay + n]
+        line[:delay] = line[n:n + delay]
+        _mix(block, dry, self.wet_level)
+
+
+class ChorusEffect(StreamingEffect):
+    """LFO-modulated delay mixed with the dry signal."""
+
+    def __init__(self, rate: float = 1.5, depth: float = 0.002, mix: float = 0.5,
+                 interpolate: bool = False):
+        super().__init__()
+        self.rate = rate
+        self.depth = depth
+        self.mix = mix
+        self.interpolate = interpolate
+
+    def prepare(self, sample_rate: int, block_size: int) -> None:
+        self.history = int(2 * self.depth * sample_rate) + 2
+        self._line = np.zeros(self.history + block_size)
+        super().prepare(sample_rate, block_size)
+
+    def reset(self) -> None:
+        self._line[:] = 0.0
+        self._lfo = _LFO(self.rate)
+        self._seen = 0
+
+    def process(self, block: np.ndarray) -> None:
+        n, history = len(block), self.history
+        line = self._line
+        line[history:history + n] = block
+        delays = self.depth * self.sample_rate * (1.0 + self._lfo.next(n, self.sample_rate))
+        origin = max(0, history - self._seen)
+        chorus = _modulated_delay(line[:history + n], delays, self.interpolate,
+                                  start=history, origin=origin)
+        self._seen += n
+        line[:history] = line[n:n + history]
+        block *= 1 - self.mix
+        block += self.mix * chorus
+
+
+class FlangerEffect(StreamingEffect):
+    """LFO-modulated delay with feedback."""
+
+    def __init__(self, rate: float = 0.5, depth: float = 0.005, feedback: float = 0.3,
+                 mix: float = 0.5, interpolate: bool = False):
+        super().__init__()
+        self.rate = rate
+        self.depth = depth
+        self.feedback = feedback
+        self.mix = mix
+        self.interpolate = interpolate
+
+    def prepare(self, sample_rate: int, block_size: int) -> None:
+        self.history = int(2 * self.depth * sample_rate) + 2
+        self._line = np.zeros(self.history + block_size)
+        super().prepare(sample_rate, block_size)
+
+    def reset(self) -> None:
+        self._line[:] = 0.0
+        self._lfo = _LFO(self.rate)
+
+    def process(self, block: np.ndarray) -> None:
+        n, history = len(block), self.history
+        dry = self._copy_dry(block)
+        line = self._line
+        line[history:history + n] = block
+        delays = self.depth * self.sample_rate * (1.0 + self._lfo.next(n, self.sample_rate))
+        # Zeroed history feeds back nothing, like the start of a whole signal
+        _modulated_feedback(line[:history + n], delays, self.feedback,
+                            self.interpolate, start=history)
+        block[:] = line[history:history + n]
+        line[:history] = line[n:n + history]
+        _mix(block, dry, self.mix)
+
+
+class ReverbEffect(StreamingEffect):
+    """Tap reverb, or convolution reverb with an impulse response."""
+
+    def __init__(self, room_size: float = 0.5, damping: float = 0.5, wet_level: float = 0.3,
+                 impulse_response: Optional[np.ndarray] = None):
+        super().__init__()
+        self.room_size = room_size
+        self.damping = damping
+        self.wet_level = wet_level
+        self.impulse_response = impulse_response
+
+    def prepare(self, sample_rate: int, block_size: int) -> None:
+        ir = self.impulse_response
+        if ir is None:
+            delays = [int(sample_rate * 0.03 * self.room_size),
+                      int(sample_rate * 0.05 * self.room_size),
+                      int(sample_rate * 0.07 * self.room_size)]
+            ir = np.zeros(max(delays) + 1)
+            for delay_samples in delays:
+                if delay_samples > 0:
+                    ir[delay_samples] += self.damping
+        self._ir = np.asarray(ir, dtype=np.float64)
+        self._taps = np.flatnonzero(self._ir)
+        self._sparse = len(self._taps) <= _SPARSE_IR_TAPS
+        self.history = len(self._ir) - 1
+        # Sparse IRs read an input history; dense ones carry a convolution tail
+        self._line = np.zeros(self.history + block_size)
+        self._wet = np.zeros(block_size)
+        super().prepare(sample_rate, block_size)
+
+    def reset(self) -> None:
+        self._line[:] = 0.0
+
+    def process(self, block: np.ndarray) -> None:
+        n, history = len(block), self.history
+        line = self._line
+        wet = self._wet[:n]
+
+        if self._sparse:
+            line[history:history + n] = block
+            wet[:] = 0.0
+            for delay in self._taps:
+                wet += line[history - delay:history - delay + n] * self._ir[delay]
+            line[:history] = line[n:n + history]
+        else:
+            # Overlap-add: the tail of earlier blocks lives in the line
+            convolved = oaconvolve(block, self._ir)
+            wet[:] = convolved[:n] + line[:n]
+            tail = line[n:history + n].copy()
+            line[:] = 0.0
+            line[:history] = tail[:history]
+            line[:history] += convolved[n:n + history]
+
+        block *= 1 - self.wet_level
+        block += self.wet_level * wet
+
+
+class EQEffect(StreamingEffect):
+    """3-band EQ (250 Hz / 4 kHz split) with persistent filter state."""
+
+    def __init__(self, low_gain: float = 1.0, mid_gain: float = 1.0, high_gain: float = 1.0):
+        super().__init__()
+        self.low_gain = low_gain
+        self.mid_gain = mid_gain
+        self.high_gain = high_gain
+
+    def prepare(self, sample_rate: int, block_size: int) -> None:
+        low_alpha = 1.0 / (1.0 + 2 * np.pi * 250 / sample_rate)
+        high_alpha = 1.0 / (1.0 + 2 * np.pi * 4000 / sample_rate)
+        self._low = ([low_alpha], [1.0, low_alpha - 1])
+        self._high = ([high_alpha, -high_alpha], [1.0, -high_alpha])
+        super().prepare(sample_rate, block_size)
+
+    def reset(self) -> None:
+        self._low_state = np.zeros(1)
+        self._high_state = np.zeros(1)
+
+    def process(self, block: np.ndarray) -> None:
+        low, self._low_state = lfilter(*self._low, block, zi=self._low_state)
+        high, self._high_state = lfilter(*self._high, block, zi=self._high_state)
+        block -= low
+        block -= high
+        block *= self.mid_gain
+        block += self.low_gain * low
+        block += self.high_gain * high
+
+
+class FilterEffect(StreamingEffect):
+    """Synthesizer low-pass or high-pass filter."""
+
+    def __init__(self, cutoff_freq: float = 1000.0, kind: str = "lowpass"):
+        super().__init__()
+        if kind not in ("lowpass", "highpass"):
+            raise ValueError(f"Unknown filter kind: {kind}")
+        self.cutoff_freq = cutoff_freq
+        self.kind = kind
+
+    def reset(self) -> None:
+        filter_class = LowPassFilter if self.kind == "lowpass" else HighPassFilter
+        self._filter = filter_class(self.cutoff_freq, self.sample_rate)
+
+    def process(self, block: np.ndarray) -> None:
+        block[:] = self._filter.process(block)
+
+
+class DistortionEffect(StreamingEffect):
+    """Soft-clipping distortion."""
+
+    def __init__(self, drive: float = 0.5, mix: float = 0.5):
+        super().__init__()
+        self.drive = drive
+        self.mix = mix
+
+    def process(self, block: np.ndarray) -> None:
+        dry = self._copy_dry(block)
+        block *= 1 + self.drive * 10
+        np.tanh(block, out=block)
+        _mix(block, dry, self.mix)
+
+
+class CompressorEffect(StreamingEffect):
+    """
+    Compressor whose gain follows the level of each block.
+
+    The gain moves towards each block's target with the attack/release
+    time constants, so it changes smoothly across block boundaries.
+    """
+
+    def __init__(self, threshold: float = -20.0, ratio: float = 4.0,
+                 attack: float = 0.005, release: float = 0.1):
+        super().__init__()
+        self.threshold = threshold
+        self.ratio = ratio
+        self.attack = attack
+        self.release = release
+
+    def prepare(self, sample_rate: int, block_size: int) -> None:
+        self._steps = np.arange(1, block_size + 1)
+        self._gain_curve = np.zeros(block_size)
+        super().prepare(sample_rate, block_size)
+
+    def reset(self) -> None:
+        self._gain: Optional[float] = None
+
+    def process(self, block: np.ndarray) -> None:
+        n = len(block)
+        threshold_linear = 10 ** (self.threshold / 20)
+        rms = float(np.sqrt(np.mean(block ** 2))) if n else 0.0
+        target = (rms / threshold_linear) ** (1 / self.ratio - 1) if rms > threshold_linear else 1.0
+
+        if self._gain is None:
+            self._gain = target
+        seconds = self.attack if target < self._gain else self.release
+        samples = max(1.0, seconds * self.sample_rate)
+
+        # gain[i] = target + (gain_prev - target) * (1 - 1/samples) ** (i + 1)
+        curve = self._gain_curve[:n]
+        np.power(1.0 - 1.0 / samples, self._steps[:n], out=curve)
+        curve *= self._gain - target
+        curve += target
+        block *= curve
+        if n:
+            self._gain = float(curve[-1])
+
+
+class LimiterEffect(StreamingEffect):
+    """Hard limiter."""
+
+    def __init__(self, threshold: float = 0.8):
+        super().__init__()
+        self.threshold = threshold
+
+    def process(self, block: np.ndarray) -> None:
+        np.clip(block, -self.threshold, self.threshold, out=block)
+
+
+class BitCrusherEffect(StreamingEffect):
+    """Quantization and sample-and-hold rate reduction."""
+
+    def __init__(self, bit_depth: int = 8, sample_rate_reduction: float = 0.5):
+        super().__init__()
+        self.bit_depth = bit_depth
+        self.sample_rate_reduction = sample_rate_reduction
+
+    def prepare(self, sample_rate: int, block_size: int) -> None:
+        self.step = int(1 / self.sample_rate_reduction) if self.sample_rate_reduction < 1.0 else 1
+        self._index = np.arange(block_size)
+        super().prepare(sample_rate, block_size)
+
+    def reset(self) -> None:
+        self._position = 0
+        self._held = 0.0
+
+    def process(self, block: np.ndarray) -> None:
+        n = len(block)
+        max_value = 2 ** (self.bit_depth - 1) - 1
+        block *= max_value
+        np.round(block, out=block)
+        block /= max_value
+
+        if self.step > 1 and n:
+            # Each sample holds the value at the start of its step period
+            index = self._index[:n]
+            anchor = index - (self._position + index) % self.step
+            held = self._held
+            self._held = float(block[anchor[-1]]) if anchor[-1] >= 0 else held
+            block[:] = np.where(anchor >= 0, block[np.maximum(anchor, 0)], held)
+        self._position += n
+
+
+class RingModulatorEffect(StreamingEffect):
+    """Ring modulation with a sine carrier."""
+
+    def __init__(self, frequency: float = 100.0, mix: float = 0.5):
+        super().__init__()
+        self.frequency = frequency
+        self.mix = mix
+
+    def reset(self) -> None:
+        self._lfo = _LFO(self.frequency)
+
+    def process(self, block: np.ndarray) -> None:
+        modulator = self._lfo.next(len(block), self.sample_rate)
+        block *= (1 - self.mix) + self.mix * modulator
+
+
+_EFFECT_TYPES = {
+    'reverb': ReverbEffect,
+    'delay': DelayEffect,
+    'distortion': DistortionEffect,
+    'chorus': ChorusEffect,
+    'flanger': FlangerEffect,
+    'compressor': CompressorEffect,
+    'limiter': LimiterEffect,
+    'eq': EQEffect,
+    'bit_crusher': BitCrusherEffect,
+    'ring_modulator': RingModulatorEffect,
+    'lowpass': lambda **params: FilterEffect(kind="lowpass", **params),
+    'highpass': lambda **params: FilterEffect(kind="highpass", **params),
+}
+
+
+def create_effect(name: str, **params: Any) -> StreamingEffect:
+    """
+    Build a streaming effect from an AudioEffects effect name.
+
+    Args:
+        name: Effect name as used by AudioEffects.apply_effects_chain
+        **params: Effect parameters
+
+    Returns:
+        StreamingEffect instance
+    """
+    try:
+        effect_type = _EFFECT_TYPES[name]
+    except KeyError:
+        raise ValueError(f"Unknown effect: {name}. Available: {', '.join(_EFFECT_TYPES)}")
+    return effect_type(**params)
+
+
+class EffectsChain:
+    """
+    Real-time effects chain processing fixed-size blocks in place.
+
+    Blocks are copied once into a preallocated float64 work buffer, every
+    effect runs in place on it, and the result is written to ``out`` (for
+    example a sounddevice output buffer) or returned as a view of the work
+    buffer, valid until the next call.
+    """
+
+    def __init__(self, effects: List[StreamingEffect], sample_rate: int = 44100,
+                 block_size: int = 1024):
+        """
+        Initialize the effects chain.
+
+        Args:
+            effects: Effects in processing order
+            sample_rate: Sample rate in Hz
+            block_size: Largest block processed at once; bigger inputs are split
+        """
+        self.effects = list(effects)
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self._work = np.zeros(block_size)
+        self._output = np.zeros(block_size)
+        for effect in self.effects:
+            effect.prepare(sample_rate, block_size)
+        self.reset_stats()
+
+    @classmethod
+    def from_spec(cls, effects: List[Tuple[str, Dict[str, Any]]], sample_rate: int = 44100,
+                  block_size: int = 1024) -> "EffectsChain":
+        """Build a chain from (effect_name, parameters) tuples, as apply_effects_chain takes."""
+        return cls([create_effect(name, **params) for name, params in effects],
+                   sample_rate=sample_rate, block_size=block_size)
+
+    def reset(self) -> None:
+        """Clear the state of every effect."""
+        for effect in self.effects:
+            effect.reset()
+
+    def reset_stats(self) -> None:
+        """Clear the timing statistics."""
+        self._stats = {
+            'blocks': 0,
+            'samples': 0,
+            'total_cpu_time': 0.0,
+            'last_block_time': 0.0,
+            'max_block_time': 0.0,
+            'max_real_time_factor': 0.0,
+            'overruns': 0
+        }
+
+    def process(self, block: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Process one block.
+
+        Args:
+            block: Mono input samples
+            out: Optional buffer (same length) receiving the output
+
+        Returns:
+            ``out``, or a view of the chain's output buffer
+        """
+        n = len(block)
+        if n > self.block_size:
+            target = out if out is not None else np.empty(n)
+            for start in range(0, n, self.block_size):
+                end = min(start + self.block_size, n)
+                self.process(block[start:end], out=target[start:end])
+            return target
+
+        start_time = time.perf_counter()
+        work = self._work[:n]
+        work[:] = block
+        for effect in self.effects:
+            effect.process(work)
+
+        if out is None:
+            out = self._output[:n]
+        out[:] = work
+        self._record(n, time.perf_counter() - start_time)
+        return out
+
+    __call__ = process
+
+    def process_array(self, audio: np.ndarray) -> np.ndarray:
+        """Process a whole signal block by block, continuing the chain's state."""
+        return self.process(audio, out=np.empty(len(audio)))
+
+    def _record(self, samples: int, cpu_time: float) -> None:
+        """Update per-block CPU time statistics."""
+        stats = self._stats
+        stats['blocks'] += 1
+        stats['samples'] += samples
+        stats['total_cpu_time'] += cpu_time
+        stats['last_block_time'] = cpu_time
+        stats['max_block_time'] = max(stats['max_block_time'], cpu_time)
+        if samples:
+            real_time_factor = cpu_time * self.sample_rate / samples
+            stats['max_real_time_factor'] = max(stats['max_real_time_factor'], real_time_factor)
+            if real_time_factor >= 1.0:
+                stats['overruns'] += 1
+                logger.warning(f"Effects chain overrun: {cpu_time * 1000:.2f} ms for "
+                               f"{samples} samples (RTF {real_time_factor:.2f})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-block CPU time statistics.
+
+        ``real_time_factor`` is CPU time divided by audio duration; it must
+        stay well below 1.0 for glitch-free playback.
+        """
+        stats = dict(self._stats)
+        audio_time = stats['samples'] / self.sample_rate
+        stats['avg_block_time'] = stats['total_cpu_time'] / stats['blocks'] if stats['blocks'] else 0.0
+        stats['block_duration'] = self.block_size / self.sample_rate
+        stats['real_time_factor'] = stats['total_cpu_time'] / audio_time if audio_time else 0.0
+        return stats
@@ -12,6 +12,7 @@ Version: 1.0
 Requirements:
 - sounddevice
 - numpy
+- scipy
 ======================================================================
 Functions:
 - __init__: Initialize ADSR envelope.
@@ -33,6 +34,7 @@ import threading
 import time
 from typing import Optional, Callable, List, Tuple, Dict
 import math
+from scipy.signal import lfilter
 
 class ADSREnvelope:
     """ADSR (Attack, Decay, Sustain, Release) envelope generator."""
@@ -120,13 +122,15 @@ class LowPassFilter(Filter):
         """Apply low-pass filter to audio."""
         # Simple first-order IIR low-pass filter
         alpha = 1.0 / (1.0 + 2 * np.pi * self.cutoff_freq / self.sample_rate)
+        if len(audio) == 0:
+            return np.zeros_like(audio)
         
-        filtered = np.zeros_like(audio)
-        for i in range(len(audio)):
-            filtered[i] = alpha * audio[i] + (1 - alpha) * self.y_history[0]
-            self.y_history[0] = filtered[i]
+        # y[i] = alpha * x[i] + (1 - alpha) * y[i-1], continuing from the last call
+        filtered, _ = lfilter([alpha], [1.0, alpha - 1], audio,
+                              zi=[(1 - alpha) * self.y_history[0]])
+        self.y_history[0] = filtered[-1]
         
-        return filtered
+        return filtered.astype(audio.dtype, copy=False)
 
 class HighPassFilter(Filter):
     """High-pass filter implementation."""
@@ -135,14 +139,16 @@ class HighPassFilter(Filter):
         """Apply high-pass filter to audio."""
         # Simple first-order IIR high-pass filter
         alpha = 1.0 / (1.0 + 2 * np.pi * self.cutoff_freq / self.sample_rate)
+        if len(audio) == 0:
+            return np.zeros_like(audio)
         
-        filtered = np.zeros_like(audio)
-        for i in range(len(audio)):
-            filtered[i] = alpha * (self.y_history[0] + audio[i] - self.x_history[0])
-            self.x_history[0] = audio[i]
-            self.y_history[0] = filtered[i]
+        # y[i] = alpha * (y[i-1] + x[i] - x[i-1]), continuing from the last call
+        filtered, _ = lfilter([alpha, -alpha], [1.0, -alpha], audio,
+                              zi=[alpha * (self.y_history[0] - self.x_history[0])])
+        self.x_history[0] = audio[-1]
+        self.y_history[0] = filtered[-1]
         
-        return filtered
+        return filtered.astype(audio.dtype, copy=False)
 
 class LFO:
     """Low Frequency Oscillator for modulation."""
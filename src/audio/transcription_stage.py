@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Transcription Stage
+======================================
+
+Bounded worker pool that runs STT/translation jobs off the capture and
+processing threads
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+======================================================================
+Classes:
+- BackpressurePolicy: What to do when the job queue is full.
+- TranscriptionStage: Worker pool with per-source ordering and backpressure.
+======================================================================
+
+Jobs are numbered per source when submitted. Workers pick the oldest job
+whose source has a free slot (one in-flight job per source by default, so
+microphone and system audio run in parallel while each source stays
+sequential). Results pass through a per-source reorder buffer and are
+delivered strictly in sequence order; dropped jobs leave a gap that is
+skipped, never waited for. Jobs submitted with droppable=False (chunks of
+a streaming session) are never dropped by backpressure: they are merged
+into the pending job of their source, or queued past the limit.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Union
+
+from src.logging_config import get_logger
+
+
+class BackpressurePolicy(Enum):
+    """Behaviour when the job queue is full."""
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest pending job
+    COALESCE = "coalesce"        # Merge into the newest pending job of the same source
+
+
+@dataclass
+class _Job:
+    """A queued unit of work."""
+    source: str
+    sequence: int
+    payload: Any
+    droppable: bool = True
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+_DROPPED = object()
+
+
+class TranscriptionStage:
+    """
+    Bounded executor stage for speech-to-text and translation jobs.
+
+    Args:
+        process: Called on a worker thread as process(source, payload) -> result
+        deliver: Called in per-source sequence order as deliver(source, sequence, result)
+        num_workers: Number of worker threads
+        max_queue_size: Maximum number of pending (not yet started) jobs
+        policy: Backpressure policy applied when the queue is full
+        coalesce: Merges two payloads of the same source; returns None if
+            they cannot be merged (then the oldest job is dropped instead)
+        max_in_flight_per_source: Concurrent jobs allowed per source
+    """
+
+    def __init__(self,
+                 process: Callable[[str, Any], Any],
+                 deliver: Callable[[str, int, Any], None],
+                 num_workers: int = 2,
+                 max_queue_size: int = 8,
+                 policy: Union[str, BackpressurePolicy] = BackpressurePolicy.DROP_OLDEST,
+                 coalesce: Optional[Callable[[Any, Any], Optional[Any]]] = None,
+                 max_in_flight_per_source: int = 1):
+        self.logger = get_logger(__name__)
+        self.process = process
+        self.deliver = deliver
+        self.num_workers = max(1, num_workers)
+        self.max_queue_size = max(1, max_queue_size)
+        self.policy = policy if isinstance(policy, BackpressurePolicy) else BackpressurePolicy(policy)
+        self.coalesce = coalesce
+        self.max_in_flight_per_source = max(1, max_in_flight_per_source)
+
+        self._pending: Deque[_Job] = deque()
+        self._condition = threading.Condition()
+        self._workers: list = []
+        self._running = False
+
+        # Per-source sequencing and reordering
+        self._next_sequence: Dict[str, int] = {}
+        self._next_delivery: Dict[str, int] = {}
+        self._completed: Dict[str, Dict[int, Any]] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._delivery_locks: Dict[str, threading.Lock] = {}
+
+        self._stats = {
+            'submitted': 0,
+            'processed': 0,
+            'failed': 0,
+            'dropped': 0,
+            'coalesced': 0,
+            'max_queue_depth': 0,
+            'total_wait_time': 0.0,
+            'max_wait_time': 0.0,
+            'last_wait_time': 0.0,
+            'total_processing_time': 0.0
+        }
+
+    def start(self) -> bool:
+        """Start the worker threads."""
+        with self._condition:
+            if self._running:
+                return True
+            self._running = True
+
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"TranscriptionWorker-{i}", daemon=True)
+            for i in range(self.num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+        self.logger.info(f"Transcription stage started ({self.num_workers} workers, "
+                         f"queue {self.max_queue_size}, policy {self.policy.value})")
+        return True
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """Stop the workers; pending jobs are discarded."""
+        with self._condition:
+            if not self._running:
+                return True
+            self._running = False
+            discarded = list(self._pending)
+            self._pending.clear()
+            self._stats['dropped'] += len(discarded)
+            self._condition.notify_all()
+
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.join(timeout=timeout)
+        self._workers = []
+
+        # Skip the discarded sequence numbers so a restart delivers again
+        for job in discarded:
+            self._complete(job, _DROPPED)
+        if discarded:
+            self.logger.info(f"Transcription stage stopped, discarded {len(discarded)} pending jobs")
+        return True
+
+    def is_running(self) -> bool:
+        """Check whether the workers are running."""
+        return self._running
+
+    def submit(self, source: str, payload: Any, droppable: bool = True) -> Optional[int]:
+        """
+        Queue a job for a source.
+
+        Args:
+            source: Source the job belongs to
+            payload: Passed to process()
+            droppable: False if backpressure must never discard the job; it
+                is merged into a pending job of its source when possible
+
+        Returns:
+            Sequence number of the job, or None if it was merged into a
+            pending job (coalesce policy)
+        """
+        dropped = None
+        with self._condition:
+            self._stats['submitted'] += 1
+
+            if len(self._pending) >= self.max_queue_size:
+                if ((self.policy == BackpressurePolicy.COALESCE or not droppable)
+                        and self._coalesce_pending(source, payload)):
+                    return None
+                dropped = self._drop_oldest()
+
+            sequence = self._next_sequence.get(source, 0)
+            self._next_sequence[source] = sequence + 1
+            self._pending.append(_Job(source, sequence, payload, droppable))
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], len(self._pending))
+            self._condition.notify()
+
+        if dropped is not None:
+            # The gap left in the dropped job's sequence must not block later results
+            self.logger.warning(f"Transcription queue full, dropped job {dropped.sequence} from {dropped.source}")
+            self._complete(dropped, _DROPPED)
+        return sequence
+
+    def _drop_oldest(self) -> Optional[_Job]:
+        """Remove the oldest droppable pending job (lock held)."""
+        for index, job in enumerate(self._pending):
+            if job.droppable:
+                del self._pending[index]
+                self._stats['dropped'] += 1
+                return job
+        return None
+
+    def _coalesce_pending(self, source: str, payload: Any) -> bool:
+        """Merge payload into the newest pending job of the same source."""
+        if self.coalesce is None:
+            return False
+        for job in reversed(self._pending):
+            if job.source == source:
+                merged = self.coalesce(job.payload, payload)
+                if merged is None:
+                    return False
+                job.payload = merged
+                self._stats['coalesced'] += 1
+                return True
+        return False
+
+    def _take_job(self) -> Optional[_Job]:
+        """Pop the oldest job whose source has a free slot (lock held)."""
+        for index, job in enumerate(self._pending):
+            if self._in_flight.get(job.source, 0) < self.max_in_flight_per_source:
+                del self._pending[index]
+                self._in_flight[job.source] = self._in_flight.get(job.source, 0) + 1
+                return job
+        return None
+
+    def _worker_loop(self) -> None:
+        """Worker thread main loop."""
+        while True:
+            with self._condition:
+                job = None
+                while self._running:
+                    job = self._take_job()
+                    if job is not None:
+                        break
+                    self._condition.wait(timeout=0.5)
+                if job is None:
+                    return
+
+                wait_time = time.monotonic() - job.enqueued_at
+                self._stats['total_wait_time'] += wait_time
+                self._stats['last_wait_time'] = wait_time
+                self._stats['max_wait_time'] = max(self._stats['max_wait_time'], wait_time)
+
+            start = time.monotonic()
+            try:
+                result = self.process(job.source, job.payload)
+            except Exception as e:
+                self.logger.error(f"Transcription job {job.sequence} from {job.source} failed: {e}")
+                result = _DROPPED
+                with self._condition:
+                    self._stats['failed'] += 1
+
+            with self._condition:
+                self._stats['processed'] += 1
+                self._stats['total_processing_time'] += time.monotonic() - start
+                self._in_flight[job.source] -= 1
+                self._condition.notify_all()
+
+            self._complete(job, result)
+
+    def _complete(self, job: _Job, result: Any) -> None:
+        """Store a result and deliver every result that is now in order."""
+        lock = self._delivery_lock(job.source)
+        with lock:
+            completed = self._completed.setdefault(job.source, {})
+            completed[job.sequence] = result
+            next_sequence = self._next_delivery.get(job.source, 0)
+            while next_sequence in completed:
+                ready = completed.pop(next_sequence)
+                if ready is not _DROPPED:
+                    try:
+                        self.deliver(job.source, next_sequence, ready)
+                    except Exception as e:
+                        self.logger.error(f"Error delivering result {next_sequence} from {job.source}: {e}")
+                next_sequence += 1
+            self._next_delivery[job.source] = next_sequence
+
+    def _delivery_lock(self, source: str) -> threading.Lock:
+        """Get the lock serializing delivery for a source."""
+        with self._condition:
+            lock = self._delivery_locks.get(source)
+            if lock is None:
+                lock = self._delivery_locks[source] = threading.Lock()
+            return lock
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, wait time and throughput statistics."""
+        with self._condition:
+            started = self._stats['processed']
+            depth_by_source: Dict[str, int] = {}
+            for job in self._pending:
+                depth_by_source[job.source] = depth_by_source.get(job.source, 0) + 1
+            return {
+                'running': self._running,
+                'policy': self.policy.value,
+                'workers': self.num_workers,
+                'queue_depth': len(self._pending),
+                'queue_depth_by_source': depth_by_source,
+                'max_queue_size': self.max_queue_size,
+                'max_queue_depth': self._stats['max_queue_depth'],
+                'in_flight': sum(self._in_flight.values()),
+                'submitted': self._stats['submitted'],
+                'processed': started,
+                'failed': self._stats['failed'],
+                'dropped': self._stats['dropped'],
+                'coalesced': self._stats['coalesced'],
+                'avg_wait_time': self._stats['total_wait_time'] / started if started else 0.0,
+                'max_wait_time': self._stats['max_wait_time'],
+                'last_wait_time': self._stats['last_wait_time'],
+                'avg_processing_time': self._stats['total_processing_time'] / started if started else 0.0
+            }
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Audio - Voice Activity Detection
+===========================================
+
+Pluggable voice activity detectors for the audio pipeline
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- numpy
+======================================================================
+Classes:
+- VADType: Available voice activity detector implementations.
+- VoiceActivityDetector: Base class for all detectors.
+- EnergyVAD: RMS energy detector working on zero-copy sample views.
+- SpectralVAD: Band energy / zero-crossing detector with hangover
+  smoothing and per-source adaptive noise floors.
+Functions:
+- as_sample_view: Interpret raw PCM bytes or arrays as a 1-D sample view.
+- create_vad: Build a detector from a type name, enum or instance.
+======================================================================
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Union
+
+import numpy as np
+
+AudioBuffer = Union[bytes, bytearray, memoryview, np.ndarray]
+
+
+class VADType(Enum):
+    """Voice activity detector implementations."""
+    ENERGY = "energy"
+    SPECTRAL = "spectral"
+
+
+def as_sample_view(audio_data: AudioBuffer, dtype: Any = np.int16) -> np.ndarray:
+    """
+    Interpret audio data as a flat sample array without copying.
+
+    Args:
+        audio_data: Raw PCM bytes/memoryview or a numpy array
+        dtype: Sample type used to interpret raw bytes (ignored for arrays)
+
+    Returns:
+        1-D numpy view over the samples (a trailing partial sample is ignored)
+    """
+    if isinstance(audio_data, np.ndarray):
+        return audio_data.reshape(-1)
+
+    dtype = np.dtype(dtype)
+    nbytes = memoryview(audio_data).nbytes
+    return np.frombuffer(audio_data, dtype=dtype, count=nbytes // dtype.itemsize)
+
+
+def _full_scale(dtype: np.dtype) -> float:
+    """Get the full-scale amplitude for a sample type."""
+    if np.issubdtype(dtype, np.integer):
+        return float(np.iinfo(dtype).max) + 1.0
+    return 1.0
+
+
+class VoiceActivityDetector(ABC):
+    """Base class for voice activity detectors."""
+
+    vad_type: VADType
+
+    def __init__(self, sample_dtype: Any = np.int16):
+        """
+        Initialize the detector.
+
+        Args:
+            sample_dtype: Sample type of raw byte input (default: 16-bit PCM)
+        """
+        self.sample_dtype = np.dtype(sample_dtype)
+
+    @abstractmethod
+    def is_speech(self, audio_data: AudioBuffer, sample_rate: int = 16000,
+                  channels: int = 1, source: str = "default") -> bool:
+        """
+        Decide whether an audio chunk contains voice activity.
+
+        Args:
+            audio_data: Raw PCM bytes or a numpy array of samples
+            sample_rate: Sample rate of the chunk in Hz
+            channels: Number of interleaved channels
+            source: Source identifier used to keep per-source state
+
+        Returns:
+            True if voice activity was detected
+        """
+        ...
+
+    def reset(self, source: Any = None) -> None:
+        """Reset internal state for one source, or all sources if None."""
+        pass
+
+
+class EnergyVAD(VoiceActivityDetector):
+    """Stateless RMS energy detector."""
+
+    vad_type = VADType.ENERGY
+
+    def __init__(self, threshold: float = 0.01, sample_dtype: Any = np.int16):
+        """
+        Initialize the energy detector.
+
+        Args:
+            threshold: Normalized RMS threshold (0.0 to 1.0)
+            sample_dtype: Sample type of raw byte input
+        """
+        super().__init__(sample_dtype)
+        self.threshold = threshold
+
+    def rms(self, audio_data: AudioBuffer) -> float:
+        """Compute the normalized RMS level of an audio chunk."""
+        samples = as_sample_view(audio_data, self.sample_dtype)
+        if samples.size == 0:
+            return 0.0
+
+        # einsum accumulates in float64 through a small buffer, so no
+        # squared or converted copy of the chunk is ever allocated
+        energy = np.einsum('i,i->', samples, samples, dtype=np.float64)
+        return float(np.sqrt(energy / samples.size)) / _full_scale(samples.dtype)
+
+    def is_speech(self, audio_data: AudioBuffer, sample_rate: int = 16000,
+                  channels: int = 1, source: str = "default") -> bool:
+        """Detect voice activity by comparing RMS energy with the threshold."""
+        return self.rms(audio_data) > self.threshold
+
+
+@dataclass
+class _SourceState:
+    """Adaptive state kept per audio source by SpectralVAD."""
+    noise_floor: float = 0.0
+    hangover_samples: int = 0
+    initialized: bool = False
+
+
+class SpectralVAD(VoiceActivityDetector):
+    """
+    Frame-based detector combining speech-band energy, zero-crossing rate
+    and an adaptive noise floor, with hangover smoothing.
+
+    A frame counts as speech when its energy is well above the source's
+    noise floor, most of its spectral power lies in the speech band and its
+    zero-crossing rate is below the noise-like range. The decision is held
+    for ``hangover_ms`` after the last speech frame so short pauses between
+    words do not split an utterance.
+    """
+
+    vad_type = VADType.SPECTRAL
+
+    def __init__(self, frame_ms: float = 20.0, snr_threshold_db: float = 6.0,
+                 min_rms: float = 0.005, speech_band: tuple = (80.0, 4000.0),
+                 min_band_ratio: float = 0.6, max_zcr: float = 0.4,
+                 min_speech_frames: float = 0.2, hangover_ms: float = 300.0,
+                 noise_adapt_rate: float = 0.05, sample_dtype: Any = np.int16):
+        """
+        Initialize the spectral detector.
+
+        Args:
+            frame_ms: Analysis frame length in milliseconds
+            snr_threshold_db: Required frame energy above the noise floor (dB)
+            min_rms: Absolute normalized RMS below which frames are never speech
+            speech_band: (low, high) speech band in Hz
+            min_band_ratio: Minimum share of spectral power inside the speech band
+            max_zcr: Maximum zero-crossing rate (crossings per sample)
+            min_speech_frames: Fraction of speech frames needed to flag a chunk
+            hangover_ms: Time to keep reporting speech after the last speech frame
+            noise_adapt_rate: Smoothing factor for the noise floor update
+            sample_dtype: Sample type of raw byte input
+        """
+        super().__init__(sample_dtype)
+        self.frame_ms = frame_ms
+        self.snr_ratio = 10.0 ** (snr_threshold_db / 10.0)
+        self.min_energy = min_rms * min_rms
+        self.speech_band = speech_band
+        self.min_band_ratio = min_band_ratio
+        self.max_zcr = max_zcr
+        self.min_speech_frames = min_speech_frames
+        self.hangover_ms = hangover_ms
+        self.noise_adapt_rate = noise_adapt_rate
+        self._states: Dict[Any, _SourceState] = {}
+        self._band_masks: Dict[tuple, np.ndarray] = {}
+
+    def get_noise_floor(self, source: Any = "default") -> float:
+        """Get the current noise floor (normalized RMS) for a source."""
+        state = self._states.get(source)
+        return float(np.sqrt(state.noise_floor)) if state else 0.0
+
+    def reset(self, source: Any = None) -> None:
+        """Reset adaptive state for one source, or all sources if None."""
+        if source is None:
+            self._states.clear()
+        else:
+            self._states.pop(source, None)
+
+    def _band_mask(self, frame_len: int, sample_rate: int) -> np.ndarray:
+        """Get (and cache) the rFFT bin mask for the speech band."""
+        key = (frame_len, sample_rate)
+        mask = self._band_masks.get(key)
+        if mask is None:
+            freqs = np.fft.rfftfreq(frame_len, d=1.0 / sample_rate)
+            mask = (freqs >= self.speech_band[0]) & (freqs <= self.speech_band[1])
+            self._band_masks[key] = mask
+        return mask
+
+    def is_speech(self, audio_data: AudioBuffer, sample_rate: int = 16000,
+                  channels: int = 1, source: Any = "default") -> bool:
+        """Detect voice activity with per-source noise tracking and hangover."""
+        samples = as_sample_view(audio_data, self.sample_dtype)
+        if channels > 1:
+            # Strided view over the first channel
+            samples = samples[:samples.size - samples.size % channels:channels]
+
+        state = self._states.setdefault(source, _SourceState())
+        if samples.size == 0:
+            return state.hangover_samples > 0
+
+        frame_len = max(1, min(samples.size, int(sample_rate * self.frame_ms / 1000.0)))
+        n_frames = samples.size // frame_len
+        frames = samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+        frames = frames.astype(np.float32) * np.float32(1.0 / _full_scale(samples.dtype))
+
+        energy = np.einsum('ij,ij->i', frames, frames) / frame_len
+        zcr = np.count_nonzero(np.diff(np.signbit(frames), axis=1), axis=1) / frame_len
+
+        power = np.abs(np.fft.rfft(frames, axis=1)) ** 2
+        total_power = power.sum(axis=1) + 1e-12
+        band_ratio = power[:, self._band_mask(frame_len, sample_rate)].sum(axis=1) / total_power
+
+        if not state.initialized:
+            state.noise_floor = min(float(energy.min()), self.min_energy)
+            state.initialized = True
+
+        threshold = max(state.noise_floor * self.snr_ratio, self.min_energy)
+        speech_frames = ((energy > threshold)
+                         & (band_ratio >= self.min_band_ratio)
+                         & (zcr <= self.max_zcr))
+
+        # Adapt the noise floor on non-speech frames; drop quickly on quieter input
+        noise_energy = energy[~speech_frames]
+        if noise_energy.size:
+            level = float(noise_energy.mean())
+            if level < state.noise_floor:
+                state.noise_floor = level
+            else:
+                state.noise_floor += self.noise_adapt_rate * (level - state.noise_floor)
+
+        detected = np.count_nonzero(speech_frames) >= max(1, self.min_speech_frames * n_frames)
+        if detected:
+            state.hangover_samples = int(sample_rate * self.hangover_ms / 1000.0)
+        else:
+            state.hangover_samples = max(0, state.hangover_samples - n_frames * frame_len)
+
+        return bool(detected) or state.hangover_samples > 0
+
+
+_VAD_CLASSES = {
+    VADType.ENERGY: EnergyVAD,
+    VADType.SPECTRAL: SpectralVAD,
+}
+
+
+def create_vad(vad: Union[str, VADType, VoiceActivityDetector] = VADType.ENERGY,
+               **kwargs: Any) -> VoiceActivityDetector:
+    """
+    Create a voice activity detector.
+
+    Args:
+        vad: Detector type name, VADType, or an existing detector instance
+        **kwargs: Constructor arguments for the selected detector
+
+    Returns:
+        VoiceActivityDetector instance
+
+    Raises:
+        ValueError: If the detector type is unknown
+    """
+    if isinstance(vad, VoiceActivityDetector):
+        return vad
+
+    try:
+        vad_type = vad if isinstance(vad, VADType) else VADType(str(vad).lower())
+    except ValueError:
+        valid = ", ".join(t.value for t in VADType)
+        raise ValueError(f"Unknown VAD type '{vad}'. Valid types: {valid}")
+
+    return _VAD_CLASSES[vad_type](**kwargs)
@@ -228,6 +228,10 @@ LLM_CONFIG = {
     "ollama_host": os.getenv("OLLAMA_HOST", "http://localhost:11434"),
     "ollama_timeout": float(os.getenv("OLLAMA_TIMEOUT", "30.0")),
     "streaming": os.getenv("LLM_STREAMING", "true").lower() == "true",
+    
+    # Model metadata cache: /api/tags and /api/show results, kept on disk between runs
+    "model_cache_ttl": float(os.getenv("OLLAMA_MODEL_CACHE_TTL", "60")),
+    "model_cache_path": Path(os.getenv("OLLAMA_MODEL_CACHE_PATH", str(DATA_DIR / "ollama_models.json"))),
 }
 
 # Translation Configuration
@@ -238,9 +242,22 @@ TRANSLATION_CONFIG = {
     "target_language": os.getenv("TARGET_LANGUAGE", "es"),
     
     # Processing settings
-    "batch_size": int(os.getenv("TRANSLATION_BATCH_SIZE", "1")),
+    "batch_size": int(os.getenv("TRANSLATION_BATCH_SIZE", "32")),  # Texts per batch
+    "max_tokens_per_batch": int(os.getenv("TRANSLATION_MAX_TOKENS_PER_BATCH", "4096")),  # Padded tokens per batch
     "max_length": int(os.getenv("TRANSLATION_MAX_LENGTH", "512")),
     "use_gpu": os.getenv("TRANSLATION_USE_GPU", "false").lower() == "true",
+    "num_threads": int(os.getenv("TRANSLATION_NUM_THREADS", "0")),  # torch CPU threads, 0 = torch default
+    "micro_batch_window_ms": float(os.getenv("TRANSLATION_MICRO_BATCH_WINDOW_MS", "5")),  # 0 disables micro-batching
+    
+    # Model registry: estimated memory for loaded models, pairs loaded at startup
+    "model_memory_budget_mb": int(os.getenv("TRANSLATION_MODEL_MEMORY_MB", "2048")),
+    "preload_pairs": [p for p in os.getenv("TRANSLATION_PRELOAD_PAIRS", "").split(",") if p],  # e.g. "en-es,es-en"
+    
+    # Translation memory: previous translations cached in memory and in SQLite
+    "memory_enabled": os.getenv("TRANSLATION_MEMORY_ENABLED", "true").lower() == "true",
+    "memory_path": Path(os.getenv("TRANSLATION_MEMORY_PATH", str(DATA_DIR / "translation_memory.sqlite3"))),
+    "memory_max_entries": int(os.getenv("TRANSLATION_MEMORY_MAX_ENTRIES", "10000")),
+    "memory_fuzzy_threshold": float(os.getenv("TRANSLATION_MEMORY_FUZZY_THRESHOLD", "0")),  # e.g. 0.9; 0 disables fuzzy matches
     
     # Supported languages
     "supported_languages": ["en", "es", "fr", "de", "it", "pt"],
@@ -38,10 +38,11 @@ from PySide6.QtCore import (
 
 # Imports from TalkBridge core modules
 try:
-    from ...tts.synthesizer import synthesize_voice
+    from ...tts.synthesizer import synthesize_voice, warm_up_synthesis
     TTS_AVAILABLE = True
 except ImportError:
     synthesize_voice = None
+    warm_up_synthesis = None
     TTS_AVAILABLE = False
     logging.warning("TTS module not available")
 
@@ -210,6 +211,26 @@ class TTSService(QObject):
             self.logger.error(f"Error in TTS synthesis: {e}")
             raise
     
+    def warm_up(self) -> bool:
+        """
+        Loads the TTS model and precomputes the configured phrases in the background.
+
+        Returns:
+            bool: True if the warm-up was started
+        """
+        if not self.is_available or warm_up_synthesis is None:
+            return False
+
+        worker = BaseWorker(warm_up_synthesis)
+        worker.signals.result.connect(
+            lambda summary: self.logger.info(f"TTS warm-up finished: {summary}")
+        )
+        worker.signals.error.connect(
+            lambda error: self.logger.warning(f"TTS warm-up failed: {error}")
+        )
+        self.thread_pool.start(worker)
+        return True
+
     def _get_default_voice_settings(self) -> Dict[str, Any]:
         """Returns default voice configuration."""
         if self.state_manager:
@@ -484,6 +505,8 @@ class CoreBridge(QObject):
             )
             
             success = self.tts_service.is_available
+            if success:
+                self.tts_service.warm_up()
             self.services_initialized["tts"] = success
             self.service_initialized.emit("tts", success)
             
@@ -12,18 +12,22 @@ Requirements:
 - requests
 """
 
-from .ollama_client import OllamaClient
+from .ollama_client import OllamaClient, create_session, get_shared_client
 from .model_manager import OllamaModelManager
 from .conversation_manager import ConversationManager
 from .prompt_engineer import PromptEngineer
 from .streaming_client import OllamaStreamingClient
+from .async_client import AsyncOllamaClient
 
 __all__ = [
     'OllamaClient',
+    'create_session',
+    'get_shared_client',
     'OllamaModelManager', 
     'ConversationManager',
     'PromptEngineer',
-    'OllamaStreamingClient'
+    'OllamaStreamingClient',
+    'AsyncOllamaClient'
 ]
 
 __version__ = "1.0.0"
\ No newline at end of file
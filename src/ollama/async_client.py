@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Ollama - Async Client
+================================
+
+Native asyncio client for the Ollama API
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- httpx
+======================================================================
+Functions:
+- __init__: Initialize the async Ollama client.
+- ping: Verify if the Ollama server is available.
+- list_models: List available models.
+- get_model_info: Get model information.
+- pull_model: Pull a model from Ollama.
+- generate: Generate text using Ollama.
+- generate_stream: Generate text, yielding chunks as they arrive.
+- chat: Chat with Ollama model.
+- chat_stream: Chat, yielding chunks as they arrive.
+- aclose: Close the connection pool.
+Classes:
+- AsyncOllamaClient: asyncio counterpart of OllamaClient.
+======================================================================
+
+All requests of a client share one httpx connection pool. Requests for the
+same model are limited by a per-model semaphore, so dozens of concurrent
+sessions queue for a busy model instead of overloading the server, while
+requests for other models proceed. Cancelling the task that runs a request
+(or closing a stream early) closes its HTTP response, which makes Ollama
+stop generating.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from ..logging_config import get_logger
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None  # type: ignore
+    HTTPX_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+
+class AsyncOllamaClient:
+    """
+    asyncio counterpart of OllamaClient.
+
+    Use as an async context manager, or call aclose() when done:
+
+        async with AsyncOllamaClient() as client:
+            text = await client.generate("llama2", "Hello")
+            async for chunk in client.chat_stream("llama2", messages):
+                ...
+    """
+
+    def __init__(self, base_url: str = "http://localhost:11434", timeout: float = 30,
+                 connect_timeout: float = 5.0, max_connections: int = 20,
+                 max_concurrency_per_model: int = 4):
+        """
+        Initialize the async Ollama client.
+
+        Args:
+            base_url: Ollama server URL
+            timeout: Read timeout in seconds (None waits indefinitely)
+            connect_timeout: Connection timeout in seconds
+            max_connections: Maximum open connections to the server
+            max_concurrency_per_model: Maximum concurrent requests per model
+        """
+        if not HTTPX_AVAILABLE or httpx is None:
+            raise ImportError("httpx is required for AsyncOllamaClient. Install with: pip install httpx")
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_concurrency_per_model = max(1, max_concurrency_per_model)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+            headers={'Content-Type': 'application/json',
+                     'User-Agent': 'TalkBridge-Ollama-Client/1.0'},
+        )
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._active: Dict[str, int] = {}
+
+        self.requests = 0
+        self.errors = 0
+        self.cancelled = 0
+
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_model)
+            self._semaphores[model] = semaphore
+        return semaphore
+
+    async def _post(self, model: str, path: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """POST a non-streaming request, holding the model's semaphore."""
+        async with self._semaphore(model):
+            self._active[model] = self._active.get(model, 0) + 1
+            self.requests += 1
+            try:
+                response = await self._client.post(path, json=payload)
+                response.raise_for_status()
+                return response.json()
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            except (httpx.HTTPError, ValueError) as e:
+                self.errors += 1
+                logger.error(f"Error in Ollama request {path} for {model}: {e}")
+                return None
+            finally:
+                self._active[model] -= 1
+
+    async def _stream(self, model: str, path: str, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """POST a streaming request and yield each JSON line, holding the model's semaphore."""
+        async with self._semaphore(model):
+            self._active[model] = self._active.get(model, 0) + 1
+            self.requests += 1
+            try:
+                async with self._client.stream("POST", path, json=payload) as response:
+                    response.raise_for_status()
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        try:
+                            data = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        yield data
+                        if data.get('done', False):
+                            break
+            except (asyncio.CancelledError, GeneratorExit):
+                # Leaving the "async with" above closed the response
+                self.cancelled += 1
+                raise
+            except httpx.HTTPError as e:
+                self.errors += 1
+                logger.error(f"Error in Ollama stream {path} for {model}: {e}")
+            finally:
+                self._active[model] -= 1
+
+    async def ping(self) -> bool:
+        """
+        Verify if the Ollama server is available.
+
+        Returns:
+            True if server is available, False otherwise
+        """
+        try:
+            response = await self._client.get("/")
+            response.raise_for_status()
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Error connecting to Ollama server: {e}")
+            return False
+
+    async def list_models(self) -> List[Dict[str, Any]]:
+        """
+        List available models.
+
+        Returns:
+            List of model information dictionaries
+        """
+        try:
+            response = await self._client.get("/api/tags")
+            response.raise_for_status()
+            return response.json().get('models', [])
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Error listing models: {e}")
+            return []
+
+    async def get_model_info(self, model: str) -> Optional[Dict[str, Any]]:
+        """
+        Get model information.
+
+        Args:
+            model: Model name
+
+        Returns:
+            Model information dictionary or None if error
+        """
+        try:
+            response = await self._client.post("/api/show", json={"name": model})
+            response.raise_for_status()
+            return response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error(f"Error getting model info for {model}: {e}")
+            return None
+
+    async def pull_model(self, model: str, callback: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Pull a model from Ollama.
+
+        Args:
+            model: Model name to pull
+            callback: Optional callback for progress updates
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            async with self._client.stream("POST", "/api/pull", json={"name": model},
+                                           timeout=httpx.Timeout(None)) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if callback and 'status' in data:
+                        callback(data['status'])
+                    if data.get('done', False):
+                        break
+            return True
+        except httpx.HTTPError as e:
+            logger.error(f"Error pulling model {model}: {e}")
+            return False
+
+    @staticmethod
+    def _generate_payload(model: str, prompt: str, system: Optional[str],
+                          options: Optional[Dict[str, Any]], keep_alive: Optional[str],
+                          stream: bool) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"model": model, "prompt": prompt, "stream": stream}
+        if system:
+            payload["system"] = system
+        if options:
+            payload["options"] = options
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        return payload
+
+    async def generate(self, model: str, prompt: str,
+                       system: Optional[str] = None,
+                       options: Optional[Dict[str, Any]] = None,
+                       keep_alive: Optional[str] = None) -> Optional[str]:
+        """
+        Generate text using Ollama.
+
+        Args:
+            model: Model name to use
+            prompt: Input prompt
+            system: System message (optional)
+            options: Generation options (optional)
+            keep_alive: How long the model stays loaded after the request (optional)
+
+        Returns:
+            Generated text, or None if error
+        """
+        payload = self._generate_payload(model, prompt, system, options, keep_alive, stream=False)
+        result = await self._post(model, "/api/generate", payload)
+        return result.get("response", "") if result is not None else None
+
+    async def generate_stream(self, model: str, prompt: str,
+                              system: Optional[str] = None,
+                              options: Optional[Dict[str, Any]] = None,
+                              keep_alive: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Generate text, yielding chunks as they arrive.
+
+        Breaking out of the loop closes the stream once the generator is
+        closed (e.g. with contextlib.aclosing); cancelling the consuming
+        task closes it immediately.
+
+        Yields:
+            Generated text chunks
+        """
+        payload = self._generate_payload(model, prompt, system, options, keep_alive, stream=True)
+        stream = self._stream(model, "/api/generate", payload)
+        try:
+            async for data in stream:
+                if data.get('response'):
+                    yield data['response']
+        finally:
+            # Release the connection and the model slot as soon as the consumer stops
+            await stream.aclose()
+
+    async def chat(self, model: str, messages: List[Dict[str, str]],
+                   options: Optional[Dict[str, Any]] = None,
+                   keep_alive: Optional[str] = None) -> Optional[str]:
+        """
+        Chat with Ollama model.
+
+        Args:
+            model: Model name to use
+            messages: List of message dictionaries with 'role' and 'content'
+            options: Generation options (optional)
+            keep_alive: How long the model stays loaded after the request (optional)
+
+        Returns:
+            Generated response, or None if error
+        """
+        payload: Dict[str, Any] = {"model": model, "messages": messages, "stream": False}
+        if options:
+            payload["options"] = options
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        result = await self._post(model, "/api/chat", payload)
+        return result.get("message", {}).get("content", "") if result is not None else None
+
+    async def chat_stream(self, model: str, messages: List[Dict[str, str]],
+                          options: Optional[Dict[str, Any]] = None,
+                          keep_alive: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        Chat, yielding chunks as they arrive.
+
+        Yields:
+            Generated text chunks
+        """
+        payload: Dict[str, Any] = {"model": model, "messages": messages, "stream": True}
+        if options:
+            payload["options"] = options
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        stream = self._stream(model, "/api/chat", payload)
+        try:
+            async for data in stream:
+                content = data.get('message', {}).get('content')
+                if content:
+                    yield content
+        finally:
+            await stream.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request statistics.
+
+        Returns:
+            Dict[str, Any]: Request, error and cancellation counts and the
+            requests currently running per model
+        """
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "cancelled": self.cancelled,
+            "active": {model: count for model, count in self._active.items() if count},
+            "max_concurrency_per_model": self.max_concurrency_per_model,
+        }
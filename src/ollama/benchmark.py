@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Ollama - Benchmark
+=============================
+
+Concurrent latency and throughput benchmark for Ollama models
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- requests
+======================================================================
+Functions:
+- percentile: Percentile of a list of values with linear interpolation.
+- run_benchmark: Run N prompts x M models with a given concurrency.
+- main: Command line entry point.
+Classes:
+- BenchmarkSample: Timings of one request.
+- BenchmarkReport: Samples of a benchmark run with p50/p95 summaries.
+======================================================================
+
+Models are benchmarked one after another so they do not compete for the
+CPU; the prompts of a model run on `concurrency` threads at once. With
+cold_start, each model is first unloaded and one request is measured on
+its own; that cold sample (which includes the load time) is reported apart
+from the warm ones. Time to first token is measured on the streamed
+response, tokens/s comes from Ollama's eval_count / eval_duration.
+
+    python -m src.ollama.benchmark --models llama2 mistral --prompt "Hello" --concurrency 4 --json out.json
+"""
+
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..logging_config import get_logger
+from .ollama_client import OllamaClient
+
+logger = get_logger(__name__)
+
+# Sample fields summarized with p50/p95
+METRICS = ("ttft", "total_time", "prompt_eval_time", "tokens_per_second")
+
+
+def percentile(values: Sequence[float], p: float) -> Optional[float]:
+    """
+    Percentile of a list of values with linear interpolation.
+
+    Args:
+        values: Values, in any order
+        p: Percentile between 0 and 100
+
+    Returns:
+        Optional[float]: The percentile, or None for an empty list
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class BenchmarkSample:
+    """Timings of one request."""
+    model: str
+    prompt_index: int
+    cold: bool
+    ttft: Optional[float] = None
+    total_time: Optional[float] = None
+    load_time: Optional[float] = None
+    prompt_eval_time: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    eval_tokens: Optional[int] = None
+    tokens_per_second: Optional[float] = None
+    error: Optional[str] = None
+
+
+class BenchmarkReport:
+    """Samples of a benchmark run with p50/p95 summaries."""
+
+    def __init__(self, samples: List[BenchmarkSample], settings: Dict[str, Any]):
+        """
+        Initialize the report.
+
+        Args:
+            samples: Measured requests
+            settings: Parameters of the run, stored in the JSON output
+        """
+        self.samples = samples
+        self.settings = settings
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarize the samples per model.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each model, request and error
+            counts, p50/p95 of each warm metric (e.g. 'ttft_p95') and the
+            cold sample's ttft and load time, if any
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+        for model in dict.fromkeys(sample.model for sample in self.samples):
+            samples = [s for s in self.samples if s.model == model]
+            warm = [s for s in samples if not s.cold and s.error is None]
+            cold = [s for s in samples if s.cold and s.error is None]
+            entry: Dict[str, Any] = {
+                "requests": len(samples),
+                "errors": sum(1 for s in samples if s.error is not None),
+            }
+            for metric in METRICS:
+                values = [getattr(s, metric) for s in warm if getattr(s, metric) is not None]
+                entry[f"{metric}_p50"] = percentile(values, 50)
+                entry[f"{metric}_p95"] = percentile(values, 95)
+            entry["cold_ttft"] = cold[0].ttft if cold else None
+            entry["cold_load_time"] = cold[0].load_time if cold else None
+            summary[model] = entry
+        return summary
+
+    def models_within(self, max_ttft_p95: Optional[float] = None,
+                      min_tokens_per_second: Optional[float] = None) -> List[str]:
+        """
+        Models meeting a latency SLO, fastest first.
+
+        Args:
+            max_ttft_p95: Maximum warm p95 time to first token in seconds (optional)
+            min_tokens_per_second: Minimum warm p50 tokens/s (optional)
+
+        Returns:
+            List[str]: Models without errors that meet every given limit,
+            ordered by p95 time to first token
+        """
+        passing = []
+        for model, entry in self.summary().items():
+            if entry["errors"] or entry["ttft_p95"] is None:
+                continue
+            if max_ttft_p95 is not None and entry["ttft_p95"] > max_ttft_p95:
+                continue
+            if min_tokens_per_second is not None and (
+                    entry["tokens_per_second_p50"] is None
+                    or entry["tokens_per_second_p50"] < min_tokens_per_second):
+                continue
+            passing.append((entry["ttft_p95"], model))
+        return [model for _, model in sorted(passing)]
+
+    def format_table(self) -> str:
+        """
+        Format the summary as a text table.
+
+        Returns:
+            str: One row per model with warm p50/p95 and cold timings
+        """
+        def cell(value: Optional[float], scale: float = 1000.0) -> str:
+            return "-" if value is None else f"{value * scale:.0f}"
+
+        header = (f"{'model':<24} {'req':>4} {'err':>4} {'ttft p50':>9} {'ttft p95':>9} "
+                  f"{'total p50':>10} {'total p95':>10} {'prefill p50':>12} "
+                  f"{'tok/s p50':>10} {'tok/s p95':>10} {'cold ttft':>10} {'load':>7}")
+        lines = [header, "-" * len(header)]
+        for model, entry in self.summary().items():
+            lines.append(
+                f"{model:<24} {entry['requests']:>4} {entry['errors']:>4} "
+                f"{cell(entry['ttft_p50']):>9} {cell(entry['ttft_p95']):>9} "
+                f"{cell(entry['total_time_p50']):>10} {cell(entry['total_time_p95']):>10} "
+                f"{cell(entry['prompt_eval_time_p50']):>12} "
+                f"{cell(entry['tokens_per_second_p50'], 1.0):>10} "
+                f"{cell(entry['tokens_per_second_p95'], 1.0):>10} "
+                f"{cell(entry['cold_ttft']):>10} {cell(entry['cold_load_time']):>7}")
+        lines.append("Times in ms; p50/p95 over warm requests.")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Settings, per-model summary and every sample, ready for JSON."""
+        return {
+            "settings": self.settings,
+            "summary": self.summary(),
+            "samples": [asdict(sample) for sample in self.samples],
+        }
+
+    def save_json(self, filename: str) -> bool:
+        """
+        Write the report to a JSON file.
+
+        Args:
+            filename: Output filename
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(filename, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
+            return True
+        except (OSError, TypeError) as e:
+            logger.error(f"Error saving benchmark report: {e}")
+            return False
+
+
+def _measure(client: OllamaClient, model: str, prompt_index: int, prompt: str, cold: bool,
+             options: Optional[Dict[str, Any]], keep_alive: Optional[str]) -> BenchmarkSample:
+    """Send one request and collect its timings."""
+    sample = BenchmarkSample(model=model, prompt_index=prompt_index, cold=cold)
+    try:
+        result = client.generate_with_context(model, prompt, options=options, keep_alive=keep_alive)
+    except Exception as e:
+        sample.error = str(e)
+        return sample
+    if result is None:
+        sample.error = "Request failed"
+        return sample
+    if result["ttft"] is None:
+        sample.error = "Empty response"
+
+    sample.ttft = result["ttft"]
+    sample.total_time = result["total_time"]
+    sample.load_time = result["load_time"]
+    sample.prompt_eval_time = result["prompt_eval_time"]
+    sample.prompt_tokens = result["prompt_eval_count"]
+    sample.eval_tokens = result["eval_count"]
+    if result["eval_count"] and result["eval_time"]:
+        sample.tokens_per_second = result["eval_count"] / result["eval_time"]
+    return sample
+
+
+def run_benchmark(client: OllamaClient, models: Sequence[str], prompts: Sequence[str],
+                  concurrency: int = 1, repeats: int = 1, cold_start: bool = False,
+                  options: Optional[Dict[str, Any]] = None,
+                  keep_alive: Optional[str] = "10m") -> BenchmarkReport:
+    """
+    Run N prompts x M models with a given concurrency.
+
+    Args:
+        client: Ollama client
+        models: Models to benchmark, one after another
+        prompts: Prompts sent to every model
+        concurrency: Requests in flight at once for a model
+        repeats: Times each prompt is sent (warm)
+        cold_start: Unload each model first and measure one request on its own
+        options: Generation options, e.g. {"num_predict": 64} (optional)
+        keep_alive: How long models stay loaded between requests (optional)
+
+    Returns:
+        BenchmarkReport: All samples with their summaries
+    """
+    samples: List[BenchmarkSample] = []
+    jobs = [(index, prompt) for _ in range(max(1, repeats)) for index, prompt in enumerate(prompts)]
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for model in models:
+            logger.info(f"Benchmarking {model}: {len(jobs)} requests, concurrency {concurrency}")
+            if cold_start and prompts:
+                client.unload_model(model)
+                samples.append(_measure(client, model, 0, prompts[0], True, options, keep_alive))
+            futures = [executor.submit(_measure, client, model, index, prompt, False, options, keep_alive)
+                       for index, prompt in jobs]
+            samples.extend(future.result() for future in futures)
+
+    settings = {
+        "models": list(models),
+        "prompts": len(prompts),
+        "concurrency": concurrency,
+        "repeats": repeats,
+        "cold_start": cold_start,
+        "options": options,
+        "timestamp": time.time(),
+    }
+    return BenchmarkReport(samples, settings)
+
+
+def main() -> None:
+    """Command line entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Ollama models")
+    parser.add_argument("--models", nargs="+", required=True, help="Models to benchmark")
+    parser.add_argument("--prompt", action="append", default=[], help="Prompt (repeatable)")
+    parser.add_argument("--prompts-file", help="File with one prompt per line")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight per model")
+    parser.add_argument("--repeats", type=int, default=3, help="Times each prompt is sent")
+    parser.add_argument("--num-predict", type=int, help="Maximum tokens generated per request")
+    parser.add_argument("--cold", action="store_true", help="Measure a cold start per model")
+    parser.add_argument("--url", default="http://localhost:11434", help="Ollama server URL")
+    parser.add_argument("--json", help="Write the report to this JSON file")
+
+    args = parser.parse_args()
+
+    prompts = list(args.prompt)
+    if args.prompts_file:
+        with open(args.prompts_file) as f:
+            prompts.extend(line.strip() for line in f if line.strip())
+    if not prompts:
+        prompts = ["Hello, how are you?"]
+
+    client = OllamaClient(args.url, pool_size=max(10, args.concurrency))
+    options = {"num_predict": args.num_predict} if args.num_predict else None
+    report = run_benchmark(client, args.models, prompts, concurrency=args.concurrency,
+                           repeats=args.repeats, cold_start=args.cold, options=options)
+    print(report.format_table())
+    if args.json and report.save_json(args.json):
+        print(f"Saved report to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
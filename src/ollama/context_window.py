@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Ollama - Context Window
+==================================
+
+Token-budgeted conversation context for chat requests
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- None
+======================================================================
+Functions:
+- estimate_tokens: Estimate the number of tokens in a text.
+- message_tokens: Token count of a message, cached on the message.
+- make_model_summarizer: Build a summarizer that asks an Ollama model to fold old turns.
+Classes:
+- ContextWindow: Rolling window of the most recent messages that fit a token budget.
+======================================================================
+
+A ContextWindow is extended as messages are appended and drops whole
+messages from the front once the budget is exceeded, so assembling the
+context costs the size of the window, not of the conversation. Token counts
+are estimated once per message and cached on it. Optionally, dropped turns
+are folded into a running summary that is sent ahead of the window.
+"""
+
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Tokens added per message for the role and chat template
+MESSAGE_OVERHEAD = 4
+
+Summarizer = Callable[[Optional[str], List[Any]], Optional[str]]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Uses about four characters per token, which is close for English and
+    Spanish with the Llama-family tokenizers Ollama serves.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        int: Estimated token count
+    """
+    return math.ceil(len(text) / 4) if text else 0
+
+
+def message_tokens(message: Any) -> int:
+    """
+    Token count of a message, cached on the message.
+
+    Args:
+        message: Message with `content` and `tokens` attributes
+
+    Returns:
+        int: Estimated tokens of the message including overhead
+    """
+    if message.tokens is None:
+        message.tokens = estimate_tokens(message.content) + MESSAGE_OVERHEAD
+    return message.tokens
+
+
+def make_model_summarizer(client: Any, model: str) -> Summarizer:
+    """
+    Build a summarizer that asks an Ollama model to fold old turns.
+
+    Args:
+        client: OllamaClient used for the summary requests
+        model: Model that writes the summaries
+
+    Returns:
+        Summarizer: Function (previous_summary, messages) -> new summary
+    """
+    def summarize(previous: Optional[str], messages: List[Any]) -> Optional[str]:
+        transcript = "\n".join(f"{m.role}: {m.content}" for m in messages)
+        prompt = (
+            "Update the summary of a conversation with the new turns below. "
+            "Keep names, facts, decisions and open questions; answer with the summary only.\n\n"
+            f"Current summary: {previous or '(none)'}\n\nNew turns:\n{transcript}"
+        )
+        result = client.generate(model, prompt, stream=False)
+        return result.strip() if result else None
+    return summarize
+
+
+class ContextWindow:
+    """
+    Rolling window of the most recent messages that fit a token budget.
+
+    append() is O(1) amortized and build() is O(window size), so latency
+    stays flat as the conversation grows.
+    """
+
+    def __init__(self, max_tokens: int, summarizer: Optional[Summarizer] = None,
+                 fold_min_tokens: Optional[int] = None):
+        """
+        Initialize the window.
+
+        Args:
+            max_tokens: Token budget for the system prompt, summary and messages
+            summarizer: Function folding dropped messages into a summary (optional)
+            fold_min_tokens: Dropped tokens collected before the summarizer is
+                             called. Defaults to a quarter of max_tokens
+        """
+        self.max_tokens = max_tokens
+        self.summarizer = summarizer
+        self.fold_min_tokens = fold_min_tokens if fold_min_tokens is not None else max_tokens // 4
+
+        self._messages: Deque[Any] = deque()
+        self._tokens = 0
+        self._pending: List[Any] = []
+        self._pending_tokens = 0
+
+        self.summary: Optional[str] = None
+        self._summary_tokens = 0
+        self.dropped = 0
+
+    @classmethod
+    def from_messages(cls, messages: List[Any], max_tokens: int,
+                      summarizer: Optional[Summarizer] = None) -> "ContextWindow":
+        """
+        Build a window over the newest messages of an existing conversation.
+
+        Only the messages that fit are visited; earlier ones are not
+        summarized.
+
+        Args:
+            messages: Conversation messages, oldest first
+            max_tokens: Token budget
+            summarizer: Function folding dropped messages into a summary (optional)
+
+        Returns:
+            ContextWindow: Window holding the newest messages that fit
+        """
+        window = cls(max_tokens, summarizer)
+        selected: List[Any] = []
+        total = 0
+        for message in reversed(messages):
+            tokens = message_tokens(message)
+            if selected and total + tokens > max_tokens:
+                break
+            selected.append(message)
+            total += tokens
+        window._messages.extend(reversed(selected))
+        window._tokens = total
+        window.dropped = len(messages) - len(selected)
+        return window
+
+    def append(self, message: Any) -> None:
+        """Add a message at the end of the window, dropping old ones if needed."""
+        self._messages.append(message)
+        self._tokens += message_tokens(message)
+        self._trim(0)
+
+    def _trim(self, reserved: int) -> None:
+        """Drop messages from the front until the window fits the budget."""
+        budget = self.max_tokens - self._summary_tokens - reserved
+        # The newest message is always kept, even if it alone exceeds the budget
+        while self._tokens > budget and len(self._messages) > 1:
+            message = self._messages.popleft()
+            self._tokens -= message.tokens
+            self.dropped += 1
+            if self.summarizer is not None:
+                self._pending.append(message)
+                self._pending_tokens += message.tokens
+
+    def _fold(self) -> None:
+        """Fold dropped messages into the summary once enough have collected."""
+        if not self._pending or self._pending_tokens < self.fold_min_tokens:
+            return
+        try:
+            summary = self.summarizer(self.summary, list(self._pending))
+        except Exception as e:
+            logger.warning(f"Could not summarize {len(self._pending)} old messages: {e}")
+            return
+        if summary:
+            self.summary = summary
+            self._summary_tokens = estimate_tokens(summary) + MESSAGE_OVERHEAD
+            self._pending.clear()
+            self._pending_tokens = 0
+
+    def build(self, system_prompt: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Assemble the messages for a chat request.
+
+        Args:
+            system_prompt: System prompt sent first (optional)
+
+        Returns:
+            List[Dict[str, str]]: Messages with 'role' and 'content', ready for /api/chat
+        """
+        reserved = estimate_tokens(system_prompt) + MESSAGE_OVERHEAD if system_prompt else 0
+        self._trim(reserved)
+        if self.summarizer is not None:
+            self._fold()
+            self._trim(reserved)
+
+        messages = []
+        if system_prompt:
+            messages.append({'role': 'system', 'content': system_prompt})
+        if self.summary:
+            messages.append({'role': 'system',
+                             'content': f"Summary of the earlier conversation: {self.summary}"})
+        messages.extend({'role': m.role, 'content': m.content} for m in self._messages)
+        return messages
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @property
+    def token_count(self) -> int:
+        """Estimated tokens of the summary and the messages in the window."""
+        return self._tokens + self._summary_tokens
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get window statistics.
+
+        Returns:
+            Dict[str, Any]: Messages and tokens in the window, dropped messages
+            and whether a summary is in use
+        """
+        return {
+            "messages": len(self._messages),
+            "tokens": self.token_count,
+            "max_tokens": self.max_tokens,
+            "dropped": self.dropped,
+            "summarized": self.summary is not None,
+            "pending_summary_tokens": self._pending_tokens,
+        }
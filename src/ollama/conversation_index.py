@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Ollama - Conversation Index
+======================================
+
+Inverted full-text index over conversation titles and messages
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- None
+======================================================================
+Functions:
+- tokenize: Split text into lowercase, accent-folded terms.
+- parse_query: Split a search query into terms and quoted phrases.
+Classes:
+- SearchHit: A matching message or title with its score.
+- ConversationIndex: Incrementally maintained inverted index with BM25 ranking.
+======================================================================
+
+Each message (and each conversation title) is a document. The index maps
+every term to the documents containing it and the positions where it
+occurs, so a query only visits the postings of its own terms instead of
+scanning every message. All terms and phrases of a query must match; hits
+are ranked with BM25, titles weighing double. Phrases ("like this") are
+checked against term positions.
+"""
+
+import math
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+_WORD_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2.0
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase, accent-folded terms.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List[str]: Terms in order of appearance
+    """
+    folded = unicodedata.normalize("NFKD", text.lower())
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return _WORD_RE.findall(folded)
+
+
+def parse_query(query: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Split a search query into terms and quoted phrases.
+
+    Args:
+        query: Query such as `hola "buenos dias"`
+
+    Returns:
+        Tuple[List[str], List[List[str]]]: Single terms, and the terms of
+        each phrase of two or more words
+    """
+    terms: List[str] = []
+    phrases: List[List[str]] = []
+    for phrase, word in _QUERY_RE.findall(query):
+        tokens = tokenize(phrase if phrase else word)
+        if len(tokens) > 1 and phrase:
+            phrases.append(tokens)
+        else:
+            terms.extend(tokens)
+    return terms, phrases
+
+
+@dataclass
+class SearchHit:
+    """A matching message or title with its score."""
+    conversation_id: str
+    message_id: Optional[str]  # None when the title matched
+    score: float
+    timestamp: float
+
+
+@dataclass
+class _Document:
+    conversation_id: str
+    message_id: Optional[str]
+    model: str
+    timestamp: float
+    length: int
+    terms: Set[str]
+    weight: float
+
+
+class ConversationIndex:
+    """
+    Incrementally maintained inverted index with BM25 ranking.
+
+    Adding or removing a document costs its own terms; a search costs the
+    postings of the query terms.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        # term -> document id -> positions of the term in the document
+        self._postings: Dict[str, Dict[str, List[int]]] = {}
+        self._documents: Dict[str, _Document] = {}
+        self._by_conversation: Dict[str, Set[str]] = {}
+        self._total_length = 0
+
+        self.searches = 0
+
+    @staticmethod
+    def title_id(conversation_id: str) -> str:
+        """Document id of a conversation title."""
+        return f"title:{conversation_id}"
+
+    def add_document(self, doc_id: str, conversation_id: str, text: str, model: str,
+                     timestamp: float, message_id: Optional[str] = None,
+                     weight: float = 1.0) -> None:
+        """
+        Index a document, replacing any previous version with the same id.
+
+        Args:
+            doc_id: Document id, e.g. the message id
+            conversation_id: Conversation the document belongs to
+            text: Text to index
+            model: Model of the conversation, for filtering
+            timestamp: Time of the message, for filtering
+            message_id: Message id reported in hits (None for titles)
+            weight: Score multiplier
+        """
+        if doc_id in self._documents:
+            self.remove_document(doc_id)
+
+        tokens = tokenize(text)
+        for position, term in enumerate(tokens):
+            self._postings.setdefault(term, {}).setdefault(doc_id, []).append(position)
+
+        self._documents[doc_id] = _Document(conversation_id, message_id, model, timestamp,
+                                            len(tokens), set(tokens), weight)
+        self._by_conversation.setdefault(conversation_id, set()).add(doc_id)
+        self._total_length += len(tokens)
+
+    def add_title(self, conversation_id: str, title: str, model: str, timestamp: float) -> None:
+        """Index (or re-index) the title of a conversation."""
+        self.add_document(self.title_id(conversation_id), conversation_id, title, model,
+                          timestamp, weight=TITLE_WEIGHT)
+
+    def remove_document(self, doc_id: str) -> None:
+        """Remove a document from the index, if present."""
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return
+        for term in document.terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        documents = self._by_conversation.get(document.conversation_id)
+        if documents is not None:
+            documents.discard(doc_id)
+            if not documents:
+                del self._by_conversation[document.conversation_id]
+        self._total_length -= document.length
+
+    def remove_conversation(self, conversation_id: str, keep_title: bool = False) -> None:
+        """
+        Remove all documents of a conversation.
+
+        Args:
+            conversation_id: Conversation ID
+            keep_title: Remove only the messages, e.g. when clearing
+        """
+        title_id = self.title_id(conversation_id)
+        for doc_id in list(self._by_conversation.get(conversation_id, ())):
+            if keep_title and doc_id == title_id:
+                continue
+            self.remove_document(doc_id)
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        self._postings.clear()
+        self._documents.clear()
+        self._by_conversation.clear()
+        self._total_length = 0
+
+    def _has_phrase(self, doc_id: str, phrase: List[str]) -> bool:
+        """Check that the terms of a phrase appear consecutively in a document."""
+        first = self._postings[phrase[0]][doc_id]
+        following = [set(self._postings[term][doc_id]) for term in phrase[1:]]
+        return any(all(start + offset in positions for offset, positions in enumerate(following, 1))
+                   for start in first)
+
+    def search(self, query: str, model: Optional[str] = None,
+               since: Optional[float] = None, until: Optional[float] = None,
+               limit: Optional[int] = None) -> List[SearchHit]:
+        """
+        Find the documents matching every term and phrase of a query.
+
+        Args:
+            query: Terms and "quoted phrases"
+            model: Only documents of conversations with this model (optional)
+            since: Only documents at or after this timestamp (optional)
+            until: Only documents at or before this timestamp (optional)
+            limit: Maximum number of hits (optional)
+
+        Returns:
+            List[SearchHit]: Hits, best first
+        """
+        self.searches += 1
+        terms, phrases = parse_query(query)
+        required = set(terms)
+        for phrase in phrases:
+            required.update(phrase)
+        if not required:
+            return []
+
+        postings = []
+        for term in required:
+            term_postings = self._postings.get(term)
+            if not term_postings:
+                return []
+            postings.append((term, term_postings))
+        # Intersect starting from the rarest term
+        postings.sort(key=lambda item: len(item[1]))
+        candidates = set(postings[0][1])
+        for _, term_postings in postings[1:]:
+            candidates.intersection_update(term_postings)
+            if not candidates:
+                return []
+
+        total_documents = len(self._documents)
+        average_length = self._total_length / total_documents if total_documents else 0.0
+        idf = {term: math.log(1 + (total_documents - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+               for term, term_postings in postings}
+
+        hits = []
+        for doc_id in candidates:
+            document = self._documents[doc_id]
+            if model is not None and document.model != model:
+                continue
+            if since is not None and document.timestamp < since:
+                continue
+            if until is not None and document.timestamp > until:
+                continue
+            if phrases and not all(self._has_phrase(doc_id, phrase) for phrase in phrases):
+                continue
+
+            norm = K1 * (1 - B + B * document.length / average_length) if average_length else K1
+            score = 0.0
+            for term, term_postings in postings:
+                frequency = len(term_postings[doc_id])
+                score += idf[term] * frequency * (K1 + 1) / (frequency + norm)
+            hits.append(SearchHit(document.conversation_id, document.message_id,
+                                  score * document.weight, document.timestamp))
+
+        hits.sort(key=lambda hit: (-hit.score, -hit.timestamp))
+        return hits[:limit] if limit is not None else hits
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict[str, int]: Documents, distinct terms, indexed tokens and searches
+        """
+        return {
+            "documents": len(self._documents),
+            "terms": len(self._postings),
+            "tokens": self._total_length,
+            "searches": self.searches,
+        }
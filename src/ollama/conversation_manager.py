@@ -20,18 +20,39 @@ Functions:
 - send_message: Send a message and get response from the model.
 - get_conversation_messages: Get all messages in a conversation.
 - get_conversation_context: Get conversation context as a formatted string.
+- get_context_messages: Get the token-budgeted messages for a chat request.
+- invalidate_context: Rebuild the context window of a conversation on next use.
+- edit_message: Change the content of a message.
+- get_turn_stats: Get per-turn timings of a conversation.
+- search_messages: Find messages matching a full-text query.
+- rebuild_index: Rebuild the search index and counters from the conversations.
 - delete_conversation: Delete a conversation.
 - clear_conversation: Clear all messages from a conversation.
 ======================================================================
+
+With reuse_kv_context enabled, send_message uses /api/generate and keeps
+the `context` it returns. The next turn sends only the new user message on
+top of that context, so the server skips re-evaluating the history. The
+cached context is dropped when messages are edited or cleared, when the
+model or system prompt changes and when it outgrows max_context_length;
+the next turn then seeds it again from the token-budgeted window.
+
+Titles and messages are kept in an inverted index (ConversationIndex) and
+totals per model in counters, both updated as conversations change, so
+searching and get_conversation_stats do not walk every message.
 """
 
 import json
 import time
 import uuid
-from typing import Dict, List, Optional, Any, Callable, Union, Generator
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Callable, Union, Generator
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from .ollama_client import OllamaClient
+from .context_window import ContextWindow, Summarizer
+from .conversation_index import ConversationIndex, SearchHit
 
 @dataclass
 class Message:
@@ -41,6 +62,7 @@ class Message:
     content: str
     timestamp: float
     metadata: Optional[Dict[str, Any]] = None
+    tokens: Optional[int] = None  # Estimated tokens, cached by the context window
 
 @dataclass
 class Conversation:
@@ -53,6 +75,14 @@ class Conversation:
     updated_at: float
     metadata: Optional[Dict[str, Any]] = None
 
+@dataclass
+class KVState:
+    """Model context cached after the last turn of a conversation."""
+    model: str
+    system_prompt: Optional[str]
+    context: List[int]
+    last_message_id: str  # Assistant message the context ends with
+
 class ConversationManager:
     """
     Manages conversations with Ollama models.
@@ -68,8 +98,23 @@ class ConversationManager:
         self.client = client or OllamaClient()
         self.conversations: Dict[str, Conversation] = {}
         self.current_conversation_id: Optional[str] = None
-        self.max_context_length = 4096  # Maximum context length
+        self.max_context_length = 4096  # Maximum context length in tokens
         self.max_messages = 100  # Maximum messages per conversation
+        # Optional function folding turns that leave the context into a summary,
+        # e.g. context_window.make_model_summarizer(client, model)
+        self.summarizer: Optional[Summarizer] = None
+        self._windows: Dict[str, ContextWindow] = {}
+        # Continue from the model context of the previous turn instead of
+        # sending the whole history again
+        self.reuse_kv_context = True
+        self.keep_alive = "30m"  # Keeps the model, and its cache, loaded between turns
+        self._kv_states: Dict[str, KVState] = {}
+        self._turn_stats: Dict[str, Deque[Dict[str, Any]]] = {}
+        # Full-text index and counters, kept up to date by the methods below
+        self.index = ConversationIndex()
+        self._message_count = 0
+        self._model_counts: Dict[str, int] = {}
+        self._recent: "OrderedDict[str, None]" = OrderedDict()  # Least recently updated first
         
     def create_conversation(self, title: str, model: str, 
                           metadata: Optional[Dict[str, Any]] = None) -> str:
@@ -99,9 +144,48 @@ class ConversationManager:
         
         self.conversations[conversation_id] = conversation
         self.current_conversation_id = conversation_id
+        self._track(conversation)
         
         return conversation_id
     
+    def _index_message(self, conversation: Conversation, message: Message) -> None:
+        """Add or update a message in the search index."""
+        self.index.add_document(message.id, conversation.id, message.content, conversation.model,
+                                message.timestamp, message_id=message.id)
+    
+    def _track(self, conversation: Conversation) -> None:
+        """Add a conversation to the search index and counters."""
+        self.index.add_title(conversation.id, conversation.title, conversation.model,
+                             conversation.created_at)
+        for message in conversation.messages:
+            self._index_message(conversation, message)
+        self._message_count += len(conversation.messages)
+        self._model_counts[conversation.model] = self._model_counts.get(conversation.model, 0) + 1
+        self._recent[conversation.id] = None
+        self._recent.move_to_end(conversation.id)
+    
+    def _untrack(self, conversation: Conversation) -> None:
+        """Remove a conversation from the search index and counters."""
+        self.index.remove_conversation(conversation.id)
+        self._message_count -= len(conversation.messages)
+        self._model_counts[conversation.model] -= 1
+        if not self._model_counts[conversation.model]:
+            del self._model_counts[conversation.model]
+        self._recent.pop(conversation.id, None)
+    
+    def rebuild_index(self) -> None:
+        """
+        Rebuild the search index and counters from the conversations.
+        
+        Call after changing conversations other than through this manager.
+        """
+        self.index.clear()
+        self._message_count = 0
+        self._model_counts.clear()
+        self._recent.clear()
+        for conversation in sorted(self.conversations.values(), key=lambda x: x.updated_at):
+            self._track(conversation)
+    
     def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """
         Get a conversation by ID.
@@ -154,9 +238,19 @@ class ConversationManager:
         
         conversation.messages.append(message)
         conversation.updated_at = current_time
+        self._index_message(conversation, message)
+        self._message_count += 1
+        self._recent.move_to_end(conversation_id)
+        
+        window = self._windows.get(conversation_id)
+        if window is not None:
+            window.append(message)
         
         # Trim messages if exceeding limit
         if len(conversation.messages) > self.max_messages:
+            for removed in conversation.messages[:-self.max_messages]:
+                self.index.remove_document(removed.id)
+                self._message_count -= 1
             conversation.messages = conversation.messages[-self.max_messages:]
         
         return message_id
@@ -188,36 +282,38 @@ class ConversationManager:
             print("Error: Message content cannot be empty")
             return None
         
+        previous_message_id = conversation.messages[-1].id if conversation.messages else None
+        
         # Add user message
         user_message_id = self.add_message(conversation_id, 'user', content)
         if not user_message_id:
             print("Error: Failed to add user message")
             return None
         
-        # Prepare messages for the model
-        messages = []
-        for msg in conversation.messages:
-            messages.append({
-                'role': msg.role,
-                'content': msg.content
-            })
-        
         # Get response from model
         try:
-            if stream:
-                response_content = ""
-                stream_response = self.client.chat(conversation.model, messages, options, stream=True)
-                if stream_response:
-                    for chunk in stream_response:
-                        if chunk:  # Check if chunk is not None
-                            response_content += chunk
-                            # You could implement real-time streaming here
+            if self.reuse_kv_context:
+                result = self._generate_with_kv(conversation, content, previous_message_id,
+                                                system_prompt, options)
             else:
-                response_content = self.client.chat(conversation.model, messages, options, stream=False)
+                result = self._chat(conversation, system_prompt, options, stream)
+            response_content = result["response"] if result else None
             
             if response_content:
                 # Add assistant message
-                assistant_message_id = self.add_message(conversation_id, 'assistant', response_content)
+                stats = {
+                    'ttft': result.get('ttft'),
+                    'total_time': result.get('total_time'),
+                    'prompt_tokens': result.get('prompt_eval_count'),
+                    'reused_context': result.get('reused_context', False),
+                }
+                assistant_message_id = self.add_message(conversation_id, 'assistant', response_content,
+                                                        metadata=dict(stats))
+                self._turn_stats.setdefault(conversation_id, deque(maxlen=100)).append(stats)
+                context = result.get('context')
+                if self.reuse_kv_context and context:
+                    self._kv_states[conversation_id] = KVState(conversation.model, system_prompt,
+                                                               context, assistant_message_id)
                 return assistant_message_id
             else:
                 print(f"Warning: Empty response from model {conversation.model}")
@@ -228,6 +324,70 @@ class ConversationManager:
             # Could add more specific error handling here
             return None
     
+    def _chat(self, conversation: Conversation, system_prompt: Optional[str],
+              options: Optional[Dict[str, Any]], stream: bool) -> Optional[Dict[str, Any]]:
+        """Send the token-budgeted history through /api/chat."""
+        messages = self.get_context_messages(conversation.id, system_prompt)
+        start_time = time.perf_counter()
+        ttft = None
+        if stream:
+            response_content = ""
+            stream_response = self.client.chat(conversation.model, messages, options, stream=True,
+                                               keep_alive=self.keep_alive)
+            if stream_response:
+                for chunk in stream_response:
+                    if chunk:  # Check if chunk is not None
+                        if ttft is None:
+                            ttft = time.perf_counter() - start_time
+                        response_content += chunk
+        else:
+            response_content = self.client.chat(conversation.model, messages, options, stream=False,
+                                                keep_alive=self.keep_alive)
+        return {'response': response_content, 'ttft': ttft,
+                'total_time': time.perf_counter() - start_time}
+    
+    def _generate_with_kv(self, conversation: Conversation, content: str,
+                          previous_message_id: Optional[str], system_prompt: Optional[str],
+                          options: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Send the new message on top of the cached context, seeding it if needed."""
+        state = self._kv_states.pop(conversation.id, None)
+        if (state is not None and state.model == conversation.model
+                and state.system_prompt == system_prompt
+                and state.last_message_id == previous_message_id
+                and len(state.context) <= self.max_context_length):
+            result = self.client.generate_with_context(
+                conversation.model, content, context=state.context,
+                options=options, keep_alive=self.keep_alive)
+            if result is not None:
+                result['reused_context'] = True
+            return result
+        
+        # No usable cache: render the token-budgeted history into one prompt
+        messages = self.get_context_messages(conversation.id, system_prompt)
+        system = "\n\n".join(m['content'] for m in messages if m['role'] == 'system') or None
+        turns = [m for m in messages if m['role'] != 'system']
+        if len(turns) > 1:
+            prompt = "\n\n".join(
+                f"{'User' if m['role'] == 'user' else 'Assistant'}: {m['content']}" for m in turns)
+        else:
+            prompt = content
+        return self.client.generate_with_context(conversation.model, prompt, system=system,
+                                                 options=options, keep_alive=self.keep_alive)
+    
+    def get_turn_stats(self, conversation_id: str) -> List[Dict[str, Any]]:
+        """
+        Get per-turn timings of a conversation.
+        
+        Args:
+            conversation_id: Conversation ID
+            
+        Returns:
+            List of dictionaries with 'ttft' and 'total_time' in seconds,
+            'prompt_tokens' evaluated by the server and 'reused_context',
+            oldest first (up to the last 100 turns)
+        """
+        return list(self._turn_stats.get(conversation_id, ()))
+    
     def get_conversation_messages(self, conversation_id: str) -> List[Message]:
         """
         Get all messages in a conversation.
@@ -248,7 +408,8 @@ class ConversationManager:
         
         Args:
             conversation_id: Conversation ID
-            max_length: Maximum context length
+            max_length: Maximum context length in characters. Only whole
+                        messages are included, most recent first
             
         Returns:
             Formatted context string
@@ -258,17 +419,92 @@ class ConversationManager:
             return ""
         
         context_parts = []
-        for message in messages:
+        length = 0
+        for message in reversed(messages):
             role_label = "User" if message.role == "user" else "Assistant"
-            context_parts.append(f"{role_label}: {message.content}")
+            part = f"{role_label}: {message.content}"
+            if max_length and context_parts and length + len(part) + 2 > max_length:
+                break
+            context_parts.append(part)
+            length += len(part) + 2
+        
+        return "\n\n".join(reversed(context_parts))
+    
+    def _window(self, conversation: Conversation) -> ContextWindow:
+        """Get the context window of a conversation, building it if needed."""
+        window = self._windows.get(conversation.id)
+        if (window is None or window.max_tokens != self.max_context_length
+                or window.summarizer is not self.summarizer):
+            window = ContextWindow.from_messages(conversation.messages, self.max_context_length,
+                                                 self.summarizer)
+            self._windows[conversation.id] = window
+        return window
+    
+    def get_context_messages(self, conversation_id: str,
+                             system_prompt: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Get the token-budgeted messages for a chat request.
+        
+        The most recent whole messages that fit max_context_length tokens
+        (together with the system prompt and, if a summarizer is set, the
+        summary of older turns) are returned, oldest first.
+        
+        Args:
+            conversation_id: Conversation ID
+            system_prompt: Optional system prompt, sent first
+            
+        Returns:
+            List of message dictionaries with 'role' and 'content'
+        """
+        conversation = self.get_conversation(conversation_id)
+        if not conversation:
+            return []
+        return self._window(conversation).build(system_prompt)
+    
+    def invalidate_context(self, conversation_id: str) -> None:
+        """
+        Rebuild the context window of a conversation on next use.
+        
+        Call after changing messages other than through add_message.
+        
+        Args:
+            conversation_id: Conversation ID
+        """
+        self._windows.pop(conversation_id, None)
+        self._kv_states.pop(conversation_id, None)
+        conversation = self.get_conversation(conversation_id)
+        if conversation:
+            for message in conversation.messages:
+                message.tokens = None
+    
+    def edit_message(self, conversation_id: str, message_id: str, content: str) -> bool:
+        """
+        Change the content of a message.
         
-        context = "\n\n".join(context_parts)
+        The context window and the cached model context are rebuilt on the
+        next turn.
         
-        if max_length and len(context) > max_length:
-            # Truncate from the beginning to keep recent messages
-            context = context[-max_length:]
+        Args:
+            conversation_id: Conversation ID
+            message_id: Message ID
+            content: New content
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        conversation = self.get_conversation(conversation_id)
+        if not conversation:
+            return False
         
-        return context
+        for message in conversation.messages:
+            if message.id == message_id:
+                message.content = content
+                conversation.updated_at = time.time()
+                self._index_message(conversation, message)
+                self._recent.move_to_end(conversation_id)
+                self.invalidate_context(conversation_id)
+                return True
+        return False
     
     def delete_conversation(self, conversation_id: str) -> bool:
         """
@@ -281,7 +517,10 @@ class ConversationManager:
             True if successful, False otherwise
         """
         if conversation_id in self.conversations:
-            del self.conversations[conversation_id]
+            self._untrack(self.conversations.pop(conversation_id))
+            self._windows.pop(conversation_id, None)
+            self._kv_states.pop(conversation_id, None)
+            self._turn_stats.pop(conversation_id, None)
             
             # Update current conversation if needed
             if self.current_conversation_id == conversation_id:
@@ -303,8 +542,13 @@ class ConversationManager:
         """
         conversation = self.get_conversation(conversation_id)
         if conversation:
+            self.index.remove_conversation(conversation_id, keep_title=True)
+            self._message_count -= len(conversation.messages)
             conversation.messages.clear()
             conversation.updated_at = time.time()
+            self._recent.move_to_end(conversation_id)
+            self._windows.pop(conversation_id, None)
+            self._kv_states.pop(conversation_id, None)
             return True
         return False
     
@@ -323,6 +567,8 @@ class ConversationManager:
         if conversation:
             conversation.title = title
             conversation.updated_at = time.time()
+            self.index.add_title(conversation_id, title, conversation.model, conversation.created_at)
+            self._recent.move_to_end(conversation_id)
             return True
         return False
     
@@ -424,7 +670,16 @@ class ConversationManager:
                 metadata=conversation_dict.get('metadata', {})
             )
             
+            previous = self.conversations.get(conversation.id)
+            if previous is not None:
+                self._untrack(previous)
             self.conversations[conversation.id] = conversation
+            self._track(conversation)
+            # Imported conversations keep their own update time
+            self._recent = OrderedDict(
+                (conv.id, None) for conv in sorted(self.conversations.values(), key=lambda x: x.updated_at))
+            self._windows.pop(conversation.id, None)
+            self._kv_states.pop(conversation.id, None)
             print(f"Imported conversation: {conversation.title}")
             
             return conversation.id
@@ -433,33 +688,57 @@ class ConversationManager:
             print(f"Error importing conversation: {e}")
             return None
     
-    def search_conversations(self, query: str) -> List[Conversation]:
+    def search_conversations(self, query: str, model: Optional[str] = None,
+                             since: Optional[float] = None, until: Optional[float] = None,
+                             limit: Optional[int] = None) -> List[Conversation]:
         """
         Search conversations by title and content.
         
+        Every word and "quoted phrase" of the query must appear in the title
+        or in one message. Matching ignores case and accents.
+        
         Args:
             query: Search query
+            model: Only conversations with this model (optional)
+            since: Only messages at or after this timestamp (optional)
+            until: Only messages at or before this timestamp (optional)
+            limit: Maximum number of conversations (optional)
             
         Returns:
-            List of matching conversations
+            List of matching conversations, best match first
         """
-        query_lower = query.lower()
         matching_conversations = []
-        
-        for conversation in self.conversations.values():
-            # Search in title
-            if query_lower in conversation.title.lower():
-                matching_conversations.append(conversation)
+        seen = set()
+        for hit in self.index.search(query, model=model, since=since, until=until):
+            if hit.conversation_id in seen:
                 continue
-            
-            # Search in messages
-            for message in conversation.messages:
-                if query_lower in message.content.lower():
-                    matching_conversations.append(conversation)
-                    break
+            seen.add(hit.conversation_id)
+            matching_conversations.append(self.conversations[hit.conversation_id])
+            if limit is not None and len(matching_conversations) >= limit:
+                break
         
         return matching_conversations
     
+    def search_messages(self, query: str, model: Optional[str] = None,
+                        since: Optional[float] = None, until: Optional[float] = None,
+                        limit: Optional[int] = 20) -> List[SearchHit]:
+        """
+        Find messages matching a full-text query.
+        
+        Args:
+            query: Words and "quoted phrases", all of which must match
+            model: Only conversations with this model (optional)
+            since: Only messages at or after this timestamp (optional)
+            until: Only messages at or before this timestamp (optional)
+            limit: Maximum number of hits (optional)
+            
+        Returns:
+            List of hits (conversation_id, message_id, score, timestamp), best first
+        """
+        hits = [hit for hit in self.index.search(query, model=model, since=since, until=until)
+                if hit.message_id is not None]
+        return hits[:limit] if limit is not None else hits
+    
     def get_conversation_stats(self) -> Dict[str, Any]:
         """
         Get statistics for all conversations.
@@ -468,27 +747,19 @@ class ConversationManager:
             Statistics dictionary
         """
         total_conversations = len(self.conversations)
-        total_messages = sum(len(conv.messages) for conv in self.conversations.values())
-        
-        # Group by model
-        model_counts = {}
-        for conversation in self.conversations.values():
-            model = conversation.model
-            model_counts[model] = model_counts.get(model, 0) + 1
+        total_messages = self._message_count
         
-        # Get recent conversations
-        recent_conversations = sorted(
-            self.conversations.values(),
-            key=lambda x: x.updated_at,
-            reverse=True
-        )[:5]
+        # Most recently updated first
+        recent_conversations = [self.conversations[conversation_id]
+                                 for conversation_id in islice(reversed(self._recent), 5)]
         
         return {
             'total_conversations': total_conversations,
             'total_messages': total_messages,
-            'model_distribution': model_counts,
+            'model_distribution': dict(self._model_counts),
             'recent_conversations': [conv.title for conv in recent_conversations],
-            'average_messages_per_conversation': total_messages / total_conversations if total_conversations > 0 else 0
+            'average_messages_per_conversation': total_messages / total_conversations if total_conversations > 0 else 0,
+            'index': self.index.get_stats()
         }
 
 if __name__ == "__main__":
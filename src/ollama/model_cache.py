@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Ollama - Model Cache
+===============================
+
+Shared, persistent cache of Ollama model metadata
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- requests
+======================================================================
+Functions:
+- get_model_cache: Get the process-wide model cache for a client's server.
+Classes:
+- ModelMetadataCache: TTL cache of /api/tags and /api/show with single-flight refresh.
+======================================================================
+
+The model list and per-model details are kept for `ttl` seconds. Callers
+that miss at the same time share one HTTP request instead of each sending
+their own. The last known state is saved to a JSON file, so after a restart
+the model list is available immediately; while it is older than the TTL it
+is served as is and a refresh runs in a background thread.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_TAGS_KEY = "tags"
+_SHOW_PREFIX = "show:"
+
+
+class ModelMetadataCache:
+    """
+    TTL cache of /api/tags and /api/show with single-flight refresh.
+
+    Empty model lists and failed lookups are not stored, because the client
+    reports errors that way and they must not replace good data.
+    """
+
+    def __init__(self, client: Any, ttl: float = 60.0,
+                 path: Optional[Union[str, Path]] = None, serve_stale: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            client: OllamaClient used for refreshes
+            ttl: Seconds before an entry is refreshed
+            path: JSON file keeping the last known state (optional)
+            serve_stale: Return expired data at once and refresh it in the
+                         background, instead of waiting for the server
+        """
+        self.client = client
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self.serve_stale = serve_stale
+
+        self._lock = threading.Lock()
+        # key -> (time stored, data); time.time() so it survives restarts
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, Future] = {}
+        # Bumped by invalidate() so fetches started before it are not stored
+        self._generation = 0
+        self._save_lock = threading.Lock()
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.requests = 0
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load the last known state of this server from disk."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f).get(str(self.client.base_url), {})
+            self._entries = {key: (float(stored), data) for key, (stored, data) in entries.items()}
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not load model cache {self.path}: {e}")
+
+    def _save(self) -> None:
+        """Write the current state to disk, keeping other servers' entries."""
+        if self.path is None:
+            return
+        with self._lock:
+            entries = {key: [stored, data] for key, (stored, data) in self._entries.items()}
+        try:
+            with self._save_lock:
+                state: Dict[str, Any] = {}
+                if self.path.exists():
+                    with open(self.path, 'r') as f:
+                        state = json.load(f)
+                state[str(self.client.base_url)] = entries
+                content = json.dumps(state)
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+                with open(temp_path, 'w') as f:
+                    f.write(content)
+                os.replace(temp_path, self.path)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not save model cache {self.path}: {e}")
+
+    def _single_flight(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Run fetch once for all concurrent callers of the same key and store the result."""
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            generation = self._generation
+        if not owner:
+            return future.result()
+
+        stored = False
+        try:
+            self.requests += 1
+            data = fetch()
+            with self._lock:
+                if data and generation == self._generation:
+                    self._entries[key] = (time.time(), data)
+                    stored = True
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            future.set_result(data)
+        except Exception as e:
+            with self._lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+            future.set_exception(e)
+            raise
+        if stored:
+            self._save()
+        return data
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Any]) -> None:
+        """Start a refresh unless one is already running."""
+        with self._lock:
+            if key in self._inflight:
+                return
+
+        def run():
+            try:
+                self._single_flight(key, fetch)
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+
+        threading.Thread(target=run, name=f"model-cache-{key}", daemon=True).start()
+
+    def _get(self, key: str, fetch: Callable[[], Any], force_refresh: bool) -> Any:
+        if not force_refresh:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is not None:
+                stored, data = entry
+                if time.time() - stored < self.ttl:
+                    self.hits += 1
+                    return data
+                if self.serve_stale:
+                    self.stale_hits += 1
+                    self._refresh_in_background(key, fetch)
+                    return data
+        self.misses += 1
+        return self._single_flight(key, fetch)
+
+    def get_models(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the model list (/api/tags).
+
+        Args:
+            force_refresh: Ask the server even if the cached list is fresh
+
+        Returns:
+            List of model information dictionaries
+        """
+        return self._get(_TAGS_KEY, self.client.list_models, force_refresh) or []
+
+    def get_model_info(self, model: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get the details of a model (/api/show).
+
+        Args:
+            model: Model name
+            force_refresh: Ask the server even if the cached details are fresh
+
+        Returns:
+            Model information dictionary or None if not found
+        """
+        return self._get(_SHOW_PREFIX + model, lambda: self.client.get_model_info(model), force_refresh)
+
+    def invalidate(self, model: Optional[str] = None) -> None:
+        """
+        Drop cached data so the next call asks the server.
+
+        Args:
+            model: Drop the list and this model's details; None drops everything
+        """
+        with self._lock:
+            self._generation += 1
+            if model is None:
+                self._entries.clear()
+                self._inflight.clear()
+            else:
+                for key in (_TAGS_KEY, _SHOW_PREFIX + model):
+                    self._entries.pop(key, None)
+                    # Later callers must not join a request sent before the change
+                    self._inflight.pop(key, None)
+        self._save()
+
+    @property
+    def last_update(self) -> float:
+        """Time the model list was last fetched, 0 if never."""
+        with self._lock:
+            entry = self._entries.get(_TAGS_KEY)
+        return entry[0] if entry else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Fresh hits, stale hits, misses, server requests
+            and cached entries
+        """
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "requests": self.requests,
+            "entries": len(self._entries),
+            "ttl": self.ttl,
+        }
+
+
+_caches: Dict[str, ModelMetadataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_model_cache(client: Any) -> ModelMetadataCache:
+    """
+    Get the process-wide model cache for a client's server.
+
+    Uses the llm "model_cache_ttl" and "model_cache_path" settings. All
+    callers for the same server URL share one cache.
+
+    Args:
+        client: OllamaClient; the first client for a URL performs the refreshes
+
+    Returns:
+        ModelMetadataCache for client.base_url
+    """
+    key = str(client.base_url).rstrip("/")
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            try:
+                from ..config import get_setting
+                ttl = float(get_setting("llm", "model_cache_ttl", 60.0))
+                path = get_setting("llm", "model_cache_path", None)
+            except Exception:
+                ttl, path = 60.0, None
+            cache = ModelMetadataCache(client, ttl=ttl, path=path)
+            _caches[key] = cache
+        return cache
@@ -23,17 +23,26 @@ Functions:
 - format_model_size: Format model size in human-readable format.
 - get_models_summary: Get summary of all models.
 - create_custom_model: Create a custom model with a specific system prompt.
+- batch_test_models: Test multiple models.
+- benchmark_models: Measure latency and throughput of models.
 ======================================================================
+
+Model lists and details come from the shared ModelMetadataCache, so
+managers, the UI and the web API reuse each other's requests, and a list
+persisted by a previous run is shown at once while it is refreshed.
 """
 
 import json
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
 
 from ..logging_config import get_logger
 from .ollama_client import OllamaClient
+from .benchmark import BenchmarkReport, run_benchmark
+from .model_cache import ModelMetadataCache, get_model_cache
 
 # Optional import with fallback
 try:
@@ -65,17 +74,32 @@ class OllamaModelManager:
     Manages Ollama models with advanced features.
     """
     
-    def __init__(self, client: Optional[OllamaClient] = None):
+    def __init__(self, client: Optional[OllamaClient] = None,
+                 cache: Optional[ModelMetadataCache] = None):
         """
         Initialize model manager.
         
         Args:
             client: Ollama client instance
+            cache: Model metadata cache (defaults to the shared cache for the client's server)
         """
         self.client = client or OllamaClient()
+        self.cache = cache or get_model_cache(self.client)
         self.models_cache = {}
-        self.last_update = 0
-        self.cache_duration = 60  # Cache for 60 seconds
+    
+    @property
+    def cache_duration(self) -> float:
+        """Seconds model metadata is cached (shared by all users of the cache)."""
+        return self.cache.ttl
+    
+    @cache_duration.setter
+    def cache_duration(self, seconds: float) -> None:
+        self.cache.ttl = seconds
+    
+    @property
+    def last_update(self) -> float:
+        """Time the model list was last fetched from the server."""
+        return self.cache.last_update
         
     def list_models(self, force_refresh: bool = False) -> List[ModelInfo]:
         """
@@ -87,13 +111,8 @@ class OllamaModelManager:
         Returns:
             List of model information objects
         """
-        current_time = time.time()
-        
-        if not force_refresh and current_time - self.last_update < self.cache_duration:
-            return list(self.models_cache.values())
-        
         try:
-            models_data = self.client.list_models()
+            models_data = self.cache.get_models(force_refresh)
             self.models_cache.clear()
             
             for model_data in models_data:
@@ -106,7 +125,6 @@ class OllamaModelManager:
                 )
                 self.models_cache[model_info.name] = model_info
             
-            self.last_update = current_time
             return list(self.models_cache.values())
             
         except Exception as e:
@@ -125,7 +143,7 @@ class OllamaModelManager:
             Model information or None if not found
         """
         try:
-            model_data = self.client.get_model_info(model_name)
+            model_data = self.cache.get_model_info(model_name)
             if model_data:
                 return ModelInfo(
                     name=model_name,
@@ -166,6 +184,7 @@ class OllamaModelManager:
                 logger.info("Successfully installed model: %s", model_name)
                 notifier.notify_info(f"Successfully installed model: {model_name}")
                 # Refresh cache
+                self.cache.invalidate(model_name)
                 self.list_models(force_refresh=True)
             else:
                 logger.error("Failed to install model: %s", model_name)
@@ -197,6 +216,7 @@ class OllamaModelManager:
                 logger.info("Successfully removed model: %s", model_name)
                 notifier.notify_info(f"Successfully removed model: {model_name}")
                 # Remove from cache
+                self.cache.invalidate(model_name)
                 if model_name in self.models_cache:
                     del self.models_cache[model_name]
             else:
@@ -233,7 +253,9 @@ class OllamaModelManager:
         Returns:
             Model size in bytes or None if not found
         """
-        model_info = self.get_model_info(model_name)
+        # The model list has sizes; /api/show does not
+        self.list_models()
+        model_info = self.models_cache.get(model_name) or self.get_model_info(model_name)
         return model_info.size if model_info else None
     
     def format_model_size(self, size_bytes: int) -> str:
@@ -321,6 +343,7 @@ class OllamaModelManager:
                 logger.info("Successfully created custom model: %s", name)
                 notifier.notify_info(f"Successfully created custom model: {name}")
                 # Refresh cache
+                self.cache.invalidate(name)
                 self.list_models(force_refresh=True)
             else:
                 logger.error("Failed to create custom model: %s", name)
@@ -375,24 +398,48 @@ class OllamaModelManager:
             }
     
     def batch_test_models(self, models: List[str], 
-                         test_prompt: str = "Hello, how are you?") -> Dict[str, Dict[str, Any]]:
+                         test_prompt: str = "Hello, how are you?",
+                         concurrency: int = 1) -> Dict[str, Dict[str, Any]]:
         """
         Test multiple models.
         
         Args:
             models: List of model names to test
             test_prompt: Test prompt to use
+            concurrency: Number of models tested at once
             
         Returns:
             Dictionary of test results for each model
         """
-        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {model_name: executor.submit(self.test_model, model_name, test_prompt)
+                       for model_name in models}
+            return {model_name: future.result() for model_name, future in futures.items()}
+    
+    def benchmark_models(self, models: List[str], prompts: Optional[List[str]] = None,
+                         concurrency: int = 1, repeats: int = 3, cold_start: bool = False,
+                         options: Optional[Dict[str, Any]] = None) -> BenchmarkReport:
+        """
+        Measure latency and throughput of models.
         
-        for model_name in models:
-            logger.info("Testing model: %s", model_name)
-            results[model_name] = self.test_model(model_name, test_prompt)
+        Each model receives every prompt `repeats` times, with `concurrency`
+        requests in flight; see benchmark.run_benchmark.
         
-        return results
+        Args:
+            models: List of model names to benchmark
+            prompts: Prompts to send (defaults to a greeting)
+            concurrency: Requests in flight at once for a model
+            repeats: Times each prompt is sent
+            cold_start: Unload each model first and measure a cold request
+            options: Generation options, e.g. {"num_predict": 64} (optional)
+            
+        Returns:
+            Report with TTFT, total time, prompt-eval time and tokens/s
+            samples and their p50/p95 per model
+        """
+        return run_benchmark(self.client, models, prompts or ["Hello, how are you?"],
+                             concurrency=concurrency, repeats=repeats,
+                             cold_start=cold_start, options=options)
     
     def cleanup_unused_models(self, keep_models: List[str]) -> List[str]:
         """
@@ -13,16 +13,20 @@ Requirements:
 - requests
 ======================================================================
 Functions:
+- create_session: Create a pooled keep-alive HTTP session.
+- get_shared_client: Get the process-wide client for an Ollama server.
 - __init__: Initialize Ollama client.
 - ping: Verify if the Ollama server is available.
 - get_server_info: Get server information.
 - list_models: List available models.
 - generate: Generate text using Ollama.
 - _generate_stream: Generate streaming response.
+- generate_with_context: Generate on top of a previous KV context, with timings.
 - chat: Chat with Ollama model.
 - _chat_stream: Chat with streaming response.
 - pull_model: Pull a model from Ollama.
 - delete_model: Delete a model.
+- unload_model: Unload a model from memory.
 ======================================================================
 """
 
@@ -32,27 +36,51 @@ import time
 import threading
 from typing import Optional, Dict, List, Callable, Any, Generator, Union
 import logging
+from requests.adapters import HTTPAdapter
+
+
+def create_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create a pooled keep-alive HTTP session.
+    
+    Connections to the server are kept open and reused by later requests,
+    up to pool_size connections at a time.
+    
+    Args:
+        pool_size: Maximum connections kept open per host
+        
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
+        'Content-Type': 'application/json',
+        'User-Agent': 'TalkBridge-Ollama-Client/1.0'
+    })
+    return session
+
 
 class OllamaClient:
     """
     Enhanced Ollama client with advanced features.
     """
     
-    def __init__(self, base_url: str = "http://localhost:11434", timeout: int = 30):
+    def __init__(self, base_url: str = "http://localhost:11434", timeout: int = 30,
+                 pool_size: int = 10):
         """
         Initialize Ollama client.
         
         Args:
             base_url: Ollama server URL
             timeout: Request timeout in seconds
+            pool_size: Maximum keep-alive connections to the server
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'User-Agent': 'TalkBridge-Ollama-Client/1.0'
-        })
+        self.session = create_session(pool_size)
         
         # Logging configuration is handled by src/desktop/logging_config.py
         # logging.basicConfig(level=logging.INFO)
@@ -175,9 +203,93 @@ class OllamaClient:
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Error in streaming generation: {e}")
     
+    def generate_with_context(self, model: str, prompt: str,
+                              context: Optional[List[int]] = None,
+                              system: Optional[str] = None,
+                              options: Optional[Dict[str, Any]] = None,
+                              keep_alive: Optional[str] = None,
+                              on_chunk: Optional[Callable[[str], None]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Generate on top of a previous KV context, with timings.
+        
+        Passing the `context` returned by the previous call makes Ollama
+        continue from that state, so only the new prompt is evaluated. The
+        response is streamed to measure the time to first token.
+        
+        Args:
+            model: Model name to use
+            prompt: New input only
+            context: Context returned by the previous call (optional)
+            system: System message (optional)
+            options: Generation options (optional)
+            keep_alive: How long the model stays loaded after the request (optional)
+            on_chunk: Called with each text chunk as it arrives (optional)
+            
+        Returns:
+            Dictionary with 'response', 'context', 'ttft' (seconds),
+            'total_time', 'load_time', 'prompt_eval_count',
+            'prompt_eval_time', 'eval_count' and 'eval_time', or None if error
+        """
+        url = f"{self.base_url}/api/generate"
+        payload: Dict[str, Any] = {
+            "model": model,
+            "prompt": prompt,
+            "stream": True
+        }
+        
+        if context:
+            payload["context"] = context
+        if system:
+            payload["system"] = system
+        if options:
+            payload["options"] = options
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        
+        start_time = time.perf_counter()
+        ttft = None
+        pieces = []
+        final: Dict[str, Any] = {}
+        try:
+            with self.session.post(url, json=payload, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line.decode('utf-8'))
+                    except json.JSONDecodeError:
+                        continue
+                    piece = data.get('response')
+                    if piece:
+                        if ttft is None:
+                            ttft = time.perf_counter() - start_time
+                        pieces.append(piece)
+                        if on_chunk:
+                            on_chunk(piece)
+                    if data.get('done', False):
+                        final = data
+                        break
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error generating response: {e}")
+            return None
+        
+        return {
+            "response": "".join(pieces),
+            "context": final.get("context"),
+            "ttft": ttft,
+            "total_time": time.perf_counter() - start_time,
+            "load_time": final.get("load_duration", 0) / 1e9,
+            "prompt_eval_count": final.get("prompt_eval_count"),
+            "prompt_eval_time": final.get("prompt_eval_duration", 0) / 1e9,
+            "eval_count": final.get("eval_count"),
+            "eval_time": final.get("eval_duration", 0) / 1e9,
+        }
+    
     def chat(self, model: str, messages: List[Dict[str, str]], 
              options: Optional[Dict[str, Any]] = None,
-             stream: bool = False) -> Union[str, Generator[str, None, None], None]:
+             stream: bool = False,
+             keep_alive: Optional[str] = None) -> Union[str, Generator[str, None, None], None]:
         """
         Chat with Ollama model.
         
@@ -186,6 +298,7 @@ class OllamaClient:
             messages: List of message dictionaries with 'role' and 'content'
             options: Generation options (optional)
             stream: Whether to stream the response
+            keep_alive: How long the model stays loaded after the request (optional)
             
         Returns:
             Generated response (str) if stream=False, Generator if stream=True, or None if error
@@ -200,6 +313,9 @@ class OllamaClient:
         if options:
             payload["options"] = options
         
+        if keep_alive is not None:
+            payload["keep_alive"] = keep_alive
+        
         try:
             if stream:
                 return self._chat_stream(url, payload)
@@ -295,6 +411,27 @@ class OllamaClient:
             self.logger.error(f"Error deleting model {model}: {e}")
             return False
     
+    def unload_model(self, model: str) -> bool:
+        """
+        Unload a model from memory.
+        
+        Args:
+            model: Model name to unload
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        url = f"{self.base_url}/api/generate"
+        payload = {"model": model, "keep_alive": 0}
+        
+        try:
+            response = self.session.post(url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"Error unloading model {model}: {e}")
+            return False
+    
     def get_model_info(self, model: str) -> Optional[Dict[str, Any]]:
         """
         Get model information.
@@ -372,6 +509,30 @@ class OllamaClient:
         
         return health_status
 
+_shared_clients: Dict[str, OllamaClient] = {}
+_shared_clients_lock = threading.Lock()
+
+def get_shared_client(base_url: str = "http://localhost:11434") -> OllamaClient:
+    """
+    Get the process-wide client for an Ollama server.
+    
+    Callers that share the client also share its connection pool, so
+    repeated requests reuse open connections instead of reconnecting.
+    
+    Args:
+        base_url: Ollama server URL
+        
+    Returns:
+        OllamaClient for base_url
+    """
+    key = base_url.rstrip("/")
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = OllamaClient(key)
+            _shared_clients[key] = client
+        return client
+
 if __name__ == "__main__":
     # Test the enhanced client
     client = OllamaClient()
@@ -23,15 +23,18 @@ Functions:
 - _calculate_similarity: Calculate similarity between response and expected response.
 - optimize_prompt: Optimize a prompt to get closer to target response.
 - batch_test_templates: Test multiple templates with test cases.
+- benchmark_templates: Measure latency and throughput of templates across models.
 ======================================================================
 """
 
 import json
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Callable, Union
 from dataclasses import dataclass, asdict
 from .ollama_client import OllamaClient
+from .benchmark import BenchmarkReport, run_benchmark
 
 @dataclass
 class PromptTemplate:
@@ -319,9 +322,20 @@ class PromptEngineer:
         
         return best_prompt
     
+    def _render_test_cases(self, template_name: str,
+                           test_cases: List[Dict[str, str]]) -> List[str]:
+        """Render a template with each test case, skipping those that fail."""
+        prompts = []
+        for test_case in test_cases:
+            prompt = self.render_template(template_name, test_case)
+            if prompt:
+                prompts.append(prompt)
+        return prompts
+    
     def batch_test_templates(self, template_names: List[str], 
                            test_cases: List[Dict[str, str]],
-                           model: Optional[str] = None) -> Dict[str, List[PromptResult]]:
+                           model: Optional[str] = None,
+                           concurrency: int = 1) -> Dict[str, List[PromptResult]]:
         """
         Test multiple templates with test cases.
         
@@ -329,6 +343,7 @@ class PromptEngineer:
             template_names: List of template names to test
             test_cases: List of test cases with variables
             model: Model to use (optional)
+            concurrency: Number of prompts tested at once
             
         Returns:
             Dictionary of results for each template
@@ -336,25 +351,49 @@ class PromptEngineer:
         results = {}
         model = model or self.default_model
         
-        for template_name in template_names:
-            template = self.get_template(template_name)
-            if not template:
-                continue
-            
-            template_results = []
-            
-            for test_case in test_cases:
-                # Render template
-                prompt = self.render_template(template_name, test_case)
-                if prompt:
-                    # Test the prompt
-                    result = self.test_prompt(prompt, model)
-                    template_results.append(result)
-            
-            results[template_name] = template_results
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            for template_name in template_names:
+                template = self.get_template(template_name)
+                if not template:
+                    continue
+                
+                futures = [executor.submit(self.test_prompt, prompt, model)
+                           for prompt in self._render_test_cases(template_name, test_cases)]
+                results[template_name] = [future.result() for future in futures]
         
         return results
     
+    def benchmark_templates(self, template_names: List[str],
+                            test_cases: List[Dict[str, str]],
+                            models: Optional[List[str]] = None,
+                            concurrency: int = 1, repeats: int = 3,
+                            cold_start: bool = False,
+                            options: Optional[Dict[str, Any]] = None) -> Dict[str, BenchmarkReport]:
+        """
+        Measure latency and throughput of templates across models.
+        
+        Args:
+            template_names: List of template names to benchmark
+            test_cases: List of test cases with variables
+            models: Models to compare (defaults to the default model)
+            concurrency: Requests in flight at once for a model
+            repeats: Times each rendered prompt is sent
+            cold_start: Unload each model first and measure a cold request
+            options: Generation options, e.g. {"num_predict": 64} (optional)
+            
+        Returns:
+            Benchmark report (TTFT, tokens/s, p50/p95 per model) for each template
+        """
+        reports = {}
+        for template_name in template_names:
+            prompts = self._render_test_cases(template_name, test_cases)
+            if not prompts:
+                continue
+            reports[template_name] = run_benchmark(
+                self.client, models or [self.default_model], prompts,
+                concurrency=concurrency, repeats=repeats, cold_start=cold_start, options=options)
+        return reports
+    
     def analyze_prompt_performance(self, template_name: str) -> Dict[str, Any]:
         """
         Analyze performance of a prompt template.
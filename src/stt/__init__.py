@@ -64,6 +64,7 @@ from .config import (
 
 # Import engine for advanced usage
 from .whisper_engine import WhisperEngine, get_whisper_engine
+from .streaming import StreamingTranscriber, StreamingUpdate
 
 # Import utilities for advanced usage
 from .audio_utils import (
@@ -73,7 +74,11 @@ from .audio_utils import (
     preprocess_audio,
     cleanup_temp_file,
     create_test_audio,
-    get_audio_info
+    get_audio_info,
+    pcm_to_float32,
+    resample_audio,
+    prepare_audio_array,
+    decode_audio_bytes
 )
 
 # Package metadata
@@ -136,6 +141,8 @@ __all__ = [
     # Advanced usage
     "WhisperEngine",
     "get_whisper_engine",
+    "StreamingTranscriber",
+    "StreamingUpdate",
     
     # Utilities
     "validate_audio_bytes",
@@ -144,5 +151,9 @@ __all__ = [
     "preprocess_audio",
     "cleanup_temp_file",
     "create_test_audio",
-    "get_audio_info"
+    "get_audio_info",
+    "pcm_to_float32",
+    "resample_audio",
+    "prepare_audio_array",
+    "decode_audio_bytes"
 ] 
\ No newline at end of file
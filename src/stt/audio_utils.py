@@ -23,13 +23,19 @@ Functions:
 - cleanup_temp_file: Clean up temporary audio file.
 - create_test_audio: Create test audio data for testing purposes.
 - get_audio_info: Get detailed information about audio file.
+- pcm_to_float32: Convert raw PCM bytes to a float32 array without temp files.
+- resample_audio: Resample a float32 array to the target sample rate.
+- prepare_audio_array: Convert an array to 16 kHz mono float32 for Whisper.
+- decode_audio_bytes: Decode encoded audio bytes (WAV/FLAC/OGG) in memory.
 ======================================================================
 """
 
+import io
 import os
 import tempfile
 import wave
 import numpy as np
+from math import gcd
 from pathlib import Path
 from typing import Optional, Tuple, Union
 import logging
@@ -345,4 +351,131 @@ def get_audio_info(file_path: str) -> dict:
     except Exception as e:
         logger.warning(f"Could not read audio info: {e}")
     
-    return info 
\ No newline at end of file
+    return info
+
+def pcm_to_float32(pcm_data: Union[bytes, bytearray, memoryview],
+                   channels: int = 1, sample_width: int = 2) -> np.ndarray:
+    """
+    Convert raw little-endian PCM bytes to a float32 array in [-1, 1].
+    
+    The bytes are viewed with np.frombuffer, so the only allocation is the
+    float32 result itself.
+    
+    Args:
+        pcm_data: Raw PCM audio bytes (or a memoryview over them)
+        channels: Number of interleaved channels
+        sample_width: Bytes per sample (1, 2 or 4)
+        
+    Returns:
+        Float32 array of shape (frames,) for mono or (frames, channels)
+    """
+    dtypes = {1: np.uint8, 2: np.dtype('<i2'), 4: np.dtype('<i4')}
+    if sample_width not in dtypes:
+        raise ValueError(f"Unsupported PCM sample width: {sample_width}")
+    
+    dtype = np.dtype(dtypes[sample_width])
+    frame_bytes = dtype.itemsize * max(1, channels)
+    nbytes = memoryview(pcm_data).nbytes
+    samples = np.frombuffer(pcm_data, dtype=dtype, count=(nbytes // frame_bytes) * max(1, channels))
+    
+    if sample_width == 1:
+        audio = (samples.astype(np.float32) - 128.0) * np.float32(1.0 / 128.0)
+    else:
+        audio = samples.astype(np.float32)
+        audio *= np.float32(1.0 / (np.iinfo(dtype).max + 1.0))
+    
+    if channels > 1:
+        audio = audio.reshape(-1, channels)
+    return audio
+
+def resample_audio(audio: np.ndarray, orig_sr: int,
+                   target_sr: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Resample audio to the target sample rate.
+    
+    Uses polyphase filtering (scipy.signal.resample_poly) when SciPy is
+    available and falls back to linear interpolation in NumPy otherwise.
+    
+    Args:
+        audio: 1-D float32 audio array
+        orig_sr: Original sample rate in Hz
+        target_sr: Target sample rate in Hz
+        
+    Returns:
+        Resampled float32 array
+    """
+    if orig_sr == target_sr or audio.size == 0:
+        return audio
+    
+    try:
+        from scipy.signal import resample_poly
+        divisor = gcd(int(orig_sr), int(target_sr))
+        resampled = resample_poly(audio, int(target_sr) // divisor, int(orig_sr) // divisor)
+    except ImportError:
+        target_length = int(round(audio.size * target_sr / orig_sr))
+        positions = np.arange(target_length, dtype=np.float64) * (orig_sr / target_sr)
+        resampled = np.interp(positions, np.arange(audio.size), audio)
+    
+    return resampled.astype(np.float32, copy=False)
+
+def prepare_audio_array(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """
+    Convert an audio array to the format Whisper expects in memory.
+    
+    Args:
+        audio: Audio array, shape (frames,) or (frames, channels)
+        sample_rate: Sample rate of the audio
+        
+    Returns:
+        Contiguous 16 kHz mono float32 array
+    """
+    if not isinstance(audio, np.ndarray):
+        raise ValueError("Audio data must be a numpy array")
+    
+    if np.issubdtype(audio.dtype, np.integer):
+        audio = audio.astype(np.float32) / np.float32(np.iinfo(audio.dtype).max + 1.0)
+    elif audio.dtype != np.float32:
+        audio = audio.astype(np.float32)
+    
+    # Down-mix to mono
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1, dtype=np.float32)
+    
+    # Normalize if needed (sounddevice typically returns data in range [-1, 1])
+    peak = float(np.max(np.abs(audio))) if audio.size else 0.0
+    if peak > 1.0:
+        audio = audio / np.float32(peak)
+    
+    audio = resample_audio(audio, sample_rate, SAMPLE_RATE)
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+def decode_audio_bytes(audio_bytes: Union[bytes, bytearray, memoryview]) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Decode an encoded audio file held in memory.
+    
+    Args:
+        audio_bytes: Encoded audio (WAV, FLAC, OGG, ...)
+        
+    Returns:
+        Tuple of (float32 array, sample_rate), or None if the format
+        cannot be decoded in memory
+    """
+    try:
+        import soundfile as sf
+        audio, sample_rate = sf.read(io.BytesIO(audio_bytes), dtype='float32')
+        return audio, int(sample_rate)
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.debug(f"soundfile could not decode audio bytes in memory: {e}")
+    
+    # Plain WAV fallback without soundfile
+    try:
+        with wave.open(io.BytesIO(audio_bytes), 'rb') as wav_file:
+            frames = wav_file.readframes(wav_file.getnframes())
+            audio = pcm_to_float32(frames, wav_file.getnchannels(), wav_file.getsampwidth())
+            return audio, wav_file.getframerate()
+    except Exception as e:
+        logger.debug(f"Could not decode audio bytes in memory: {e}")
+        return None
+
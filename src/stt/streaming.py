@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+TalkBridge STT - Streaming
+==========================
+
+Incremental transcription with partial hypotheses
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- openai-whisper
+- numpy
+======================================================================
+Classes:
+- TimedWord: A transcribed word with absolute timestamps.
+- StreamingUpdate: Committed and unstable text after one decode step.
+- StreamingTranscriber: Sliding-window transcriber using a local-agreement
+  commit policy.
+======================================================================
+
+The transcriber keeps an audio window that starts at the end of the last
+committed word. Every ``step_seconds`` of new audio the window is decoded
+again; the words on which two consecutive hypotheses agree (longest common
+prefix) are committed and the window is trimmed to the end of the last
+committed word, so only the unstable tail is re-decoded on the next step.
+"""
+
+import re
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from .config import SAMPLE_RATE
+from .audio_utils import pcm_to_float32, resample_audio
+
+logger = logging.getLogger(__name__)
+
+_NORMALIZE_PATTERN = re.compile(r"[^\w']+", re.UNICODE)
+
+
+@dataclass
+class TimedWord:
+    """A transcribed word with absolute start/end times in seconds."""
+    text: str
+    start: Optional[float] = None
+    end: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        """Normalized form used to compare hypotheses."""
+        return _NORMALIZE_PATTERN.sub("", self.text.lower())
+
+
+@dataclass
+class StreamingUpdate:
+    """Result of one streaming decode step."""
+    committed_text: str
+    new_committed_text: str
+    unstable_text: str
+    language: str
+    is_final: bool = False
+    processing_time: float = 0.0
+
+    @property
+    def text(self) -> str:
+        """Committed text followed by the current unstable tail."""
+        return " ".join(part for part in (self.committed_text, self.unstable_text) if part)
+
+
+def _join_words(words: List[TimedWord]) -> str:
+    return " ".join(word.text for word in words)
+
+
+class StreamingTranscriber:
+    """
+    Incremental transcriber for one audio source.
+
+    The engine must provide ``transcribe_array_with_metadata(audio,
+    sample_rate, language, initial_prompt, word_timestamps)`` returning a
+    Whisper-style result dictionary (see WhisperEngine).
+    """
+
+    def __init__(self, engine: Any, language: Optional[str] = None,
+                 step_seconds: float = 1.0, min_window_seconds: float = 1.0,
+                 max_window_seconds: float = 15.0, overlap_seconds: float = 2.0,
+                 prompt_chars: int = 200):
+        """
+        Initialize the streaming transcriber.
+
+        Args:
+            engine: WhisperEngine (or compatible) instance
+            language: Language code (optional, auto-detected if None)
+            step_seconds: New audio required before decoding again
+            min_window_seconds: Minimum window length worth decoding
+            max_window_seconds: Window length that forces a commit and trim
+            overlap_seconds: Audio kept as context when the window is force-trimmed
+            prompt_chars: Characters of committed text passed as decoder prompt
+        """
+        self.engine = engine
+        self.language = language
+        self.step_samples = int(step_seconds * SAMPLE_RATE)
+        self.min_window_samples = int(min_window_seconds * SAMPLE_RATE)
+        self.max_window_samples = int(max_window_seconds * SAMPLE_RATE)
+        self.overlap_samples = int(overlap_seconds * SAMPLE_RATE)
+        self.prompt_chars = prompt_chars
+
+        # Window buffer is preallocated with room for one extra step
+        self._audio = np.zeros(self.max_window_samples + self.step_samples * 2, dtype=np.float32)
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all audio and hypotheses."""
+        self._length = 0
+        self._pending = 0
+        self._offset = 0.0  # absolute time (s) of the window start
+        self._committed: List[TimedWord] = []
+        self._hypothesis: List[TimedWord] = []
+        self._detected_language = self.language
+
+    @property
+    def committed_text(self) -> str:
+        """All text committed so far."""
+        return _join_words(self._committed)
+
+    @property
+    def window_seconds(self) -> float:
+        """Length of the audio window that will be decoded next."""
+        return self._length / SAMPLE_RATE
+
+    def push_pcm(self, pcm_data: Union[bytes, memoryview], sample_rate: int,
+                 channels: int = 1) -> Optional[StreamingUpdate]:
+        """Append 16-bit PCM audio; see push()."""
+        audio = pcm_to_float32(pcm_data, channels)
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1, dtype=np.float32)
+        return self.push(audio, sample_rate)
+
+    def push(self, audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> Optional[StreamingUpdate]:
+        """
+        Append mono float32 audio and decode if enough new audio arrived.
+
+        Args:
+            audio: Mono float32 samples
+            sample_rate: Sample rate of the samples
+
+        Returns:
+            StreamingUpdate if a decode step ran, None otherwise
+        """
+        audio = resample_audio(np.asarray(audio, dtype=np.float32), sample_rate, SAMPLE_RATE)
+        self._append(audio)
+
+        if self._pending < self.step_samples or self._length < self.min_window_samples:
+            return None
+        return self._decode_step(final=False)
+
+    def finish(self) -> StreamingUpdate:
+        """Decode the remaining window, commit everything and reset."""
+        update: Optional[StreamingUpdate] = None
+        if self._length >= int(0.1 * SAMPLE_RATE):
+            update = self._decode_step(final=True)
+        else:
+            new_words = self._hypothesis
+            self._committed.extend(new_words)
+            update = StreamingUpdate(
+                committed_text=self.committed_text,
+                new_committed_text=_join_words(new_words),
+                unstable_text="",
+                language=self._detected_language or "en",
+                is_final=True
+            )
+        self.reset()
+        return update
+
+    def _append(self, audio: np.ndarray) -> None:
+        """Copy samples into the window buffer, trimming if it would overflow."""
+        if audio.size > self._audio.size:
+            audio = audio[-self._audio.size:]
+        overflow = self._length + audio.size - self._audio.size
+        if overflow > 0:
+            self._trim(overflow)
+        self._audio[self._length:self._length + audio.size] = audio
+        self._length += audio.size
+        self._pending += audio.size
+
+    def _trim(self, samples: int) -> None:
+        """Drop samples from the start of the window."""
+        samples = min(max(0, samples), self._length)
+        if samples == 0:
+            return
+        remaining = self._length - samples
+        self._audio[:remaining] = self._audio[samples:self._length]
+        self._length = remaining
+        self._offset += samples / SAMPLE_RATE
+
+    def _decode(self) -> List[TimedWord]:
+        """Decode the current window into words with absolute timestamps."""
+        prompt = self.committed_text[-self.prompt_chars:] or None
+        result = self.engine.transcribe_array_with_metadata(
+            self._audio[:self._length], SAMPLE_RATE,
+            language=self.language, initial_prompt=prompt, word_timestamps=True
+        )
+        if result.get("language"):
+            self._detected_language = result["language"]
+        return self._extract_words(result)
+
+    def _extract_words(self, result: Dict[str, Any]) -> List[TimedWord]:
+        """Get timed words from word timestamps, segments or plain text."""
+        words: List[TimedWord] = []
+        for segment in result.get("segments") or []:
+            if segment.get("words"):
+                for word in segment["words"]:
+                    text = str(word.get("word", "")).strip()
+                    if text:
+                        words.append(TimedWord(text, self._offset + word["start"],
+                                               self._offset + word["end"]))
+                continue
+
+            # Spread the segment's words evenly over its time span
+            seg_words = str(segment.get("text", "")).split()
+            if not seg_words:
+                continue
+            start, end = segment.get("start"), segment.get("end")
+            if start is None or end is None:
+                words.extend(TimedWord(text) for text in seg_words)
+                continue
+            step = (end - start) / len(seg_words)
+            for i, text in enumerate(seg_words):
+                words.append(TimedWord(text, self._offset + start + i * step,
+                                       self._offset + start + (i + 1) * step))
+
+        if not words:
+            words = [TimedWord(text) for text in str(result.get("text", "")).split()]
+
+        return self._drop_repeated_prefix(words)
+
+    def _drop_repeated_prefix(self, words: List[TimedWord]) -> List[TimedWord]:
+        """Remove leading words that repeat the tail of the committed text."""
+        if not self._committed or not words:
+            return words
+        for n in range(min(5, len(self._committed), len(words)), 0, -1):
+            tail = [w.key for w in self._committed[-n:]]
+            head = [w.key for w in words[:n]]
+            if tail == head:
+                return words[n:]
+        return words
+
+    def _decode_step(self, final: bool) -> StreamingUpdate:
+        """Decode, apply the local-agreement policy and trim the window."""
+        start_time = time.time()
+        words = self._decode()
+        self._pending = 0
+
+        if final:
+            agreed = len(words)
+        else:
+            agreed = 0
+            for previous, current in zip(self._hypothesis, words):
+                if previous.key != current.key:
+                    break
+                agreed += 1
+
+        new_words = words[:agreed]
+        tail = words[agreed:]
+
+        # Force progress when the window grows past its limit
+        if not final and self._length > self.max_window_samples:
+            limit = self._offset + (self._length - self.overlap_samples) / SAMPLE_RATE
+            forced = 0
+            for word in tail:
+                if word.end is None or word.end > limit:
+                    break
+                forced += 1
+            if forced == 0 and tail and tail[0].end is None:
+                forced = len(tail)
+            new_words += tail[:forced]
+            tail = tail[forced:]
+
+        self._committed.extend(new_words)
+        self._hypothesis = tail
+
+        # Re-decode only the unstable tail next time
+        if not final:
+            last_end = next((w.end for w in reversed(new_words) if w.end is not None), None)
+            if last_end is not None:
+                self._trim(int(round((last_end - self._offset) * SAMPLE_RATE)))
+            if self._length > self.max_window_samples:
+                self._trim(self._length - self.overlap_samples)
+
+        update = StreamingUpdate(
+            committed_text=self.committed_text,
+            new_committed_text=_join_words(new_words),
+            unstable_text=_join_words(tail),
+            language=self._detected_language or "en",
+            is_final=final,
+            processing_time=time.time() - start_time
+        )
+        logger.debug(f"Streaming STT step: +{len(new_words)} committed, "
+                     f"{len(tail)} unstable, window {self.window_seconds:.1f}s")
+        return update
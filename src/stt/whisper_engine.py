@@ -22,24 +22,28 @@ Functions:
 - _detect_device: Detect and validate the best available device.
 - load_model: Load Whisper model.
 - transcribe_audio_bytes: Transcribe audio bytes to text.
+- transcribe_pcm: Transcribe raw PCM bytes in memory.
+- transcribe_array: Transcribe a numpy array in memory.
+- transcribe_array_with_metadata: Transcribe a numpy array with segments/words.
 - transcribe_file: Transcribe audio file to text.
 ======================================================================
 """
 
 import os
 import logging
-import tempfile
 from typing import Optional, Dict, Any, Union, List
 from pathlib import Path
 
 from .config import (
     MODEL_NAME, DEFAULT_LANGUAGE, SUPPORTED_LANGUAGES,
     DEVICE, AUTO_DEVICE, CACHE_DIR, LOG_TRANSCRIPTION,
-    CONFIDENCE_THRESHOLD, WORD_TIMESTAMPS, LANGUAGE_DETECTION
+    CONFIDENCE_THRESHOLD, WORD_TIMESTAMPS, LANGUAGE_DETECTION,
+    SAMPLE_RATE
 )
 from .audio_utils import (
     validate_audio_bytes, save_audio_bytes_to_temp,
-    validate_audio_file, preprocess_audio, cleanup_temp_file
+    validate_audio_file, preprocess_audio, cleanup_temp_file,
+    pcm_to_float32, prepare_audio_array, decode_audio_bytes
 )
 
 # Set up logging
@@ -178,19 +182,25 @@ class WhisperEngine:
             logger.error(f"Failed to load Whisper model: {e}")
             return False
     
-    def transcribe(self, audio_path: str, language: Optional[str] = None) -> str:
+    def transcribe(self, audio_path: Union[str, Any], language: Optional[str] = None,
+                   sample_rate: int = SAMPLE_RATE) -> str:
         """
         Transcribe audio file to text.
         
-        This is a convenience method that delegates to transcribe_file.
+        This is a convenience method that delegates to transcribe_file, or to
+        transcribe_array when given a numpy array.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or a numpy audio array
             language: Language code (optional, auto-detected if None)
+            sample_rate: Sample rate of array input (ignored for files)
             
         Returns:
             Transcribed text as string
         """
+        if hasattr(audio_path, 'dtype') and hasattr(audio_path, 'shape'):
+            return self.transcribe_array(audio_path, sample_rate, language)
+        
         if not audio_path or not isinstance(audio_path, str):
             raise ValueError("Invalid audio path provided")
         
@@ -200,18 +210,26 @@ class WhisperEngine:
         return self.transcribe_file(audio_path, language)
     
     def transcribe_audio_bytes(self, audio_bytes: bytes, 
-                              language: Optional[str] = None) -> str:
+                              language: Optional[str] = None,
+                              sample_rate: Optional[int] = None,
+                              channels: int = 1) -> str:
         """
         Transcribe audio bytes to text.
         
+        Encoded audio (WAV, FLAC, OGG) is decoded in memory. Raw 16-bit PCM
+        is accepted when ``sample_rate`` is given. Only formats that cannot be
+        decoded in memory (e.g. MP3) fall back to a temporary file.
+        
         Args:
             audio_bytes: Raw audio data as bytes
             language: Language code (optional, auto-detected if None)
+            sample_rate: Sample rate of raw PCM input (None for encoded audio)
+            channels: Channel count of raw PCM input
             
         Returns:
             Transcribed text as string
         """
-        if not isinstance(audio_bytes, bytes):
+        if not isinstance(audio_bytes, (bytes, bytearray, memoryview)):
             raise TypeError("audio_bytes must be of type bytes")
         
         if not self.is_loaded:
@@ -221,10 +239,18 @@ class WhisperEngine:
         if not validate_audio_bytes(audio_bytes):
             raise ValueError("Invalid audio bytes provided")
         
+        if sample_rate is not None:
+            return self.transcribe_pcm(audio_bytes, sample_rate, channels, language)
+        
+        decoded = decode_audio_bytes(audio_bytes)
+        if decoded is not None:
+            audio_array, decoded_rate = decoded
+            return self.transcribe_array(audio_array, decoded_rate, language)
+        
         # Save audio bytes to temporary file
         temp_file = None
         try:
-            temp_file = save_audio_bytes_to_temp(audio_bytes)
+            temp_file = save_audio_bytes_to_temp(bytes(audio_bytes))
             
             # Transcribe the file
             result = self.transcribe_file(temp_file, language)
@@ -236,13 +262,33 @@ class WhisperEngine:
             if temp_file and os.path.exists(temp_file):
                 cleanup_temp_file(temp_file)
     
-    def transcribe_numpy(self, audio_data, sample_rate: int, 
-                        language: Optional[str] = None) -> str:
+    def transcribe_pcm(self, pcm_data: Union[bytes, bytearray, memoryview],
+                       sample_rate: int, channels: int = 1,
+                       language: Optional[str] = None) -> str:
         """
-        Transcribe numpy audio array to text.
+        Transcribe raw 16-bit PCM audio without touching the disk.
         
         Args:
-            audio_data: Audio data as numpy array
+            pcm_data: Little-endian 16-bit PCM bytes (or a memoryview over them)
+            sample_rate: Sample rate of the audio
+            channels: Number of interleaved channels
+            language: Language code (optional, auto-detected if None)
+            
+        Returns:
+            Transcribed text as string
+        """
+        return self.transcribe_array(pcm_to_float32(pcm_data, channels), sample_rate, language)
+    
+    def transcribe_array(self, audio_data, sample_rate: int = SAMPLE_RATE,
+                         language: Optional[str] = None) -> str:
+        """
+        Transcribe a numpy audio array without touching the disk.
+        
+        The array is down-mixed, resampled to 16 kHz float32 in NumPy and
+        passed straight to the model.
+        
+        Args:
+            audio_data: Audio data as numpy array, shape (frames,) or (frames, channels)
             sample_rate: Sample rate of the audio
             language: Language code (optional, auto-detected if None)
             
@@ -253,6 +299,73 @@ class WhisperEngine:
             if not self.load_model():
                 raise RuntimeError("Failed to load Whisper model")
         
+        if audio_data is None or len(audio_data) == 0:
+            raise ValueError("Audio data is empty")
+        
+        audio = prepare_audio_array(audio_data, sample_rate)
+        logger.info(f"Transcribing {audio.size / SAMPLE_RATE:.2f}s of in-memory audio")
+        return self._run_transcription(audio, language)
+    
+    def transcribe_array_with_metadata(self, audio_data, sample_rate: int = SAMPLE_RATE,
+                                       language: Optional[str] = None,
+                                       initial_prompt: Optional[str] = None,
+                                       word_timestamps: bool = WORD_TIMESTAMPS) -> Dict[str, Any]:
+        """
+        Transcribe a numpy audio array in memory with detailed metadata.
+        
+        Used by the streaming transcriber, which needs segment and word
+        timestamps to commit stable words and trim its window.
+        
+        Args:
+            audio_data: Audio data as numpy array
+            sample_rate: Sample rate of the audio
+            language: Language code (optional, auto-detected if None)
+            initial_prompt: Previously committed text used as decoder context
+            word_timestamps: Whether to request word-level timestamps
+            
+        Returns:
+            Dictionary with transcription result and metadata
+        """
+        if not self.is_loaded:
+            if not self.load_model():
+                raise RuntimeError("Failed to load Whisper model")
+        
+        if audio_data is None or len(audio_data) == 0:
+            raise ValueError("Audio data is empty")
+        
+        if self.model is None:
+            raise RuntimeError("Whisper model is not loaded")
+        
+        options = {
+            "language": language if language else None,
+            "task": "transcribe",
+            "fp16": False,
+            "verbose": False,
+            "word_timestamps": word_timestamps,
+            "initial_prompt": initial_prompt,
+            "condition_on_previous_text": False
+        }
+        options = {k: v for k, v in options.items() if v is not None}
+        
+        result = self.model.transcribe(prepare_audio_array(audio_data, sample_rate), **options)
+        result["model_name"] = self.model_name
+        result["device"] = self.device
+        result["language_detected"] = result.get("language", language or "unknown")
+        return result
+    
+    def transcribe_numpy(self, audio_data, sample_rate: int, 
+                        language: Optional[str] = None) -> str:
+        """
+        Transcribe numpy audio array to text.
+        
+        Args:
+            audio_data: Audio data as numpy array
+            sample_rate: Sample rate of the audio
+            language: Language code (optional, auto-detected if None)
+            
+        Returns:
+            Transcribed text as string
+        """
         try:
             import numpy as np
         except ImportError:
@@ -265,41 +378,52 @@ class WhisperEngine:
         if not isinstance(audio_data, np.ndarray):
             raise ValueError("Audio data must be a numpy array")
         
-        # Convert numpy array to bytes for processing
-        temp_file = None
         try:
-            # Create temporary WAV file from numpy array
-            import soundfile as sf
-            
-            # Create temporary file
-            temp_fd, temp_file = tempfile.mkstemp(suffix='.wav', prefix='whisper_')
-            os.close(temp_fd)  # Close file descriptor, soundfile will handle the file
-            
-            # Ensure audio_data is float32 and in correct range
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
-            
-            # Normalize if needed (sounddevice typically returns data in range [-1, 1])
-            if np.max(np.abs(audio_data)) > 1.0:
-                audio_data = audio_data / np.max(np.abs(audio_data))
-            
-            # Save as WAV file
-            sf.write(temp_file, audio_data, sample_rate)
-            
-            # Transcribe the file
-            result = self.transcribe_file(temp_file, language)
-            
-            return result
-            
-        except ImportError:
-            raise RuntimeError("soundfile library is required for numpy audio processing")
+            return self.transcribe_array(audio_data, sample_rate, language)
         except Exception as e:
             logger.error(f"Failed to process numpy audio data: {e}")
             raise RuntimeError(f"Failed to process audio data: {e}")
-        finally:
-            # Clean up temporary file
-            if temp_file and os.path.exists(temp_file):
-                cleanup_temp_file(temp_file)
+
+    def _run_transcription(self, audio_input: Any, language: Optional[str] = None) -> str:
+        """
+        Run the loaded model on a file path or 16 kHz float32 array.
+        
+        Args:
+            audio_input: Audio file path or prepared numpy array
+            language: Language code (optional, auto-detected if None)
+            
+        Returns:
+            Transcribed text as string
+        """
+        # Prepare transcription options
+        options = {
+            "language": language if language else None,
+            "task": "transcribe",
+            "fp16": False,  # Use float32 for better compatibility
+            "verbose": False
+        }
+        
+        # Remove None values
+        options = {k: v for k, v in options.items() if v is not None}
+        
+        # Perform transcription
+        if self.model is None:
+            raise RuntimeError("Whisper model is not loaded")
+        
+        result = self.model.transcribe(audio_input, **options)
+        
+        # Extract text from result - handle both string and list cases
+        text_result = result.get("text", "")
+        if isinstance(text_result, list):
+            transcribed_text = " ".join(str(item) for item in text_result).strip()
+        else:
+            transcribed_text = str(text_result).strip()
+        
+        # Log transcription result
+        if LOG_TRANSCRIPTION:
+            logger.info(f"Transcription result: {transcribed_text[:100]}...")
+        
+        return transcribed_text
 
     def transcribe_file(self, file_path: str, 
                        language: Optional[str] = None) -> str:
@@ -326,37 +450,8 @@ class WhisperEngine:
             is_temp_file = processed_file != file_path
             
             try:
-                # Prepare transcription options
-                options = {
-                    "language": language if language else None,
-                    "task": "transcribe",
-                    "fp16": False,  # Use float32 for better compatibility
-                    "verbose": False
-                }
-                
-                # Remove None values
-                options = {k: v for k, v in options.items() if v is not None}
-                
                 logger.info(f"Transcribing file: {file_path}")
-                
-                # Perform transcription
-                if self.model is None:
-                    raise RuntimeError("Whisper model is not loaded")
-                
-                result = self.model.transcribe(processed_file, **options)
-                
-                # Extract text from result - handle both string and list cases
-                text_result = result.get("text", "")
-                if isinstance(text_result, list):
-                    transcribed_text = " ".join(str(item) for item in text_result).strip()
-                else:
-                    transcribed_text = str(text_result).strip()
-                
-                # Log transcription result
-                if LOG_TRANSCRIPTION:
-                    logger.info(f"Transcription result: {transcribed_text[:100]}...")
-                
-                return transcribed_text
+                return self._run_transcription(processed_file, language)
                 
             finally:
                 # Clean up temporary processed file if created
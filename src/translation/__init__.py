@@ -20,7 +20,13 @@ Functions:
 
 from typing import Optional, Any
 from .translator import Translator
-from .offline_translator import OfflineTranslator, translate_to_spanish, TranslationError
+from .offline_translator import (
+    OfflineTranslator, translate_to_spanish, TranslationError,
+    get_offline_translator, get_translation_batcher, preload_translation_models
+)
+from .model_registry import TranslationModelRegistry, get_model_registry
+from .batching import TranslationBatcher, make_length_buckets
+from .translation_memory import TranslationMemory, get_translation_memory
 
 # Try to import argos-translate first, then deep-translator as fallback
 try:
@@ -54,14 +60,12 @@ def translate_text(text: str, source_lang: str = "en", target_lang: str = "es")
     if not text or not text.strip():
         return ""
     
-    # Try offline translation first
+    # Try offline translation first, with models shared through the registry.
+    # Concurrent callers share batches through the micro-batching queue.
     try:
-        if target_lang == "es":
-            return translate_to_spanish(text, source_lang)
-        else:
-            # For other languages, use the offline translator
-            translator = OfflineTranslator()
-            return translator.translate_to_spanish(text, source_lang)  # Fallback to Spanish for now
+        translator = get_offline_translator()
+        return get_translation_batcher().translate(text, source_lang, target_lang,
+                                                   translate_batch=translator.translate_batch)
     except Exception as e:
         # If offline translation fails, try Argos Translate
         if ARGOS_TRANSLATE_AVAILABLE and argostranslate is not None:
@@ -95,7 +99,16 @@ __all__ = [
     'OfflineTranslator', 
     'translate_to_spanish',
     'translate_text',
-    'TranslationError'
+    'TranslationError',
+    'get_offline_translator',
+    'preload_translation_models',
+    'TranslationModelRegistry',
+    'get_model_registry',
+    'TranslationBatcher',
+    'get_translation_batcher',
+    'make_length_buckets',
+    'TranslationMemory',
+    'get_translation_memory'
 ]
 
 __version__ = "1.0.0" 
\ No newline at end of file
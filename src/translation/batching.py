@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Translation - Batching
+=================================
+
+Length-bucketed batches and a micro-batching queue for translation
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- None
+======================================================================
+Functions:
+- make_length_buckets: Group texts of similar length into token-bounded batches.
+Classes:
+- TranslationBatcher: Queue that merges concurrent single-text requests into batches.
+======================================================================
+
+Neural translation models run a batch of sentences in about the time of
+its longest sentence, so batching pays off when the sentences in a batch
+have similar lengths. make_length_buckets() sorts texts by token count and
+cuts batches so that (batch size x longest sentence) stays under a token
+budget.
+
+TranslationBatcher collects the requests that arrive within a few
+milliseconds of each other (e.g. from several pipeline workers and web
+handlers) and translates them with one batch call per language pair.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from ..logging_config import get_logger
+from ..utils.exceptions import TranslationError
+
+logger = get_logger(__name__)
+
+BatchTranslateFn = Callable[[List[str], str, str], List[Optional[str]]]
+
+_STOP = object()
+
+
+def make_length_buckets(lengths: Sequence[int], max_tokens: int,
+                        max_batch_size: int = 64) -> List[List[int]]:
+    """
+    Group texts of similar length into token-bounded batches.
+
+    Indices are sorted by length, longest first, and each batch is filled
+    while (number of texts x longest text) fits in max_tokens. A single
+    text longer than max_tokens gets a batch of its own.
+
+    Args:
+        lengths: Token count of each text
+        max_tokens: Maximum padded tokens per batch
+        max_batch_size: Maximum texts per batch
+
+    Returns:
+        List[List[int]]: Batches of indices into lengths
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    batches: List[List[int]] = []
+    current: List[int] = []
+    longest = 0
+    for index in order:
+        length = max(1, lengths[index])
+        if current:
+            fits = (len(current) + 1) * max(longest, length) <= max_tokens
+            if fits and len(current) < max_batch_size:
+                current.append(index)
+                longest = max(longest, length)
+                continue
+            batches.append(current)
+        current = [index]
+        longest = length
+    if current:
+        batches.append(current)
+    return batches
+
+
+@dataclass
+class _Request:
+    """A text waiting to be translated."""
+    text: str
+    source_lang: str
+    target_lang: str
+    translate_batch: BatchTranslateFn
+    future: Future = field(default_factory=Future)
+    submitted_at: float = field(default_factory=time.perf_counter)
+
+
+class TranslationBatcher:
+    """
+    Queue that merges concurrent single-text requests into batches.
+
+    A worker thread waits for the first request, then keeps collecting
+    requests for `window` seconds (or until max_batch_size is reached) and
+    translates them with one batch call per (translator, source, target).
+    With a window of 0 requests are translated directly on the caller's
+    thread.
+    """
+
+    def __init__(self, translate_batch: BatchTranslateFn, window: float = 0.005,
+                 max_batch_size: int = 32):
+        """
+        Initialize the batcher.
+
+        Args:
+            translate_batch: Default function translating a list of texts
+                             for a language pair; None marks a text it
+                             could not translate
+            window: Seconds to wait for more requests after the first one
+            max_batch_size: Maximum requests collected into one batch
+        """
+        self.translate_batch = translate_batch
+        self.window = max(0.0, window)
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.errors = 0
+        self._total_wait = 0.0
+
+    def submit(self, text: str, source_lang: str, target_lang: str,
+               translate_batch: Optional[BatchTranslateFn] = None) -> Future:
+        """
+        Queue a text for translation.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            translate_batch: Batch function to use instead of the default one
+
+        Returns:
+            Future: Resolves to the translated text
+        """
+        request = _Request(text, source_lang, target_lang,
+                           translate_batch or self.translate_batch)
+        if self.window == 0:
+            self._run_batch([request])
+            return request.future
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker, name="translation-batcher",
+                                                daemon=True)
+                self._thread.start()
+        self._queue.put(request)
+        return request.future
+
+    def translate(self, text: str, source_lang: str, target_lang: str,
+                  translate_batch: Optional[BatchTranslateFn] = None,
+                  timeout: Optional[float] = None) -> str:
+        """
+        Translate a text, sharing a batch with concurrent callers.
+
+        Raises:
+            TranslationError: If the batch function could not translate this text
+            Exception: Whatever the batch function raised for this batch
+        """
+        return self.submit(text, source_lang, target_lang, translate_batch).result(timeout)
+
+    def _worker(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            pending = [first]
+            stop = False
+            deadline = time.perf_counter() + self.window
+            while len(pending) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                pending.append(item)
+
+            self._run_batch(pending)
+            if stop:
+                return
+
+    def _run_batch(self, pending: List[_Request]) -> None:
+        """Translate collected requests, one call per translator and language pair."""
+        groups: Dict[Any, List[_Request]] = {}
+        for request in pending:
+            key = (request.translate_batch, request.source_lang, request.target_lang)
+            groups.setdefault(key, []).append(request)
+
+        for (translate_batch, source_lang, target_lang), requests in groups.items():
+            started = time.perf_counter()
+            try:
+                results = translate_batch([r.text for r in requests], source_lang, target_lang)
+                if len(results) != len(requests):
+                    raise RuntimeError(f"Expected {len(requests)} translations, got {len(results)}")
+            except Exception as e:
+                self.errors += 1
+                for request in requests:
+                    request.future.set_exception(e)
+            else:
+                # A text that could not be translated fails only its own caller
+                for request, result in zip(requests, results):
+                    if result is None:
+                        request.future.set_exception(TranslationError(
+                            f"Could not translate text from {source_lang} to {target_lang}",
+                            source_language=source_lang, target_language=target_lang))
+                    else:
+                        request.future.set_result(result)
+
+            self.requests += len(requests)
+            self.batches += 1
+            self.largest_batch = max(self.largest_batch, len(requests))
+            self._total_wait += sum(started - r.submitted_at for r in requests)
+
+    def close(self) -> None:
+        """Translate the requests already queued and stop the worker thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout=5.0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dict[str, Any]: Request and batch counts, average batch size and
+            average time requests waited in the queue
+        """
+        return {
+            "window_ms": self.window * 1000,
+            "requests": self.requests,
+            "batches": self.batches,
+            "average_batch_size": self.requests / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "average_wait_ms": self._total_wait / self.requests * 1000 if self.requests else 0.0,
+            "errors": self.errors,
+        }
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Translation - Model Registry
+=======================================
+
+Process-wide registry of loaded translation models
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- None
+======================================================================
+Functions:
+- estimate_model_size: Estimate the memory used by a loaded model.
+- get_model_registry: Get the process-wide model registry.
+Classes:
+- TranslationModelRegistry: Thread-safe LRU of models keyed by (engine, src, tgt).
+======================================================================
+
+Every translator in the process shares one registry, so a model is loaded
+once no matter how many OfflineTranslator instances, API handlers or
+pipeline workers use it. Concurrent requests for a model that is still
+loading wait for that load instead of starting their own. When the
+estimated size of the loaded models exceeds the memory budget, the least
+recently used models are dropped.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+ModelKey = Tuple[str, str, str]
+
+# Size assumed for models whose parameters cannot be inspected (e.g. argos)
+DEFAULT_MODEL_SIZE = 100 * 1024 * 1024
+
+# Seconds before a pair that failed to load is tried again
+FAILED_LOAD_RETRY = 60.0
+
+
+def estimate_model_size(model: Any, default: int = DEFAULT_MODEL_SIZE) -> int:
+    """
+    Estimate the memory used by a loaded model.
+
+    Torch modules are measured from their parameters and buffers; tuples
+    such as (model, tokenizer) are the sum of their parts.
+
+    Args:
+        model: Loaded model object
+        default: Size to assume when the model cannot be inspected
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    if isinstance(model, (tuple, list)):
+        sizes = [estimate_model_size(part, 0) for part in model]
+        return sum(sizes) or default
+
+    if hasattr(model, 'parameters') and callable(model.parameters):
+        try:
+            size = sum(p.numel() * p.element_size() for p in model.parameters())
+            if hasattr(model, 'buffers'):
+                size += sum(b.numel() * b.element_size() for b in model.buffers())
+            return int(size)
+        except Exception:
+            return default
+    return default
+
+
+@dataclass
+class _Entry:
+    """A loaded model and its bookkeeping."""
+    model: Any
+    size: int
+    load_time: float
+    loaded_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    hits: int = 0
+
+
+class TranslationModelRegistry:
+    """
+    Thread-safe LRU of translation models keyed by (engine, src, tgt).
+
+    Models are loaded lazily by the loader passed to get(); the registry
+    only decides when a load is needed and when a model is dropped.
+    """
+
+    def __init__(self, memory_budget: int = 2048 * 1024 * 1024,
+                 default_model_size: int = DEFAULT_MODEL_SIZE):
+        """
+        Initialize the registry.
+
+        Args:
+            memory_budget: Maximum estimated size of all loaded models in bytes
+            default_model_size: Size assumed for models that cannot be measured
+        """
+        self.memory_budget = memory_budget
+        self.default_model_size = default_model_size
+
+        self._models: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self._loading: Dict[ModelKey, threading.Event] = {}
+        self._failed: Dict[ModelKey, float] = {}
+        self._load_times: Dict[ModelKey, float] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.loads = 0
+        self.failed_loads = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(engine: str, source_lang: str, target_lang: str) -> ModelKey:
+        return (engine.lower(), source_lang.lower(), target_lang.lower())
+
+    def get(self, engine: str, source_lang: str, target_lang: str,
+            loader: Callable[[], Optional[Any]]) -> Optional[Any]:
+        """
+        Get a model, loading it with `loader` if it is not loaded yet.
+
+        Args:
+            engine: Engine name (e.g. "argos", "huggingface")
+            source_lang: Source language code
+            target_lang: Target language code
+            loader: Function that loads the model, returning None on failure
+
+        Returns:
+            Optional[Any]: The model, or None if it could not be loaded
+        """
+        key = self._key(engine, source_lang, target_lang)
+
+        while True:
+            with self._lock:
+                entry = self._models.get(key)
+                if entry is not None:
+                    self._models.move_to_end(key)
+                    entry.hits += 1
+                    entry.last_used = time.time()
+                    self.hits += 1
+                    return entry.model
+
+                failed_at = self._failed.get(key)
+                if failed_at is not None and time.time() - failed_at < FAILED_LOAD_RETRY:
+                    return None
+
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = threading.Event()
+                    self._loading[key] = pending
+                    break
+            # Another thread is loading this model; use its result
+            pending.wait()
+
+        start_time = time.perf_counter()
+        try:
+            model = loader()
+        except Exception as e:
+            logger.error(f"Error loading {key[0]} model for {key[1]}-{key[2]}: {e}")
+            model = None
+        load_time = time.perf_counter() - start_time
+
+        with self._lock:
+            del self._loading[key]
+            if model is None:
+                self._failed[key] = time.time()
+                self.failed_loads += 1
+            else:
+                self._failed.pop(key, None)
+                size = estimate_model_size(model, self.default_model_size)
+                self._models[key] = _Entry(model=model, size=size, load_time=load_time)
+                self._load_times[key] = load_time
+                self.loads += 1
+                self._evict_over_budget(keep=key)
+        pending.set()
+
+        if model is not None:
+            logger.info(f"Loaded {key[0]} model for {key[1]}-{key[2]} in {load_time:.2f}s")
+        return model
+
+    def _evict_over_budget(self, keep: ModelKey) -> None:
+        """Drop least recently used models until under budget (lock held)."""
+        total = sum(entry.size for entry in self._models.values())
+        for key in list(self._models):
+            if total <= self.memory_budget:
+                break
+            if key == keep:
+                continue
+            entry = self._models.pop(key)
+            total -= entry.size
+            self.evictions += 1
+            logger.info(f"Evicted {key[0]} model for {key[1]}-{key[2]} "
+                        f"({entry.size / 1024 / 1024:.0f} MB)")
+
+    def contains(self, engine: str, source_lang: str, target_lang: str) -> bool:
+        """Check whether a model is loaded."""
+        with self._lock:
+            return self._key(engine, source_lang, target_lang) in self._models
+
+    def evict(self, engine: str, source_lang: str, target_lang: str) -> bool:
+        """
+        Drop a model from the registry.
+
+        Returns:
+            bool: True if the model was loaded
+        """
+        with self._lock:
+            return self._models.pop(self._key(engine, source_lang, target_lang), None) is not None
+
+    def clear(self) -> None:
+        """Drop all models and forget failed loads."""
+        with self._lock:
+            self._models.clear()
+            self._failed.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dict[str, Any]: Totals and, per loaded pair, size, load time and hits
+        """
+        with self._lock:
+            now = time.time()
+            models = {
+                f"{engine}:{src}-{tgt}": {
+                    "size_mb": entry.size / 1024 / 1024,
+                    "load_time": entry.load_time,
+                    "hits": entry.hits,
+                    "idle_seconds": now - entry.last_used,
+                }
+                for (engine, src, tgt), entry in self._models.items()
+            }
+            return {
+                "loaded_models": len(self._models),
+                "memory_mb": sum(e.size for e in self._models.values()) / 1024 / 1024,
+                "memory_budget_mb": self.memory_budget / 1024 / 1024,
+                "hits": self.hits,
+                "loads": self.loads,
+                "failed_loads": self.failed_loads,
+                "evictions": self.evictions,
+                "load_times": {f"{engine}:{src}-{tgt}": seconds
+                               for (engine, src, tgt), seconds in self._load_times.items()},
+                "models": models,
+            }
+
+
+_registry: Optional[TranslationModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> TranslationModelRegistry:
+    """
+    Get the process-wide model registry.
+
+    The memory budget comes from the translation "model_memory_budget_mb"
+    setting.
+
+    Returns:
+        TranslationModelRegistry: The shared registry
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                try:
+                    from ..config import get_setting
+                    budget_mb = get_setting("translation", "model_memory_budget_mb", 2048)
+                except Exception:
+                    budget_mb = 2048
+                _registry = TranslationModelRegistry(memory_budget=int(budget_mb) * 1024 * 1024)
+    return _registry
@@ -14,24 +14,37 @@ Requirements:
 ======================================================================
 Functions:
 - translate_to_spanish: Convenience function to translate text to Spanish.
+- get_offline_translator: Get the shared OfflineTranslator instance.
+- get_translation_batcher: Get the shared micro-batching queue.
+- preload_translation_models: Load the configured language pairs ahead of use.
 - __init__: Initialize the offline translator.
 - _download_argos_model: Download argos-translate model for the specified language pair.
-- _load_argos_model: Load or download argos-translate model.
-- _load_hf_model: Load HuggingFace MarianMT model.
+- _load_argos_model: Get the argos-translate model from the shared model registry.
+- _load_hf_model: Get the HuggingFace MarianMT model from the shared model registry.
+- translate: Translate text between two languages.
+- translate_batch: Translate a list of texts between two languages.
+- lookup_memory: Look up a previous translation in the translation memory.
 - translate_to_spanish: Translate text to Spanish.
+- preload: Load the models for a list of language pairs.
 - _translate_with_argos: Translate using argos-translate.
 - _translate_with_hf: Translate using HuggingFace MarianMT.
+- _translate_batch_with_hf: Translate a list of texts with length-bucketed MarianMT batches.
 - get_supported_languages: Get list of supported language pairs for each engine.
 - is_available: Check if any translation engine is available.
 ======================================================================
 """
 
 import os
-from typing import Optional, Dict, Any
+import threading
+from importlib import metadata
+from typing import Optional, Dict, Any, Iterable, List
 from pathlib import Path
 import time
 from ..logging_config import get_logger
 from ..utils.exceptions import TranslationError
+from .model_registry import TranslationModelRegistry, get_model_registry
+from .batching import TranslationBatcher, make_length_buckets
+from .translation_memory import TranslationMemory, get_translation_memory
 
 logger = get_logger(__name__)
 
@@ -60,6 +73,37 @@ except ImportError:
     logger.warning("transformers not available. Install with: pip install transformers torch")
 
 
+def _get_translation_setting(key: str, default: Any) -> Any:
+    """Read a translation setting, falling back to default without config."""
+    try:
+        from ..config import get_setting
+        return get_setting("translation", key, default)
+    except Exception:
+        return default
+
+
+def _package_version(package: str) -> str:
+    """Installed version of a package, used in the memory model version."""
+    try:
+        return f"{package}={metadata.version(package)}"
+    except Exception:
+        return f"{package}=unknown"
+
+
+_torch_threads_configured = False
+
+def _configure_torch_threads() -> None:
+    """Apply the translation "num_threads" setting to torch once per process."""
+    global _torch_threads_configured
+    if _torch_threads_configured or torch is None:
+        return
+    _torch_threads_configured = True
+    num_threads = int(_get_translation_setting("num_threads", 0))
+    if num_threads > 0:
+        torch.set_num_threads(num_threads)
+        logger.info(f"Using {num_threads} torch threads for translation")
+
+
 class OfflineTranslator:
     """
     Offline translation class that supports multiple translation engines.
@@ -69,12 +113,18 @@ class OfflineTranslator:
     2. HuggingFace MarianMT models (fallback) - High-quality neural translation
     
     Models are automatically downloaded on first use and cached locally.
+    Loaded models live in the process-wide model registry, so they are
+    shared by all instances.
     """
     
     def __init__(self, 
                  preferred_engine: str = "argos",
                  model_cache_dir: Optional[str] = None,
-                 auto_download: bool = True):
+                 auto_download: bool = True,
+                 registry: Optional[TranslationModelRegistry] = None,
+                 max_tokens_per_batch: Optional[int] = None,
+                 max_batch_size: Optional[int] = None,
+                 memory: Optional[TranslationMemory] = None):
         """
         Initialize the offline translator.
         
@@ -82,10 +132,25 @@ class OfflineTranslator:
             preferred_engine: "argos" or "huggingface"
             model_cache_dir: Directory to cache downloaded models
             auto_download: Whether to automatically download missing models
+            registry: Model registry to use. If None, uses the shared registry
+            max_tokens_per_batch: Padded tokens per MarianMT batch. If None, uses
+                                  the "max_tokens_per_batch" setting
+            max_batch_size: Texts per MarianMT batch. If None, uses the
+                            "batch_size" setting
+            memory: Translation memory to use. If None, uses the shared memory
         """
         self.preferred_engine = preferred_engine.lower()
         self.auto_download = auto_download
         
+        # Batch limits for HuggingFace inference
+        if max_tokens_per_batch is None:
+            max_tokens_per_batch = _get_translation_setting("max_tokens_per_batch", 4096)
+        if max_batch_size is None:
+            max_batch_size = _get_translation_setting("batch_size", 32)
+        self.max_tokens_per_batch = max(1, int(max_tokens_per_batch))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_length = int(_get_translation_setting("max_length", 512))
+        
         # Set up model cache directory
         if model_cache_dir is None:
             self.model_cache_dir = Path.home() / ".cache" / "talkbridge" / "translation_models"
@@ -98,9 +163,13 @@ class OfflineTranslator:
         self.argos_available = ARGOS_AVAILABLE
         self.hf_available = HF_AVAILABLE
         
-        # Cache for loaded models
-        self._argos_models = {}
-        self._hf_models = {}
+        # Loaded models are shared through the registry
+        self._registry = registry if registry is not None else get_model_registry()
+        
+        # Previous translations, keyed by the engine and model that produced them
+        self._memory = memory if memory is not None else get_translation_memory()
+        self._package_versions = {"argos": _package_version("argostranslate"),
+                                  "huggingface": _package_version("transformers")}
         
         # Supported language pairs
         self.supported_pairs = {
@@ -168,20 +237,35 @@ class OfflineTranslator:
     
     def _load_argos_model(self, source_lang: str, target_lang: str) -> Optional[Any]:
         """
+        Get the argos-translate model from the shared model registry.
+        
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Loaded model or None if failed
+        """
+        return self._registry.get(
+            "argos", source_lang, target_lang,
+            lambda: self._read_argos_model(source_lang, target_lang)
+        )
+    
+    def _read_argos_model(self, source_lang: str, target_lang: str,
+                          allow_download: bool = True) -> Optional[Any]:
+        """
         Load or download argos-translate model.
         
         Args:
             source_lang: Source language code
             target_lang: Target language code
+            allow_download: Whether a missing model may be downloaded
             
         Returns:
             Loaded model or None if failed
         """
         model_key = f"{source_lang}-{target_lang}"
         
-        if model_key in self._argos_models:
-            return self._argos_models[model_key]
-        
         try:
             if not ARGOS_AVAILABLE or argostranslate is None:
                 logger.error("argos-translate not available for model loading")
@@ -200,16 +284,15 @@ class OfflineTranslator:
             
             if source_lang_obj and target_lang_obj:
                 translation = source_lang_obj.get_translation(target_lang_obj)
-                self._argos_models[model_key] = translation
                 logger.info(f"Loaded argos-translate model for {model_key}")
                 return translation
             
             # Model not found, try to download
-            if self.auto_download:
+            if self.auto_download and allow_download:
                 logger.info(f"Model not found, attempting to download...")
                 if self._download_argos_model(source_lang, target_lang):
                     # Try loading again after download
-                    return self._load_argos_model(source_lang, target_lang)
+                    return self._read_argos_model(source_lang, target_lang, allow_download=False)
             
             logger.error(f"Could not load argos-translate model for {model_key}")
             return None
@@ -219,6 +302,22 @@ class OfflineTranslator:
             return None
     
     def _load_hf_model(self, source_lang: str, target_lang: str) -> Optional[tuple]:
+        """
+        Get the HuggingFace MarianMT model from the shared model registry.
+        
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Tuple of (model, tokenizer) or None if failed
+        """
+        return self._registry.get(
+            "huggingface", source_lang, target_lang,
+            lambda: self._read_hf_model(source_lang, target_lang)
+        )
+    
+    def _read_hf_model(self, source_lang: str, target_lang: str) -> Optional[tuple]:
         """
         Load HuggingFace MarianMT model.
         
@@ -231,24 +330,19 @@ class OfflineTranslator:
         """
         model_key = f"{source_lang}-{target_lang}"
         
-        if model_key in self._hf_models:
-            return self._hf_models[model_key]
-        
         try:
             if not HF_AVAILABLE or MarianTokenizer is None or MarianMTModel is None:
                 logger.error("transformers not available for model loading")
                 return None
                 
-            model_name = self.supported_pairs["huggingface"].get(model_key)
-            if not model_name:
-                logger.error(f"No HuggingFace model found for {model_key}")
-                return None
+            model_name = self._hf_model_name(source_lang, target_lang)
             
+            _configure_torch_threads()
             logger.info(f"Loading HuggingFace model: {model_name}")
             tokenizer = MarianTokenizer.from_pretrained(model_name)
             model = MarianMTModel.from_pretrained(model_name)
+            model.eval()
             
-            self._hf_models[model_key] = (model, tokenizer)
             logger.info(f"Successfully loaded HuggingFace model for {model_key}")
             return (model, tokenizer)
             
@@ -256,6 +350,13 @@ class OfflineTranslator:
             logger.error(f"Error loading HuggingFace model: {e}")
             return None
     
+    def _hf_model_name(self, source_lang: str, target_lang: str) -> str:
+        """MarianMT model used for a language pair."""
+        # Helsinki-NLP publishes opus-mt models for most pairs under this name
+        return self.supported_pairs["huggingface"].get(
+            f"{source_lang}-{target_lang}", f"Helsinki-NLP/opus-mt-{source_lang}-{target_lang}"
+        )
+    
     def translate_to_spanish(self, text: str, source_lang: str = "en") -> str:
         """
         Translate text to Spanish.
@@ -270,6 +371,23 @@ class OfflineTranslator:
         Returns:
             Translated text in Spanish
             
+        Raises:
+            TranslationError: If translation fails
+        """
+        return self.translate(text, source_lang, "es")
+    
+    def translate(self, text: str, source_lang: str = "en", target_lang: str = "es") -> str:
+        """
+        Translate text between two languages.
+        
+        Args:
+            text: Text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Translated text
+            
         Raises:
             TranslationError: If translation fails
         """
@@ -278,18 +396,28 @@ class OfflineTranslator:
         
         # Normalize language codes
         source_lang = source_lang.lower()[:2]
-        target_lang = "es"
+        target_lang = target_lang.lower()[:2]
+        
+        cached = self.lookup_memory(text, source_lang, target_lang)
+        if cached is not None:
+            return cached
+        
+        start_time = time.perf_counter()
         
         # Try preferred engine first
         if self.preferred_engine == "argos" and self.argos_available:
             result = self._translate_with_argos(text, source_lang, target_lang)
             if result:
+                self._remember("argos", text, source_lang, target_lang, result,
+                               time.perf_counter() - start_time)
                 return result
         
         # Fallback to HuggingFace
         if self.hf_available:
             result = self._translate_with_hf(text, source_lang, target_lang)
             if result:
+                self._remember("huggingface", text, source_lang, target_lang, result,
+                               time.perf_counter() - start_time)
                 return result
         
         # If both engines fail
@@ -297,6 +425,112 @@ class OfflineTranslator:
             f"Translation failed. No available translation engines for {source_lang}-{target_lang}"
         )
     
+    def translate_batch(self, texts: List[str], source_lang: str = "en",
+                        target_lang: str = "es") -> List[Optional[str]]:
+        """
+        Translate a list of texts between two languages.
+        
+        argos-translate translates the texts one by one; HuggingFace runs
+        length-bucketed batches with one generate() call per batch.
+        
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Translated texts in the same order ("" for empty texts, None for
+            texts no engine could translate)
+        """
+        results: List[Optional[str]] = [""] * len(texts)
+        pending = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not pending:
+            return results
+        
+        # Normalize language codes
+        source_lang = source_lang.lower()[:2]
+        target_lang = target_lang.lower()[:2]
+        
+        for i in pending:
+            results[i] = self.lookup_memory(texts[i], source_lang, target_lang) or ""
+        pending = [i for i in pending if not results[i]]
+        translated_now = list(pending)
+        engines: Dict[int, str] = {}  # Engine that translated each text
+        start_time = time.perf_counter()
+        
+        # Try preferred engine first
+        if pending and self.preferred_engine == "argos" and self.argos_available:
+            for i in pending:
+                results[i] = self._translate_with_argos(texts[i], source_lang, target_lang) or ""
+                if results[i]:
+                    engines[i] = "argos"
+            pending = [i for i in pending if not results[i]]
+        
+        # Fallback to HuggingFace
+        if pending and self.hf_available:
+            translated = self._translate_batch_with_hf([texts[i] for i in pending],
+                                                       source_lang, target_lang)
+            if translated is not None:
+                for i, result in zip(pending, translated):
+                    results[i] = result
+                    if result:
+                        engines[i] = "huggingface"
+                pending = [i for i in pending if not results[i]]
+        
+        if translated_now:
+            latency = (time.perf_counter() - start_time) / len(translated_now)
+            for i, engine in engines.items():
+                self._remember(engine, texts[i], source_lang, target_lang, results[i], latency)
+        
+        if pending:
+            logger.warning(f"Translation failed for {len(pending)} of {len(texts)} texts. "
+                           f"No available translation engines for {source_lang}-{target_lang}")
+            for i in pending:
+                results[i] = None
+        return results
+    
+    def lookup_memory(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        Look up a previous translation in the translation memory.
+        
+        Args:
+            text: Text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Cached translation or None
+        """
+        if self._memory is None:
+            return None
+        source_lang, target_lang = source_lang.lower()[:2], target_lang.lower()[:2]
+        # Same engine order as translate()
+        engines = []
+        if self.preferred_engine == "argos" and self.argos_available:
+            engines.append("argos")
+        if self.hf_available:
+            engines.append("huggingface")
+        for engine in engines:
+            cached = self._memory.lookup(f"offline-{engine}",
+                                         self._memory_model(engine, source_lang, target_lang),
+                                         source_lang, target_lang, text)
+            if cached is not None:
+                return cached
+        return None
+    
+    def _memory_model(self, engine: str, source_lang: str, target_lang: str) -> str:
+        """Model version of a memory entry: the engine package and, for MarianMT, the model."""
+        if engine == "huggingface":
+            return f"{self._hf_model_name(source_lang, target_lang)};{self._package_versions[engine]}"
+        return self._package_versions[engine]
+    
+    def _remember(self, engine: str, text: str, source_lang: str, target_lang: str,
+                  translation: str, latency: float) -> None:
+        """Store a translation under the engine and model that produced it."""
+        if self._memory is not None:
+            self._memory.store(f"offline-{engine}", self._memory_model(engine, source_lang, target_lang),
+                               source_lang, target_lang, text, translation, latency)
+    
     def _translate_with_argos(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
         """
         Translate using argos-translate.
@@ -337,6 +571,26 @@ class OfflineTranslator:
         Returns:
             Translated text or None if failed
         """
+        results = self._translate_batch_with_hf([text], source_lang, target_lang)
+        return results[0] if results else None
+    
+    def _translate_batch_with_hf(self, texts: List[str], source_lang: str,
+                                 target_lang: str) -> Optional[List[str]]:
+        """
+        Translate a list of texts with length-bucketed MarianMT batches.
+        
+        Texts are sorted by token count and grouped so that each batch pads
+        to at most max_tokens_per_batch tokens; each batch is a single
+        generate() call.
+        
+        Args:
+            texts: Texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+            
+        Returns:
+            Translated texts in the same order, or None if failed
+        """
         try:
             if not HF_AVAILABLE or torch is None:
                 logger.error("torch not available for HuggingFace translation")
@@ -350,17 +604,29 @@ class OfflineTranslator:
             
             start_time = time.time()
             
-            # Tokenize and translate
-            inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512)
+            # Token counts without padding decide the buckets
+            encoded = tokenizer(texts, truncation=True, max_length=self.max_length)
+            lengths = [len(ids) for ids in encoded["input_ids"]]
+            batches = make_length_buckets(lengths, self.max_tokens_per_batch, self.max_batch_size)
             
-            with torch.no_grad():
-                translated = model.generate(**inputs)
+            results = [""] * len(texts)
+            for batch in batches:
+                # Pads only to the longest text of the batch
+                inputs = tokenizer([texts[i] for i in batch], return_tensors="pt",
+                                   padding=True, truncation=True, max_length=self.max_length)
+                
+                with torch.no_grad():
+                    translated = model.generate(**inputs)
+                
+                decoded = tokenizer.batch_decode(translated, skip_special_tokens=True)
+                for i, result in zip(batch, decoded):
+                    results[i] = result
             
-            result = tokenizer.decode(translated[0], skip_special_tokens=True)
             latency = time.time() - start_time
             
-            logger.info(f"HuggingFace translation completed in {latency:.3f}s")
-            return result
+            logger.info(f"HuggingFace translated {len(texts)} texts in {len(batches)} "
+                        f"batches in {latency:.3f}s")
+            return results
             
         except Exception as e:
             logger.error(f"HuggingFace translation error: {e}")
@@ -383,6 +649,29 @@ class OfflineTranslator:
             True if at least one engine is available
         """
         return self.argos_available or self.hf_available
+    
+    def preload(self, pairs: Iterable[str]) -> Dict[str, bool]:
+        """
+        Load the models for a list of language pairs.
+        
+        Each pair is loaded with the engine translate() would try first.
+        
+        Args:
+            pairs: Language pairs such as "en-es"
+            
+        Returns:
+            Dict[str, bool]: Whether each pair has a model loaded
+        """
+        results = {}
+        for pair in pairs:
+            source_lang, _, target_lang = pair.partition("-")
+            model = None
+            if self.preferred_engine == "argos" and self.argos_available:
+                model = self._load_argos_model(source_lang, target_lang)
+            if model is None and self.hf_available:
+                model = self._load_hf_model(source_lang, target_lang)
+            results[pair] = model is not None
+        return results
 
 # Convenience function for quick translation
 def translate_to_spanish(text: str, source_lang: str = "en") -> str:
@@ -402,8 +691,79 @@ def translate_to_spanish(text: str, source_lang: str = "en") -> str:
     Raises:
         TranslationError: If translation fails
     """
-    translator = OfflineTranslator()
-    return translator.translate_to_spanish(text, source_lang)
+    return get_offline_translator().translate_to_spanish(text, source_lang)
+
+_offline_translator: Optional[OfflineTranslator] = None
+_offline_translator_lock = threading.Lock()
+
+def get_offline_translator() -> OfflineTranslator:
+    """
+    Get the shared OfflineTranslator instance.
+    
+    Returns:
+        OfflineTranslator: Translator backed by the shared model registry
+    """
+    global _offline_translator
+    if _offline_translator is None:
+        with _offline_translator_lock:
+            if _offline_translator is None:
+                _offline_translator = OfflineTranslator()
+    return _offline_translator
+
+_translation_batcher: Optional[TranslationBatcher] = None
+
+def get_translation_batcher() -> TranslationBatcher:
+    """
+    Get the shared micro-batching queue.
+    
+    Requests from all callers within the translation "micro_batch_window_ms"
+    setting are translated together by the shared OfflineTranslator.
+    
+    Returns:
+        TranslationBatcher: The shared batcher
+    """
+    global _translation_batcher
+    if _translation_batcher is None:
+        with _offline_translator_lock:
+            if _translation_batcher is None:
+                window_ms = float(_get_translation_setting("micro_batch_window_ms", 5))
+                _translation_batcher = TranslationBatcher(
+                    lambda texts, source_lang, target_lang:
+                        get_offline_translator().translate_batch(texts, source_lang, target_lang),
+                    window=window_ms / 1000,
+                    max_batch_size=int(_get_translation_setting("batch_size", 32)),
+                )
+    return _translation_batcher
+
+def preload_translation_models(pairs: Optional[Iterable[str]] = None) -> Dict[str, bool]:
+    """
+    Load the configured language pairs ahead of use.
+    
+    Args:
+        pairs: Language pairs such as "en-es". If None, uses the translation
+               "preload_pairs" setting
+        
+    Returns:
+        Dict[str, bool]: Whether each pair has a model loaded
+    """
+    if pairs is None:
+        try:
+            from ..config import get_setting
+            pairs = get_setting("translation", "preload_pairs", [])
+        except Exception:
+            pairs = []
+    
+    pairs = list(pairs)
+    if not pairs:
+        return {}
+    
+    translator = get_offline_translator()
+    if not translator.is_available():
+        return {pair: False for pair in pairs}
+    
+    results = translator.preload(pairs)
+    logger.info(f"Preloaded translation models: {results}")
+    return results
 
 # Example usage and testing
 if __name__ == "__main__":
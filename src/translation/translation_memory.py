@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Translation - Translation Memory
+===========================================
+
+Persistent cache of previous translations with exact and fuzzy lookup
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- sqlite3 (standard library)
+======================================================================
+Functions:
+- normalize_text: Normalize text for translation memory lookups.
+- make_memory_key: Build the key of a translation memory entry.
+- get_translation_memory: Get the process-wide translation memory.
+Classes:
+- TranslationMemory: In-memory index backed by an SQLite store.
+======================================================================
+
+Entries are keyed by (engine, model version, source language, target
+language, normalized text), so changing the engine or upgrading a model
+never returns translations it did not produce. Recently used entries are
+kept in an in-memory hash index; all entries are stored in SQLite so they
+survive restarts. When a fuzzy threshold is set, a miss is retried against
+the in-memory entries of the same engine, model and language pair using a
+character trigram index to find candidates and an edit-distance ratio to
+accept them.
+"""
+
+import difflib
+import hashlib
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple, Union
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+BucketKey = Tuple[str, str, str, str]
+
+# Candidates compared by edit distance for each fuzzy lookup
+FUZZY_CANDIDATES = 20
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for translation memory lookups.
+
+    Applies Unicode NFC normalization and collapses whitespace, so
+    "Can  you hear me?\\n" and "Can you hear me?" share an entry.
+
+    Args:
+        text: Source text
+
+    Returns:
+        str: Normalized text
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_memory_key(engine: str, model: str, source_lang: str, target_lang: str,
+                    text: str) -> str:
+    """
+    Build the key of a translation memory entry.
+
+    Args:
+        engine: Translation engine name
+        model: Model name or version
+        source_lang: Source language code
+        target_lang: Target language code
+        text: Source text
+
+    Returns:
+        str: Hex digest identifying the entry
+    """
+    parts = (engine, model, source_lang.lower(), target_lang.lower(), normalize_text(text))
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+@dataclass
+class _Entry:
+    """A cached translation and its fuzzy-match data."""
+    translation: str
+    latency: float
+    bucket: BucketKey
+    match_text: str
+    grams: FrozenSet[str]
+
+
+class TranslationMemory:
+    """
+    In-memory index of translations backed by an SQLite store.
+
+    The in-memory index holds up to max_entries recently used entries and
+    is warmed from the store on start; lookups that miss it fall through to
+    SQLite. Statistics report hit rates and the translation time saved,
+    estimated from the time each cached translation originally took.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None,
+                 max_entries: int = 10000, fuzzy_threshold: float = 0.0):
+        """
+        Initialize the translation memory.
+
+        Args:
+            db_path: SQLite database file. If None, entries are kept in memory only
+            max_entries: Maximum entries in the in-memory index
+            fuzzy_threshold: Minimum similarity (0-1) for fuzzy matches; 0 disables them
+        """
+        self.max_entries = max(1, max_entries)
+        self.fuzzy_threshold = fuzzy_threshold
+        self.db_path = Path(db_path) if db_path else None
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._grams: Dict[BucketKey, Dict[str, Set[str]]] = {}
+        self._lock = threading.RLock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.saved_latency = 0.0
+        self._lookup_time = 0.0
+
+        if self.db_path is not None:
+            self._open_db()
+
+    def _open_db(self) -> None:
+        """Open the SQLite store and warm the in-memory index from it."""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS translations (
+                    key TEXT PRIMARY KEY,
+                    engine TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT NOT NULL,
+                    latency REAL NOT NULL DEFAULT 0,
+                    hits INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            self._db.commit()
+
+            rows = self._db.execute(
+                "SELECT key, engine, model, source_lang, target_lang, source_text, "
+                "translated_text, latency FROM translations ORDER BY last_used DESC LIMIT ?",
+                (self.max_entries,)
+            ).fetchall()
+            for key, engine, model, src, tgt, source_text, translated, latency in reversed(rows):
+                self._add_entry(key, (engine, model, src, tgt), source_text, translated, latency)
+            logger.info(f"Translation memory opened at {self.db_path} ({len(rows)} entries loaded)")
+        except sqlite3.Error as e:
+            logger.error(f"Could not open translation memory {self.db_path}: {e}")
+            self._db = None
+
+    def _add_entry(self, key: str, bucket: BucketKey, source_text: str,
+                   translation: str, latency: float) -> None:
+        """Add an entry to the in-memory index (lock held)."""
+        if key in self._entries:
+            self._remove_entry(key)
+        match_text = normalize_text(source_text).casefold()
+        entry = _Entry(translation, latency, bucket, match_text, _trigrams(match_text))
+        self._entries[key] = entry
+        if self.fuzzy_threshold > 0:
+            index = self._grams.setdefault(bucket, {})
+            for gram in entry.grams:
+                index.setdefault(gram, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove_entry(next(iter(self._entries)))
+
+    def _remove_entry(self, key: str) -> None:
+        """Remove an entry from the in-memory index (lock held)."""
+        entry = self._entries.pop(key)
+        index = self._grams.get(entry.bucket)
+        if index is None:
+            return
+        for gram in entry.grams:
+            keys = index.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[gram]
+
+    def _fuzzy_lookup(self, bucket: BucketKey, text: str) -> Optional[_Entry]:
+        """Find the most similar entry above the threshold (lock held)."""
+        index = self._grams.get(bucket)
+        if not index:
+            return None
+
+        match_text = normalize_text(text).casefold()
+        grams = _trigrams(match_text)
+        overlap: Dict[str, int] = {}
+        for gram in grams:
+            for key in index.get(gram, ()):
+                overlap[key] = overlap.get(key, 0) + 1
+
+        # Trigram overlap picks the candidates, edit distance decides
+        candidates = sorted(overlap, key=overlap.get, reverse=True)[:FUZZY_CANDIDATES]
+        best: Optional[_Entry] = None
+        best_score = self.fuzzy_threshold
+        for key in candidates:
+            entry = self._entries[key]
+            dice = 2 * overlap[key] / (len(grams) + len(entry.grams))
+            if dice < best_score * 0.5:
+                continue
+            score = difflib.SequenceMatcher(None, match_text, entry.match_text).ratio()
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+
+    def lookup(self, engine: str, model: str, source_lang: str, target_lang: str,
+               text: str) -> Optional[str]:
+        """
+        Look up a previous translation.
+
+        Args:
+            engine: Translation engine name
+            model: Model name or version
+            source_lang: Source language code
+            target_lang: Target language code
+            text: Source text
+
+        Returns:
+            Optional[str]: Cached translation, or None on a miss
+        """
+        start_time = time.perf_counter()
+        key = make_memory_key(engine, model, source_lang, target_lang, text)
+        bucket = (engine, model, source_lang.lower(), target_lang.lower())
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+            else:
+                entry = self._read_entry(key)
+                if entry is not None:
+                    self.disk_hits += 1
+                elif self.fuzzy_threshold > 0:
+                    entry = self._fuzzy_lookup(bucket, text)
+                    if entry is not None:
+                        self.fuzzy_hits += 1
+
+            elapsed = time.perf_counter() - start_time
+            self._lookup_time += elapsed
+            if entry is None:
+                self.misses += 1
+                return None
+            self.saved_latency += max(0.0, entry.latency - elapsed)
+            return entry.translation
+
+    def _read_entry(self, key: str) -> Optional[_Entry]:
+        """Load an entry from SQLite into the in-memory index (lock held)."""
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT engine, model, source_lang, target_lang, source_text, translated_text, "
+                "latency FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE translations SET hits = hits + 1, last_used = ? WHERE key = ?",
+                             (time.time(), key))
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Translation memory read failed: {e}")
+            return None
+
+        engine, model, src, tgt, source_text, translated, latency = row
+        self._add_entry(key, (engine, model, src, tgt), source_text, translated, latency)
+        return self._entries[key]
+
+    def store(self, engine: str, model: str, source_lang: str, target_lang: str,
+              text: str, translation: str, latency: float = 0.0) -> None:
+        """
+        Store a translation.
+
+        Args:
+            engine: Translation engine name
+            model: Model name or version
+            source_lang: Source language code
+            target_lang: Target language code
+            text: Source text
+            translation: Translated text
+            latency: Seconds the translation took, used to report saved time
+        """
+        if not text or not text.strip() or not translation:
+            return
+
+        key = make_memory_key(engine, model, source_lang, target_lang, text)
+        source_lang, target_lang = source_lang.lower(), target_lang.lower()
+        with self._lock:
+            self._add_entry(key, (engine, model, source_lang, target_lang), text, translation, latency)
+            self.stores += 1
+            if self._db is None:
+                return
+            try:
+                now = time.time()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO translations (key, engine, model, source_lang, "
+                    "target_lang, source_text, translated_text, latency, hits, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?)",
+                    (key, engine, model, source_lang, target_lang, normalize_text(text),
+                     translation, latency, now, now)
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Translation memory write failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries from memory and from the store."""
+        with self._lock:
+            self._entries.clear()
+            self._grams.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM translations")
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.error(f"Translation memory clear failed: {e}")
+
+    def close(self) -> None:
+        """Close the SQLite store."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get translation memory statistics.
+
+        Returns:
+            Dict[str, Any]: Hits by kind, misses, hit rate and saved latency
+        """
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits + self.fuzzy_hits
+            lookups = hits + self.misses
+            disk_entries = None
+            if self._db is not None:
+                try:
+                    disk_entries = self._db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            return {
+                "entries": len(self._entries),
+                "disk_entries": disk_entries,
+                "lookups": lookups,
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "fuzzy_hits": self.fuzzy_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "saved_latency": self.saved_latency,
+                "average_lookup_ms": self._lookup_time / lookups * 1000 if lookups else 0.0,
+                "fuzzy_threshold": self.fuzzy_threshold,
+            }
+
+
+_memory: Optional[TranslationMemory] = None
+_memory_lock = threading.Lock()
+_memory_initialized = False
+
+
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """
+    Get the process-wide translation memory.
+
+    Uses the translation "memory_enabled", "memory_path",
+    "memory_max_entries" and "memory_fuzzy_threshold" settings.
+
+    Returns:
+        Optional[TranslationMemory]: The shared memory, or None if disabled
+    """
+    global _memory, _memory_initialized
+    if not _memory_initialized:
+        with _memory_lock:
+            if not _memory_initialized:
+                try:
+                    from ..config import get_setting
+                    enabled = get_setting("translation", "memory_enabled", True)
+                    db_path = get_setting("translation", "memory_path", None)
+                    max_entries = int(get_setting("translation", "memory_max_entries", 10000))
+                    threshold = float(get_setting("translation", "memory_fuzzy_threshold", 0.0))
+                except Exception:
+                    enabled, db_path, max_entries, threshold = True, None, 10000, 0.0
+                if enabled:
+                    _memory = TranslationMemory(db_path, max_entries, threshold)
+                _memory_initialized = True
+    return _memory
@@ -10,17 +10,29 @@ Date: 2025-08-19
 Version: 1.0
 
 Requirements:
-- None
+- requests
 ======================================================================
 Functions:
+- estimate_num_predict: Token limit for the translation of a text.
 - __init__: Function __init__
 - translate: Function translate
+- translate_stream: Translate text, yielding the translation as it is generated.
 ======================================================================
+
+Requests go through the pooled session of the shared OllamaClient for the
+configured server, so consecutive translations reuse an open connection.
+Each request asks Ollama to keep the model loaded for `keep_alive` and
+limits the generated tokens to what a translation of the input needs.
 """
 
+import json
+import math
 import requests
 import time
-from typing import Optional, Tuple
+from typing import Generator, Optional, Tuple
+
+from ..ollama.ollama_client import get_shared_client
+from .translation_memory import TranslationMemory, get_translation_memory
 
 try:
     import yaml
@@ -30,11 +42,35 @@ except ImportError:
     YAML_AVAILABLE = False
 
 
+def estimate_num_predict(text: str, maximum: int = 1024) -> int:
+    """
+    Token limit for the translation of a text.
+
+    Assumes about four characters per token and allows the translation
+    twice the tokens of the input, plus headroom for very short texts.
+
+    Args:
+        text: Text to translate
+        maximum: Upper bound on the limit
+
+    Returns:
+        int: Value for the num_predict option
+    """
+    return min(maximum, 32 + 2 * math.ceil(len(text) / 4))
+
+
 class Translator:
-    def __init__(self, config_path: str = "config/config.yaml") -> None:
+    def __init__(self, config_path: str = "config/config.yaml",
+                 memory: Optional[TranslationMemory] = None) -> None:
         # Set default values
         self.base_url = "http://localhost:11434"
         self.model = "llama2"
+        self.connect_timeout = 3.0
+        self.read_timeout = 60.0
+        self.keep_alive = "30m"  # How long Ollama keeps the model loaded after a request
+        self.max_predict = 1024
+        # Previous translations are served from the translation memory
+        self.memory = memory if memory is not None else get_translation_memory()
         
         if not YAML_AVAILABLE or yaml is None:
             print("Warning: YAML module not available, using default Ollama settings")
@@ -49,6 +85,10 @@ class Translator:
                 
             self.base_url = config['ollama']['base_url'].rstrip("/")
             self.model = config['ollama']['model']
+            self.connect_timeout = float(config['ollama'].get('connect_timeout', self.connect_timeout))
+            self.read_timeout = float(config['ollama'].get('read_timeout', self.read_timeout))
+            self.keep_alive = config['ollama'].get('keep_alive', self.keep_alive)
+            self.max_predict = int(config['ollama'].get('max_predict', self.max_predict))
         except (FileNotFoundError, KeyError) as e:
             # Fallback to default values if config is missing or invalid
             print(f"Warning: Config issue ({e}), using default Ollama settings")
@@ -56,28 +96,106 @@ class Translator:
             # Handle YAML errors and other exceptions
             print(f"Warning: Config parsing error ({e}), using default Ollama settings")
 
-    def translate(self, text: str, source_lang: str, target_lang: str) -> Tuple[Optional[str], Optional[float]]:
+    @property
+    def session(self) -> requests.Session:
+        """Pooled session shared with the other clients of the same server."""
+        return get_shared_client(self.base_url).session
+
+    def _payload(self, text: str, source_lang: str, target_lang: str, stream: bool) -> dict:
         prompt = (
             f"Translate the following text from {source_lang} to {target_lang}:\n"
             f"Text: \"{text}\""
         )
-
-        payload = {
+        return {
             "model": self.model,
-            "prompt": prompt
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": self.keep_alive,
+            "options": {"num_predict": estimate_num_predict(text, self.max_predict)},
         }
 
+    def translate(self, text: str, source_lang: str, target_lang: str) -> Tuple[Optional[str], Optional[float]]:
+        start_time = time.time()
+        if self.memory is not None:
+            cached = self.memory.lookup("ollama", self.model, source_lang, target_lang, text)
+            if cached is not None:
+                return cached, time.time() - start_time
+
+        payload = self._payload(text, source_lang, target_lang, stream=False)
+
         try:
             start_time = time.time()
-            response = requests.post(f"{self.base_url}/api/generate", json=payload)
+            response = self.session.post(f"{self.base_url}/api/generate", json=payload,
+                                         timeout=(self.connect_timeout, self.read_timeout))
             response.raise_for_status()
             result = response.json()
             latency = time.time() - start_time
 
             translation = result.get("response", "").strip()
             print(f"Translation received in {latency:.2f} seconds")
+            # Output cut off by num_predict is returned but not remembered
+            if self.memory is not None and translation and result.get("done_reason") != "length":
+                self.memory.store("ollama", self.model, source_lang, target_lang,
+                                  text, translation, latency)
             return translation, latency
 
         except requests.exceptions.RequestException as e:
             print(f"Error in Deepseek inference: {e}")
-            return None, None
\ No newline at end of file
+            return None, None
+
+    def translate_stream(self, text: str, source_lang: str, target_lang: str) -> Generator[str, None, None]:
+        """
+        Translate text, yielding the translation as it is generated.
+
+        Cached translations are yielded in one piece. Closing the generator
+        early closes the HTTP response, which stops generation on the server.
+        Only a stream that ends with "done" and was not cut off by the
+        num_predict limit is stored in the translation memory.
+
+        Args:
+            text: Text to translate
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Yields:
+            Pieces of the translated text
+        """
+        if self.memory is not None:
+            cached = self.memory.lookup("ollama", self.model, source_lang, target_lang, text)
+            if cached is not None:
+                yield cached
+                return
+
+        payload = self._payload(text, source_lang, target_lang, stream=True)
+        pieces = []
+        complete = False
+        start_time = time.time()
+
+        try:
+            with self.session.post(f"{self.base_url}/api/generate", json=payload, stream=True,
+                                   timeout=(self.connect_timeout, self.read_timeout)) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    try:
+                        data = json.loads(line.decode('utf-8'))
+                    except json.JSONDecodeError:
+                        continue
+                    piece = data.get("response", "")
+                    if piece:
+                        pieces.append(piece)
+                        yield piece
+                    if data.get("done", False):
+                        # done_reason "length" means num_predict truncated the output
+                        complete = data.get("done_reason") != "length"
+                        break
+        except requests.exceptions.RequestException as e:
+            print(f"Error in streaming translation: {e}")
+            return
+
+        latency = time.time() - start_time
+        translation = "".join(pieces).strip()
+        if self.memory is not None and translation and complete:
+            self.memory.store("ollama", self.model, source_lang, target_lang,
+                              text, translation, latency)
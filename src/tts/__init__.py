@@ -20,12 +20,21 @@ except ImportError:
     VoiceCloner = None
     TTS_AVAILABLE = False
 
-from .synthesizer import synthesize_voice, setup_voice_cloning, get_synthesis_info
+from .synthesizer import (
+    synthesize_voice, synthesize_stream, setup_voice_cloning, get_synthesis_info, warm_up_synthesis
+)
+from .synthesis_cache import SynthesisCache
+from .streaming import SynthesisStream, split_sentences
 
 __all__ = [
     'synthesize_voice',
+    'synthesize_stream',
+    'SynthesisStream',
+    'split_sentences',
     'setup_voice_cloning',
     'get_synthesis_info',
+    'warm_up_synthesis',
+    'SynthesisCache',
     'TTS_AVAILABLE'
 ]
 
@@ -51,7 +51,10 @@ PERFORMANCE_CONFIG = {
     "batch_size": 1,
     "max_text_length": 500,  # Maximum characters per synthesis
     "enable_caching": True,
-    "cache_size": 10  # Number of cached results
+    "cache_size": 10,  # Number of cached results kept in memory
+    "disk_cache_size_mb": 256,  # Size cap of the on-disk synthesis cache
+    "warmup_phrases": [],  # Phrases synthesized into the cache by warm_up_synthesis()
+    "warmup_languages": ["en"]
 }
 
 # Language configuration
@@ -80,7 +83,8 @@ ERROR_CONFIG = {
 PATHS_CONFIG = {
     "model_cache_dir": os.path.expanduser("~/.cache/tts_models"),
     "temp_dir": os.path.join(os.getcwd(), "temp"),
-    "output_dir": os.path.join(os.getcwd(), "output")
+    "output_dir": os.path.join(os.getcwd(), "output"),
+    "synthesis_cache_dir": os.path.expanduser("~/.cache/talkbridge/tts_synthesis")
 }
 
 # Model-specific configurations
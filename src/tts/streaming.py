@@ -0,0 +1,217 @@
+#! /usr/bin/env python3
+"""
+TalkBridge TTS - Streaming
+==========================
+
+Sentence-level streaming synthesis
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- numpy
+======================================================================
+Functions:
+- split_sentences: Split text into sentence-sized synthesis chunks.
+Classes:
+- SynthesisStream: Iterator of audio chunks synthesized one sentence ahead.
+======================================================================
+
+Long texts (e.g. LLM answers) are split into sentences that are synthesized
+on a background thread, up to `prefetch` sentences ahead of the consumer.
+The consumer receives float32 arrays as soon as each sentence is ready, so
+sentence N can play while sentence N+1 is being synthesized and the time to
+first audio is that of the first sentence only.
+"""
+
+import queue
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;:…。！？])\s+")
+_CLAUSE_END = re.compile(r"(?<=[,、，])\s+")
+
+_DONE = object()
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """Split a sentence longer than max_chars at clause breaks, then at spaces."""
+    if len(sentence) <= max_chars:
+        return [sentence]
+
+    pieces: List[str] = []
+    current = ""
+    for part in _CLAUSE_END.split(sentence):
+        words = part.split(" ") if len(part) > max_chars else [part]
+        for word in words:
+            candidate = f"{current} {word}" if current else word
+            if len(candidate) > max_chars and current:
+                pieces.append(current)
+                current = word
+            else:
+                current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_sentences(text: str, max_chars: int = 250, min_chars: int = 20) -> List[str]:
+    """
+    Split text into sentence-sized synthesis chunks.
+
+    Very short sentences are merged with the next one so prosody does not
+    break after every "Yes." or "OK.", and sentences longer than max_chars
+    are split at commas or spaces.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+        min_chars: Chunks shorter than this are merged with the following one
+
+    Returns:
+        List[str]: Chunks in order
+    """
+    chunks: List[str] = []
+    pending = ""
+    for sentence in _SENTENCE_END.split(" ".join(text.split())):
+        if not sentence:
+            continue
+        sentence = f"{pending} {sentence}" if pending else sentence
+        if len(sentence) < min_chars:
+            pending = sentence
+            continue
+        pending = ""
+        chunks.extend(_split_long(sentence, max_chars))
+
+    if pending:
+        if chunks and len(chunks[-1]) + len(pending) < max_chars:
+            chunks[-1] = f"{chunks[-1]} {pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+
+class SynthesisStream:
+    """
+    Iterator of audio chunks synthesized one sentence ahead.
+
+    Iterating starts a worker thread that synthesizes the sentences in order
+    into a bounded queue. Timing is available from get_stats() while and
+    after the stream is consumed:
+
+    - time_to_first_audio: seconds from the start of iteration until the
+      first chunk is ready
+    - real_time_factor: synthesis time / duration of the audio produced
+    """
+
+    def __init__(self, synthesize: Callable[[str], np.ndarray], sentences: List[str],
+                 sample_rate: int, prefetch: int = 1):
+        """
+        Initialize the stream.
+
+        Args:
+            synthesize: Function returning the waveform of one sentence
+            sentences: Sentences to synthesize in order
+            sample_rate: Sample rate of the synthesized audio
+            prefetch: Number of chunks synthesized ahead of the consumer
+        """
+        self.sentences = sentences
+        self.sample_rate = sample_rate
+        self._synthesize = synthesize
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, prefetch))
+        self._cancelled = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._start_time: Optional[float] = None
+        self._first_audio_time: Optional[float] = None
+        self._synthesis_time = 0.0
+        self._samples = 0
+        self._chunks = 0
+        self._error: Optional[BaseException] = None
+
+    def _worker(self) -> None:
+        try:
+            for sentence in self.sentences:
+                if self._cancelled.is_set():
+                    return
+                start = time.perf_counter()
+                chunk = np.asarray(self._synthesize(sentence), dtype=np.float32).reshape(-1)
+                self._synthesis_time += time.perf_counter() - start
+                self._put(chunk)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._put(_DONE)
+
+    def _put(self, item: Any) -> None:
+        """Block until there is room in the queue, giving up when cancelled."""
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        if self._thread is not None:
+            raise RuntimeError("A SynthesisStream can only be iterated once")
+
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._worker, name="tts-stream", daemon=True)
+        self._thread.start()
+
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _DONE:
+                    break
+                if self._first_audio_time is None:
+                    self._first_audio_time = time.perf_counter()
+                self._samples += len(item)
+                self._chunks += 1
+                yield item
+        finally:
+            # Runs on normal exit, on error and when the consumer stops early
+            self.cancel()
+
+        if self._error is not None:
+            raise RuntimeError(f"Streaming synthesis failed: {self._error}") from self._error
+
+        stats = self.get_stats()
+        if stats['chunks']:
+            logger.info(f"Streamed {stats['chunks']} chunks: TTFA {stats['time_to_first_audio']:.3f}s, "
+                        f"RTF {stats['real_time_factor'] or 0.0:.2f}")
+
+    def cancel(self) -> None:
+        """Stop synthesizing further sentences."""
+        self._cancelled.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get timing statistics of this request.
+
+        Returns:
+            Dict[str, Any]: Chunk counts, time to first audio and real-time factor
+        """
+        audio_duration = self._samples / self.sample_rate if self.sample_rate else 0.0
+        ttfa = (self._first_audio_time - self._start_time
+                if self._first_audio_time is not None and self._start_time is not None else None)
+        return {
+            "sentences": len(self.sentences),
+            "chunks": self._chunks,
+            "sample_rate": self.sample_rate,
+            "time_to_first_audio": ttfa,
+            "synthesis_time": self._synthesis_time,
+            "audio_duration": audio_duration,
+            "real_time_factor": self._synthesis_time / audio_duration if audio_duration else None,
+            "cancelled": self._cancelled.is_set() and self._chunks < len(self.sentences),
+        }
@@ -0,0 +1,323 @@
+#! /usr/bin/env python3
+"""
+TalkBridge TTS - Synthesis Cache
+================================
+
+Content-addressed cache for synthesized speech
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+
+Requirements:
+- None (standard library only)
+======================================================================
+Functions:
+- normalize_text: Normalize text so equivalent strings share a cache entry.
+- make_cache_key: Build the cache key for a synthesis request.
+- voice_fingerprint: Hash the contents of the reference samples of a voice.
+Classes:
+- SynthesisCache: In-memory LRU in front of a size-capped on-disk store.
+======================================================================
+
+Synthesized audio is stored as WAV bytes under a SHA-256 key built from
+the normalized text, the voice (a hash of the reference sample contents,
+or "default"), the language and the model name. Because the key only
+depends on content, entries survive restarts and stay valid when samples
+are renamed or moved.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from ..logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_VOICE = "default"
+
+_WHITESPACE = re.compile(r"\s+")
+
+# (path, size, mtime) -> content hash, so samples are only hashed once
+_fingerprint_cache: Dict[Tuple[str, int, float], str] = {}
+_fingerprint_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text so equivalent strings share a cache entry.
+
+    Applies Unicode NFC normalization and collapses runs of whitespace.
+    Case and punctuation are kept since both change the synthesized prosody.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def make_cache_key(text: str, voice: str, language: str, model: str) -> str:
+    """
+    Build the cache key for a synthesis request.
+
+    Args:
+        text: Text to synthesize (normalized here)
+        voice: Voice fingerprint from voice_fingerprint()
+        language: Language code
+        model: TTS model name
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in (normalize_text(text), voice, language, model):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _file_hash(path: str) -> Optional[str]:
+    """Hash a file's contents, reusing the result while size and mtime are unchanged."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    stamp = (os.path.abspath(path), stat.st_size, stat.st_mtime)
+    with _fingerprint_lock:
+        cached = _fingerprint_cache.get(stamp)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+
+    with _fingerprint_lock:
+        _fingerprint_cache[stamp] = digest.hexdigest()
+    return digest.hexdigest()
+
+
+def voice_fingerprint(reference_samples: Optional[Iterable[Union[str, Path]]]) -> str:
+    """
+    Hash the contents of the reference samples of a voice.
+
+    Missing or unreadable files are skipped, like VoiceCloner does when it
+    validates samples.
+
+    Args:
+        reference_samples: Reference audio files, or None for the default voice
+
+    Returns:
+        str: Fingerprint of the voice, DEFAULT_VOICE if no sample is readable
+    """
+    hashes = [h for h in (_file_hash(str(p)) for p in reference_samples or []) if h]
+    if not hashes:
+        return DEFAULT_VOICE
+    return hashlib.sha256(":".join(hashes).encode("ascii")).hexdigest()
+
+
+class SynthesisCache:
+    """
+    In-memory LRU in front of a size-capped on-disk store.
+
+    Lookups check memory first, then disk; disk hits are promoted into
+    memory. Disk entries are evicted oldest-access first once the store
+    grows past max_disk_bytes. All methods are thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 64,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 max_disk_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Number of entries kept in memory
+            cache_dir: Directory of the on-disk store, None for memory only
+            max_disk_bytes: Size cap of the on-disk store
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.max_disk_bytes = max(0, int(max_disk_bytes))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes = 0
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._disk_bytes = sum(p.stat().st_size for p in self._disk_entries())
+            except OSError as e:
+                logger.warning(f"Synthesis disk cache disabled ({self.cache_dir}): {e}")
+                self.cache_dir = None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.wav"
+
+    def _disk_entries(self):
+        return self.cache_dir.glob("*/*.wav")
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        """Insert into the memory LRU (lock held)."""
+        if self.max_entries == 0:
+            return
+        self._memory[key] = audio
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up synthesized audio.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            Optional[bytes]: WAV bytes, or None on a miss
+        """
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return audio
+
+        if self.cache_dir is not None:
+            path = self._path(key)
+            try:
+                audio = path.read_bytes()
+                os.utime(path)  # Mark as recently used for disk eviction
+            except OSError:
+                audio = None
+            if audio is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, audio)
+                return audio
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, audio: bytes) -> None:
+        """
+        Store synthesized audio in memory and on disk.
+
+        Args:
+            key: Key from make_cache_key()
+            audio: WAV bytes
+        """
+        if not audio:
+            return
+        with self._lock:
+            self._remember(key, audio)
+            self.stores += 1
+
+        if self.cache_dir is None or len(audio) > self.max_disk_bytes:
+            return
+
+        path = self._path(key)
+        try:
+            existed = path.exists()
+            previous = path.stat().st_size if existed else 0
+            path.parent.mkdir(exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            temp_path.write_bytes(audio)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write synthesis cache entry: {e}")
+            return
+
+        with self._lock:
+            self._disk_bytes += len(audio) - previous
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used disk entries until under the size cap."""
+        entries = []
+        for path in self._disk_entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            with self._lock:
+                self.evictions += 1
+
+        with self._lock:
+            self._disk_bytes = total
+
+    def clear(self, disk: bool = True) -> None:
+        """
+        Remove all cached entries.
+
+        Args:
+            disk: Also delete the on-disk store
+        """
+        with self._lock:
+            self._memory.clear()
+        if disk and self.cache_dir is not None:
+            for path in self._disk_entries():
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            with self._lock:
+                self._disk_bytes = 0
+
+    def get_stats(self) -> Dict[str, Union[int, float, str, None]]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict: Hit/miss counters, hit rate and current sizes
+        """
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "memory_bytes": sum(len(a) for a in self._memory.values()),
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+                "cache_dir": str(self.cache_dir) if self.cache_dir else None,
+            }
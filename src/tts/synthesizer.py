@@ -15,22 +15,28 @@ Requirements:
 Functions:
 - _get_voice_cloner: Get or create a global voice cloner instance.
 - synthesize_voice: Main function to synthesize speech from text using voice cloning.
+- synthesize_stream: Synthesize long text sentence by sentence as a stream of chunks.
 - _synthesize_default_voice: Synthesize speech using the default voice (no cloning).
 - setup_voice_cloning: Set up voice cloning with reference samples.
 - get_synthesis_info: Get information about the current synthesis setup.
 - list_available_models: Get list of available TTS models.
+- warm_up_synthesis: Preload the model and precompute the configured phrases.
+- _get_synthesis_cache: Get or create the global synthesis cache.
 ======================================================================
 """
 
 import os
+import time
 import logging
-import tempfile
+import threading
 from pathlib import Path
-from typing import List, Optional, Union
-import soundfile as sf
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
 
-from .voice_cloner import VoiceCloner
+from .voice_cloner import VoiceCloner, waveform_to_wav_bytes
+from .streaming import SynthesisStream, split_sentences
 from .config import get_config, AUDIO_CONFIG
+from .synthesis_cache import SynthesisCache, DEFAULT_VOICE, make_cache_key, voice_fingerprint
 
 # Configure logging
 # Logging configuration is handled by src/desktop/logging_config.py
@@ -39,19 +45,71 @@ logger = logging.getLogger(__name__)
 
 # Global voice cloner instance for caching
 _voice_cloner = None
+_voice_cloner_lock = threading.Lock()
+
+# Global synthesis cache (None when caching is disabled)
+_synthesis_cache = None
+_synthesis_cache_lock = threading.Lock()
 
 def _get_voice_cloner() -> VoiceCloner:
     """
     Get or create a global voice cloner instance.
     
+    The lock makes sure a warm-up thread and a synthesis request never
+    load the model twice.
+    
     Returns:
         VoiceCloner: The voice cloner instance
     """
     global _voice_cloner
     if _voice_cloner is None:
-        _voice_cloner = VoiceCloner()
+        with _voice_cloner_lock:
+            if _voice_cloner is None:
+                _voice_cloner = VoiceCloner()
     return _voice_cloner
 
+def _get_synthesis_cache() -> Optional[SynthesisCache]:
+    """
+    Get or create the global synthesis cache.
+    
+    Returns:
+        Optional[SynthesisCache]: The cache, or None if caching is disabled
+    """
+    global _synthesis_cache
+    config = get_config()
+    performance_config = config["performance"]
+    if not performance_config.get("enable_caching", True):
+        return None
+    
+    if _synthesis_cache is None:
+        with _synthesis_cache_lock:
+            if _synthesis_cache is None:
+                _synthesis_cache = SynthesisCache(
+                    max_entries=performance_config.get("cache_size", 10),
+                    cache_dir=config["paths"].get("synthesis_cache_dir"),
+                    max_disk_bytes=int(performance_config.get("disk_cache_size_mb", 256) * 1024 * 1024)
+                )
+    return _synthesis_cache
+
+def _synthesis_cache_key(text: str, reference_samples: Optional[List[Union[str, Path]]],
+                         language: str, clone_voice: bool) -> str:
+    """
+    Build the cache key for a synthesize_voice call.
+    
+    The voice part mirrors how synthesize_voice picks the voice: the given
+    reference samples, else the samples already cloned, else the default
+    voice. The model name is known without loading the model.
+    """
+    if clone_voice and reference_samples:
+        voice = voice_fingerprint(reference_samples)
+    elif clone_voice and _voice_cloner is not None and getattr(_voice_cloner, 'reference_samples', None):
+        voice = voice_fingerprint(_voice_cloner.reference_samples)
+    else:
+        voice = DEFAULT_VOICE
+    
+    model_name = _voice_cloner.model_name if _voice_cloner is not None else get_config()["default_model"]
+    return make_cache_key(text, voice, language, model_name)
+
 def synthesize_voice(text: str, 
                     output_path: Optional[str] = None,
                     reference_samples: Optional[List[Union[str, Path]]] = None,
@@ -86,6 +144,20 @@ def synthesize_voice(text: str,
     if len(text.strip()) == 0:
         raise ValueError("Text cannot be empty or whitespace only")
     
+    # Replayed strings (UI prompts, repeated phrases) are served from the cache
+    cache = _get_synthesis_cache()
+    cache_key = None
+    if cache is not None:
+        cache_key = _synthesis_cache_key(text, reference_samples, language, clone_voice)
+        cached_audio = cache.get(cache_key)
+        if cached_audio is not None:
+            logger.debug(f"Synthesis cache hit for {len(text)} characters")
+            if output_path:
+                with open(output_path, 'wb') as f:
+                    f.write(cached_audio)
+                return output_path
+            return cached_audio
+    
     try:
         # Get voice cloner instance
         voice_cloner = _get_voice_cloner()
@@ -118,12 +190,75 @@ def synthesize_voice(text: str,
             )
         
         logger.info(f"Successfully synthesized {len(text)} characters")
+        
+        if cache_key is not None:
+            if isinstance(result, bytes):
+                cache.put(cache_key, result)
+            else:
+                with open(result, 'rb') as f:
+                    cache.put(cache_key, f.read())
+        
         return result
         
     except Exception as e:
         logger.error(f"Speech synthesis failed: {e}")
         raise RuntimeError(f"Speech synthesis failed: {e}")
 
+def synthesize_stream(text: str,
+                      reference_samples: Optional[List[Union[str, Path]]] = None,
+                      language: str = "en",
+                      clone_voice: bool = True,
+                      prefetch: int = 1,
+                      max_sentence_chars: int = 250) -> SynthesisStream:
+    """
+    Synthesize long text sentence by sentence as a stream of chunks.
+    
+    Iterating the returned stream yields one mono float32 waveform per
+    sentence as soon as it is ready; the next sentences are synthesized on a
+    background thread while the caller plays the current one. No audio goes
+    through a file.
+    
+    Args:
+        text: Text to synthesize
+        reference_samples: List of audio file paths for voice cloning
+        language: Language code for synthesis (default: "en")
+        clone_voice: Whether to use voice cloning (default: True)
+        prefetch: Number of sentences synthesized ahead of playback
+        max_sentence_chars: Longer sentences are split at commas or spaces
+        
+    Returns:
+        SynthesisStream: Iterable of chunks; get_stats() reports time to first
+        audio and real-time factor
+        
+    Raises:
+        ValueError: If text is empty
+        RuntimeError: If the TTS model cannot be loaded
+    """
+    if not text or not text.strip():
+        raise ValueError("Text cannot be empty")
+    
+    try:
+        voice_cloner = _get_voice_cloner()
+    except Exception as e:
+        logger.error(f"Speech synthesis failed: {e}")
+        raise RuntimeError(f"Speech synthesis failed: {e}")
+    
+    if clone_voice and reference_samples:
+        if not voice_cloner.clone_voice_from_samples(reference_samples):
+            logger.warning("Voice cloning failed, falling back to default voice")
+            clone_voice = False
+    clone_voice = clone_voice and bool(getattr(voice_cloner, 'reference_samples', None))
+    
+    def synthesize_sentence(sentence: str) -> np.ndarray:
+        return voice_cloner.synthesize_array(sentence, language, clone_voice=clone_voice)
+    
+    return SynthesisStream(
+        synthesize_sentence,
+        split_sentences(text, max_chars=max_sentence_chars),
+        sample_rate=voice_cloner.sample_rate,
+        prefetch=prefetch
+    )
+
 def _synthesize_default_voice(text: str,
                              output_path: Optional[str] = None,
                              language: str = "en",
@@ -167,12 +302,8 @@ def _synthesize_default_voice(text: str,
                 language=language
             )
             
-            # Convert to bytes
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                sf.write(temp_file.name, audio_data, AUDIO_CONFIG["sample_rate"])
-                with open(temp_file.name, 'rb') as f:
-                    audio_bytes = f.read()
-                os.unlink(temp_file.name)
+            # Convert to bytes in memory
+            audio_bytes = waveform_to_wav_bytes(np.asarray(audio_data), AUDIO_CONFIG["sample_rate"])
             
             logger.info(f"Generated audio: {len(audio_bytes)} bytes")
             return audio_bytes
@@ -206,14 +337,19 @@ def get_synthesis_info() -> dict:
     Get information about the current synthesis setup.
     
     Returns:
-        dict: Information about the voice cloner and synthesis capabilities
+        dict: Information about the voice cloner and synthesis capabilities,
+              with synthesis cache statistics under "cache"
     """
+    cache = _get_synthesis_cache()
+    cache_stats = cache.get_stats() if cache is not None else {"enabled": False}
     try:
         voice_cloner = _get_voice_cloner()
-        return voice_cloner.get_model_info()
+        info = voice_cloner.get_model_info()
+        info["cache"] = cache_stats
+        return info
     except Exception as e:
         logger.error(f"Failed to get synthesis info: {e}")
-        return {"error": str(e)}
+        return {"error": str(e), "cache": cache_stats}
 
 def list_available_models() -> List[str]:
     """
@@ -227,4 +363,73 @@ def list_available_models() -> List[str]:
         return voice_cloner.get_available_models()
     except Exception as e:
         logger.error(f"Failed to get available models: {e}")
-        return [] 
\ No newline at end of file
+        return []
+
+def warm_up_synthesis(phrases: Optional[Sequence[str]] = None,
+                      languages: Optional[Sequence[str]] = None,
+                      reference_samples: Optional[List[Union[str, Path]]] = None) -> Dict[str, Any]:
+    """
+    Preload the model and precompute the configured phrase list.
+    
+    Meant to run once at startup (typically on a worker thread) so the first
+    request does not pay for model loading and common phrases are served
+    from the synthesis cache. Phrases already cached are not synthesized again.
+    
+    Args:
+        phrases: Phrases to precompute. If None, uses performance.warmup_phrases
+        languages: Languages to precompute each phrase in. If None, uses
+                   performance.warmup_languages
+        reference_samples: Reference samples of the voice to precompute with.
+                           If None, uses the default voice
+        
+    Returns:
+        dict: Model load time and counts of cached, synthesized and failed phrases
+    """
+    performance_config = get_config()["performance"]
+    if phrases is None:
+        phrases = performance_config.get("warmup_phrases", [])
+    if languages is None:
+        languages = performance_config.get("warmup_languages", ["en"])
+    
+    summary: Dict[str, Any] = {
+        "model_loaded": False,
+        "load_time": 0.0,
+        "cached": 0,
+        "synthesized": 0,
+        "failed": 0,
+        "elapsed": 0.0
+    }
+    start_time = time.perf_counter()
+    
+    try:
+        _get_voice_cloner()
+        summary["model_loaded"] = True
+    except Exception as e:
+        logger.error(f"Synthesis warm-up could not load the model: {e}")
+        summary["error"] = str(e)
+        summary["elapsed"] = time.perf_counter() - start_time
+        return summary
+    summary["load_time"] = time.perf_counter() - start_time
+    
+    cache = _get_synthesis_cache()
+    clone_voice = bool(reference_samples)
+    for language in languages:
+        for phrase in phrases:
+            if not phrase or not phrase.strip():
+                continue
+            hits_before = cache.get_stats()["hits"] if cache is not None else 0
+            try:
+                synthesize_voice(phrase, reference_samples=reference_samples,
+                                 language=language, clone_voice=clone_voice)
+                if cache is not None and cache.get_stats()["hits"] > hits_before:
+                    summary["cached"] += 1
+                else:
+                    summary["synthesized"] += 1
+            except Exception as e:
+                logger.warning(f"Synthesis warm-up failed for '{phrase[:30]}': {e}")
+                summary["failed"] += 1
+    
+    summary["elapsed"] = time.perf_counter() - start_time
+    logger.info(f"Synthesis warm-up done in {summary['elapsed']:.2f}s: "
+                f"{summary['synthesized']} synthesized, {summary['cached']} already cached")
+    return summary
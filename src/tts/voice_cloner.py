@@ -16,19 +16,24 @@ Functions:
 - __init__: Initialize the voice cloner with a pre-trained model.
 - _load_model: Load the TTS model and move it to the appropriate device.
 - clone_voice_from_samples: Clone a voice from reference audio samples.
+- use_voice: Switch to a voice that was cloned before.
+- _get_voice_embedding: Compute, load or reuse the speaker embedding of a voice.
+- synthesize_array: Synthesize speech into a float32 waveform in memory.
 - synthesize_with_cloned_voice: Synthesize speech using the cloned voice.
+- waveform_to_wav_bytes: Encode a waveform as WAV bytes in memory.
 - get_available_models: Get list of available TTS models.
 - get_model_info: Get information about the loaded model.
 ======================================================================
 """
 
+import io
 import os
+import hashlib
 import logging
-import tempfile
 import numpy as np
 import soundfile as sf
 from pathlib import Path
-from typing import List, Optional, Union, Tuple
+from typing import Any, Dict, List, Optional, Union, Tuple
 import torch
 from ..logging_config import get_logger
 from ..utils.error_handler import retry_with_backoff, RetryableError, handle_error
@@ -52,6 +57,22 @@ except ImportError:
         _tts_warning_logged = True
 
 from .config import get_config, get_model_config
+from .synthesis_cache import voice_fingerprint
+
+try:
+    from TTS.tts.utils.synthesis import synthesis as _tts_synthesis
+except ImportError:
+    _tts_synthesis = None  # type: ignore
+
+# Speaker embeddings are saved next to the reference samples under this prefix
+VOICE_EMBEDDING_PREFIX = ".talkbridge_voice_"
+
+
+def waveform_to_wav_bytes(audio_data: np.ndarray, sample_rate: int) -> bytes:
+    """Encode a waveform as WAV bytes in memory."""
+    buffer = io.BytesIO()
+    sf.write(buffer, audio_data, sample_rate, format="WAV")
+    return buffer.getvalue()
 
 # Configure logging
 # Logging configuration is handled by src/desktop/logging_config.py
@@ -85,6 +106,11 @@ class VoiceCloner:
         self.config = get_model_config(self.model_name)
         self.tts = None
         
+        # Speaker embeddings of cloned voices, keyed by voice id
+        self._voices: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._voice_samples: Dict[str, List[str]] = {}
+        self.voice_id: Optional[str] = None
+        
         # Set device based on configuration
         performance_config = config["performance"]
         if performance_config["use_gpu"] and torch.cuda.is_available():
@@ -133,6 +159,11 @@ class VoiceCloner:
         """
         Clone a voice from reference audio samples.
         
+        The speaker embedding is computed once per voice, averaged over all
+        valid samples, and saved next to the samples under a hash of their
+        contents. Cloning the same samples again (in this or a later
+        session) reuses it instead of re-encoding the audio.
+        
         Args:
             audio_samples: List of paths to reference audio files
             sample_rate: Target sample rate for audio processing
@@ -158,11 +189,11 @@ class VoiceCloner:
                     logger.warning(f"Audio file not found: {sample_path}")
                     continue
                     
-                # Check if file is readable
+                # Check the duration from the file header
                 try:
-                    audio, sr = sf.read(sample_path)
+                    info = sf.info(str(sample_path))
                     min_duration = voice_cloning_config["min_sample_duration"]
-                    if len(audio) < sr * min_duration:  # Check minimum duration
+                    if info.frames < info.samplerate * min_duration:  # Check minimum duration
                         logger.warning(f"Audio file too short: {sample_path}")
                         continue
                     valid_samples.append(str(sample_path))
@@ -177,18 +208,198 @@ class VoiceCloner:
             
             # Store reference samples for later use
             self.reference_samples = valid_samples
+            self.voice_id = self._voice_id(valid_samples)
+            self._voice_samples[self.voice_id] = valid_samples
+            self._get_voice_embedding(self.voice_id)
             return True
             
         except Exception as e:
             logger.error(f"Voice cloning failed: {e}")
             return False
     
+    def use_voice(self, voice_id: str) -> bool:
+        """
+        Switch to a voice that was cloned before.
+        
+        Args:
+            voice_id: Id of the voice (the voice_id after clone_voice_from_samples)
+            
+        Returns:
+            bool: True if the voice is known
+        """
+        samples = self._voice_samples.get(voice_id)
+        if samples is None:
+            return False
+        self.reference_samples = samples
+        self.voice_id = voice_id
+        return True
+    
+    def _voice_id(self, samples: List[str]) -> str:
+        """Id of a voice: hash of the sample contents and the model name."""
+        key = f"{voice_fingerprint(samples)}:{self.model_name}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    
+    def _embedding_path(self, voice_id: str) -> Path:
+        """File the speaker embedding of a voice is saved to."""
+        samples = self._voice_samples[voice_id]
+        return Path(samples[0]).parent / f"{VOICE_EMBEDDING_PREFIX}{voice_id}.npz"
+    
+    def _get_voice_embedding(self, voice_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Compute, load or reuse the speaker embedding of a voice.
+        
+        Returns:
+            Optional[Dict[str, Any]]: Embedding arrays with their "kind", or None
+            if the model cannot synthesize from an embedding
+        """
+        if voice_id in self._voices:
+            return self._voices[voice_id]
+        
+        embedding = None
+        path = self._embedding_path(voice_id)
+        if path.exists():
+            try:
+                with np.load(path) as data:
+                    embedding = {name: data[name] for name in data.files}
+                embedding["kind"] = str(embedding["kind"])
+                logger.info(f"Loaded speaker embedding from {path}")
+            except Exception as e:
+                logger.warning(f"Could not load speaker embedding {path}: {e}")
+                embedding = None
+        
+        if embedding is None:
+            embedding = self._compute_voice_embedding(self._voice_samples[voice_id])
+            if embedding is not None:
+                try:
+                    np.savez(path, **embedding)
+                    logger.info(f"Saved speaker embedding to {path}")
+                except OSError as e:
+                    logger.warning(f"Could not save speaker embedding {path}: {e}")
+        
+        self._voices[voice_id] = embedding
+        return embedding
+    
+    def _compute_voice_embedding(self, samples: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Encode the speaker from all samples.
+        
+        XTTS models give conditioning latents; models with a speaker encoder
+        (e.g. YourTTS) give a d-vector. Both average over the samples.
+        """
+        model = getattr(getattr(self.tts, 'synthesizer', None), 'tts_model', None)
+        if model is None:
+            return None
+        
+        try:
+            if hasattr(model, 'get_conditioning_latents') and hasattr(model, 'inference'):
+                gpt_cond_latent, speaker_embedding = model.get_conditioning_latents(audio_path=samples)
+                return {
+                    "kind": np.array("xtts"),
+                    "gpt_cond_latent": gpt_cond_latent.detach().cpu().numpy(),
+                    "speaker_embedding": speaker_embedding.detach().cpu().numpy()
+                }
+            
+            speaker_manager = getattr(model, 'speaker_manager', None)
+            if speaker_manager is not None and getattr(speaker_manager, 'encoder', None) is not None:
+                d_vector = speaker_manager.compute_embedding_from_clip(samples)
+                return {"kind": np.array("d_vector"), "d_vector": np.asarray(d_vector, dtype=np.float32)}
+        except Exception as e:
+            logger.warning(f"Could not compute speaker embedding, using reference audio: {e}")
+        return None
+    
+    def _synthesize_from_embedding(self, text: str, language: str,
+                                   embedding: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Synthesize with a precomputed speaker embedding.
+        
+        Returns:
+            Optional[np.ndarray]: Waveform, or None if this model needs the
+            reference audio path instead
+        """
+        synthesizer = self.tts.synthesizer
+        model = synthesizer.tts_model
+        
+        if embedding["kind"] == "xtts":
+            output = model.inference(
+                text, language,
+                torch.from_numpy(embedding["gpt_cond_latent"]).to(self.device),
+                torch.from_numpy(embedding["speaker_embedding"]).to(self.device)
+            )
+            return np.asarray(output["wav"])
+        
+        if _tts_synthesis is None or getattr(synthesizer, 'vocoder_model', None) is not None:
+            return None
+        
+        language_id = None
+        language_manager = getattr(model, 'language_manager', None)
+        if language_manager is not None:
+            language_id = language_manager.name_to_id[language]
+        
+        sentences = (synthesizer.split_into_sentences(text)
+                     if hasattr(synthesizer, 'split_into_sentences') else [text])
+        waveforms = []
+        for sentence in sentences:
+            outputs = _tts_synthesis(
+                model=model,
+                text=sentence,
+                CONFIG=synthesizer.tts_config,
+                use_cuda=self.device == "cuda",
+                d_vector=embedding["d_vector"],
+                language_id=language_id
+            )
+            waveform = outputs["wav"]
+            if isinstance(waveform, torch.Tensor):
+                waveform = waveform.cpu().numpy()
+            waveforms.append(np.asarray(waveform).squeeze())
+        return np.concatenate(waveforms) if waveforms else np.zeros(0, dtype=np.float32)
+    
+    @property
+    def sample_rate(self) -> int:
+        """Sample rate of the synthesized audio."""
+        synthesizer = getattr(self.tts, 'synthesizer', None)
+        return getattr(synthesizer, 'output_sample_rate', None) or get_config()["audio"]["sample_rate"]
+    
+    def synthesize_array(self, text: str, language: str = "en",
+                         clone_voice: bool = True) -> np.ndarray:
+        """
+        Synthesize speech into a float32 waveform, without touching disk.
+        
+        Args:
+            text: Text to synthesize
+            language: Language code for synthesis
+            clone_voice: Use the cloned voice if one is set up
+            
+        Returns:
+            np.ndarray: Mono float32 waveform at self.sample_rate
+        """
+        if self.tts is None:
+            raise RuntimeError("TTS model is not loaded. Cannot synthesize speech.")
+        
+        audio_data = None
+        if clone_voice and getattr(self, 'reference_samples', None):
+            embedding = self._get_voice_embedding(self.voice_id) if self.voice_id else None
+            if embedding is not None:
+                audio_data = self._synthesize_from_embedding(text, language, embedding)
+            if audio_data is None:
+                audio_data = self.tts.tts(
+                    text=text,
+                    speaker_wav=self.reference_samples[0],
+                    language=language
+                )
+        else:
+            audio_data = self.tts.tts(text=text, language=language)
+        
+        return np.asarray(audio_data, dtype=np.float32).reshape(-1)
+    
     def synthesize_with_cloned_voice(self, text: str, 
                                    output_path: Optional[str] = None,
                                    language: str = "en") -> Union[bytes, str]:
         """
         Synthesize speech using the cloned voice.
         
+        Uses the cached speaker embedding of the voice when the model
+        supports it, so the reference audio is not re-encoded on every call.
+        
         Args:
             text: Text to synthesize
             output_path: Optional path to save the audio file
@@ -205,39 +416,17 @@ class VoiceCloner:
             raise RuntimeError("TTS model is not loaded. Cannot synthesize speech.")
             
         try:
-            # Use the first reference sample for voice cloning
-            reference_sample = self.reference_samples[0]
-            
             logger.info(f"Synthesizing text: '{text[:50]}...' with cloned voice")
+            audio_data = self.synthesize_array(text, language)
             
-            # Synthesize with cloned voice
             if output_path:
-                # Save to file
-                self.tts.tts_to_file(
-                    text=text,
-                    speaker_wav=reference_sample,
-                    language=language,
-                    file_path=output_path
-                )
+                sf.write(output_path, audio_data, self.sample_rate)
                 logger.info(f"Audio saved to: {output_path}")
                 return output_path
-            else:
-                # Return audio as bytes
-                audio_data = self.tts.tts(
-                    text=text,
-                    speaker_wav=reference_sample,
-                    language=language
-                )
-                
-                # Convert to bytes
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                    sf.write(temp_file.name, audio_data, 22050)
-                    with open(temp_file.name, 'rb') as f:
-                        audio_bytes = f.read()
-                    os.unlink(temp_file.name)
-                
-                logger.info(f"Generated audio: {len(audio_bytes)} bytes")
-                return audio_bytes
+            
+            audio_bytes = waveform_to_wav_bytes(audio_data, self.sample_rate)
+            logger.info(f"Generated audio: {len(audio_bytes)} bytes")
+            return audio_bytes
                 
         except Exception as e:
             logger.error(f"Speech synthesis failed: {e}")
@@ -271,5 +460,8 @@ class VoiceCloner:
             "model_name": self.model_name,
             "device": self.device,
             "has_cloned_voice": hasattr(self, 'reference_samples'),
-            "reference_samples_count": len(self.reference_samples) if hasattr(self, 'reference_samples') else 0
+            "reference_samples_count": len(self.reference_samples) if hasattr(self, 'reference_samples') else 0,
+            "voice_id": self.voice_id,
+            "cached_voices": len(self._voice_samples),
+            "has_speaker_embedding": self._voices.get(self.voice_id) is not None if self.voice_id else False
         } 
\ No newline at end of file
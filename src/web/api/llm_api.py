@@ -34,6 +34,7 @@ import logging
 
 try:
     from ...ollama import OllamaClient
+    from ...ollama.model_cache import get_model_cache
 except ImportError:
     logging.warning("Ollama module not available")
 
@@ -187,7 +188,8 @@ class LLMAPI:
         """
         try:
             if self.client:
-                return self.client.list_models()
+                # Shared, persisted model list: no request to Ollama while it is fresh
+                return [model.get('name', '') for model in get_model_cache(self.client).get_models()]
             else:
                 return ["llama2", "mistral", "codellama", "llama2:7b", "llama2:13b"]
         except Exception as e:
@@ -33,7 +33,7 @@ from typing import Optional, Dict, Any
 import logging
 
 try:
-    from ...translation import translate_text
+    from ...translation import translate_text, get_offline_translator
     TRANSLATION_AVAILABLE = True
 except ImportError:
     logging.warning("Translation module not available")
@@ -217,11 +217,22 @@ class TranslationAPI:
             if not texts:
                 return []
             
-            translated_texts = []
+            # Same or unsupported languages leave the texts unchanged
+            if not TRANSLATION_AVAILABLE or not self.validate_language_pair(source_lang, target_lang):
+                return list(texts)
             
-            for text in texts:
-                translated = self.translate_text(text, source_lang, target_lang)
-                translated_texts.append(translated if translated else text)
+            # One call for the whole list: the offline translator groups the
+            # texts into length-bucketed batches
+            try:
+                translated_texts = get_offline_translator().translate_batch(
+                    list(texts), source_lang, target_lang)
+            except Exception as e:
+                logger.warning(f"Batched translation failed, translating one by one: {e}")
+                translated_texts = [self.translate_text(text, source_lang, target_lang)
+                                    for text in texts]
+            
+            translated_texts = [translated if translated else text
+                                for text, translated in zip(texts, translated_texts)]
             
             logger.info(f"Translated {len(texts)} texts")
             return translated_texts
@@ -0,0 +1,169 @@
+"""
+Unit tests for the asyncio Ollama client against a fake Ollama server.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from src.ollama.async_client import AsyncOllamaClient, HTTPX_AVAILABLE
+    COMPONENTS_AVAILABLE = HTTPX_AVAILABLE
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Minimal Ollama API: tags, show, pull, generate and chat."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, data):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_lines(self, lines, delay=0.0):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for data in lines:
+            line = json.dumps(data) + "\n"
+            self.wfile.write(f"{len(line.encode()):x}\r\n{line}\r\n".encode())
+            self.wfile.flush()
+            time.sleep(delay)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        if self.path == "/api/tags":
+            self._send_json({"models": [{"name": "llama2"}, {"name": "mistral"}]})
+        else:
+            self._send_json({})
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        model = payload.get("model") or payload.get("name")
+
+        if self.path == "/api/show":
+            self._send_json({"details": {"family": "llama"}, "name": model})
+            return
+        if self.path == "/api/pull":
+            self._send_lines([{"status": "pulling"}, {"status": "success", "done": True}])
+            return
+
+        with server.lock:
+            server.inflight[model] = server.inflight.get(model, 0) + 1
+            server.max_inflight[model] = max(server.max_inflight.get(model, 0), server.inflight[model])
+        try:
+            if payload.get("stream"):
+                key = "response" if self.path == "/api/generate" else "message"
+                pieces = [{key: f"w{i} " if key == "response" else {"content": f"w{i} "},
+                           "done": False} for i in range(server.pieces)]
+                self._send_lines(pieces + [{"done": True}], delay=server.delay)
+            else:
+                time.sleep(server.delay)
+                if self.path == "/api/generate":
+                    self._send_json({"response": f"echo: {payload['prompt']}", "done": True})
+                else:
+                    last = payload["messages"][-1]["content"]
+                    self._send_json({"message": {"role": "assistant", "content": f"re: {last}"},
+                                     "done": True})
+        except (BrokenPipeError, ConnectionResetError):
+            server.disconnected.set()
+        finally:
+            with server.lock:
+                server.inflight[model] -= 1
+
+
+class TestAsyncOllamaClient(unittest.IsolatedAsyncioTestCase):
+    """Test the async client surface, per-model limits and cancellation."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("httpx not available")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllamaHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.inflight = {}
+        self.server.max_inflight = {}
+        self.server.delay = 0.0
+        self.server.pieces = 3
+        self.server.disconnected = threading.Event()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    async def test_same_surface_as_sync_client(self):
+        """generate, chat, list, show and pull work like OllamaClient."""
+        async with AsyncOllamaClient(self.base_url) as client:
+            self.assertTrue(await client.ping())
+            self.assertEqual(await client.generate("llama2", "hi"), "echo: hi")
+            self.assertEqual(await client.chat("llama2", [{"role": "user", "content": "hey"}]), "re: hey")
+            self.assertEqual([m["name"] for m in await client.list_models()], ["llama2", "mistral"])
+            self.assertEqual((await client.get_model_info("llama2"))["details"]["family"], "llama")
+
+            statuses = []
+            self.assertTrue(await client.pull_model("llama2", statuses.append))
+            self.assertEqual(statuses, ["pulling", "success"])
+
+            chunks = [chunk async for chunk in client.generate_stream("llama2", "hi")]
+            self.assertEqual(chunks, ["w0 ", "w1 ", "w2 "])
+            chunks = [chunk async for chunk in client.chat_stream("llama2", [{"role": "user", "content": "x"}])]
+            self.assertEqual("".join(chunks), "w0 w1 w2 ")
+
+    async def test_per_model_concurrency_limit(self):
+        """At most max_concurrency_per_model requests run per model; other models are not blocked."""
+        self.server.delay = 0.1
+        async with AsyncOllamaClient(self.base_url, max_concurrency_per_model=2) as client:
+            results = await asyncio.gather(
+                *[client.generate("llama2", f"p{i}") for i in range(6)],
+                *[client.generate("mistral", f"q{i}") for i in range(2)],
+            )
+        self.assertEqual(results[0], "echo: p0")
+        self.assertEqual(self.server.max_inflight["llama2"], 2)
+        self.assertEqual(self.server.max_inflight["mistral"], 2)
+
+    async def test_cancellation_aborts_stream(self):
+        """Cancelling a streaming task closes the HTTP response on the server side."""
+        self.server.delay = 0.02
+        self.server.pieces = 500
+        async with AsyncOllamaClient(self.base_url) as client:
+            received = []
+
+            async def consume():
+                async for chunk in client.generate_stream("llama2", "long"):
+                    received.append(chunk)
+
+            task = asyncio.create_task(consume())
+            while len(received) < 3:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            self.assertEqual(client.get_stats()["cancelled"], 1)
+            self.assertEqual(client.get_stats()["active"], {})
+            disconnected = await asyncio.get_running_loop().run_in_executor(
+                None, self.server.disconnected.wait, 2.0)
+            self.assertTrue(disconnected)
+            self.assertLess(len(received), 100)
+
+            # The model slot was released
+            self.assertEqual(await client.generate("llama2", "next"), "echo: next")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
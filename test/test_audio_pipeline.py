@@ -112,6 +112,64 @@ class TestMockSTTAdapter(unittest.TestCase):
         self.assertEqual(result.language, "en")
         self.assertGreater(result.confidence, 0)
     
+    @patch('src.audio.adapters.stt_adapter.WHISPER_AVAILABLE', True)
+    @patch('src.audio.adapters.stt_adapter.WhisperEngine')
+    def test_stt_adapter_in_memory_pcm(self, mock_whisper_engine):
+        """Test that PCM audio reaches WhisperEngine as an array, not a temp file."""
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+        import numpy as np
+
+        mock_engine_instance = Mock()
+        mock_engine_instance.transcribe.return_value = "Hello world"
+        mock_whisper_engine.return_value = mock_engine_instance
+        adapter = WhisperSTTAdapter(model_size="base")
+
+        pcm = (np.full(8000, 0.25) * 32767).astype(np.int16).tobytes()
+        audio_data = AudioData(
+            data=memoryview(pcm),
+            sample_rate=44100,
+            channels=2,
+            format=AudioFormat.PCM,
+            source_type="microphone"
+        )
+
+        with patch('tempfile.NamedTemporaryFile') as mock_tempfile:
+            result = adapter.transcribe(audio_data)
+            mock_tempfile.assert_not_called()
+
+        self.assertEqual(result.text, "Hello world")
+        args, kwargs = mock_engine_instance.transcribe.call_args
+        self.assertIsInstance(args[0], np.ndarray)
+        self.assertEqual(args[0].dtype, np.float32)
+        self.assertEqual(args[0].shape, (4000, 2))
+        self.assertEqual(kwargs['sample_rate'], 44100)
+
+    def test_whisper_engine_transcribe_pcm(self):
+        """Test the in-memory PCM path resamples to 16 kHz mono float32."""
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+        import numpy as np
+        from src.stt.whisper_engine import WhisperEngine
+
+        engine = WhisperEngine(model_name="base", device="cpu")
+        engine.model = Mock()
+        engine.model.transcribe.return_value = {"text": " hola "}
+        engine.is_loaded = True
+
+        t = np.arange(44100) / 44100
+        pcm = (0.5 * np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16).tobytes()
+
+        self.assertEqual(engine.transcribe_pcm(pcm, 44100, language="es"), "hola")
+        model_input = engine.model.transcribe.call_args[0][0]
+        self.assertEqual(model_input.dtype, np.float32)
+        self.assertEqual(model_input.ndim, 1)
+        self.assertEqual(model_input.size, 16000)
+        self.assertLessEqual(float(np.max(np.abs(model_input))), 1.0)
+        self.assertEqual(engine.model.transcribe.call_args[1]['language'], "es")
+
     @patch('src.audio.adapters.translation_adapter.TRANSLATOR_AVAILABLE', True)
     @patch('src.audio.adapters.translation_adapter.Translator')
     def test_translation_adapter(self, mock_translator):
@@ -232,6 +290,75 @@ class TestVoiceActivityDetection(unittest.TestCase):
         has_voice = pipeline._detect_voice_activity(noisy_audio)
         self.assertTrue(has_voice)
     
+    @patch('src.audio.pipeline_manager.ADAPTERS_AVAILABLE', False)
+    def test_vad_selection(self):
+        """Test selecting the VAD implementation through the constructor."""
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+        from src.audio.vad import VADType, EnergyVAD, SpectralVAD
+
+        self.assertIsInstance(PipelineManager().vad, EnergyVAD)
+        self.assertIsInstance(PipelineManager(vad_type="spectral").vad, SpectralVAD)
+
+        custom_vad = EnergyVAD(threshold=0.5)
+        pipeline = PipelineManager(vad_type=custom_vad)
+        self.assertIs(pipeline.vad, custom_vad)
+        self.assertEqual(pipeline.vad.vad_type, VADType.ENERGY)
+
+        with self.assertRaises(ValueError):
+            PipelineManager(vad_type="unknown")
+
+    def test_energy_vad_frombuffer(self):
+        """Test energy VAD on raw PCM bytes, memoryviews and float arrays."""
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+        import numpy as np
+        from src.audio.vad import EnergyVAD, as_sample_view
+
+        vad = EnergyVAD(threshold=0.01)
+        loud = (np.full(1600, 0.5) * 32767).astype(np.int16).tobytes()
+
+        self.assertAlmostEqual(vad.rms(loud), 0.5, places=3)
+        self.assertTrue(vad.is_speech(memoryview(loud)))
+        self.assertFalse(vad.is_speech(b'\x00' * 3201))  # odd trailing byte ignored
+        self.assertTrue(vad.is_speech(np.full(1600, 0.5, dtype=np.float32)))
+
+        view = as_sample_view(loud)
+        self.assertFalse(view.flags.owndata)
+
+    def test_spectral_vad_hangover_and_noise_floor(self):
+        """Test spectral VAD hangover smoothing and per-source noise floors."""
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+        import numpy as np
+        from src.audio.vad import SpectralVAD
+
+        sample_rate = 16000
+        t = np.arange(sample_rate // 10) / sample_rate
+        rng = np.random.default_rng(0)
+        to_pcm = lambda x: (np.clip(x, -1, 1) * 32767).astype(np.int16).tobytes()
+        silence = to_pcm(rng.normal(0, 0.001, t.size))
+        noise = to_pcm(rng.normal(0, 0.2, t.size))
+        voice = to_pcm(0.3 * np.sin(2 * np.pi * 200 * t) + 0.2 * np.sin(2 * np.pi * 800 * t))
+
+        vad = SpectralVAD(hangover_ms=150)
+        self.assertFalse(vad.is_speech(silence, sample_rate, source="mic"))
+        self.assertTrue(vad.is_speech(voice, sample_rate, source="mic"))
+        # Hangover keeps the decision for the next silent chunk only
+        self.assertTrue(vad.is_speech(silence, sample_rate, source="mic"))
+        self.assertFalse(vad.is_speech(silence, sample_rate, source="mic"))
+
+        # Broadband noise is rejected and only raises that source's floor
+        for _ in range(3):
+            self.assertFalse(vad.is_speech(noise, sample_rate, source="system"))
+        self.assertGreater(vad.get_noise_floor("system"), vad.get_noise_floor("mic"))
+
+        vad.reset("system")
+        self.assertEqual(vad.get_noise_floor("system"), 0.0)
+
     @patch('src.audio.pipeline_manager.ADAPTERS_AVAILABLE', False)
     def test_audio_buffering(self):
         """Test audio buffering logic."""
@@ -257,7 +384,8 @@ class TestVoiceActivityDetection(unittest.TestCase):
         pipeline._add_to_audio_buffer(test_data)
         new_buffer_size = len(pipeline.audio_buffers[AudioSourceType.MICROPHONE])
         
-        self.assertEqual(new_buffer_size, initial_buffer_size + 1)
+        # Buffers count frames: 10 bytes of 16-bit mono PCM are 5 frames
+        self.assertEqual(new_buffer_size, initial_buffer_size + 5)
 
 
 class TestErrorHandling(unittest.TestCase):
@@ -0,0 +1,118 @@
+"""
+Unit tests for reusing the Ollama KV context across conversation turns.
+"""
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from src.ollama.conversation_manager import ConversationManager
+    from src.ollama.ollama_client import OllamaClient
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+class FakeGenerateHandler(BaseHTTPRequestHandler):
+    """Streams /api/generate and returns a context that grows with each prompt."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.payloads.append(payload)
+        prompt_tokens = len(payload["prompt"].split()) + len((payload.get("system") or "").split())
+        context = list(payload.get("context", [])) + [1] * (prompt_tokens + 2)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        lines = [{"response": "Sure, ", "done": False}, {"response": "done.", "done": False},
+                 {"done": True, "context": context, "prompt_eval_count": prompt_tokens,
+                  "prompt_eval_duration": 1000000, "eval_count": 2}]
+        for data in lines:
+            line = json.dumps(data) + "\n"
+            self.wfile.write(f"{len(line.encode()):x}\r\n{line}\r\n".encode())
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class TestConversationKVCache(unittest.TestCase):
+    """Test that later turns send only the new message on top of the cached context."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGenerateHandler)
+        self.server.daemon_threads = True
+        self.server.payloads = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        client = OllamaClient(f"http://127.0.0.1:{self.server.server_address[1]}")
+        self.manager = ConversationManager(client)
+        self.conversation_id = self.manager.create_conversation("Test", "llama2")
+
+    def test_generate_with_context_reports_timings(self):
+        """The client returns the text, the new context and the time to first token."""
+        result = self.manager.client.generate_with_context("llama2", "hello there", context=[7, 8])
+        self.assertEqual(result["response"], "Sure, done.")
+        self.assertEqual(result["context"][:2], [7, 8])
+        self.assertGreater(result["ttft"], 0)
+        self.assertLessEqual(result["ttft"], result["total_time"])
+        self.assertEqual(result["prompt_eval_count"], 2)
+
+    def test_later_turns_send_only_new_message(self):
+        """The second turn sends the new message and the previous context, pinned with keep_alive."""
+        self.manager.send_message(self.conversation_id, "first question", system_prompt="Be brief.")
+        self.manager.send_message(self.conversation_id, "second question", system_prompt="Be brief.")
+
+        first, second = self.server.payloads
+        self.assertEqual(first["system"], "Be brief.")
+        self.assertNotIn("context", first)
+        self.assertEqual(second["prompt"], "second question")
+        self.assertNotIn("system", second)
+        self.assertEqual(len(second["context"]), 6)  # Context returned by the first turn
+        self.assertEqual(second["keep_alive"], self.manager.keep_alive)
+
+        stats = self.manager.get_turn_stats(self.conversation_id)
+        self.assertEqual([s["reused_context"] for s in stats], [False, True])
+        self.assertTrue(all(s["ttft"] is not None for s in stats))
+        last = self.manager.get_conversation_messages(self.conversation_id)[-1]
+        self.assertTrue(last.metadata["reused_context"])
+
+    def test_edit_and_clear_invalidate_cache(self):
+        """Editing or clearing the history makes the next turn seed a new context."""
+        self.manager.send_message(self.conversation_id, "my name is Ana")
+        first_message = self.manager.get_conversation_messages(self.conversation_id)[0]
+        self.assertTrue(self.manager.edit_message(self.conversation_id, first_message.id, "my name is Eva"))
+
+        self.manager.send_message(self.conversation_id, "what is my name?")
+        reseeded = self.server.payloads[-1]
+        self.assertNotIn("context", reseeded)
+        self.assertIn("User: my name is Eva", reseeded["prompt"])
+        self.assertTrue(reseeded["prompt"].endswith("User: what is my name?"))
+
+        self.manager.clear_conversation(self.conversation_id)
+        self.manager.send_message(self.conversation_id, "hello")
+        self.assertEqual(self.server.payloads[-1]["prompt"], "hello")
+        self.assertNotIn("context", self.server.payloads[-1])
+
+    def test_system_prompt_change_invalidates_cache(self):
+        """A different system prompt is not applied on top of the old context."""
+        self.manager.send_message(self.conversation_id, "hi", system_prompt="Be brief.")
+        self.manager.send_message(self.conversation_id, "and now?", system_prompt="Be verbose.")
+        payload = self.server.payloads[-1]
+        self.assertNotIn("context", payload)
+        self.assertEqual(payload["system"], "Be verbose.")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
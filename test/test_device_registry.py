@@ -0,0 +1,221 @@
+"""
+Unit tests for the audio device registry.
+
+A fake sounddevice backend counts enumerations and lets a test plug in a
+device, so cached lookups and hot-plug detection are observable.
+"""
+
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+try:
+    from src.audio.device_registry import DeviceRegistry
+    from src.audio.pipeline_manager import PipelineManager, AudioSourceType
+    from src.audio.capture import AudioCapture
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+def device(name, inputs=2, outputs=0, hostapi=0, samplerate=48000.0):
+    return {'name': name, 'hostapi': hostapi, 'max_input_channels': inputs,
+            'max_output_channels': outputs, 'default_samplerate': samplerate}
+
+
+class FakeSoundDevice:
+    """Backend module replacement with an editable device list."""
+
+    def __init__(self, devices):
+        self.devices = list(devices)
+        self.visible = list(devices)  # What PortAudio saw at initialization
+        self.queries = 0
+        self.reinitialized = 0
+        self.default = SimpleNamespace(device=(0, 1))
+
+    def query_devices(self):
+        self.queries += 1
+        return [dict(d, index=i) for i, d in enumerate(self.visible)]
+
+    def query_hostapis(self):
+        return [{'name': 'ALSA'}, {'name': 'JACK Audio Connection Kit'}]
+
+    def _terminate(self):
+        self.visible = []
+
+    def _initialize(self):
+        self.reinitialized += 1
+        self.visible = list(self.devices)
+
+
+class TestDeviceRegistry(unittest.TestCase):
+    """Test enumeration and indexed lookups."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.backend = FakeSoundDevice([
+            device("USB Microphone"),
+            device("Speakers", inputs=0, outputs=2),
+            device("Monitor of Speakers", hostapi=1),
+        ])
+        self.registry = DeviceRegistry(backend=self.backend)
+
+    def test_enumerates_once_and_indexes_devices(self):
+        """Lookups by index, name and host API reuse one enumeration."""
+        self.assertEqual(self.registry.get(2).name, "Monitor of Speakers")
+        self.assertEqual(self.registry.find("usb microphone").index, 0)
+        self.assertEqual(self.registry.find("Speakers").index, 1)
+        self.assertEqual(self.registry.find("monitor").index, 2)
+        self.assertIsNone(self.registry.find("Headset"))
+        self.assertEqual([d.name for d in self.registry.by_hostapi("ALSA")],
+                         ["USB Microphone", "Speakers"])
+        self.assertEqual(self.registry.default_input, 0)
+        self.assertEqual(self.backend.queries, 1)
+
+    def test_refresh_reports_changes_to_listeners(self):
+        """Only a changed device list notifies listeners."""
+        events = []
+        self.registry.devices()
+        self.registry.add_listener(lambda added, removed: events.append((added, removed)))
+
+        self.assertFalse(self.registry.refresh())
+        self.backend.visible = self.backend.visible[:2]
+        self.assertTrue(self.registry.refresh())
+
+        self.assertEqual(len(events), 1)
+        added, removed = events[0]
+        self.assertEqual(added, ())
+        self.assertEqual([d.name for d in removed], ["Monitor of Speakers"])
+        self.assertIsNone(self.registry.get(2))
+
+    def test_poll_detects_hot_plugged_device(self):
+        """The poll re-initializes PortAudio when allowed and finds the new device."""
+        changed = threading.Event()
+        self.registry.devices()
+        self.registry.add_listener(lambda added, removed: changed.set())
+        allowed = threading.Event()
+
+        self.backend.devices.append(device("USB Headset"))
+        self.registry.start_polling(interval=0.01, can_reinitialize=allowed.is_set)
+        self.addCleanup(self.registry.stop_polling)
+
+        # Streams open: the cached list is re-read but PortAudio is left alone
+        self.assertFalse(changed.wait(0.1))
+        self.assertEqual(self.backend.reinitialized, 0)
+
+        allowed.set()
+        self.assertTrue(changed.wait(2.0))
+        self.assertEqual(self.registry.find("USB Headset").index, 3)
+        self.registry.stop_polling()
+        self.assertFalse(self.registry.is_polling)
+
+
+class TestPipelineDevices(unittest.TestCase):
+    """Test that PipelineManager uses the registry and per-stream metadata."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.backend = FakeSoundDevice([
+            device("USB Microphone", hostapi=1),
+            device("Monitor of Speakers"),
+        ])
+        self.registry = DeviceRegistry(backend=self.backend)
+
+    @patch('src.audio.pipeline_manager.ADAPTERS_AVAILABLE', False)
+    def test_device_lists_come_from_cached_enumeration(self):
+        """Pipelines share one enumeration and select devices by name."""
+        pipelines = [PipelineManager(device_registry=self.registry) for _ in range(3)]
+        for pipeline in pipelines:
+            self.addCleanup(pipeline.shutdown)
+        pipeline = pipelines[0]
+
+        self.assertEqual(self.backend.queries, 1)
+        self.assertEqual(pipeline.get_available_devices(AudioSourceType.MICROPHONE), ["USB Microphone"])
+        self.assertTrue(pipeline.set_device(AudioSourceType.SYSTEM_AUDIO, "Monitor of Speakers"))
+        self.assertEqual(pipeline.selected_sys_device, 1)
+        self.assertFalse(pipeline.set_device(AudioSourceType.MICROPHONE, "Monitor of Speakers"))
+
+        pipeline.refresh_audio_devices()
+        self.assertEqual(self.backend.queries, 2)
+        self.assertEqual(pipeline.list_input_devices()[0].hostapi, "JACK Audio Connection Kit")
+
+    @patch('src.audio.pipeline_manager.ADAPTERS_AVAILABLE', False)
+    def test_capture_loop_uses_stream_metadata(self):
+        """Packets carry the metadata built at stream start; no lookup per packet."""
+        pipeline = PipelineManager(device_registry=self.registry, ingest_format=None)
+        self.addCleanup(pipeline.shutdown)
+        frames = iter([np.zeros(160, dtype=np.float32)] * 3)
+        capture = SimpleNamespace(sample_rate=16000, channels=1,
+                                  capture_chunk=lambda: next(frames, None),
+                                  stop_capture=lambda: None)
+
+        pipeline.mic_capture = capture
+        pipeline.selected_mic_device = 0
+        pipeline.mic_active = True
+        pipeline.mic_running.set()
+        thread = threading.Thread(target=pipeline._microphone_capture_loop, daemon=True)
+        thread.start()
+        chunks = [pipeline.mic_queue.get(timeout=2.0) for _ in range(3)]
+
+        # A refresh while the stream runs does not change its metadata
+        self.backend.visible = []
+        pipeline.refresh_audio_devices()
+        pipeline.mic_running.clear()
+        thread.join(timeout=2.0)
+
+        metadata = pipeline.stream_metadata[AudioSourceType.MICROPHONE]
+        self.assertEqual(metadata.device_name, "USB Microphone")
+        self.assertEqual(metadata.source_format.dtype, "float32")
+        self.assertTrue(all(c.device_name == "USB Microphone" for c in chunks))
+        self.assertTrue(all(c.sample_format is metadata.source_format for c in chunks))
+
+
+class TestAudioCaptureDevices(unittest.TestCase):
+    """Test that AudioCapture reads devices from the registry."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.backend = FakeSoundDevice([
+            device("USB Microphone", samplerate=48000.0),
+            device("Monitor of Speakers", hostapi=1),
+        ])
+        self.sd = Mock()
+        patches = [
+            patch('src.audio.capture.get_device_registry',
+                  return_value=DeviceRegistry(backend=self.backend)),
+            patch('src.audio.capture.sd', self.sd),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_construction_does_not_probe_devices(self):
+        """Captures share one enumeration and make no test recording."""
+        captures = [AudioCapture(device="USB Microphone"), AudioCapture(device=1), AudioCapture()]
+
+        self.assertEqual([c.sample_rate for c in captures], [48000, 48000, 48000])
+        self.assertEqual(self.backend.queries, 1)
+        self.sd.query_devices.assert_not_called()
+        self.sd.rec.assert_not_called()
+
+    @patch('src.audio.capture.subprocess.run', side_effect=FileNotFoundError)
+    @patch('src.audio.capture.platform.system', return_value="Linux")
+    def test_loopback_devices_from_registry(self, system, run):
+        """Monitor sources are found in the cached device list."""
+        loopback = AudioCapture().get_loopback_devices()
+
+        self.assertEqual([(d['index'], d['name'], d['hostapi']) for d in loopback],
+                         [(1, "Monitor of Speakers", "JACK Audio Connection Kit")])
+        self.assertEqual(self.backend.queries, 1)
+        self.sd.query_devices.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
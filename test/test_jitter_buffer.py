@@ -0,0 +1,229 @@
+"""
+Unit tests for the jitter buffer and buffered streaming playback.
+
+The fake output stream is driven by the test, one callback per pull, so
+priming, underruns and drain can be checked block by block.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+try:
+    from src.audio.jitter_buffer import BufferedOutputStream, JitterBuffer
+    from src.audio import player as player_module
+    from src.audio.player import AudioPlayer, AudioStreamer
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+SAMPLE_RATE = 1000
+BLOCK_SIZE = 10
+
+
+class FakeOutputStream:
+    """OutputStream whose callback is driven by pull()."""
+
+    def __init__(self, backend, samplerate, channels, callback, blocksize=0, **kwargs):
+        self.channels = channels
+        self.blocksize = blocksize or BLOCK_SIZE
+        self.callback = callback
+        backend.streams.append(self)
+
+    def start(self):
+        pass
+
+    def pull(self, blocks=1):
+        """Run the callback for `blocks` blocks and return the mono output."""
+        output = []
+        for _ in range(blocks):
+            outdata = np.full((self.blocksize, self.channels), np.nan, dtype=np.float32)
+            self.callback(outdata, self.blocksize, None, None)
+            output.append(outdata[:, 0])
+        return np.concatenate(output)
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeSoundDevice:
+    """Backend module replacement recording opened output streams."""
+
+    def __init__(self):
+        self.streams = []
+
+    def OutputStream(self, **kwargs):
+        return FakeOutputStream(self, **kwargs)
+
+
+def counting(start, frames):
+    return np.arange(start, start + frames, dtype=np.float32)
+
+
+class TestJitterBuffer(unittest.TestCase):
+    """Test the preallocated output ring."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    def test_variable_blocks_wrap_around_in_order(self):
+        """Blocks of any size come out in order across the wrap point."""
+        ring = JitterBuffer(16)
+        out = np.zeros((12, 1), dtype=np.float32)
+        self.assertEqual(ring.write(counting(0, 5)), 5)
+        self.assertEqual(ring.write(counting(5, 7)), 7)
+        self.assertEqual(ring.read_into(out), 12)
+        self.assertEqual(ring.write(counting(12, 13)), 13)
+        self.assertEqual(ring.read_into(out), 12)
+        np.testing.assert_array_equal(out[:, 0], counting(12, 12))
+        self.assertEqual(len(ring), 1)
+
+    def test_full_ring_blocks_producer_until_read(self):
+        """A write waits for room, or gives up after its timeout."""
+        ring = JitterBuffer(8)
+        self.assertEqual(ring.write(counting(0, 12), timeout=0.01), 8)
+
+        out = np.zeros((4, 1), dtype=np.float32)
+        threading.Timer(0.05, ring.read_into, args=(out,)).start()
+        started = time.monotonic()
+        self.assertEqual(ring.write(counting(8, 4), timeout=2.0), 4)
+        self.assertLess(time.monotonic() - started, 1.0)
+
+
+class TestBufferedOutputStream(unittest.TestCase):
+    """Test priming, underruns and overruns in the output callback."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.backend = FakeSoundDevice()
+
+    def test_plays_after_target_latency_and_rebuffers_after_underrun(self):
+        """Silence until the target is buffered; an underrun re-primes once."""
+        output = BufferedOutputStream(SAMPLE_RATE, target_latency=0.03, blocksize=BLOCK_SIZE,
+                                      backend=self.backend)
+        self.assertTrue(output.start())
+        self.addCleanup(output.stop)
+        stream = self.backend.streams[0]
+
+        output.push(counting(1, 17))
+        np.testing.assert_array_equal(stream.pull(), 0.0)
+        output.push(counting(18, 13))  # 30 frames buffered: playback starts
+        np.testing.assert_array_equal(stream.pull(3), counting(1, 30))
+
+        output.push(counting(31, 5))
+        np.testing.assert_array_equal(stream.pull(), np.r_[counting(31, 5), np.zeros(5)])
+        self.assertEqual(output.underruns, 1)
+        output.push(counting(36, 10))
+        np.testing.assert_array_equal(stream.pull(), 0.0)  # Re-buffering
+
+        output.finish()
+        np.testing.assert_array_equal(stream.pull(), counting(36, 10))
+        stream.pull()
+        self.assertTrue(output.wait(0))
+        self.assertEqual(output.get_stats()["underruns"], 1)
+
+    def test_producer_fills_ahead_of_a_jittery_source(self):
+        """A source that stalls now and then plays without underruns."""
+        blocks = iter([counting(i * 20, 20) for i in range(10)])
+        delays = iter([0.0, 0.03, 0.0, 0.0, 0.0] * 2)  # Stalls shorter than the target
+
+        def source():
+            time.sleep(next(delays, 0.0))
+            return next(blocks, None)
+
+        output = BufferedOutputStream(SAMPLE_RATE, target_latency=0.08, max_latency=0.3,
+                                      blocksize=BLOCK_SIZE, backend=self.backend)
+        self.assertTrue(output.start(source=source, processor=lambda block: block * 2))
+        self.addCleanup(output.stop)
+        stream = self.backend.streams[0]
+
+        # Pull one block per block duration, like the device would
+        played = []
+        deadline = time.monotonic() + 5.0
+        while not output.wait(0) and time.monotonic() < deadline:
+            played.append(stream.pull())
+            time.sleep(BLOCK_SIZE / SAMPLE_RATE)
+        audio = np.concatenate(played)
+        audio = audio[np.argmax(audio != 0) - 1:]  # From the first sample (0) on
+        np.testing.assert_array_equal(audio[:200], counting(0, 200) * 2)
+        self.assertEqual(output.underruns, 0)
+        self.assertEqual(output.get_stats()["frames_played"], 200)
+
+    def test_push_into_full_buffer_counts_overrun(self):
+        """A push that cannot wait drops what does not fit."""
+        output = BufferedOutputStream(SAMPLE_RATE, target_latency=0.01, max_latency=0.02,
+                                      backend=self.backend)
+        self.assertTrue(output.start())
+        self.addCleanup(output.stop)
+
+        self.assertEqual(output.push(np.ones(25), timeout=0.0), 20)
+        stats = output.get_stats()
+        self.assertEqual((stats["overruns"], stats["dropped_frames"]), (1, 5))
+
+
+class TestPlayerStreaming(unittest.TestCase):
+    """Test the buffered mode of AudioPlayer and AudioStreamer."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.backend = FakeSoundDevice()
+        patcher = patch.object(player_module, "sd", self.backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_player_push_mode_applies_volume(self):
+        """Pushed TTS chunks play back to back at the player volume."""
+        player = AudioPlayer(sample_rate=SAMPLE_RATE, buffer_size=BLOCK_SIZE)
+        self.addCleanup(player.stop_streaming)
+        player.start_streaming(target_latency=0.02)
+        player.set_volume(0.5)
+
+        player.push(np.ones(13))
+        player.push(np.ones(7) * 2)
+        player.buffered_stream.finish()
+        output = self.backend.streams[0].pull(2)
+        np.testing.assert_array_equal(output, np.r_[np.full(13, 0.5), np.ones(7)])
+        self.assertEqual(player.get_streaming_stats()["underruns"], 0)
+
+    def test_streamer_runs_source_off_the_callback(self):
+        """In buffered mode the device callback never calls the source."""
+        calls = []
+
+        def source():
+            calls.append(threading.current_thread().name)
+            return np.ones(BLOCK_SIZE) if len(calls) < 5 else None
+
+        streamer = AudioStreamer(sample_rate=SAMPLE_RATE, buffer_size=BLOCK_SIZE)
+        self.addCleanup(streamer.stop_streaming)
+        streamer.start_streaming(source, target_latency=0.02)
+
+        stream = self.backend.streams[0]
+        deadline = time.monotonic() + 2.0
+        while not streamer.buffered_stream.wait(0) and time.monotonic() < deadline:
+            stream.pull()
+            time.sleep(0.005)
+        self.assertEqual(set(calls), {"StreamProducer"})
+        self.assertEqual(streamer.get_streaming_stats()["frames_played"], 4 * BLOCK_SIZE)
+
+    def test_direct_mode_fills_device_buffer(self):
+        """Without a target latency the callback pads short blocks with silence."""
+        player = AudioPlayer(sample_rate=SAMPLE_RATE, buffer_size=BLOCK_SIZE)
+        self.addCleanup(player.stop_streaming)
+        player.set_volume(0.5)
+        player.start_streaming(lambda: np.ones(6))
+        np.testing.assert_array_equal(self.backend.streams[0].pull(), np.r_[np.full(6, 0.5),
+                                                                           np.zeros(4)])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
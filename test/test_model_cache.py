@@ -0,0 +1,129 @@
+"""
+Unit tests for the shared Ollama model metadata cache.
+"""
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+try:
+    from src.ollama.model_cache import ModelMetadataCache
+    from src.ollama.model_manager import OllamaModelManager
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+def make_client(models=("llama2",), delay=0.0):
+    client = Mock()
+    client.base_url = "http://ollama.test:11434"
+
+    def list_models():
+        time.sleep(delay)
+        return [{"name": name, "size": 4 * 1024 ** 3} for name in client.models]
+
+    client.models = list(models)
+    client.list_models.side_effect = list_models
+    client.get_model_info.side_effect = lambda name: {"details": {"family": "llama"}}
+    return client
+
+
+class TestModelMetadataCache(unittest.TestCase):
+    """Test TTL, single-flight, invalidation and persistence."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.path = Path(self.temp_dir) / "models.json"
+
+    def test_ttl_and_invalidation(self):
+        """Fresh entries are served from memory; invalidation forces a request."""
+        client = make_client()
+        cache = ModelMetadataCache(client, ttl=60)
+        cache.get_models()
+        cache.get_models()
+        cache.get_model_info("llama2")
+        cache.get_model_info("llama2")
+        self.assertEqual(client.list_models.call_count, 1)
+        self.assertEqual(client.get_model_info.call_count, 1)
+
+        client.models.append("mistral")
+        cache.invalidate("mistral")
+        self.assertEqual([m["name"] for m in cache.get_models()], ["llama2", "mistral"])
+        self.assertEqual(client.list_models.call_count, 2)
+
+        # Failed lookups are not cached
+        client.list_models.side_effect = lambda: []
+        cache.invalidate()
+        self.assertEqual(cache.get_models(), [])
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_concurrent_misses_share_one_request(self):
+        """Callers that miss together wait for the same request."""
+        client = make_client(delay=0.1)
+        cache = ModelMetadataCache(client, ttl=60)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_models())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(client.list_models.call_count, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test_persisted_list_served_at_startup(self):
+        """A new cache returns the saved list at once and refreshes it in the background."""
+        cache = ModelMetadataCache(make_client(), ttl=0.01, path=self.path)
+        cache.get_models()
+        time.sleep(0.02)
+
+        client = make_client(models=("llama2", "mistral"), delay=0.1)
+        restarted = ModelMetadataCache(client, ttl=0.01, path=self.path)
+        start = time.perf_counter()
+        self.assertEqual([m["name"] for m in restarted.get_models()], ["llama2"])
+        self.assertLess(time.perf_counter() - start, 0.05)
+        self.assertEqual(restarted.get_stats()["stale_hits"], 1)
+
+        deadline = time.time() + 2
+        while restarted.get_stats()["requests"] < 1 or restarted.last_update == cache.last_update:
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.01)
+        restarted.ttl = 60
+        self.assertEqual([m["name"] for m in restarted.get_models()], ["llama2", "mistral"])
+
+
+class TestModelManagerCache(unittest.TestCase):
+    """Test that the model manager goes through the cache."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    def test_lookups_reuse_cached_list(self):
+        """model_exists and get_model_size do not send a request each."""
+        client = make_client()
+        manager = OllamaModelManager(client, cache=ModelMetadataCache(client, ttl=60))
+        self.assertTrue(manager.model_exists("llama2"))
+        self.assertFalse(manager.model_exists("mistral"))
+        self.assertEqual(manager.get_model_size("llama2"), 4 * 1024 ** 3)
+        self.assertEqual(manager.get_model_info("llama2").details["details"]["family"], "llama")
+        self.assertEqual(client.list_models.call_count, 1)
+
+        client.delete_model.return_value = True
+        client.models.remove("llama2")
+        self.assertTrue(manager.remove_model("llama2"))
+        self.assertFalse(manager.model_exists("llama2"))
+        self.assertEqual(client.list_models.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
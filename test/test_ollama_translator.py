@@ -0,0 +1,136 @@
+"""
+Unit tests for the pooled, streaming Ollama translator against a fake Ollama server.
+"""
+
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from src.translation.translation_memory import TranslationMemory
+    from src.translation.translator import Translator, estimate_num_predict
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """Answers /api/generate with the words of "hola mundo desde ollama"."""
+
+    protocol_version = "HTTP/1.1"
+    words = ["hola", " mundo", " desde", " ollama"]
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.client_address[1], payload))
+        time.sleep(self.server.delay)
+
+        if payload.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            words = self.words[:self.server.stream_words]
+            for i, word in enumerate(words):
+                message = {"response": word, "done": i == len(self.words) - 1}
+                if message["done"] and self.server.done_reason:
+                    message["done_reason"] = self.server.done_reason
+                line = json.dumps(message) + "\n"
+                self.wfile.write(f"{len(line.encode()):x}\r\n{line}\r\n".encode())
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            body = json.dumps({"response": "".join(self.words), "done": True}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+
+class TestOllamaTranslator(unittest.TestCase):
+    """Test connection reuse, request options, streaming and timeouts."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllamaHandler)
+        self.server.requests = []
+        self.server.delay = 0.0
+        self.server.stream_words = None  # Send every word and "done"
+        self.server.done_reason = None
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.translator = Translator(config_path="missing.yaml", memory=TranslationMemory())
+        self.translator.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def test_requests_reuse_one_connection(self):
+        """Consecutive translations go over the same keep-alive connection."""
+        first, _ = self.translator.translate("Hello world from Ollama", "en", "es")
+        self.translator.memory.clear()
+        second, _ = self.translator.translate("Hello world from Ollama", "en", "es")
+
+        self.assertEqual(first, "hola mundo desde ollama")
+        self.assertEqual(second, first)
+        ports = {port for port, _ in self.server.requests}
+        self.assertEqual(len(ports), 1)
+
+        payload = self.server.requests[0][1]
+        self.assertFalse(payload["stream"])
+        self.assertEqual(payload["keep_alive"], "30m")
+        self.assertEqual(payload["options"]["num_predict"],
+                         estimate_num_predict("Hello world from Ollama"))
+
+    def test_num_predict_grows_with_input(self):
+        """Longer inputs get a larger, capped token limit."""
+        self.assertLess(estimate_num_predict("Hi"), estimate_num_predict("Hi " * 100))
+        self.assertEqual(estimate_num_predict("word " * 5000, maximum=256), 256)
+
+    def test_stream_yields_pieces_as_generated(self):
+        """translate_stream yields each piece and stores the full translation."""
+        pieces = list(self.translator.translate_stream("Hello world", "en", "es"))
+        self.assertEqual(pieces, ["hola", " mundo", " desde", " ollama"])
+        self.assertTrue(self.server.requests[0][1]["stream"])
+
+        # The complete translation is now in the translation memory
+        self.assertEqual(list(self.translator.translate_stream("Hello world", "en", "es")),
+                         ["hola mundo desde ollama"])
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_incomplete_stream_is_not_stored(self):
+        """A stream cut off by num_predict or ending without "done" is not cached."""
+        self.server.done_reason = "length"
+        self.assertEqual("".join(self.translator.translate_stream("Hello world", "en", "es")),
+                         "hola mundo desde ollama")
+        self.server.done_reason = None
+        self.server.stream_words = 2
+        self.assertEqual("".join(self.translator.translate_stream("Hello world", "en", "es")),
+                         "hola mundo")
+        self.assertEqual(self.translator.memory.get_stats()["entries"], 0)
+
+        self.server.stream_words = None
+        self.server.done_reason = "stop"
+        list(self.translator.translate_stream("Hello world", "en", "es"))
+        self.assertEqual(list(self.translator.translate_stream("Hello world", "en", "es")),
+                         ["hola mundo desde ollama"])
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_read_timeout(self):
+        """A server slower than the read timeout fails fast instead of hanging."""
+        self.server.delay = 0.5
+        self.translator.read_timeout = 0.1
+        start = time.perf_counter()
+        self.assertEqual(self.translator.translate("Slow", "en", "es"), (None, None))
+        self.assertLess(time.perf_counter() - start, 0.45)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,233 @@
+"""
+Unit tests for the persistent playback engine and AudioPlayerAdapter.
+
+The fake output stream does not run on its own: each test pulls blocks
+from the engine's callback, so gaps, preemption and volume changes can be
+checked sample by sample.
+"""
+
+import io
+import unittest
+import wave
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+try:
+    from src.audio.playback_engine import PlaybackEngine
+    from src.audio.ports import AudioData, AudioFormat, SampleFormat
+    from src.audio.adapters import player_adapter
+    from src.audio.adapters.player_adapter import AudioPlayerAdapter
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+class FakeOutputStream:
+    """OutputStream whose callback is driven by pull()."""
+
+    def __init__(self, backend, samplerate, channels, dtype, device, blocksize, latency, callback):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize or 64
+        self.callback = callback
+        self.latency = 0.01
+        self.closed = False
+        backend.streams.append(self)
+
+    def start(self):
+        pass
+
+    def pull(self, blocks=1):
+        """Run the callback for `blocks` blocks and return the output."""
+        output = []
+        for _ in range(blocks):
+            outdata = np.full((self.blocksize, self.channels), np.nan, dtype=np.float32)
+            self.callback(outdata, self.blocksize, None, None)
+            output.append(outdata)
+        return np.concatenate(output)
+
+    def stop(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSoundDevice:
+    """Backend module replacement recording opened output streams."""
+
+    def __init__(self):
+        self.streams = []
+
+    def OutputStream(self, **kwargs):
+        return FakeOutputStream(self, **kwargs)
+
+
+def ramp(frames, start=1):
+    return np.arange(start, start + frames, dtype=np.float32) / 1000.0
+
+
+class TestPlaybackEngine(unittest.TestCase):
+    """Test queueing, preemption and volume in the output callback."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.backend = FakeSoundDevice()
+        self.engine = PlaybackEngine(backend=self.backend)
+        self.addCleanup(self.engine.close)
+
+    def test_clips_play_back_to_back_without_gap(self):
+        """Consecutive clips fill the same block; silence only follows the last one."""
+        first, second = ramp(100), ramp(50, start=101)
+        clips = [self.engine.play(first, 16000), self.engine.play(second, 16000)]
+        stream = self.backend.streams[0]
+
+        output = stream.pull(3)[:, 0]
+        np.testing.assert_array_equal(output[:150], np.concatenate([first, second]))
+        np.testing.assert_array_equal(output[150:], 0.0)
+        self.assertTrue(all(clip.done.is_set() and not clip.preempted for clip in clips))
+        self.assertEqual(len(self.backend.streams), 1)
+
+        stats = self.engine.get_stats()
+        self.assertEqual(stats["clips_played"], 2)
+        self.assertGreaterEqual(stats["latency_ms"]["max"], 0.0)
+        self.assertEqual(stats["output_latency_ms"], 10.0)
+        self.assertFalse(self.engine.is_playing)
+
+    def test_interrupt_and_stop_take_effect_next_block(self):
+        """A preempting clip starts in the next block; stop() silences it."""
+        long_clip = self.engine.play(np.ones(10000, dtype=np.float32), 16000)
+        queued = self.engine.play(np.ones(100, dtype=np.float32), 16000)
+        stream = self.backend.streams[0]
+        stream.pull()
+
+        urgent = ramp(200)
+        self.engine.play(urgent, 16000, interrupt=True)
+        self.assertTrue(long_clip.preempted and queued.preempted)
+        self.assertTrue(long_clip.wait(0))
+        np.testing.assert_array_equal(stream.pull()[:, 0], urgent[:64])
+
+        self.engine.stop()
+        np.testing.assert_array_equal(stream.pull(), 0.0)
+        self.assertEqual(self.engine.get_stats()["clips_preempted"], 3)
+
+    def test_volume_scales_output_not_clip(self):
+        """Volume changes apply to the playing clip without touching its samples."""
+        samples = np.full(256, 0.5, dtype=np.float32)
+        clip = self.engine.play(samples, 16000)
+        stream = self.backend.streams[0]
+        np.testing.assert_allclose(stream.pull(), 0.5)
+
+        self.engine.volume = 0.5
+        np.testing.assert_allclose(stream.pull(), 0.25)
+        np.testing.assert_array_equal(clip.samples, 0.5)
+
+    def test_other_formats_are_converted_once(self):
+        """Mono clips are broadcast to stereo; other rates are resampled."""
+        engine = PlaybackEngine(sample_rate=16000, channels=2, backend=self.backend)
+        self.addCleanup(engine.close)
+        mono = engine.play(ramp(64), 16000)
+        self.assertEqual(mono.samples.shape, (64, 1))
+        output = self.backend.streams[0].pull()
+        np.testing.assert_array_equal(output[:, 0], output[:, 1])
+
+        # 0.1 s at 48 kHz keeps its length, alignment and tail at 16 kHz
+        tone = np.sin(2 * np.pi * 440 * np.arange(4800) / 48000).astype(np.float32)
+        resampled = engine.play(np.stack([tone, tone], axis=1), 48000)
+        self.assertEqual(resampled.samples.shape, (1600, 2))
+        expected = np.sin(2 * np.pi * 440 * np.arange(1600) / 16000)
+        np.testing.assert_allclose(resampled.samples[16:, 0], expected[16:], atol=0.05)
+
+
+class TestAudioPlayerAdapter(unittest.TestCase):
+    """Test that the adapter decodes once and plays through one stream."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.backend = FakeSoundDevice()
+        patches = [
+            patch.object(player_adapter, "sd", self.backend),
+            patch.object(player_adapter, "SOUNDDEVICE_AVAILABLE", True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.adapter = AudioPlayerAdapter()
+        self.addCleanup(self.adapter.close)
+
+    def test_float32_pcm_is_played_without_copy(self):
+        """Float32 PCM is viewed in place and queued behind the playing clip."""
+        samples = ramp(100)
+        audio_data = AudioData(data=samples.tobytes(), sample_rate=16000, channels=1,
+                               format=AudioFormat.PCM, source_type="tts",
+                               sample_format=SampleFormat("float32", 16000, 1))
+        self.assertTrue(self.adapter.play(audio_data))
+        clip = self.adapter.last_clip
+        self.assertTrue(np.shares_memory(clip.samples, np.frombuffer(audio_data.data, np.float32)))
+
+        self.assertTrue(self.adapter.play(audio_data))
+        self.assertTrue(self.adapter.is_playing())
+        output = self.backend.streams[0].pull(4)[:, 0]
+        np.testing.assert_array_equal(output[:200], np.concatenate([samples, samples]))
+        self.assertFalse(self.adapter.is_playing())
+        self.assertEqual(self.adapter.get_playback_stats()["clips_played"], 2)
+
+    def test_int16_pcm_and_wav_are_decoded(self):
+        """16-bit PCM and WAV files are scaled to [-1, 1] with their own format."""
+        pcm = np.array([16384, -16384, 8192, -8192], dtype=np.int16)
+        legacy = AudioData(data=pcm.tobytes(), sample_rate=8000, channels=2,
+                           format=AudioFormat.PCM, source_type="tts")
+        samples, sample_rate = self.adapter._decode(legacy)
+        self.assertEqual(sample_rate, 8000)
+        np.testing.assert_array_equal(samples, [[0.5, -0.5], [0.25, -0.25]])
+
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(22050)
+            wav_file.writeframes(pcm.tobytes())
+        wav = AudioData(data=wav_buffer.getvalue(), sample_rate=22050, channels=1,
+                        format=AudioFormat.WAV, source_type="tts")
+        samples, sample_rate = self.adapter._decode(wav)
+        self.assertEqual((samples.shape, sample_rate), ((4, 1), 22050))
+
+        mp3 = AudioData(data=b"ID3", sample_rate=22050, channels=1,
+                        format=AudioFormat.MP3, source_type="tts")
+        with patch.object(player_adapter, "SOUNDFILE_AVAILABLE", False):
+            self.assertFalse(self.adapter.play(mp3))
+
+    def test_float_wav_and_mp3_are_decoded_with_soundfile(self):
+        """Files the wave module cannot read fall back to soundfile."""
+        fake_sf = Mock()
+        fake_sf.read.return_value = (np.zeros((10, 2), dtype=np.float32), 44100)
+        for p in (patch.object(player_adapter, "sf", fake_sf),
+                  patch.object(player_adapter, "SOUNDFILE_AVAILABLE", True)):
+            p.start()
+            self.addCleanup(p.stop)
+
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, 'wb') as wav_file:
+            wav_file.setnchannels(2)
+            wav_file.setsampwidth(4)
+            wav_file.setframerate(44100)
+            wav_file.writeframes(np.zeros(20, dtype=np.float32).tobytes())
+        header = bytearray(wav_buffer.getvalue())
+        header[20:22] = (3).to_bytes(2, "little")  # WAVE_FORMAT_IEEE_FLOAT
+        float_wav = AudioData(data=bytes(header), sample_rate=44100, channels=2,
+                              format=AudioFormat.WAV, source_type="tts")
+        mp3 = AudioData(data=b"ID3", sample_rate=44100, channels=2,
+                        format=AudioFormat.MP3, source_type="tts")
+
+        for audio_data in (float_wav, mp3):
+            samples, sample_rate = self.adapter._decode(audio_data)
+            self.assertEqual((samples.shape, sample_rate), ((10, 2), 44100))
+        self.assertEqual(fake_sf.read.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,205 @@
+"""
+Unit tests for incremental (streaming) speech-to-text.
+
+Tests the local-agreement StreamingTranscriber and the streaming mode of
+PipelineManager using a fake engine, so no Whisper model is required.
+"""
+
+import unittest
+import time
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+try:
+    from src.stt.streaming import StreamingTranscriber
+    from src.audio.pipeline_manager import PipelineManager, AudioSourceType, AudioStreamData
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+SAMPLE_RATE = 16000
+WORDS = "the quick brown fox jumps over the lazy dog again and again".split()
+
+
+class FakeEngine:
+    """Engine that 'hears' one word every 0.5 s.
+
+    Samples carry their absolute time (t / 100), so the engine can tell which
+    part of the utterance the window covers. The last, partially heard word
+    is returned misspelled to make the tail unstable.
+    """
+
+    def __init__(self):
+        self.window_lengths = []
+
+    def transcribe_array_with_metadata(self, audio, sample_rate, language=None,
+                                       initial_prompt=None, word_timestamps=True):
+        self.window_lengths.append(len(audio) / sample_rate)
+        window_start = float(audio[0]) * 100
+        window_end = window_start + len(audio) / sample_rate
+        words = []
+        for i, text in enumerate(WORDS):
+            start, end = i * 0.5, i * 0.5 + 0.4
+            if end <= window_start + 1e-6:
+                continue
+            if start >= window_end:
+                break
+            if end > window_end:
+                text = text[:2] + "?"
+            words.append({"word": " " + text, "start": max(0.0, start - window_start),
+                          "end": min(end, window_end) - window_start})
+        return {"text": " ".join(w["word"] for w in words), "language": "en",
+                "segments": [{"words": words}]}
+
+
+def timed_audio(start: float, duration: float) -> np.ndarray:
+    """Audio whose sample values encode their absolute time."""
+    t = start + np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    return (t / 100).astype(np.float32)
+
+
+class TestStreamingTranscriber(unittest.TestCase):
+    """Test the local-agreement streaming transcriber."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    def test_local_agreement_commits_stable_prefix(self):
+        """Words are committed once two consecutive hypotheses agree."""
+        engine = FakeEngine()
+        stream = StreamingTranscriber(engine, step_seconds=1.0, min_window_seconds=1.0)
+
+        updates = []
+        for second in range(4):
+            update = stream.push(timed_audio(second, 1.0))
+            self.assertIsNotNone(update)
+            updates.append(update)
+
+        # First decode has nothing to agree with
+        self.assertEqual(updates[0].committed_text, "")
+        self.assertIn("the quick", updates[0].unstable_text)
+
+        # Later decodes commit the agreed prefix and never revise it
+        self.assertTrue(updates[1].committed_text.startswith("the quick"))
+        for previous, current in zip(updates, updates[1:]):
+            self.assertTrue(current.committed_text.startswith(previous.committed_text))
+        self.assertNotIn("?", updates[-1].committed_text)
+
+        final = stream.finish()
+        self.assertTrue(final.is_final)
+        self.assertEqual(final.committed_text, " ".join(WORDS[:8]))
+
+    def test_only_unstable_tail_is_redecoded(self):
+        """The window is trimmed to the last committed word."""
+        engine = FakeEngine()
+        stream = StreamingTranscriber(engine, step_seconds=1.0, min_window_seconds=1.0)
+
+        for second in range(5):
+            stream.push(timed_audio(second, 1.0))
+
+        # Without trimming the fifth window would cover all 5 seconds
+        self.assertLess(engine.window_lengths[-1], 3.0)
+        self.assertLess(stream.window_seconds, 2.0)
+
+    def test_pcm_input_and_step_size(self):
+        """No decode happens until a full step of new audio is buffered."""
+        engine = FakeEngine()
+        stream = StreamingTranscriber(engine, step_seconds=1.0)
+
+        pcm = (timed_audio(0, 0.5) * 32767).astype(np.int16).tobytes()
+        self.assertIsNone(stream.push_pcm(pcm, SAMPLE_RATE))
+        self.assertEqual(engine.window_lengths, [])
+
+
+class TestPipelineStreamingMode(unittest.TestCase):
+    """Test streaming STT integration in PipelineManager."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    @patch('src.audio.pipeline_manager.ADAPTERS_AVAILABLE', False)
+    def test_partial_and_final_transcripts(self):
+        """Partial hypotheses are emitted while speaking, final text on silence."""
+        on_transcript = Mock()
+        on_partial = Mock()
+        pipeline = PipelineManager(on_transcript=on_transcript, streaming_stt=True,
+                                   on_partial_transcript=on_partial)
+        pipeline.silence_duration = 0.0
+
+        engine = FakeEngine()
+        pipeline.stt_adapter = Mock()
+        pipeline.stt_adapter.create_stream.side_effect = \
+            lambda language=None: StreamingTranscriber(engine)
+
+        def chunk(audio):
+            return AudioStreamData(
+                source_type=AudioSourceType.MICROPHONE,
+                audio_data=(audio * 32767).astype(np.int16).tobytes(),
+                timestamp=time.time(),
+                device_name="test_device",
+                sample_rate=SAMPLE_RATE,
+                channels=1
+            )
+
+        pipeline.vad = Mock()
+        pipeline.vad.is_speech.return_value = True
+        for second in range(3):
+            pipeline._process_audio_for_transcript(chunk(timed_audio(second, 1.0)))
+
+        self.assertIn(AudioSourceType.MICROPHONE, pipeline.stt_streams)
+        self.assertEqual(on_partial.call_count, 3)
+        source, committed, unstable, language = on_partial.call_args[0]
+        self.assertEqual(source, "microphone")
+        self.assertTrue(committed.startswith("the quick"))
+        on_transcript.assert_not_called()
+
+        pipeline.vad.is_speech.return_value = False
+        pipeline._process_audio_for_transcript(chunk(timed_audio(3, 0.1)))
+
+        self.assertNotIn(AudioSourceType.MICROPHONE, pipeline.stt_streams)
+        on_transcript.assert_called_once()
+        source, text, language, confidence = on_transcript.call_args[0]
+        self.assertEqual(source, "microphone")
+        self.assertTrue(text.startswith("the quick brown fox jumps"))
+
+    @patch('src.audio.pipeline_manager.ADAPTERS_AVAILABLE', False)
+    def test_stop_finishes_open_session(self):
+        """Stopping mid-utterance delivers the session's text instead of dropping it."""
+        on_transcript = Mock()
+        pipeline = PipelineManager(on_transcript=on_transcript, streaming_stt=True)
+        engine = FakeEngine()
+        pipeline.stt_adapter = Mock()
+        pipeline.stt_adapter.create_stream.side_effect = \
+            lambda language=None: StreamingTranscriber(engine)
+        pipeline.vad = Mock()
+        pipeline.vad.is_speech.return_value = True
+
+        for second in range(2):
+            pipeline._process_audio_for_transcript(AudioStreamData(
+                source_type=AudioSourceType.MICROPHONE,
+                audio_data=(timed_audio(second, 1.0) * 32767).astype(np.int16).tobytes(),
+                timestamp=time.time(),
+                device_name="test_device",
+                sample_rate=SAMPLE_RATE,
+                channels=1
+            ))
+        self.assertIn(AudioSourceType.MICROPHONE, pipeline.stt_streams)
+        on_transcript.assert_not_called()
+
+        pipeline.processing_running.set()
+        self.assertTrue(pipeline.stop_processing())
+
+        self.assertEqual(pipeline.stt_streams, {})
+        self.assertEqual(pipeline.open_streams, set())
+        on_transcript.assert_called_once()
+        source, text, language, confidence = on_transcript.call_args[0]
+        self.assertEqual(source, "microphone")
+        self.assertTrue(text.startswith("the quick"))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,150 @@
+"""
+Unit tests for the TTS synthesis cache and warm-up.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    from src.tts import synthesizer
+    from src.tts.synthesis_cache import (
+        SynthesisCache, DEFAULT_VOICE, make_cache_key, voice_fingerprint
+    )
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+class TestSynthesisCache(unittest.TestCase):
+    """Test the memory LRU and on-disk store."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_key_normalizes_text(self):
+        """Whitespace and Unicode form do not change the key; other fields do."""
+        key = make_cache_key("Hello  world\n", DEFAULT_VOICE, "en", "model")
+        self.assertEqual(key, make_cache_key(" Hello world", DEFAULT_VOICE, "en", "model"))
+        self.assertEqual(make_cache_key("café", DEFAULT_VOICE, "en", "m"),
+                         make_cache_key("café", DEFAULT_VOICE, "en", "m"))
+        self.assertNotEqual(key, make_cache_key("hello world", DEFAULT_VOICE, "en", "model"))
+        self.assertNotEqual(key, make_cache_key("Hello world", DEFAULT_VOICE, "es", "model"))
+        self.assertNotEqual(key, make_cache_key("Hello world", DEFAULT_VOICE, "en", "other"))
+
+    def test_voice_fingerprint_uses_contents(self):
+        """Samples are identified by content, not by path."""
+        first = os.path.join(self.cache_dir, "a.wav")
+        second = os.path.join(self.cache_dir, "b.wav")
+        for path in (first, second):
+            with open(path, "wb") as f:
+                f.write(b"same voice")
+
+        self.assertEqual(voice_fingerprint([first]), voice_fingerprint([second]))
+        self.assertEqual(voice_fingerprint(None), DEFAULT_VOICE)
+        self.assertEqual(voice_fingerprint(["missing.wav"]), DEFAULT_VOICE)
+
+        with open(second, "wb") as f:
+            f.write(b"another voice")
+        self.assertNotEqual(voice_fingerprint([first]), voice_fingerprint([second]))
+
+    def test_memory_lru_and_disk_promotion(self):
+        """Evicted memory entries are still served from disk."""
+        cache = SynthesisCache(max_entries=2, cache_dir=self.cache_dir)
+        for i in range(3):
+            cache.put(f"key{i}", f"audio{i}".encode())
+
+        self.assertEqual(cache.get("key2"), b"audio2")
+        self.assertEqual(cache.get("key0"), b"audio0")  # From disk
+        self.assertIsNone(cache.get("unknown"))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["disk_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["memory_entries"], 2)
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+
+        # A new instance picks up the store
+        reopened = SynthesisCache(max_entries=2, cache_dir=self.cache_dir)
+        self.assertEqual(reopened.get_stats()["disk_bytes"], stats["disk_bytes"])
+        self.assertEqual(reopened.get("key1"), b"audio1")
+
+    def test_disk_size_cap(self):
+        """The least recently used disk entries are evicted past the cap."""
+        cache = SynthesisCache(max_entries=0, cache_dir=self.cache_dir, max_disk_bytes=250)
+        for i in range(3):
+            cache.put(f"key{i}", bytes(100))
+            path = cache._path(f"key{i}")
+            os.utime(path, (i, i))
+
+        self.assertLessEqual(cache.get_stats()["disk_bytes"], 250)
+        self.assertIsNone(cache.get("key0"))
+        self.assertIsNotNone(cache.get("key2"))
+
+
+class TestCachedSynthesis(unittest.TestCase):
+    """Test synthesize_voice and warm_up_synthesis with a fake model."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.cache_dir = tempfile.mkdtemp()
+        self.cloner = Mock(model_name="test-model", spec=["tts", "model_name", "get_model_info"])
+        self.cloner.get_model_info.return_value = {"model_name": "test-model"}
+
+        patches = [
+            patch.object(synthesizer, "_voice_cloner", self.cloner),
+            patch.object(synthesizer, "_synthesis_cache",
+                         SynthesisCache(max_entries=8, cache_dir=self.cache_dir)),
+            patch.object(synthesizer, "_synthesize_default_voice",
+                         side_effect=lambda text, **kwargs: f"wav:{text}".encode()),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_repeated_text_is_not_resynthesized(self):
+        """The second call is a cache hit, also when writing to a file."""
+        first = synthesizer.synthesize_voice("Welcome back", clone_voice=False)
+        second = synthesizer.synthesize_voice("Welcome  back ", clone_voice=False)
+        self.assertEqual(first, second)
+        self.assertEqual(synthesizer._synthesize_default_voice.call_count, 1)
+
+        output_path = os.path.join(self.cache_dir, "out.wav")
+        self.assertEqual(synthesizer.synthesize_voice("Welcome back", output_path=output_path,
+                                                      clone_voice=False), output_path)
+        with open(output_path, "rb") as f:
+            self.assertEqual(f.read(), first)
+
+        synthesizer.synthesize_voice("Welcome back", language="es", clone_voice=False)
+        self.assertEqual(synthesizer._synthesize_default_voice.call_count, 2)
+
+        cache_info = synthesizer.get_synthesis_info()["cache"]
+        self.assertEqual(cache_info["hits"], 2)
+        self.assertEqual(cache_info["misses"], 2)
+
+    def test_warm_up_precomputes_phrases(self):
+        """Warm-up synthesizes each phrase once per language."""
+        summary = synthesizer.warm_up_synthesis(["Hello", "Goodbye"], languages=["en", "es"])
+        self.assertTrue(summary["model_loaded"])
+        self.assertEqual(summary["synthesized"], 4)
+
+        summary = synthesizer.warm_up_synthesis(["Hello"], languages=["en"])
+        self.assertEqual(summary["cached"], 1)
+        self.assertEqual(synthesizer._synthesize_default_voice.call_count, 4)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
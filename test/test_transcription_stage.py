@@ -0,0 +1,295 @@
+"""
+Unit tests for the transcription worker stage.
+
+Tests per-source ordering, parallelism between sources, backpressure
+policies and the PipelineManager integration.
+"""
+
+import unittest
+import time
+import random
+import threading
+from unittest.mock import Mock, patch
+
+try:
+    from src.audio.transcription_stage import TranscriptionStage, BackpressurePolicy
+    from src.audio.pipeline_manager import PipelineManager, AudioSourceType, AudioStreamData, StreamingChunk
+    from src.audio.ports import TranscriptionResult
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+class Collector:
+    """Thread-safe record of delivered results."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = []
+        self.done = threading.Event()
+        self.expected = None
+
+    def __call__(self, source, sequence, result):
+        with self.lock:
+            self.results.append((source, sequence, result))
+            if self.expected is not None and len(self.results) >= self.expected:
+                self.done.set()
+
+    def for_source(self, source):
+        with self.lock:
+            return [(sequence, result) for s, sequence, result in self.results if s == source]
+
+
+class TestTranscriptionStage(unittest.TestCase):
+    """Test the bounded transcription stage."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    def test_results_delivered_in_order_per_source(self):
+        """Out-of-order completion is reordered by sequence number."""
+        rng = random.Random(0)
+        delays = [rng.uniform(0.0, 0.02) for _ in range(20)]
+
+        def process(source, payload):
+            time.sleep(delays[payload])
+            return payload
+
+        collector = Collector()
+        collector.expected = 20
+        stage = TranscriptionStage(process, collector, num_workers=4, max_queue_size=32,
+                                   max_in_flight_per_source=4)
+        stage.start()
+        try:
+            for i in range(20):
+                stage.submit("microphone", i)
+            self.assertTrue(collector.done.wait(5.0))
+        finally:
+            stage.stop()
+
+        delivered = collector.for_source("microphone")
+        self.assertEqual([sequence for sequence, _ in delivered], list(range(20)))
+        self.assertEqual([result for _, result in delivered], list(range(20)))
+
+    def test_slow_source_does_not_starve_other_source(self):
+        """System audio is transcribed while a microphone job is still running."""
+        release = threading.Event()
+
+        def process(source, payload):
+            if source == "microphone":
+                release.wait(2.0)
+            return payload
+
+        collector = Collector()
+        stage = TranscriptionStage(process, collector, num_workers=2)
+        stage.start()
+        try:
+            stage.submit("microphone", "slow")
+            stage.submit("system_audio", "fast")
+            deadline = time.time() + 2.0
+            while not collector.for_source("system_audio") and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(collector.for_source("system_audio"), [(0, "fast")])
+            self.assertEqual(collector.for_source("microphone"), [])
+        finally:
+            release.set()
+            stage.stop()
+
+    def test_drop_oldest_policy(self):
+        """A full queue drops its oldest job and later results are not blocked."""
+        collector = Collector()
+        stage = TranscriptionStage(lambda source, payload: payload, collector,
+                                   max_queue_size=2, policy="drop_oldest")
+
+        for payload in ("a", "b", "c"):
+            stage.submit("microphone", payload)
+        self.assertEqual(stage.get_stats()['dropped'], 1)
+        self.assertEqual(stage.get_stats()['queue_depth'], 2)
+
+        collector.expected = 2
+        stage.start()
+        try:
+            self.assertTrue(collector.done.wait(2.0))
+        finally:
+            stage.stop()
+        self.assertEqual(collector.for_source("microphone"), [(1, "b"), (2, "c")])
+
+    def test_coalesce_policy(self):
+        """A full queue merges new audio into the pending job of the same source."""
+        collector = Collector()
+        stage = TranscriptionStage(lambda source, payload: payload, collector,
+                                   max_queue_size=2, policy=BackpressurePolicy.COALESCE,
+                                   coalesce=lambda old, new: old + new)
+
+        stage.submit("microphone", [1])
+        stage.submit("system_audio", [2])
+        self.assertIsNone(stage.submit("microphone", [3]))
+        stats = stage.get_stats()
+        self.assertEqual(stats['coalesced'], 1)
+        self.assertEqual(stats['dropped'], 0)
+
+        collector.expected = 2
+        stage.start()
+        try:
+            self.assertTrue(collector.done.wait(2.0))
+        finally:
+            stage.stop()
+        self.assertEqual(collector.for_source("microphone"), [(0, [1, 3])])
+
+    def test_undroppable_jobs_are_merged_or_queued(self):
+        """Backpressure never discards a job submitted with droppable=False."""
+        collector = Collector()
+        stage = TranscriptionStage(lambda source, payload: payload, collector,
+                                   max_queue_size=2, policy="drop_oldest",
+                                   coalesce=lambda old, new: None if old[-1] == "end" else old + new)
+
+        stage.submit("microphone", ["a"], droppable=False)
+        stage.submit("microphone", ["b", "end"], droppable=False)
+        self.assertIsNotNone(stage.submit("microphone", ["c"], droppable=False))
+        self.assertIsNone(stage.submit("microphone", ["d"], droppable=False))
+        stats = stage.get_stats()
+        self.assertEqual((stats['dropped'], stats['coalesced'], stats['queue_depth']), (0, 1, 3))
+
+        collector.expected = 3
+        stage.start()
+        try:
+            self.assertTrue(collector.done.wait(2.0))
+        finally:
+            stage.stop()
+        self.assertEqual(collector.for_source("microphone"),
+                         [(0, ["a"]), (1, ["b", "end"]), (2, ["c", "d"])])
+
+    def test_failed_job_is_skipped(self):
+        """A job that raises leaves a gap instead of blocking the source."""
+        def process(source, payload):
+            if payload == "bad":
+                raise RuntimeError("model error")
+            return payload
+
+        collector = Collector()
+        collector.expected = 2
+        stage = TranscriptionStage(process, collector)
+        stage.start()
+        try:
+            for payload in ("ok", "bad", "fine"):
+                stage.submit("microphone", payload)
+            self.assertTrue(collector.done.wait(2.0))
+        finally:
+            stage.stop()
+        self.assertEqual(collector.for_source("microphone"), [(0, "ok"), (2, "fine")])
+        self.assertEqual(stage.get_stats()['failed'], 1)
+
+    def test_restart_after_stop_with_pending_jobs(self):
+        """Jobs discarded by stop() do not block results after a restart."""
+        release = threading.Event()
+
+        def process(source, payload):
+            if payload == "slow":
+                release.wait(2.0)
+            return payload
+
+        collector = Collector()
+        stage = TranscriptionStage(process, collector, num_workers=1)
+        stage.start()
+        for payload in ("slow", "b", "c"):
+            stage.submit("microphone", payload)
+        deadline = time.time() + 2.0
+        while stage.get_stats()['in_flight'] == 0 and time.time() < deadline:
+            time.sleep(0.005)
+        threading.Timer(0.05, release.set).start()
+        stage.stop()
+        self.assertEqual(stage.get_stats()['dropped'], 2)
+
+        collector.expected = 2
+        stage.start()
+        try:
+            stage.submit("microphone", "after restart")
+            self.assertTrue(collector.done.wait(2.0))
+        finally:
+            stage.stop()
+        self.assertEqual(collector.for_source("microphone"), [(0, "slow"), (3, "after restart")])
+
+
+class TestPipelineTranscriptionStage(unittest.TestCase):
+    """Test the transcription stage inside PipelineManager."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    @patch('src.audio.pipeline_manager.ADAPTERS_AVAILABLE', False)
+    def test_health_reports_stage_stats(self):
+        """Queue depth and wait times are part of the pipeline health."""
+        pipeline = PipelineManager(stt_queue_size=4, stt_backpressure="coalesce")
+        health = pipeline.get_pipeline_health()
+
+        self.assertIn('transcription_stage', health['components'])
+        stats = health['performance']['transcription_stage']
+        self.assertEqual(stats['policy'], 'coalesce')
+        self.assertEqual(stats['max_queue_size'], 4)
+        for key in ('queue_depth', 'avg_wait_time', 'max_wait_time', 'dropped'):
+            self.assertIn(key, stats)
+
+    @patch('src.audio.pipeline_manager.ADAPTERS_AVAILABLE', False)
+    def test_streaming_chunks_survive_drop_oldest(self):
+        """Streaming audio is merged under backpressure and a finish chunk is kept."""
+        pipeline = PipelineManager(stt_queue_size=1)
+        stage = pipeline.transcription_stage
+
+        def chunk(data):
+            return AudioStreamData(source_type=AudioSourceType.MICROPHONE, audio_data=data,
+                                   timestamp=time.time(), device_name="test_device")
+
+        with patch.object(stage, "is_running", return_value=True):
+            pipeline._submit_transcription(AudioSourceType.MICROPHONE, StreamingChunk(chunk(b"\x01\x00")))
+            pipeline._submit_transcription(AudioSourceType.MICROPHONE, StreamingChunk(chunk(b"\x02\x00"), True))
+            pipeline._submit_transcription(AudioSourceType.MICROPHONE, StreamingChunk(chunk(b"\x03\x00")))
+
+        stats = stage.get_stats()
+        self.assertEqual((stats['dropped'], stats['coalesced'], stats['queue_depth']), (0, 1, 2))
+        finishing, next_session = [job.payload for job in stage._pending]
+        self.assertTrue(finishing.finish)
+        self.assertEqual(finishing.stream_data.audio_data, b"\x01\x00\x02\x00")
+        self.assertFalse(next_session.finish)
+
+    def test_buffered_audio_does_not_block_on_stt(self):
+        """The processing thread only queues utterances; workers deliver them."""
+        on_transcript = Mock()
+        pipeline = PipelineManager(on_transcript=on_transcript)
+        release = threading.Event()
+
+        def slow_transcribe(audio_data):
+            release.wait(2.0)
+            return TranscriptionResult(text="hello there", language="en", confidence=0.9)
+
+        pipeline.stt_adapter = Mock()
+        pipeline.stt_adapter.transcribe.side_effect = slow_transcribe
+        pipeline.translation_adapter = None
+
+        pipeline.transcription_stage.start()
+        try:
+            pipeline._add_to_audio_buffer(AudioStreamData(
+                source_type=AudioSourceType.MICROPHONE,
+                audio_data=b"\x00\x01" * 1600,
+                timestamp=time.time(),
+                device_name="test_device"
+            ))
+            start = time.time()
+            pipeline._process_buffered_audio(AudioSourceType.MICROPHONE)
+            self.assertLess(time.time() - start, 0.5)
+            on_transcript.assert_not_called()
+
+            release.set()
+            deadline = time.time() + 2.0
+            while not on_transcript.called and time.time() < deadline:
+                time.sleep(0.01)
+            on_transcript.assert_called_once_with("microphone", "hello there", "en", 0.9)
+        finally:
+            release.set()
+            pipeline.transcription_stage.stop()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,196 @@
+"""
+Unit tests for batched translation and the micro-batching queue.
+"""
+
+import threading
+import time
+import unittest
+from contextlib import nullcontext
+from unittest.mock import Mock, patch
+
+try:
+    from src.translation import offline_translator
+    from src.translation.batching import TranslationBatcher, make_length_buckets
+    from src.translation.model_registry import TranslationModelRegistry
+    from src.translation.offline_translator import OfflineTranslator, TranslationError
+    from src.translation.translation_memory import TranslationMemory
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+class FakeTokenizer:
+    """Whitespace tokenizer that pads batches the way MarianTokenizer does."""
+
+    def __call__(self, texts, return_tensors=None, padding=False, truncation=False, max_length=None):
+        rows = [text.split()[:max_length] for text in texts]
+        if padding:
+            width = max(len(row) for row in rows)
+            rows = [row + ["<pad>"] * (width - len(row)) for row in rows]
+        return {"input_ids": rows}
+
+    def batch_decode(self, rows, skip_special_tokens=False):
+        return [" ".join(word.upper() for word in row if word != "<pad>") for row in rows]
+
+
+class FakeModel:
+    """Records the padded shape of every generate() call."""
+
+    def __init__(self):
+        self.shapes = []
+
+    def generate(self, input_ids):
+        self.shapes.append((len(input_ids), len(input_ids[0])))
+        return input_ids
+
+
+class TestLengthBuckets(unittest.TestCase):
+    """Test grouping texts into token-bounded batches."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    def test_batches_respect_token_budget(self):
+        """Each batch pads to at most max_tokens; every text is in one batch."""
+        lengths = [5, 40, 6, 38, 5, 100, 7]
+        batches = make_length_buckets(lengths, max_tokens=80, max_batch_size=8)
+
+        self.assertEqual(sorted(i for batch in batches for i in batch), list(range(len(lengths))))
+        for batch in batches:
+            longest = max(lengths[i] for i in batch)
+            self.assertTrue(len(batch) == 1 or len(batch) * longest <= 80)
+        # Similar lengths end up together
+        self.assertIn([1, 3], batches)
+        self.assertIn([5], batches)
+
+    def test_batch_size_limit(self):
+        """max_batch_size caps the texts per batch."""
+        batches = make_length_buckets([1] * 10, max_tokens=1000, max_batch_size=4)
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+
+
+class TestBatchedTranslation(unittest.TestCase):
+    """Test OfflineTranslator.translate_batch with a fake MarianMT model."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.model = FakeModel()
+        fake_torch = Mock()
+        fake_torch.no_grad.side_effect = nullcontext
+        for p in [patch.object(offline_translator, "torch", fake_torch),
+                  patch.object(offline_translator, "HF_AVAILABLE", True),
+                  patch.object(OfflineTranslator, "_read_hf_model",
+                               return_value=(self.model, FakeTokenizer()))]:
+            p.start()
+            self.addCleanup(p.stop)
+
+        self.translator = OfflineTranslator(preferred_engine="huggingface",
+                                            registry=TranslationModelRegistry(),
+                                            memory=TranslationMemory(),
+                                            max_tokens_per_batch=12, max_batch_size=8)
+        self.translator.argos_available = False
+        self.translator.hf_available = True
+
+    def test_one_generate_call_per_bucket(self):
+        """Short and long texts are batched separately, results keep their order."""
+        texts = ["a b", "one two three four five six", "c d", "", "e f",
+                 "seven eight nine ten eleven twelve"]
+        results = self.translator.translate_batch(texts, "en", "es")
+
+        self.assertEqual(results, ["A B", "ONE TWO THREE FOUR FIVE SIX", "C D", "", "E F",
+                                   "SEVEN EIGHT NINE TEN ELEVEN TWELVE"])
+        self.assertEqual(sorted(self.model.shapes), [(2, 6), (3, 2)])
+
+    def test_single_text_is_not_padded_to_max_length(self):
+        """translate() pads a sentence to its own length only."""
+        self.assertEqual(self.translator.translate("hola mundo", "es", "en"), "HOLA MUNDO")
+        self.assertEqual(self.model.shapes, [(1, 2)])
+
+    def test_missing_model_fails_per_text(self):
+        """Texts no engine can translate come back as None; the others are kept."""
+        self.translator.translate("memorized", "en", "xx")
+        with patch.object(OfflineTranslator, "_load_hf_model", return_value=None):
+            with self.assertRaises(TranslationError):
+                self.translator.translate("hello", "en", "xx")
+            self.assertEqual(self.translator.translate_batch(["hello", "", "memorized"], "en", "xx"),
+                             [None, "", "MEMORIZED"])
+
+
+class TestTranslationBatcher(unittest.TestCase):
+    """Test merging concurrent requests into batches."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.calls = []
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        self.calls.append((list(texts), source_lang, target_lang))
+        time.sleep(0.01)
+        return [f"{target_lang}:{text}" for text in texts]
+
+    def test_concurrent_callers_share_batches(self):
+        """Requests arriving within the window go out in one call per language pair."""
+        batcher = TranslationBatcher(self.translate_batch, window=0.05)
+        self.addCleanup(batcher.close)
+        results = {}
+
+        def worker(i):
+            target = "es" if i % 2 else "fr"
+            results[i] = batcher.translate(f"text {i}", "en", target, timeout=2.0)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results[3], "es:text 3")
+        self.assertEqual(results[4], "fr:text 4")
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(sorted(call[2] for call in self.calls), ["es", "fr"])
+
+        stats = batcher.get_stats()
+        self.assertEqual(stats["requests"], 8)
+        self.assertEqual(stats["batches"], 2)
+        self.assertEqual(stats["average_batch_size"], 4.0)
+
+    def test_errors_reach_every_caller(self):
+        """An exception from the batch function is raised to each waiting caller."""
+        def failing(texts, source_lang, target_lang):
+            raise TranslationError("model crashed")
+
+        batcher = TranslationBatcher(failing, window=0.01)
+        self.addCleanup(batcher.close)
+        futures = [batcher.submit("hello", "en", "es") for _ in range(3)]
+        for future in futures:
+            with self.assertRaises(TranslationError):
+                future.result(timeout=2.0)
+        self.assertEqual(batcher.get_stats()["errors"], 1)
+
+    def test_untranslated_text_fails_only_its_caller(self):
+        """A None result raises for that request; the rest of the batch succeeds."""
+        def partial(texts, source_lang, target_lang):
+            return [None if text == "bad" else text.upper() for text in texts]
+
+        batcher = TranslationBatcher(partial, window=0.05)
+        self.addCleanup(batcher.close)
+        futures = [batcher.submit(text, "en", "es") for text in ("good", "bad", "fine")]
+        self.assertEqual(futures[0].result(timeout=2.0), "GOOD")
+        self.assertEqual(futures[2].result(timeout=2.0), "FINE")
+        with self.assertRaises(TranslationError):
+            futures[1].result(timeout=2.0)
+        self.assertEqual(batcher.get_stats()["batches"], 1)
+
+    def test_zero_window_translates_directly(self):
+        """With no window the request is translated on the caller's thread."""
+        batcher = TranslationBatcher(self.translate_batch, window=0)
+        self.assertEqual(batcher.translate("hi", "en", "de"), "de:hi")
+        self.assertIsNone(batcher._thread)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
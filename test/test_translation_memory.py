@@ -0,0 +1,140 @@
+"""
+Unit tests for the translation memory.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+try:
+    from src.translation import translator as translator_module
+    from src.translation.model_registry import TranslationModelRegistry
+    from src.translation.offline_translator import OfflineTranslator
+    from src.translation.translation_memory import TranslationMemory, make_memory_key
+    from src.translation.translator import Translator
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+class TestTranslationMemory(unittest.TestCase):
+    """Test exact, persistent and fuzzy lookups."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+        self.db_path = Path(self.temp_dir) / "memory.sqlite3"
+
+    def test_key_covers_engine_model_and_languages(self):
+        """Whitespace does not matter; engine, model and languages do."""
+        key = make_memory_key("argos", "v1", "en", "es", "Can you  hear me?\n")
+        self.assertEqual(key, make_memory_key("argos", "v1", "EN", "es", "Can you hear me?"))
+        self.assertNotEqual(key, make_memory_key("argos", "v2", "en", "es", "Can you hear me?"))
+        self.assertNotEqual(key, make_memory_key("ollama", "v1", "en", "es", "Can you hear me?"))
+        self.assertNotEqual(key, make_memory_key("argos", "v1", "en", "fr", "Can you hear me?"))
+
+    def test_entries_survive_restart(self):
+        """Stored translations are found again by a new instance on the same file."""
+        memory = TranslationMemory(self.db_path)
+        memory.store("argos", "v1", "en", "es", "Hello", "Hola", latency=0.3)
+        self.assertEqual(memory.lookup("argos", "v1", "en", "es", "Hello"), "Hola")
+        memory.close()
+
+        reopened = TranslationMemory(self.db_path, max_entries=1)
+        reopened.store("argos", "v1", "en", "es", "Yes", "Sí")  # Pushes "Hello" out of memory
+        self.assertEqual(reopened.lookup("argos", "v1", "en", "es", "Hello"), "Hola")
+        self.assertIsNone(reopened.lookup("argos", "v2", "en", "es", "Hello"))
+
+        stats = reopened.get_stats()
+        self.assertEqual(stats["disk_hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(stats["disk_entries"], 2)
+        self.assertGreater(stats["saved_latency"], 0.29)
+        reopened.close()
+
+    def test_fuzzy_match_above_threshold(self):
+        """Near-identical phrases match only when fuzzy matching is enabled."""
+        memory = TranslationMemory(fuzzy_threshold=0.85)
+        memory.store("argos", "v1", "en", "es", "Can you hear me?", "¿Me oyes?")
+
+        self.assertEqual(memory.lookup("argos", "v1", "en", "es", "can you hear me"), "¿Me oyes?")
+        self.assertIsNone(memory.lookup("argos", "v1", "en", "es", "Can you see me now?"))
+        self.assertIsNone(memory.lookup("argos", "v1", "en", "fr", "Can you hear me?"))
+        self.assertEqual(memory.get_stats()["fuzzy_hits"], 1)
+
+        exact_only = TranslationMemory()
+        exact_only.store("argos", "v1", "en", "es", "Can you hear me?", "¿Me oyes?")
+        self.assertIsNone(exact_only.lookup("argos", "v1", "en", "es", "can you hear me"))
+
+
+class TestTranslatorsUseMemory(unittest.TestCase):
+    """Test that repeated phrases skip the translation engines."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.memory = TranslationMemory()
+
+    def test_offline_translator_translates_once(self):
+        """A repeated phrase is served from memory, in single and batch calls."""
+        model = Mock()
+        model.translate.side_effect = lambda text: f"[{text}]"
+        translator = OfflineTranslator(registry=TranslationModelRegistry(), memory=self.memory)
+        translator.argos_available = True
+        translator.hf_available = False
+
+        with patch.object(OfflineTranslator, "_read_argos_model", return_value=model):
+            self.assertEqual(translator.translate("yes", "en", "es"), "[yes]")
+            self.assertEqual(translator.translate("yes ", "en", "es"), "[yes]")
+            self.assertEqual(translator.translate_batch(["yes", "no"], "en", "es"), ["[yes]", "[no]"])
+
+        self.assertEqual([c.args[0] for c in model.translate.call_args_list], ["yes", "no"])
+        self.assertEqual(self.memory.get_stats()["hits"], 2)
+
+    def test_fallback_translation_is_keyed_by_its_engine(self):
+        """A MarianMT fallback result is stored under that engine and model, not argos."""
+        translator = OfflineTranslator(registry=TranslationModelRegistry(), memory=self.memory)
+        translator.argos_available = True
+        translator.hf_available = True
+
+        with patch.object(OfflineTranslator, "_translate_with_argos", return_value=None), \
+                patch.object(OfflineTranslator, "_translate_with_hf", return_value="[hf]") as hf:
+            self.assertEqual(translator.translate("hello", "en", "es"), "[hf]")
+            self.assertEqual(translator.translate("hello", "en", "es"), "[hf]")
+        self.assertEqual(hf.call_count, 1)
+
+        model = translator._memory_model("huggingface", "en", "es")
+        self.assertTrue(model.startswith("Helsinki-NLP/opus-mt-en-es;"))
+        self.assertEqual(self.memory.lookup("offline-huggingface", model, "en", "es", "hello"), "[hf]")
+        self.assertIsNone(self.memory.lookup("offline-argos", translator._memory_model("argos", "en", "es"),
+                                             "en", "es", "hello"))
+        self.assertNotEqual(translator._memory_model("huggingface", "en", "fr"), model)
+
+    def test_ollama_translator_translates_once(self):
+        """The Ollama translator caches by its model name."""
+        response = Mock()
+        response.json.return_value = {"response": "Hola"}
+        client = Mock()
+        client.session.post.return_value = response
+        post = client.session.post
+        with patch.object(translator_module, "YAML_AVAILABLE", False), \
+                patch.object(translator_module, "get_shared_client", return_value=client):
+            translator = Translator(memory=self.memory)
+            self.assertEqual(translator.translate("Hello", "en", "es")[0], "Hola")
+            translation, latency = translator.translate("Hello", "en", "es")
+            translator.model = "mistral"
+            translator.translate("Hello", "en", "es")
+
+        self.assertEqual(translation, "Hola")
+        self.assertLess(latency, 0.1)
+        self.assertEqual(post.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
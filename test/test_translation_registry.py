@@ -0,0 +1,172 @@
+"""
+Unit tests for the shared translation model registry.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+try:
+    import src.translation as translation
+    from src.translation import offline_translator
+    from src.translation.model_registry import TranslationModelRegistry, estimate_model_size
+    from src.translation.offline_translator import OfflineTranslator
+    from src.translation.translation_memory import TranslationMemory
+    from src.audio.adapters import translation_adapter
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+MB = 1024 * 1024
+
+
+class FakeTensor:
+    def __init__(self, size):
+        self.size = size
+
+    def numel(self):
+        return self.size
+
+    def element_size(self):
+        return 4
+
+
+class FakeModel:
+    """Object that looks like a torch module of a given size in MB."""
+
+    def __init__(self, size_mb):
+        self.size_mb = size_mb
+
+    def parameters(self):
+        return [FakeTensor(self.size_mb * MB // 4)]
+
+
+class TestModelRegistry(unittest.TestCase):
+    """Test loading, sharing and eviction."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    def test_concurrent_requests_load_once(self):
+        """Threads asking for a loading model wait for it instead of loading again."""
+        registry = TranslationModelRegistry()
+        loads = []
+
+        def loader():
+            loads.append(1)
+            time.sleep(0.05)
+            return "model"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            registry.get("argos", "en", "es", loader))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(results, ["model"] * 8)
+        stats = registry.get_stats()
+        self.assertEqual(stats["loads"], 1)
+        self.assertEqual(stats["hits"], 7)
+        self.assertGreaterEqual(stats["load_times"]["argos:en-es"], 0.05)
+
+    def test_lru_eviction_under_memory_budget(self):
+        """The least recently used model is dropped when over budget."""
+        registry = TranslationModelRegistry(memory_budget=250 * MB)
+        registry.get("huggingface", "en", "es", lambda: FakeModel(100))
+        registry.get("huggingface", "es", "en", lambda: FakeModel(100))
+        registry.get("huggingface", "en", "es", lambda: None)  # Touch en-es
+        registry.get("huggingface", "fr", "es", lambda: FakeModel(100))
+
+        self.assertTrue(registry.contains("huggingface", "en", "es"))
+        self.assertFalse(registry.contains("huggingface", "es", "en"))
+        self.assertTrue(registry.contains("huggingface", "fr", "es"))
+        stats = registry.get_stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertAlmostEqual(stats["memory_mb"], 200)
+
+    def test_failed_loads_are_not_retried_immediately(self):
+        """A missing pair does not rescan installed models on every sentence."""
+        registry = TranslationModelRegistry()
+        loader = Mock(return_value=None)
+        self.assertIsNone(registry.get("argos", "en", "xx", loader))
+        self.assertIsNone(registry.get("argos", "en", "xx", loader))
+        loader.assert_called_once()
+        self.assertEqual(registry.get_stats()["failed_loads"], 1)
+
+    def test_size_estimate(self):
+        """Model and tokenizer tuples are measured by their parameters."""
+        self.assertEqual(estimate_model_size((FakeModel(3), object())), 3 * MB)
+        self.assertEqual(estimate_model_size(object(), default=7), 7)
+
+
+class TestSharedTranslators(unittest.TestCase):
+    """Test that translators share models through the registry."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.registry = TranslationModelRegistry()
+        self.model = Mock()
+        self.model.translate.side_effect = lambda text: f"[{text}]"
+
+    def make_translator(self):
+        translator = OfflineTranslator(registry=self.registry, memory=TranslationMemory())
+        translator.argos_available = True
+        translator.hf_available = False
+        return translator
+
+    def test_instances_share_loaded_models(self):
+        """A second translator reuses the model loaded by the first."""
+        with patch.object(OfflineTranslator, "_read_argos_model", return_value=self.model) as read:
+            self.assertEqual(self.make_translator().translate("hi", "en", "fr"), "[hi]")
+            self.assertEqual(self.make_translator().translate("bye", "en", "fr"), "[bye]")
+            read.assert_called_once_with("en", "fr")
+
+    def test_translate_text_honours_target_language(self):
+        """Non-Spanish targets are translated to the requested language."""
+        translator = self.make_translator()
+        with patch.object(translation, "get_offline_translator", return_value=translator), \
+                patch.object(OfflineTranslator, "_read_argos_model", return_value=self.model) as read:
+            self.assertEqual(translation.translate_text("hello", "en", "de"), "[hello]")
+            read.assert_called_once_with("en", "de")
+
+    def test_preload_configured_pairs(self):
+        """Preloading loads each pair once; later translations are hits."""
+        translator = self.make_translator()
+        with patch.object(offline_translator, "get_offline_translator", return_value=translator), \
+                patch.object(OfflineTranslator, "_read_argos_model", return_value=self.model):
+            results = offline_translator.preload_translation_models(["en-es", "es-en"])
+            self.assertEqual(results, {"en-es": True, "es-en": True})
+            translator.translate("hello", "en", "es")
+
+        stats = self.registry.get_stats()
+        self.assertEqual(stats["loads"], 2)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_adapter_uses_offline_models_first(self):
+        """TranslationAdapter translates through the shared offline translator."""
+        translator = self.make_translator()
+        with patch.object(translation_adapter, "get_offline_translator", return_value=translator), \
+                patch.object(translation_adapter, "preload_translation_models", None), \
+                patch.object(translation_adapter, "Translator") as ollama, \
+                patch.object(OfflineTranslator, "_read_argos_model", return_value=self.model):
+            adapter = translation_adapter.TranslationAdapter()
+            result = adapter.translate("hello", "en", "es")
+            self.assertEqual(result.translated_text, "[hello]")
+            ollama.return_value.translate.assert_not_called()
+
+            # Pairs without an offline model fall back to the Ollama translator
+            ollama.return_value.translate.return_value = ("hallo", 0.1)
+            with patch.object(OfflineTranslator, "_read_argos_model", return_value=None):
+                result = adapter.translate("hello", "en", "nl")
+            self.assertEqual(result.translated_text, "hallo")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,189 @@
+"""
+Unit tests for sentence-level streaming synthesis and streaming playback.
+"""
+
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+try:
+    from src.tts import synthesizer
+    from src.tts.streaming import SynthesisStream, split_sentences
+    from src.audio.adapters import player_adapter
+    from src.audio.adapters.player_adapter import AudioPlayerAdapter
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+SAMPLE_RATE = 1000
+
+
+def slow_synthesizer(delay, calls=None):
+    """Fake TTS: 0.1 s of audio per sentence after `delay` seconds."""
+    def synthesize(sentence):
+        if calls is not None:
+            calls.append(sentence)
+        time.sleep(delay)
+        return np.full(SAMPLE_RATE // 10, len(sentence), dtype=np.float64)
+    return synthesize
+
+
+class TestSplitSentences(unittest.TestCase):
+    """Test sentence chunking."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+
+    def test_split_merges_short_and_breaks_long(self):
+        """Short sentences are merged; long ones split under max_chars."""
+        text = "Yes. That is a good question!  Let me explain it step by step.\nOK."
+        self.assertEqual(split_sentences(text),
+                         ["Yes. That is a good question!", "Let me explain it step by step. OK."])
+
+        long_sentence = "one, two, three, " * 20 + "end."
+        chunks = split_sentences(long_sentence, max_chars=40)
+        self.assertTrue(all(len(chunk) <= 40 for chunk in chunks))
+        self.assertEqual(" ".join(chunks), " ".join(long_sentence.split()))
+
+
+class TestSynthesisStream(unittest.TestCase):
+    """Test overlapped synthesis."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.sentences = [f"Sentence number {i}." for i in range(4)]
+
+    def test_next_sentence_synthesized_while_consuming(self):
+        """Synthesis of chunk N+1 overlaps consumption of chunk N."""
+        stream = SynthesisStream(slow_synthesizer(0.05), self.sentences, SAMPLE_RATE)
+        start = time.perf_counter()
+        chunks = []
+        for chunk in stream:
+            self.assertEqual(chunk.dtype, np.float32)
+            chunks.append(chunk)
+            time.sleep(0.05)  # "Playback"
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(chunks), 4)
+        self.assertLess(elapsed, 0.35)  # Sequential would take 0.4 s
+
+        stats = stream.get_stats()
+        self.assertLess(stats['time_to_first_audio'], 0.1)
+        self.assertAlmostEqual(stats['audio_duration'], 0.4)
+        self.assertAlmostEqual(stats['real_time_factor'], stats['synthesis_time'] / 0.4)
+        self.assertFalse(stats['cancelled'])
+
+    def test_stopping_early_cancels_synthesis(self):
+        """Sentences after the consumer stops are not synthesized."""
+        calls = []
+        stream = SynthesisStream(slow_synthesizer(0.02, calls), self.sentences * 5, SAMPLE_RATE)
+        for _ in stream:
+            break
+        time.sleep(0.1)
+        self.assertLessEqual(len(calls), 3)
+        self.assertTrue(stream.get_stats()['cancelled'])
+
+    def test_errors_are_raised_to_the_consumer(self):
+        """A synthesis failure ends the stream with RuntimeError."""
+        def failing(sentence):
+            raise ValueError("model crashed")
+        with self.assertRaises(RuntimeError):
+            list(SynthesisStream(failing, self.sentences, SAMPLE_RATE))
+
+    def test_synthesize_stream_uses_voice_cloner(self):
+        """synthesize_stream feeds sentences to the cloner, in memory."""
+        cloner = Mock(sample_rate=SAMPLE_RATE, reference_samples=None)
+        cloner.synthesize_array.side_effect = lambda text, language, clone_voice: np.zeros(10)
+        with patch.object(synthesizer, "_voice_cloner", cloner):
+            stream = synthesizer.synthesize_stream("First sentence here. Second sentence here.",
+                                                   language="es")
+            self.assertEqual(len(list(stream)), 2)
+        cloner.synthesize_array.assert_called_with("Second sentence here.", "es", clone_voice=False)
+
+
+class FakeOutputStream:
+    """OutputStream whose callback is driven by pull()."""
+
+    def __init__(self, backend, samplerate, channels, callback, **kwargs):
+        self.channels = channels
+        self.callback = callback
+        backend.streams.append(self)
+
+    def start(self):
+        pass
+
+    def pull(self, frames=50):
+        """Run the callback for one block and return the mono output."""
+        outdata = np.full((frames, self.channels), np.nan, dtype=np.float32)
+        self.callback(outdata, frames, None, None)
+        return outdata[:, 0]
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeSoundDevice:
+    """Backend module replacement recording opened output streams."""
+
+    def __init__(self):
+        self.streams = []
+
+    def OutputStream(self, **kwargs):
+        return FakeOutputStream(self, **kwargs)
+
+
+class TestStreamingPlayback(unittest.TestCase):
+    """Test AudioPlayerAdapter.play_stream with a fake output device."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.fake_sd = FakeSoundDevice()
+
+        patches = [
+            patch.object(player_adapter, "sd", self.fake_sd),
+            patch.object(player_adapter, "SOUNDDEVICE_AVAILABLE", True),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_chunks_played_back_to_back(self):
+        """Chunks play on the adapter's one output stream at its volume."""
+        adapter = AudioPlayerAdapter()
+        self.addCleanup(adapter.close)
+        adapter.set_volume(0.5)
+        stream = SynthesisStream(slow_synthesizer(0.01), ["a" * 25, "b" * 30], SAMPLE_RATE)
+
+        self.assertTrue(adapter.play_stream(stream, SAMPLE_RATE))
+        played = []
+        deadline = time.monotonic() + 2.0
+        while adapter._current_thread.is_alive() and time.monotonic() < deadline:
+            if self.fake_sd.streams:
+                played.append(self.fake_sd.streams[0].pull())
+            time.sleep(0.005)
+
+        self.assertEqual(len(self.fake_sd.streams), 1)
+        audio = np.concatenate(played)
+        audio = audio[audio != 0]
+        np.testing.assert_allclose(audio, np.r_[np.full(100, 12.5), np.full(100, 15.0)])
+
+        stats = adapter.get_stream_stats()
+        self.assertEqual(stats['chunks'], 2)
+        self.assertEqual(stats['samples'], 2 * SAMPLE_RATE // 10)
+        self.assertIsNotNone(stats['time_to_first_audio'])
+        self.assertIn('real_time_factor', stats['synthesis'])
+        self.assertEqual(adapter.get_playback_stats()['clips_played'], 2)
+        self.assertFalse(adapter.is_playing())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
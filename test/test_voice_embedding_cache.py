@@ -0,0 +1,111 @@
+"""
+Unit tests for the speaker embedding cache of VoiceCloner.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+import soundfile as sf
+
+try:
+    from src.tts import voice_cloner as voice_cloner_module
+    from src.tts.voice_cloner import VoiceCloner, VOICE_EMBEDDING_PREFIX
+    COMPONENTS_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import components for testing: {e}")
+    COMPONENTS_AVAILABLE = False
+
+
+def make_cloner(model):
+    """Build a VoiceCloner around a fake Coqui model without loading TTS."""
+    cloner = VoiceCloner.__new__(VoiceCloner)
+    cloner.model_name = "tts_models/multilingual/multi-dataset/your_tts"
+    cloner.device = "cpu"
+    cloner.tts = Mock()
+    cloner.tts.synthesizer = Mock(tts_model=model, vocoder_model=None, output_sample_rate=16000,
+                                  tts_config={}, spec=["tts_model", "vocoder_model",
+                                                       "output_sample_rate", "tts_config"])
+    cloner._voices = {}
+    cloner._voice_samples = {}
+    cloner.voice_id = None
+    return cloner
+
+
+class TestVoiceEmbeddingCache(unittest.TestCase):
+    """Test that speaker embeddings are computed once per voice."""
+
+    def setUp(self):
+        if not COMPONENTS_AVAILABLE:
+            self.skipTest("Components not available")
+        self.sample_dir = tempfile.mkdtemp()
+        self.samples = []
+        rng = np.random.default_rng(0)
+        for name in ("a.wav", "b.wav", "c.wav"):
+            path = os.path.join(self.sample_dir, name)
+            sf.write(path, rng.uniform(-0.1, 0.1, 16000 * 2), 16000)
+            self.samples.append(path)
+
+        self.model = Mock(spec=["speaker_manager", "language_manager"])
+        self.model.speaker_manager.encoder = object()
+        self.model.speaker_manager.compute_embedding_from_clip.return_value = [0.1] * 8
+        self.model.language_manager.name_to_id = {"en": 0, "es": 1}
+
+    def tearDown(self):
+        shutil.rmtree(self.sample_dir, ignore_errors=True)
+
+    def test_embedding_computed_once_and_persisted(self):
+        """All valid samples are encoded once; a new session loads the saved file."""
+        cloner = make_cloner(self.model)
+        self.assertTrue(cloner.clone_voice_from_samples(self.samples + ["missing.wav"]))
+        self.assertTrue(cloner.clone_voice_from_samples(self.samples))
+
+        encode = self.model.speaker_manager.compute_embedding_from_clip
+        encode.assert_called_once_with(self.samples)
+        saved = [f for f in os.listdir(self.sample_dir) if f.startswith(VOICE_EMBEDDING_PREFIX)]
+        self.assertEqual(saved, [f"{VOICE_EMBEDDING_PREFIX}{cloner.voice_id}.npz"])
+
+        restarted = make_cloner(self.model)
+        self.assertTrue(restarted.clone_voice_from_samples(self.samples))
+        self.assertEqual(restarted.voice_id, cloner.voice_id)
+        encode.assert_called_once()
+        self.assertTrue(restarted.get_model_info()["has_speaker_embedding"])
+
+    def test_short_samples_rejected_without_decoding(self):
+        """Durations come from the file header."""
+        short = os.path.join(self.sample_dir, "short.wav")
+        sf.write(short, np.zeros(100), 16000)
+        cloner = make_cloner(self.model)
+        with patch.object(voice_cloner_module.sf, "read") as read:
+            self.assertFalse(cloner.clone_voice_from_samples([short]))
+            self.assertTrue(cloner.clone_voice_from_samples(self.samples[:1]))
+            read.assert_not_called()
+
+    def test_voice_switching_and_synthesis(self):
+        """Switching voices is a lookup; synthesis passes the cached d-vector."""
+        cloner = make_cloner(self.model)
+        cloner.clone_voice_from_samples(self.samples[:1])
+        first_voice = cloner.voice_id
+        cloner.clone_voice_from_samples(self.samples[1:])
+        self.assertNotEqual(cloner.voice_id, first_voice)
+
+        self.assertTrue(cloner.use_voice(first_voice))
+        self.assertEqual(cloner.reference_samples, self.samples[:1])
+        self.assertFalse(cloner.use_voice("unknown"))
+
+        fake_synthesis = Mock(return_value={"wav": np.zeros(1600, dtype=np.float32)})
+        with patch.object(voice_cloner_module, "_tts_synthesis", fake_synthesis):
+            audio = cloner.synthesize_with_cloned_voice("Hola", language="es")
+
+        self.assertGreater(len(audio), 1600 * 2)
+        kwargs = fake_synthesis.call_args.kwargs
+        np.testing.assert_allclose(kwargs["d_vector"], [0.1] * 8)
+        self.assertEqual(kwargs["language_id"], 1)
+        cloner.tts.tts.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+TalkBridge Effects Benchmark
+============================
+
+Times every AudioEffects effect (and the synthesizer filters) on a long
+signal next to the original per-sample Python loop implementations, and
+checks that both produce the same output.
+
+Usage:
+    python tools/benchmark_effects.py [--seconds 60] [--sample-rate 44100]
+                                      [--skip-legacy]
+
+Author: TalkBridge Team
+Date: 2025-10-16
+Version: 1.0
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    from src.audio.effects import AudioEffects
+    from src.audio.synthesizer import LowPassFilter, HighPassFilter
+except ImportError as e:
+    print(f"❌ Error importing TalkBridge modules: {e}")
+    print("   Make sure you're running this from the project root directory")
+    print("   and that all dependencies are installed.")
+    sys.exit(1)
+
+
+# Original implementations, kept here as the baseline
+
+def legacy_reverb(audio, sample_rate, room_size=0.5, damping=0.5, wet_level=0.3):
+    wet = np.zeros_like(audio)
+    delays = [int(sample_rate * 0.03 * room_size),
+              int(sample_rate * 0.05 * room_size),
+              int(sample_rate * 0.07 * room_size)]
+    for delay_samples in delays:
+        if delay_samples > 0:
+            delayed = np.zeros_like(audio)
+            delayed[delay_samples:] = audio[:-delay_samples] * damping
+            wet += delayed
+    return (1 - wet_level) * audio + wet_level * wet
+
+
+def legacy_delay(audio, sample_rate, delay_time=0.5, feedback=0.3, wet_level=0.5):
+    delay_samples = int(delay_time * sample_rate)
+    result = np.zeros_like(audio)
+    for i in range(len(audio)):
+        if i >= delay_samples:
+            result[i] = audio[i] + feedback * result[i - delay_samples]
+        else:
+            result[i] = audio[i]
+    return (1 - wet_level) * audio + wet_level * result
+
+
+def legacy_chorus(audio, sample_rate, rate=1.5, depth=0.002, mix=0.5):
+    t = np.linspace(0, len(audio) / sample_rate, len(audio), False)
+    modulated_delay = depth * sample_rate * (1.0 + np.sin(2 * np.pi * rate * t))
+    chorus = np.zeros_like(audio)
+    for i in range(len(audio)):
+        delay_samples = int(modulated_delay[i])
+        chorus[i] = audio[i - delay_samples] if i >= delay_samples else audio[i]
+    return (1 - mix) * audio + mix * chorus
+
+
+def legacy_flanger(audio, sample_rate, rate=0.5, depth=0.005, feedback=0.3, mix=0.5):
+    t = np.linspace(0, len(audio) / sample_rate, len(audio), False)
+    modulated_delay = depth * sample_rate * (1.0 + np.sin(2 * np.pi * rate * t))
+    flanger = np.zeros_like(audio)
+    for i in range(len(audio)):
+        delay_samples = int(modulated_delay[i])
+        if i >= delay_samples:
+            flanger[i] = audio[i] + feedback * flanger[i - delay_samples]
+        else:
+            flanger[i] = audio[i]
+    return (1 - mix) * audio + mix * flanger
+
+
+def legacy_eq(audio, sample_rate, low_gain=1.5, mid_gain=0.8, high_gain=1.2):
+    low_alpha = 1.0 / (1.0 + 2 * np.pi * 250 / sample_rate)
+    low = np.zeros_like(audio)
+    for i in range(len(audio)):
+        low[i] = low_alpha * audio[i] + ((1 - low_alpha) * low[i - 1] if i else 0.0)
+    high_alpha = 1.0 / (1.0 + 2 * np.pi * 4000 / sample_rate)
+    high = np.zeros_like(audio)
+    for i in range(len(audio)):
+        if i == 0:
+            high[i] = high_alpha * audio[i]
+        else:
+            high[i] = high_alpha * (high[i - 1] + audio[i] - audio[i - 1])
+    mid = audio - low - high
+    return low_gain * low + mid_gain * mid + high_gain * high
+
+
+def legacy_lowpass(audio, sample_rate, cutoff=1000.0):
+    alpha = 1.0 / (1.0 + 2 * np.pi * cutoff / sample_rate)
+    filtered = np.zeros_like(audio)
+    previous = 0.0
+    for i in range(len(audio)):
+        filtered[i] = alpha * audio[i] + (1 - alpha) * previous
+        previous = filtered[i]
+    return filtered
+
+
+def legacy_highpass(audio, sample_rate, cutoff=1000.0):
+    alpha = 1.0 / (1.0 + 2 * np.pi * cutoff / sample_rate)
+    filtered = np.zeros_like(audio)
+    x_prev = y_prev = 0.0
+    for i in range(len(audio)):
+        filtered[i] = alpha * (y_prev + audio[i] - x_prev)
+        x_prev, y_prev = audio[i], filtered[i]
+    return filtered
+
+
+def timed(func, *args, **kwargs):
+    """Run func once and return (result, seconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark TalkBridge audio effects")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Length of the test signal")
+    parser.add_argument("--sample-rate", type=int, default=44100)
+    parser.add_argument("--skip-legacy", action="store_true",
+                        help="Only time the vectorized implementations")
+    args = parser.parse_args()
+
+    sr = args.sample_rate
+    t = np.arange(int(args.seconds * sr)) / sr
+    rng = np.random.default_rng(0)
+    audio = 0.5 * np.sin(2 * np.pi * 220 * t) + 0.1 * rng.standard_normal(t.size)
+
+    effects = AudioEffects(sample_rate=sr)
+    cases = [
+        ("reverb", lambda a: effects.apply_reverb(a), lambda a: legacy_reverb(a, sr)),
+        ("delay", lambda a: effects.apply_delay(a), lambda a: legacy_delay(a, sr)),
+        ("chorus", lambda a: effects.apply_chorus(a), lambda a: legacy_chorus(a, sr)),
+        ("flanger", lambda a: effects.apply_flanger(a), lambda a: legacy_flanger(a, sr)),
+        ("eq", lambda a: effects.apply_eq(a, 1.5, 0.8, 1.2), lambda a: legacy_eq(a, sr)),
+        ("lowpass", lambda a: LowPassFilter(1000.0, sr).process(a), lambda a: legacy_lowpass(a, sr)),
+        ("highpass", lambda a: HighPassFilter(1000.0, sr).process(a), lambda a: legacy_highpass(a, sr)),
+    ]
+
+    print(f"Effects benchmark: {args.seconds:.0f} s of audio at {sr} Hz ({audio.size} samples)")
+    print(f"{'effect':<10} {'legacy s':>10} {'vector s':>10} {'speedup':>10} {'max |diff|':>12}")
+    print("-" * 56)
+
+    for name, vectorized, legacy in cases:
+        new, new_time = timed(vectorized, audio)
+        if args.skip_legacy:
+            print(f"{name:<10} {'-':>10} {new_time:>10.3f} {'-':>10} {'-':>12}")
+            continue
+        old, old_time = timed(legacy, audio)
+        diff = float(np.max(np.abs(new - old)))
+        print(f"{name:<10} {old_time:>10.3f} {new_time:>10.3f} "
+              f"{old_time / max(new_time, 1e-9):>9.0f}x {diff:>12.2e}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())